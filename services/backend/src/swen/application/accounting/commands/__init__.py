@@ -21,6 +21,7 @@ from swen.application.accounting.commands.generate_default_accounts_command impo
 )
 from swen.application.accounting.commands.post_transaction_command import (
     BulkPostTransactionsCommand,
+    BulkUnpostTransactionsCommand,
     PostTransactionCommand,
     UnpostTransactionCommand,
 )
@@ -41,6 +42,7 @@ __all__ = [
     "CreateSimpleTransactionCommand",  # Convenience: simple 2-entry with hints
     # Transaction lifecycle
     "BulkPostTransactionsCommand",
+    "BulkUnpostTransactionsCommand",
     "DeleteTransactionCommand",
     "EditTransactionCommand",
     "PostTransactionCommand",
@@ -127,10 +127,10 @@ class CreateAccountCommand:
             # Save account
             await self._account_repo.save(account)
 
-        # Trigger ML account embedding (fire-and-forget)
-        # Only for expense/income accounts (used for classification)
-        if account.account_type.value.lower() in ("expense", "income"):
-            self._trigger_account_embedding(account)
+            # Queue ML account embedding in the same transaction
+            # Only for expense/income accounts (used for classification)
+            if account.account_type.value.lower() in ("expense", "income"):
+                self._trigger_account_embedding(account)
 
         return account
 
@@ -83,8 +83,8 @@ class GenerateDefaultAccountsCommand:
                 await self._account_repo.save(account)
                 accounts_created[account.account_type.value.upper()] += 1
 
-        # Trigger ML embedding for expense/income accounts
-        self._trigger_account_embeddings(default_accounts)
+            # Queue ML embedding for expense/income accounts
+            self._trigger_account_embeddings(default_accounts)
 
         total = sum(accounts_created.values())
         return {
@@ -130,8 +130,8 @@ class GenerateDefaultAccountsCommand:
                     await self._account_repo.save(account)
                     created_count += 1
 
-        if created_count > 0:
-            self._trigger_account_embeddings(essential_accounts)
+            if created_count > 0:
+                self._trigger_account_embeddings(essential_accounts)
 
         return {
             "accounts_created": created_count,
@@ -22,6 +22,7 @@ if TYPE_CHECKING:
     from swen.application.ports.account_classifier_training import (
         AccountClassifierTrainingPort,
     )
+    from swen.domain.accounting.aggregates import Transaction
 
 logger = logging.getLogger(__name__)
 
@@ -63,8 +64,8 @@ class PostTransactionCommand:
             transaction.post()
             await self._transaction_repo.save(transaction)
 
-        # Submit as training example (fire-and-forget)
-        self._ml_example_service.submit_example(transaction)
+            # Queued with the post, delivered to the ML service after commit
+            self._ml_example_service.submit_example(transaction)
 
         return TransactionDTO.from_transaction(transaction)
 
@@ -99,7 +100,12 @@ class UnpostTransactionCommand:
 
 
 class BulkPostTransactionsCommand:
-    """Post multiple draft transactions."""
+    """Post multiple draft transactions.
+
+    Every draft is validated in memory first; the status change is then
+    written with one set-based update and the training examples go to the
+    ML service as a single batch.
+    """
 
     def __init__(
         self,
@@ -132,25 +138,82 @@ class BulkPostTransactionsCommand:
             msg = "Either specify transaction_ids or set post_all_drafts=True"
             raise ValidationError(msg)
 
-        posted = []
-
         async with self._uow:
             if post_all_drafts:
                 drafts = await self._transaction_repo.find_draft_transactions()
-                for txn in drafts:
-                    txn.post()
-                    await self._transaction_repo.save(txn)
-                    posted.append(txn)
-            elif transaction_ids:
-                for txn_id in transaction_ids:
-                    txn = await self._transaction_repo.find_by_id(txn_id)
-                    if txn and not txn.is_posted:
-                        txn.post()
-                        await self._transaction_repo.save(txn)
-                        posted.append(txn)
-
-        # Submit as training examples (fire-and-forget), after commit
-        for txn in posted:
-            self._ml_example_service.submit_example(txn)
+            else:
+                drafts = _in_requested_order(
+                    await self._transaction_repo.find_by_ids(transaction_ids or []),
+                    transaction_ids or [],
+                )
+                drafts = [txn for txn in drafts if not txn.is_posted]
+
+            # Any invalid draft aborts the batch before a row is written
+            for txn in drafts:
+                txn.post()
+
+            changed = set(
+                await self._transaction_repo.set_posted(
+                    [txn.id for txn in drafts],
+                    is_posted=True,
+                ),
+            )
+            posted = [txn for txn in drafts if txn.id in changed]
+
+            # Queued with the post, delivered to the ML service after commit
+            self._ml_example_service.submit_examples(posted)
 
         return [TransactionDTO.from_transaction(txn) for txn in posted]
+
+
+class BulkUnpostTransactionsCommand:
+    """Revert multiple posted transactions to draft with one set-based update."""
+
+    def __init__(self, transaction_repository: TransactionRepository, uow: UnitOfWork):
+        self._transaction_repo = transaction_repository
+        self._uow = uow
+
+    @classmethod
+    def from_factory(
+        cls,
+        factory: RepositoryFactory,
+    ) -> BulkUnpostTransactionsCommand:
+        return cls(
+            transaction_repository=factory.transaction_repository(),
+            uow=factory.unit_of_work(),
+        )
+
+    async def execute(self, transaction_ids: list[UUID]) -> list[TransactionDTO]:
+        if not transaction_ids:
+            msg = "Specify at least one transaction_id"
+            raise ValidationError(msg)
+
+        async with self._uow:
+            posted = [
+                txn
+                for txn in _in_requested_order(
+                    await self._transaction_repo.find_by_ids(transaction_ids),
+                    transaction_ids,
+                )
+                if txn.is_posted
+            ]
+            for txn in posted:
+                txn.unpost()
+
+            changed = set(
+                await self._transaction_repo.set_posted(
+                    [txn.id for txn in posted],
+                    is_posted=False,
+                ),
+            )
+            unposted = [txn for txn in posted if txn.id in changed]
+
+        return [TransactionDTO.from_transaction(txn) for txn in unposted]
+
+
+def _in_requested_order(
+    transactions: list[Transaction],
+    transaction_ids: list[UUID],
+) -> list[Transaction]:
+    position = {txn_id: index for index, txn_id in enumerate(transaction_ids)}
+    return sorted(transactions, key=lambda txn: position[txn.id])
@@ -81,10 +81,10 @@ class UpdateAccountCommand:
 
             await self._account_repo.save(account)
 
-        # Trigger ML account embedding update (fire-and-forget)
-        # Only for expense/income accounts (used for classification)
-        if account.account_type.value.lower() in ("expense", "income"):
-            self._trigger_account_embedding(account)
+            # Queue ML account embedding update in the same transaction
+            # Only for expense/income accounts (used for classification)
+            if account.account_type.value.lower() in ("expense", "income"):
+                self._trigger_account_embedding(account)
 
         return account
 
@@ -206,9 +206,9 @@ class DeactivateAccountCommand:
             account.deactivate()
             await self._account_repo.save(account)
 
-        # Delete ML anchor for this account (fire-and-forget)
-        if account.account_type.value.lower() in ("expense", "income"):
-            self._delete_account_anchor(account.id)
+            # Queue deletion of the ML anchor for this account
+            if account.account_type.value.lower() in ("expense", "income"):
+                self._delete_account_anchor(account.id)
 
         return account
 
@@ -257,9 +257,9 @@ class ReactivateAccountCommand:
             account.activate()
             await self._account_repo.save(account)
 
-        # Re-embed ML anchor for this account (fire-and-forget)
-        if account.account_type.value.lower() in ("expense", "income"):
-            self._trigger_account_embedding(account)
+            # Queue re-embedding of the ML anchor for this account
+            if account.account_type.value.lower() in ("expense", "income"):
+                self._trigger_account_embedding(account)
 
         return account
 
@@ -329,9 +329,9 @@ class DeleteAccountCommand:
 
             await self._account_repo.delete(account_id)
 
-        # Delete ML anchor for this account (fire-and-forget)
-        if was_classification_account:
-            self._delete_account_anchor(account_id)
+            # Queue deletion of the ML anchor for this account
+            if was_classification_account:
+                self._delete_account_anchor(account_id)
 
     def _delete_account_anchor(self, account_id: UUID) -> None:
         """Delete ML anchor for this account."""
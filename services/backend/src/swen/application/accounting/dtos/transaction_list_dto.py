@@ -63,10 +63,17 @@ class TransactionListItemDTO(BaseModel):
 
 
 class TransactionListFilterDTO(BaseModel):
-    """Filter and pagination parameters for listing transactions."""
+    """Filter and pagination parameters for listing transactions.
+
+    ``cursor`` (a ``next_cursor`` from a previous result) switches to keyset
+    pagination and takes precedence over ``page``. ``include_totals=False``
+    skips the count query for clients that only scroll forward.
+    """
 
     page: int = 1
     page_size: int = 50
+    cursor: Optional[str] = None
+    include_totals: bool = True
     status_filter: Optional[str] = None
     iban_filter: Optional[str] = None
     show_drafts: bool = True
@@ -78,6 +85,8 @@ class TransactionListResultDTO(BaseModel):
 
     ``total`` is the unfiltered transaction count for the user; ``filtered_count``
     is the count matching the active filters (and drives ``total_pages``).
+    All counts are 0 when the caller skipped totals. ``next_cursor`` fetches
+    the following page and is None on the last one.
     """
 
     transactions: list[TransactionListItemDTO] = []
@@ -87,6 +96,7 @@ class TransactionListResultDTO(BaseModel):
     posted_count: int = 0
     page: int = 1
     page_size: int = 50
+    next_cursor: Optional[str] = None
 
     @computed_field
     @property
@@ -14,7 +14,7 @@ from swen.application.accounting.dtos import (
 from swen.domain.accounting.aggregates import Transaction
 from swen.domain.accounting.repositories import AccountRepository, TransactionRepository
 from swen.domain.accounting.value_objects import TransactionFilters
-from swen.domain.shared.value_objects import Pagination
+from swen.domain.shared.value_objects import PageCursor, Pagination
 
 if TYPE_CHECKING:
     from swen.application.factories import RepositoryFactory
@@ -42,6 +42,12 @@ class ListTransactionsQuery:
         self,
         filters: TransactionListFilterDTO,
     ) -> TransactionListResultDTO:
+        """List one page of transactions.
+
+        Raises ValueError if ``filters.cursor`` is not a valid page cursor.
+        """
+        cursor = PageCursor.decode(filters.cursor) if filters.cursor else None
+
         status = filters.status_filter
         if status is None and not filters.show_drafts:
             status = "posted"
@@ -54,7 +60,7 @@ class ListTransactionsQuery:
             if account:
                 account_id = account.id
             else:
-                counts = await self._transaction_repo.count_by_status()
+                counts = await self._count(None, filters.include_totals)
                 return TransactionListResultDTO(
                     transactions=[],
                     total=counts["total"],
@@ -74,27 +80,45 @@ class ListTransactionsQuery:
             account_id=account_id,
             exclude_internal_transfers=should_exclude_transfers,
         )
-        pagination = Pagination(page=filters.page, page_size=filters.page_size)
+        pagination = Pagination(
+            page=filters.page,
+            page_size=filters.page_size,
+            cursor=cursor,
+        )
 
         filtered = await self._transaction_repo.find_with_filters(
             filters=txn_filters,
             pagination=pagination,
         )
-        filtered_count = await self._transaction_repo.count_with_filters(txn_filters)
-        counts = await self._transaction_repo.count_by_status()
+        counts = await self._count(txn_filters, filters.include_totals)
+
+        next_cursor = None
+        if len(filtered) == filters.page_size:
+            last = filtered[-1]
+            next_cursor = PageCursor(date=last.date, id=last.id).encode()
 
         return TransactionListResultDTO(
             transactions=[
                 TransactionListItemDTO.from_transaction(txn) for txn in filtered
             ],
             total=counts["total"],
-            filtered_count=filtered_count,
+            filtered_count=counts.get("filtered", 0),
             draft_count=counts["draft"],
             posted_count=counts["posted"],
             page=filters.page,
             page_size=filters.page_size,
+            next_cursor=next_cursor,
         )
 
+    async def _count(
+        self,
+        txn_filters: Optional[TransactionFilters],
+        include_totals: bool,
+    ) -> dict[str, int]:
+        if not include_totals:
+            return {"posted": 0, "draft": 0, "total": 0}
+        return await self._transaction_repo.count_by_status(txn_filters)
+
     async def find_by_id(
         self,
         transaction_id: UUID,
@@ -105,13 +129,8 @@ class ListTransactionsQuery:
         self,
         partial_id: str,
     ) -> Optional[Transaction]:
-        posted = await self._transaction_repo.find_posted_transactions()
-        drafts = await self._transaction_repo.find_draft_transactions()
-
-        for txn in posted + drafts:
-            if str(txn.id).startswith(partial_id):
-                return txn
-        return None
+        matches = await self._transaction_repo.find_by_id_prefix(partial_id, limit=1)
+        return matches[0] if matches else None
 
     async def find_by_id_or_partial(
         self,
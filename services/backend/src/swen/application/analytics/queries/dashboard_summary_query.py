@@ -1,7 +1,9 @@
 """Dashboard summary query - aggregates financial data for display.
 
 This query encapsulates the business logic for calculating dashboard metrics,
-keeping the CLI layer focused on presentation only.
+keeping the CLI layer focused on presentation only. Totals, balances and counts
+are aggregated in the database; only the recent-activity list loads
+transactions, so the cost does not grow with the size of the ledger.
 """
 
 from __future__ import annotations
@@ -16,25 +18,22 @@ from swen.application.analytics.dtos import (
     DashboardSummaryDTO,
     RecentTransactionDTO,
 )
+from swen.application.ports.analytics import DashboardReadPort
+from swen.domain.accounting.entities import AccountType
 from swen.domain.accounting.repositories import (
     AccountRepository,
     TransactionRepository,
 )
-from swen.domain.accounting.services import (
-    AccountBalanceService,
-    FinancialSummaryService,
-)
+from swen.domain.accounting.value_objects import TransactionFilters
 from swen.domain.settings.repositories import UserSettingsRepository
-from swen.domain.shared.time import ensure_tz_aware, utc_now
+from swen.domain.shared.time import utc_now
+from swen.domain.shared.value_objects import Pagination
 
 if TYPE_CHECKING:
     from swen.application.factories import RepositoryFactory
     from swen.domain.accounting.entities import Account
 
-
-def _date_in_range(dt: datetime, start: datetime, end: datetime) -> bool:
-    """Check if datetime is in range, handling timezone-naive/aware mismatches."""
-    return ensure_tz_aware(start) <= ensure_tz_aware(dt) < ensure_tz_aware(end)
+RECENT_TRANSACTIONS_LIMIT = 10
 
 
 class DashboardSummaryQuery:
@@ -44,18 +43,20 @@ class DashboardSummaryQuery:
         self,
         account_repository: AccountRepository,
         transaction_repository: TransactionRepository,
+        dashboard_read_port: DashboardReadPort,
         settings_repository: Optional[UserSettingsRepository] = None,
     ):
         self._account_repo = account_repository
         self._transaction_repo = transaction_repository
+        self._dashboard = dashboard_read_port
         self._settings_repo = settings_repository
-        self._balance_service = AccountBalanceService()
 
     @classmethod
     def from_factory(cls, factory: RepositoryFactory) -> DashboardSummaryQuery:
         return cls(
             account_repository=factory.account_repository(),
             transaction_repository=factory.transaction_repository(),
+            dashboard_read_port=factory.dashboard_read_port(),
             settings_repository=factory.user_settings_repository(),
         )
 
@@ -132,33 +133,35 @@ class DashboardSummaryQuery:
         if show_drafts is None:
             show_drafts = await self._get_show_drafts_preference()
 
-        all_accounts = await self._account_repo.find_all_active()
-        if show_drafts:
-            all_transactions = await self._transaction_repo.find_all()
-        else:
-            all_transactions = await self._transaction_repo.find_posted_transactions()
-
         start_date, end_date, period_label = self._calculate_period(days, month)
 
-        period_transactions = [
-            t for t in all_transactions if _date_in_range(t.date, start_date, end_date)
-        ]
+        counts = await self._transaction_repo.count_by_status()
+        draft_count = counts["draft"] if show_drafts else 0
+        posted_count = counts["posted"]
 
-        draft_count = sum(1 for t in all_transactions if not t.is_posted)
-        posted_count = sum(1 for t in all_transactions if t.is_posted)
+        totals = await self._dashboard.period_totals(
+            start_date=start_date,
+            end_date=end_date,
+            include_drafts=show_drafts,
+        )
 
-        balances = FinancialSummaryService.asset_balances(
-            all_accounts,
-            all_transactions,
-            balance_service=self._balance_service,
+        asset_accounts = [
+            account
+            for account in await self._account_repo.find_all_active()
+            if account.account_type == AccountType.ASSET
+        ]
+        balance_by_id = await self._dashboard.asset_balances(
+            include_drafts=show_drafts,
         )
-        totals = FinancialSummaryService.period_totals(period_transactions)
+        balances = [
+            (account, balance_by_id.get(account.id, Decimal("0")))
+            for account in asset_accounts
+        ]
 
-        recent_transactions = sorted(
-            all_transactions,
-            key=lambda t: t.date,
-            reverse=True,
-        )[:10]
+        recent_transactions = await self._transaction_repo.find_with_filters(
+            TransactionFilters(status=None if show_drafts else "posted"),
+            Pagination(page_size=RECENT_TRANSACTIONS_LIMIT),
+        )
 
         return DashboardSummaryDTO(
             period_label=period_label,
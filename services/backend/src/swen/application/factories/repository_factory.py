@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Protocol
 
-from swen.application.ports.analytics import AnalyticsReadPort
+from swen.application.ports.analytics import AnalyticsReadPort, DashboardReadPort
 from swen.application.ports.unit_of_work import UnitOfWork
 from swen.domain.accounting.repositories import (
     AccountRepository,
@@ -86,6 +86,10 @@ class RepositoryFactory(Protocol):
         """Get analytics read port."""
         ...
 
+    def dashboard_read_port(self) -> DashboardReadPort:
+        """Get dashboard read port."""
+        ...
+
     def user_repository(self) -> UserRepository:
         """Get user repository."""
         ...
@@ -13,6 +13,7 @@ from typing import TYPE_CHECKING, Optional
 from swen.application.events import ErrorCode
 from swen.application.integration.services.bank_account_sync import (
     BankAccountSyncService,
+    SyncBatchConfig,
 )
 from swen.application.integration.services.sync_notification_service import (
     SyncNotificationService,
@@ -57,12 +58,14 @@ class SyncBankAccountsCommand:
         factory: RepositoryFactory,
         resolution_port: CounterAccountProposalPort,
         publisher: SyncEventPublisher,
+        batch_config: Optional[SyncBatchConfig] = None,
     ) -> SyncBankAccountsCommand:
         notifier = SyncNotificationService(publisher)
         sync_service = BankAccountSyncService.from_factory(
             factory=factory,
             resolution_port=resolution_port,
             notifier=notifier,
+            batch_config=batch_config,
         )
         return cls(
             sync_service=sync_service,
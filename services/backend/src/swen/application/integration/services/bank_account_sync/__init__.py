@@ -1,7 +1,13 @@
 from swen.application.integration.services.bank_account_sync.bank_account_sync_service import (  # NOQA: E501
     BankAccountSyncService,
 )
+from swen.application.integration.services.bank_account_sync.batch_sizing import (
+    AdaptiveBatchSizer,
+    SyncBatchConfig,
+)
 
 __all__ = [
+    "AdaptiveBatchSizer",
     "BankAccountSyncService",
+    "SyncBatchConfig",
 ]
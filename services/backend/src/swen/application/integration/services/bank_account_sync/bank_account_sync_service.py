@@ -11,10 +11,15 @@ See `.kiro/specs/transaction-sync-modularization/design.md` — section
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from typing import TYPE_CHECKING, Optional
 
+from swen.application.integration.services.bank_account_sync.batch_sizing import (
+    AdaptiveBatchSizer,
+    SyncBatchConfig,
+)
 from swen.application.integration.services.counter_account_batch_service import (
     CounterAccountBatchService,
 )
@@ -32,6 +37,8 @@ from swen.domain.integration.services.sync_period_resolver import (
 )
 
 if TYPE_CHECKING:
+    from uuid import UUID
+
     from swen.application.factories import RepositoryFactory
     from swen.application.integration.services.sync_notification_service import (
         SyncNotificationService,
@@ -47,15 +54,21 @@ if TYPE_CHECKING:
         CounterAccountProposalPort,
     )
     from swen.domain.integration.repositories import TransactionImportRepository
+    from swen.domain.integration.value_objects import ResolvedCounterAccount
+
+    _ClassifiedBatch = tuple[
+        list[StoredBankTransaction],
+        dict[UUID, ResolvedCounterAccount],
+    ]
 
 logger = logging.getLogger(__name__)
 
+_END_OF_BATCHES = None
+
 
 class BankAccountSyncService:
     """Orchestrate sync for a single IBAN with pre-resolved inputs."""
 
-    BATCH_SIZE = 5
-
     def __init__(  # noqa: PLR0913
         self,
         bank_fetch_service: BankFetchService,
@@ -67,6 +80,7 @@ class BankAccountSyncService:
         credential_repo: BankCredentialRepository,
         import_repo: TransactionImportRepository,
         notifier: SyncNotificationService,
+        batch_config: Optional[SyncBatchConfig] = None,
     ) -> None:
         self._bank_fetch_service = bank_fetch_service
         self._opening_balance_service = opening_balance_service
@@ -77,6 +91,7 @@ class BankAccountSyncService:
         self._credential_repo = credential_repo
         self._import_repo = import_repo
         self._notifier = notifier
+        self._batch_config = batch_config or SyncBatchConfig()
 
     @classmethod
     def from_factory(
@@ -84,6 +99,7 @@ class BankAccountSyncService:
         factory: RepositoryFactory,
         resolution_port: CounterAccountProposalPort,
         notifier: SyncNotificationService,
+        batch_config: Optional[SyncBatchConfig] = None,
     ) -> BankAccountSyncService:
         """Build the service and all its dependencies via the factory."""
         opening_balance_service = OpeningBalanceService(
@@ -111,6 +127,7 @@ class BankAccountSyncService:
             credential_repo=factory.credential_repository(),
             import_repo=factory.import_repository(),
             notifier=notifier,
+            batch_config=batch_config,
         )
 
     async def sync_account(
@@ -212,7 +229,16 @@ class BankAccountSyncService:
         iban: str,
         auto_post: bool,
     ) -> tuple[int, int, int]:
-        """Classify and import in interleaved batches, publishing SSE events."""
+        """Classify and import in pipelined batches, publishing SSE events.
+
+        A producer task classifies batches (sized by ``AdaptiveBatchSizer``)
+        and hands the resolved chunks to the import loop through a bounded
+        queue, so importing overlaps with classification of the rest. Classification
+        does not touch the database session after ``preload``, so the import
+        keeps exclusive use of it. Progress events are published by the import
+        loop only, once per chunk. Chunks arrive in tier order, so transactions
+        are imported (and counted) out of their original order within a batch.
+        """
         total = len(to_import)
         if total == 0:
             return 0, 0, 0
@@ -221,34 +247,50 @@ class BankAccountSyncService:
 
         start_ms = time.monotonic()
 
+        # Load mappings and accounts once; batches then resolve in memory
+        await self._batch_service.preload()
+
+        queue: asyncio.Queue[_ClassifiedBatch | BaseException | None] = asyncio.Queue(
+            maxsize=self._batch_config.pipeline_depth
+        )
+        producer = asyncio.create_task(self._classify_batches(to_import, queue))
+
         # Accumulate stats across all batches
         total_imported = 0
         total_skipped = 0
         total_failed = 0
-
-        for batch_start in range(0, total, self.BATCH_SIZE):
-            batch = to_import[batch_start : batch_start + self.BATCH_SIZE]
-
-            resolved = await self._batch_service.resolve_batch(batch)
-
-            await self._notifier.emit_classification_progress_event(
-                current=min(batch_start + len(batch), total),
-                total=total,
-            )
-
-            batch_results = await self._import_service.import_batch(
-                stored_transactions=batch,
-                source_iban=iban,
-                resolved=resolved,
-                auto_post=auto_post,
-            )
-            imported, skipped, failed = self._import_service.compute_stats(
-                batch_results
-            )
-            # Accumulate per-batch stats into running totals
-            total_imported += imported
-            total_skipped += skipped
-            total_failed += failed
+        done = 0
+
+        try:
+            while (item := await queue.get()) is not _END_OF_BATCHES:
+                if isinstance(item, BaseException):
+                    raise item
+                batch, resolved = item
+                done += len(batch)
+
+                await self._notifier.emit_classification_progress_event(
+                    current=done,
+                    total=total,
+                )
+
+                batch_results = await self._import_service.import_batch(
+                    stored_transactions=batch,
+                    source_iban=iban,
+                    resolved=resolved,
+                    auto_post=auto_post,
+                    bulk=True,
+                )
+                imported, skipped, failed = self._import_service.compute_stats(
+                    batch_results
+                )
+                # Accumulate per-batch stats into running totals
+                total_imported += imported
+                total_skipped += skipped
+                total_failed += failed
+        finally:
+            if not producer.done():
+                producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
 
         elapsed_ms = int((time.monotonic() - start_ms) * 1000)
         await self._notifier.emit_classification_completed_event(
@@ -257,3 +299,36 @@ class BankAccountSyncService:
         )
 
         return total_imported, total_skipped, total_failed
+
+    async def _classify_batches(
+        self,
+        to_import: list[StoredBankTransaction],
+        queue: asyncio.Queue[_ClassifiedBatch | BaseException | None],
+    ) -> None:
+        """Classify ``to_import`` in adaptive batches and queue the results.
+
+        Each batch is queued chunk by chunk as the ML service resolves it, so
+        e.g. example-tier hits can be imported while the slower tiers are
+        still running. Ends with ``_END_OF_BATCHES``, or with the exception
+        that stopped it.
+        """
+        sizer = AdaptiveBatchSizer(self._batch_config)
+        batch_start = 0
+        try:
+            while batch_start < len(to_import):
+                batch = to_import[batch_start : batch_start + sizer.size]
+                # Time spent waiting for the import loop is not ML latency
+                elapsed = 0.0
+                started = time.monotonic()
+                async for chunk in self._batch_service.resolve_batch_streaming(batch):
+                    elapsed += time.monotonic() - started
+                    await queue.put(chunk)
+                    started = time.monotonic()
+                elapsed += time.monotonic() - started
+                sizer.record(len(batch), elapsed)
+
+                batch_start += len(batch)
+        except Exception as e:  # re-raised by the import loop
+            await queue.put(e)
+            return
+        await queue.put(_END_OF_BATCHES)
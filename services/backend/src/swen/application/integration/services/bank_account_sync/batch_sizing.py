@@ -0,0 +1,93 @@
+"""Batch sizing for the classify/import loop of a bank account sync.
+
+Each classification batch costs one ML round-trip with a sizable fixed part
+(the ML service loads the user's embeddings per request), so larger batches
+are cheaper per transaction, while smaller batches give more frequent progress
+events. ``AdaptiveBatchSizer`` starts at the configured size and steers the
+size towards a target round-trip latency based on measured durations.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class SyncBatchConfig:
+    """Batch sizing and pipelining settings for ``BankAccountSyncService``.
+
+    Attributes
+    ----------
+    initial_size
+        Size of the first classification batch.
+    min_size
+        Lower bound for adaptive batch sizes.
+    max_size
+        Upper bound for adaptive batch sizes.
+    target_seconds
+        Desired duration of one classification round-trip. Batch sizes are
+        adapted towards it; ``0`` disables adaptation (fixed ``initial_size``).
+    pipeline_depth
+        Number of classified chunks that may wait for import while
+        classification continues.
+    """
+
+    initial_size: int = 20
+    min_size: int = 5
+    max_size: int = 200
+    target_seconds: float = 5.0
+    pipeline_depth: int = 2
+
+    def __post_init__(self) -> None:
+        if self.min_size < 1 or self.max_size < self.min_size:
+            msg = "Batch sizes must satisfy 1 <= min_size <= max_size"
+            raise ValueError(msg)
+        if self.pipeline_depth < 1:
+            msg = "pipeline_depth must be at least 1"
+            raise ValueError(msg)
+
+
+class AdaptiveBatchSizer:
+    """Pick classification batch sizes from measured round-trip latencies.
+
+    Keeps an exponentially weighted estimate of the time per transaction and
+    sizes the next batch so that it takes about ``target_seconds``. Growth is
+    limited to doubling per batch so a single fast response cannot produce a
+    huge batch.
+    """
+
+    _SMOOTHING = 0.5
+    _MAX_GROWTH = 2
+
+    def __init__(self, config: SyncBatchConfig) -> None:
+        self._config = config
+        self._size = self._clamp(config.initial_size)
+        self._seconds_per_item: float | None = None
+
+    @property
+    def size(self) -> int:
+        """Size to use for the next batch."""
+        return self._size
+
+    def record(self, batch_size: int, elapsed_seconds: float) -> None:
+        """Record the duration of a classification round-trip."""
+        if self._config.target_seconds <= 0 or batch_size <= 0:
+            return
+
+        per_item = max(elapsed_seconds, 0.0) / batch_size
+        if self._seconds_per_item is None:
+            self._seconds_per_item = per_item
+        else:
+            self._seconds_per_item = (
+                self._SMOOTHING * per_item
+                + (1 - self._SMOOTHING) * self._seconds_per_item
+            )
+
+        if self._seconds_per_item > 0:
+            wanted = int(self._config.target_seconds / self._seconds_per_item)
+        else:
+            wanted = self._config.max_size
+        self._size = self._clamp(min(wanted, batch_size * self._MAX_GROWTH))
+
+    def _clamp(self, size: int) -> int:
+        return max(self._config.min_size, min(size, self._config.max_size))
@@ -5,13 +5,20 @@ port once, validates proposals against accounting business rules, detects
 internal transfers, and returns a dict of resolved counter-accounts ready
 for import.
 
-No streaming, no chunking — the caller is responsible for batching.
+No chunking — the caller is responsible for batching. ``resolve_batch``
+returns once the whole batch is resolved; ``resolve_batch_streaming`` yields
+resolutions as the proposal port streams them in.
+
+Account mappings and accounts are loaded once (see ``preload``) and kept in
+memory, so resolving a batch issues no repository queries of its own.
 """
 
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
 from swen.domain.accounting.services.classification_rules import ClassificationRules
@@ -34,6 +41,21 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+ResolvedChunk = tuple[
+    list[StoredBankTransaction],
+    dict[UUID, ResolvedCounterAccount],
+]
+
+
+@dataclass(frozen=True)
+class _AccountIndex:
+    """In-memory snapshot of the lookups needed to resolve counter-accounts."""
+
+    account_id_by_iban: dict[str, UUID]
+    accounts_by_id: dict[UUID, Account]
+    fallback_expense: Optional[Account]
+    fallback_income: Optional[Account]
+
 
 class CounterAccountBatchService:
     """Resolve counter-accounts for a batch of bank transactions.
@@ -41,6 +63,10 @@ class CounterAccountBatchService:
     Calls the proposal port once for the entire batch, validates each
     proposal against accounting direction rules, and falls back to
     well-known default accounts when a proposal is invalid or missing.
+
+    The user's account mappings and accounts are loaded on first use and
+    reused for every later batch; call ``preload`` to refresh them, e.g. at
+    the start of each sync.
     """
 
     def __init__(
@@ -54,6 +80,7 @@ class CounterAccountBatchService:
         self._account_repo = account_repository
         self._mapping_repo = mapping_repository
         self._user_id = current_user.user_id
+        self._index: Optional[_AccountIndex] = None
 
     @classmethod
     def from_factory(
@@ -68,6 +95,38 @@ class CounterAccountBatchService:
             current_user=factory.current_user,
         )
 
+    async def preload(self) -> None:
+        """Load account mappings, accounts and fallback accounts into memory.
+
+        Issues one query for the mappings and one for the accounts. Later
+        ``resolve_batch`` calls resolve against this snapshot until the next
+        ``preload``.
+        """
+        self._index = await self._load_index()
+
+    async def _load_index(self) -> _AccountIndex:
+        mappings = await self._mapping_repo.find_all()
+        accounts = await self._account_repo.find_all()
+
+        accounts_by_number = {a.account_number: a for a in accounts}
+        return _AccountIndex(
+            account_id_by_iban={
+                m.iban.strip().upper(): m.accounting_account_id for m in mappings
+            },
+            accounts_by_id={a.id: a for a in accounts},
+            fallback_expense=accounts_by_number.get(
+                WellKnownAccounts.FALLBACK_EXPENSE,
+            ),
+            fallback_income=accounts_by_number.get(
+                WellKnownAccounts.FALLBACK_INCOME,
+            ),
+        )
+
+    async def _get_index(self) -> _AccountIndex:
+        if self._index is None:
+            self._index = await self._load_index()
+        return self._index
+
     async def resolve_batch(
         self,
         stored_transactions: list[StoredBankTransaction],
@@ -90,16 +149,10 @@ class CounterAccountBatchService:
             counter-account, guaranteed to contain an entry for every
             input transaction.
         """
-        # Step 1: Detect internal transfers
-        results: dict[UUID, ResolvedCounterAccount] = {}
-        remaining: list[StoredBankTransaction] = []
+        index = await self._get_index()
 
-        for stored in stored_transactions:
-            internal = await self._detect_internal(stored)
-            if internal is not None:
-                results[stored.id] = internal
-            else:
-                remaining.append(stored)
+        # Step 1: Detect internal transfers
+        results, remaining = self._split_internal(index, stored_transactions)
 
         if not remaining:
             return results
@@ -112,11 +165,11 @@ class CounterAccountBatchService:
 
         if proposals is None:
             logger.warning("Proposal port unavailable. So, using fallback for all")
-            fallbacks = await self._build_all_fallback(remaining)
+            fallbacks = self._build_all_fallback(index, remaining)
             results.update(fallbacks)
             return results
 
-        ml_results = await self._validate_proposals(proposals, remaining)
+        ml_results = self._validate_proposals(index, proposals, remaining)
         results.update(ml_results)
 
         # Post-condition: every input transaction must have a resolution
@@ -127,8 +180,79 @@ class CounterAccountBatchService:
 
         return results
 
-    async def _detect_internal(
+    async def resolve_batch_streaming(
         self,
+        stored_transactions: list[StoredBankTransaction],
+    ) -> AsyncIterator[ResolvedChunk]:
+        """Resolve counter-accounts, yielding them as proposals arrive.
+
+        Same resolution rules as ``resolve_batch``, but internal transfers are
+        yielded right away and ML proposals chunk by chunk as the proposal
+        port streams them. Transactions the port never proposed for are
+        yielded last with fallback accounts.
+
+        Parameters
+        ----------
+        stored_transactions
+            The batch of stored bank transactions to resolve.
+
+        Yields
+        ------
+        tuple[list[StoredBankTransaction], dict[UUID, ResolvedCounterAccount]]
+            A chunk of the input transactions and their resolved
+            counter-accounts. Every input transaction is in exactly one chunk.
+        """
+        index = await self._get_index()
+
+        internal, remaining = self._split_internal(index, stored_transactions)
+        if internal:
+            yield [s for s in stored_transactions if s.id in internal], internal
+
+        pending = {s.id: s for s in remaining}
+        if pending:
+            async for proposals in self._port.classify_batch_streaming(
+                user_id=self._user_id,
+                transactions=remaining,
+            ):
+                accepted: list[CounterAccountProposal] = []
+                chunk: list[StoredBankTransaction] = []
+                for proposal in proposals:
+                    stored = pending.pop(proposal.transaction_id, None)
+                    if stored is not None:
+                        accepted.append(proposal)
+                        chunk.append(stored)
+                if chunk:
+                    yield chunk, self._validate_proposals(index, accepted, chunk)
+
+        if pending:
+            logger.warning(
+                "No proposal for %d transaction(s). So, using fallback",
+                len(pending),
+            )
+            rest = list(pending.values())
+            yield rest, self._build_all_fallback(index, rest)
+
+    def _split_internal(
+        self,
+        index: _AccountIndex,
+        stored_transactions: list[StoredBankTransaction],
+    ) -> tuple[dict[UUID, ResolvedCounterAccount], list[StoredBankTransaction]]:
+        """Resolve internal transfers; return them and the remaining transactions."""
+        internal: dict[UUID, ResolvedCounterAccount] = {}
+        remaining: list[StoredBankTransaction] = []
+
+        for stored in stored_transactions:
+            resolved = self._detect_internal(index, stored)
+            if resolved is not None:
+                internal[stored.id] = resolved
+            else:
+                remaining.append(stored)
+
+        return internal, remaining
+
+    def _detect_internal(
+        self,
+        index: _AccountIndex,
         stored: StoredBankTransaction,
     ) -> ResolvedCounterAccount | None:
         """Check if the counterparty IBAN maps to an internal account.
@@ -140,16 +264,16 @@ class CounterAccountBatchService:
         if not counterparty_iban:
             return None
 
-        mapping = await self._mapping_repo.find_by_iban(counterparty_iban)
-        if not mapping:
+        account_id = index.account_id_by_iban.get(counterparty_iban.strip().upper())
+        if account_id is None:
             return None
 
-        account = await self._account_repo.find_by_id(mapping.accounting_account_id)
+        account = index.accounts_by_id.get(account_id)
         if account is None:
             logger.warning(
                 "Mapping for IBAN %s references non-existent account %s",
                 counterparty_iban,
-                mapping.accounting_account_id,
+                account_id,
             )
             return None
 
@@ -158,8 +282,9 @@ class CounterAccountBatchService:
             confidence=None,
         )
 
-    async def _validate_proposals(
+    def _validate_proposals(
         self,
+        index: _AccountIndex,
         proposals: list[CounterAccountProposal],
         stored_transactions: list[StoredBankTransaction],
     ) -> dict[UUID, ResolvedCounterAccount]:
@@ -180,13 +305,14 @@ class CounterAccountBatchService:
                 )
                 continue
 
-            resolved = await self._resolve_single_proposal(proposal, stored)
+            resolved = self._resolve_single_proposal(index, proposal, stored)
             results[proposal.transaction_id] = resolved
 
         # Fill in any transactions that didn't get a proposal
         for stored in stored_transactions:
             if stored.id not in results:
-                fallback = await self._get_fallback_account(
+                fallback = self._get_fallback_account(
+                    index,
                     stored.transaction.is_debit(),
                 )
                 results[stored.id] = ResolvedCounterAccount(
@@ -196,14 +322,16 @@ class CounterAccountBatchService:
 
         return results
 
-    async def _resolve_single_proposal(
+    def _resolve_single_proposal(
         self,
+        index: _AccountIndex,
         proposal: CounterAccountProposal,
         stored: StoredBankTransaction,
     ) -> ResolvedCounterAccount:
         """Resolve a single proposal to a validated account or fallback."""
         if not proposal.counter_account_id:
-            fallback = await self._get_fallback_account(
+            fallback = self._get_fallback_account(
+                index,
                 stored.transaction.is_debit(),
             )
             return ResolvedCounterAccount(
@@ -211,13 +339,14 @@ class CounterAccountBatchService:
                 confidence=proposal.confidence,
             )
 
-        account = await self._account_repo.find_by_id(proposal.counter_account_id)
+        account = index.accounts_by_id.get(proposal.counter_account_id)
         if account is None:
             logger.warning(
                 "Proposal account_id=%s not found — falling back",
                 proposal.counter_account_id,
             )
-            fallback = await self._get_fallback_account(
+            fallback = self._get_fallback_account(
+                index,
                 stored.transaction.is_debit(),
             )
             return ResolvedCounterAccount(
@@ -238,7 +367,7 @@ class CounterAccountBatchService:
                 account.account_number,
                 account.name,
             )
-            fallback = await self._get_fallback_account(is_money_outflow)
+            fallback = self._get_fallback_account(index, is_money_outflow)
             return ResolvedCounterAccount(
                 account=fallback,
                 confidence=proposal.confidence,
@@ -249,27 +378,29 @@ class CounterAccountBatchService:
             confidence=proposal.confidence,
         )
 
-    async def _get_fallback_account(self, is_expense: bool) -> Account:
-        """Look up the well-known fallback account."""
-        account_number = (
-            WellKnownAccounts.FALLBACK_EXPENSE
-            if is_expense
-            else WellKnownAccounts.FALLBACK_INCOME
-        )
-        account = await self._account_repo.find_by_account_number(account_number)
+    @staticmethod
+    def _get_fallback_account(index: _AccountIndex, is_expense: bool) -> Account:
+        """Return the well-known fallback account."""
+        if is_expense:
+            account_number = WellKnownAccounts.FALLBACK_EXPENSE
+            account = index.fallback_expense
+        else:
+            account_number = WellKnownAccounts.FALLBACK_INCOME
+            account = index.fallback_income
         if not account:
             msg = f"Fallback account ({account_number}) not found"
             raise ValueError(msg)
         return account
 
-    async def _build_all_fallback(
+    def _build_all_fallback(
         self,
+        index: _AccountIndex,
         stored_transactions: list[StoredBankTransaction],
     ) -> dict[UUID, ResolvedCounterAccount]:
         """Build fallback results for all transactions (port unavailable)."""
         results: dict[UUID, ResolvedCounterAccount] = {}
         for stored in stored_transactions:
-            fallback = await self._get_fallback_account(stored.transaction.is_debit())
+            fallback = self._get_fallback_account(index, stored.transaction.is_debit())
             results[stored.id] = ResolvedCounterAccount(
                 account=fallback,
                 confidence=None,
@@ -33,9 +33,40 @@ class MLExampleService:
         if self._ml_port is None or not self._ml_port.enabled:
             return
 
+        example = self._build_example(transaction)
+        if example is None:
+            return
+
+        self._ml_port.submit_example(example)
+        logger.debug(
+            "Submitted ML example: txn=%s -> account=%s",
+            transaction.id,
+            example.account_number,
+        )
+
+    def submit_examples(self, transactions: list[Transaction]) -> None:
+        """Submit many posted transactions as one batch of training examples.
+
+        Applies the same skip rules as ``submit_example``.
+        """
+        if self._ml_port is None or not self._ml_port.enabled:
+            return
+
+        examples = [
+            example
+            for example in map(self._build_example, transactions)
+            if example is not None
+        ]
+        if not examples:
+            return
+
+        self._ml_port.submit_examples(examples)
+        logger.debug("Submitted %d ML examples", len(examples))
+
+    def _build_example(self, transaction: Transaction) -> TransactionExample | None:
         counter_account = self._find_counter_account(transaction)
         if counter_account is None:
-            return
+            return None
 
         # Skip fallback accounts. Don't train ML to use them
         if counter_account.account_number in WellKnownAccounts.FALLBACK_ACCOUNTS:
@@ -43,28 +74,19 @@ class MLExampleService:
                 "Skipping ML example for fallback account: %s",
                 counter_account.account_number,
             )
-            return
-
-        amount = self._extract_amount(transaction)
+            return None
 
-        example = TransactionExample(
+        return TransactionExample(
             user_id=transaction.user_id,
             account_id=counter_account.id,
             account_number=counter_account.account_number,
             account_type=counter_account.account_type.value.lower(),
             transaction_id=transaction.id,
             purpose=transaction.description or "",
-            amount=amount,
+            amount=self._extract_amount(transaction),
             counterparty_name=transaction.counterparty,
         )
 
-        self._ml_port.submit_example(example)
-        logger.debug(
-            "Submitted ML example: txn=%s -> account=%s",
-            transaction.id,
-            counter_account.name,
-        )
-
     def _find_counter_account(self, transaction: Transaction):
         for entry in transaction.entries:
             if entry.account.account_type in (AccountType.EXPENSE, AccountType.INCOME):
@@ -154,6 +154,7 @@ class TransactionImportService:
         source_iban: str,
         resolved: dict[UUID, ResolvedCounterAccount],
         auto_post: bool = False,
+        bulk: bool = False,
     ) -> list[TransactionImportOutcome]:
         """Import a batch of transactions with pre-resolved counter-accounts.
 
@@ -168,18 +169,30 @@ class TransactionImportService:
             ``ResolvedCounterAccount``.
         auto_post
             Whether to auto-post transactions.
+        bulk
+            Whether to use the set-based path (see ``_import_batch_bulk``)
+            instead of importing one transaction at a time.
 
         Returns
         -------
         list[TransactionImportOutcome]
             One result per input transaction.
         """
-        results: list[TransactionImportOutcome] = []
         logger.debug(
-            "import_batch: %d txns, %d resolved",
+            "import_batch: %d txns, %d resolved, bulk=%s",
             len(stored_transactions),
             len(resolved),
+            bulk,
         )
+        if bulk:
+            return await self._import_batch_bulk(
+                stored_transactions,
+                source_iban,
+                resolved,
+                auto_post=auto_post,
+            )
+
+        results: list[TransactionImportOutcome] = []
         for stored in stored_transactions:
             resolved_item = resolved[stored.id]
             result = await self._import_stored_transaction(
@@ -191,6 +204,186 @@ class TransactionImportService:
             results.append(result)
         return results
 
+    async def _import_batch_bulk(
+        self,
+        stored_transactions: list[StoredBankTransaction],
+        source_iban: str,
+        resolved: dict[UUID, ResolvedCounterAccount],
+        auto_post: bool,
+    ) -> list[TransactionImportOutcome]:
+        """Import a batch with set-based lookups and one multi-row write.
+
+        Duplicates are checked with one query for the whole batch and the
+        asset account is resolved once. Transactions to plain counter-accounts
+        are then built in memory and persisted together with their import
+        records (and skipped/failed records) in one flush. Transactions that
+        need per-transaction lookups - counter-accounts with an IBAN
+        (transfer reconciliation, opening-balance adjustments) or an earlier
+        unsuccessful import record - take the single-transaction path.
+
+        If the combined write fails, each pending import is retried in its own
+        savepoint, so one bad row only fails its own transaction.
+        """
+        existing = await self._import_repo.find_by_bank_transaction_ids(
+            [s.id for s in stored_transactions],
+        )
+
+        asset_account: Optional[Account] = None
+        asset_error = ""
+        try:
+            asset_account = (
+                await self._bank_account_service.get_or_create_asset_account(
+                    iban=source_iban,
+                )
+            )
+        except Exception as e:
+            asset_error = f"Import failed: {e!s}"
+
+        results: list[TransactionImportOutcome] = []
+        pending: list[tuple[int, TransactionImport, Optional[Transaction]]] = []
+
+        for stored in stored_transactions:
+            bank_transaction = stored.transaction
+            resolved_item = resolved[stored.id]
+            previous = existing.get(stored.id)
+
+            if previous is not None and previous.status == ImportStatus.SUCCESS:
+                results.append(
+                    TransactionImportOutcome(
+                        bank_transaction=bank_transaction,
+                        status=ImportStatus.DUPLICATE,
+                        error_message="Transaction already imported",
+                    )
+                )
+                continue
+
+            if previous is not None or resolved_item.account.iban:
+                results.append(
+                    await self._import_stored_transaction(
+                        stored,
+                        source_iban,
+                        resolved_item,
+                        auto_post=auto_post,
+                    )
+                )
+                continue
+
+            import_record = TransactionImport(
+                user_id=self._user_id,
+                bank_transaction_id=stored.id,
+                booking_date=bank_transaction.booking_date,
+                status=ImportStatus.PENDING,
+            )
+            outcome, accounting_tx = self._build_import(
+                bank_transaction=bank_transaction,
+                import_record=import_record,
+                asset_account=asset_account,
+                asset_error=asset_error,
+                resolved_item=resolved_item,
+                source_iban=source_iban,
+                auto_post=auto_post,
+            )
+
+            pending.append((len(results), import_record, accounting_tx))
+            results.append(outcome)
+
+        if pending:
+            await self._save_pending_imports(pending, results)
+
+        return results
+
+    def _build_import(  # NOQA: PLR0913
+        self,
+        bank_transaction: BankTransaction,
+        import_record: TransactionImport,
+        asset_account: Optional[Account],
+        asset_error: str,
+        resolved_item: ResolvedCounterAccount,
+        source_iban: str,
+        auto_post: bool,
+    ) -> tuple[TransactionImportOutcome, Optional[Transaction]]:
+        """Build the accounting transaction for a plain import in memory.
+
+        Applies the skip conditions and updates ``import_record`` accordingly;
+        nothing is persisted. ``asset_account`` is ``None`` if its lookup
+        failed with ``asset_error``.
+        """
+        skip_reason = self._get_skip_reason(bank_transaction)
+        if skip_reason:
+            import_record.mark_as_skipped(skip_reason)
+            outcome = TransactionImportOutcome(
+                bank_transaction=bank_transaction,
+                status=ImportStatus.SKIPPED,
+                error_message=skip_reason,
+            )
+            return outcome, None
+
+        if asset_account is None:
+            return self._mark_failed(bank_transaction, import_record, asset_error), None
+
+        try:
+            accounting_tx = self._factory.create(
+                bank_transaction=bank_transaction,
+                asset_account=asset_account,
+                counter_account=resolved_item.account,
+                source_iban=source_iban,
+                is_internal_transfer=False,
+                ai_resolution=self._build_ai_resolution_metadata(resolved_item),
+            )
+            if auto_post:
+                accounting_tx.post()
+        except Exception as e:
+            outcome = self._mark_failed(
+                bank_transaction,
+                import_record,
+                f"Import failed: {e!s}",
+            )
+            return outcome, None
+
+        import_record.mark_as_imported(accounting_tx.id)
+        outcome = TransactionImportOutcome(
+            bank_transaction=bank_transaction,
+            status=ImportStatus.SUCCESS,
+            accounting_transaction=accounting_tx,
+        )
+        return outcome, accounting_tx
+
+    async def _save_pending_imports(
+        self,
+        pending: list[tuple[int, TransactionImport, Optional[Transaction]]],
+        results: list[TransactionImportOutcome],
+    ) -> None:
+        """Persist the bulk path's records, isolating failures if needed."""
+        try:
+            await self._import_repo.save_complete_imports(
+                [(record, tx) for _, record, tx in pending],
+            )
+            return
+        except Exception as e:
+            logger.warning(
+                "Bulk import of %d records failed, retrying one by one: %s",
+                len(pending),
+                e,
+            )
+
+        for index, import_record, accounting_tx in pending:
+            try:
+                if accounting_tx is None:
+                    await self._import_repo.save_complete_imports(
+                        [(import_record, None)],
+                    )
+                else:
+                    await self._import_repo.save_complete_import(
+                        import_record=import_record,
+                        accounting_tx=accounting_tx,
+                    )
+            except Exception as e:
+                results[index] = await self._handle_failure(
+                    results[index].bank_transaction,
+                    import_record,
+                    e,
+                )
+
     async def _import_stored_transaction(
         self,
         stored: StoredBankTransaction,
@@ -299,13 +492,7 @@ class TransactionImportService:
         bank_transaction: BankTransaction,
         import_record: TransactionImport,
     ) -> TransactionImportOutcome | None:
-        skip_reason = None
-
-        if bank_transaction.amount == 0:
-            skip_reason = "Skipping zero-amount bank transaction"
-        elif bank_transaction.currency != "EUR":
-            skip_reason = f"Unsupported currency: {bank_transaction.currency}"
-
+        skip_reason = self._get_skip_reason(bank_transaction)
         if skip_reason:
             import_record.mark_as_skipped(skip_reason)
             await self._import_repo.save(import_record)
@@ -317,6 +504,14 @@ class TransactionImportService:
 
         return None
 
+    @staticmethod
+    def _get_skip_reason(bank_transaction: BankTransaction) -> str | None:
+        if bank_transaction.amount == 0:
+            return "Skipping zero-amount bank transaction"
+        if bank_transaction.currency != "EUR":
+            return f"Unsupported currency: {bank_transaction.currency}"
+        return None
+
     async def _is_already_imported(self, bank_transaction_id) -> bool:
         existing = await self._import_repo.find_by_bank_transaction_id(
             bank_transaction_id,
@@ -379,10 +574,21 @@ class TransactionImportService:
         import_record: TransactionImport,
         error: Exception,
     ) -> TransactionImportOutcome:
-        error_msg = f"Import failed: {error!s}"
-        import_record.mark_as_failed(error_msg)
+        outcome = self._mark_failed(
+            bank_transaction,
+            import_record,
+            f"Import failed: {error!s}",
+        )
         await self._import_repo.save(import_record)
+        return outcome
 
+    @staticmethod
+    def _mark_failed(
+        bank_transaction: BankTransaction,
+        import_record: TransactionImport,
+        error_msg: str,
+    ) -> TransactionImportOutcome:
+        import_record.mark_as_failed(error_msg)
         return TransactionImportOutcome(
             bank_transaction=bank_transaction,
             status=ImportStatus.FAILED,
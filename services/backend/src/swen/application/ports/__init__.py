@@ -4,13 +4,14 @@ from swen.application.ports.account_classifier_training import (
     AccountClassifierTrainingPort,
     TransactionExample,
 )
-from swen.application.ports.analytics import AnalyticsReadPort
+from swen.application.ports.analytics import AnalyticsReadPort, DashboardReadPort
 from swen.application.ports.system import DatabaseIntegrityPort
 from swen.application.ports.unit_of_work import UnitOfWork
 
 __all__ = [
     "AccountClassifierTrainingPort",
     "AnalyticsReadPort",
+    "DashboardReadPort",
     "DatabaseIntegrityPort",
     "TransactionExample",
     "UnitOfWork",
@@ -50,6 +50,10 @@ class AccountClassifierTrainingPort(ABC):
     Transaction Classification is handled by ``CounterAccountProposalPort`` in the
     integration domain. This port covers example submission and account
     anchor embedding/deletion.
+
+    The fire-and-forget methods may be delivered later and are bound to the
+    caller's unit of work: call them inside it, so the update is only sent
+    if the change that produced it is committed.
     """
 
     @property
@@ -61,6 +65,14 @@ class AccountClassifierTrainingPort(ABC):
     def submit_example(self, example: TransactionExample) -> None:
         """Submit a transaction example for ML training (fire-and-forget)."""
 
+    @abstractmethod
+    def submit_examples(self, examples: list[TransactionExample]) -> None:
+        """Submit many transaction examples as one batch (fire-and-forget).
+
+        Used by bulk posting so a large batch costs a few requests instead
+        of one per transaction.
+        """
+
     @abstractmethod
     async def embed_accounts(
         self,
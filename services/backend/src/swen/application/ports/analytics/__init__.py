@@ -5,5 +5,6 @@ They intentionally return application DTOs (read models), not domain aggregates.
 """
 
 from swen.application.ports.analytics.analytics_read_port import AnalyticsReadPort
+from swen.application.ports.analytics.dashboard_read_port import DashboardReadPort
 
-__all__ = ["AnalyticsReadPort"]
+__all__ = ["AnalyticsReadPort", "DashboardReadPort"]
@@ -0,0 +1,32 @@
+"""Dashboard read port (aggregates behind the dashboard summary).
+
+Each method returns one pre-aggregated figure set, so the dashboard never
+loads transactions beyond the handful it lists as recent activity.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Protocol
+from uuid import UUID
+
+from swen.domain.accounting.services import PeriodTotals
+
+
+class DashboardReadPort(Protocol):
+    """Aggregate queries for the dashboard summary."""
+
+    async def period_totals(
+        self,
+        *,
+        start_date: datetime,
+        end_date: datetime,
+        include_drafts: bool,
+    ) -> PeriodTotals:
+        """Income, expenses and spending per category for start <= date < end."""
+        ...
+
+    async def asset_balances(self, *, include_drafts: bool) -> dict[UUID, Decimal]:
+        """Current balance per asset account. Accounts without bookings are absent."""
+        ...
@@ -6,7 +6,7 @@ filter by the current user's user_id.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterable, List, Optional
 from uuid import UUID
 
 from swen.domain.accounting.entities import Account
@@ -29,6 +29,10 @@ class AccountRepository(ABC):
     async def find_by_id(self, account_id: UUID) -> Optional[Account]:
         """Find account by ID."""
 
+    @abstractmethod
+    async def find_by_ids(self, account_ids: Iterable[UUID]) -> List[Account]:
+        """Find all accounts with the given IDs (unknown IDs are ignored)."""
+
     @abstractmethod
     async def find_by_name(self, name: str) -> Optional[Account]:
         """Find account by name."""
@@ -6,7 +6,9 @@ filter by the current user's user_id.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, List, Optional
+from datetime import date
+from decimal import Decimal
+from typing import Any, Iterable, List, Optional
 from uuid import UUID
 
 from swen.domain.accounting.aggregates import Transaction
@@ -27,10 +29,43 @@ class TransactionRepository(ABC):
     async def save(self, transaction: Transaction) -> None:
         """Save a transaction."""
 
+    @abstractmethod
+    async def save_all(self, transactions: Iterable[Transaction]) -> None:
+        """Save several transactions in a single write."""
+
     @abstractmethod
     async def find_by_id(self, transaction_id: UUID) -> Optional[Transaction]:
         """Find transaction by ID."""
 
+    @abstractmethod
+    async def find_by_ids(self, transaction_ids: Iterable[UUID]) -> List[Transaction]:
+        """Find all transactions with the given IDs (unknown IDs are ignored)."""
+
+    @abstractmethod
+    async def find_by_id_prefix(
+        self,
+        prefix: str,
+        limit: int = 5,
+    ) -> List[Transaction]:
+        """Find transactions whose ID string starts with ``prefix``.
+
+        Returns at most ``limit`` matches ordered by ID, so an ambiguous or
+        mistyped short ID never loads more than a handful of aggregates.
+        """
+
+    @abstractmethod
+    async def set_posted(
+        self,
+        transaction_ids: Iterable[UUID],
+        is_posted: bool,
+    ) -> List[UUID]:
+        """Set the posting state of many transactions in one set-based write.
+
+        Only transactions currently in the opposite state are changed; their
+        IDs are returned. Domain validation is the caller's job: this does
+        not load or check the aggregates.
+        """
+
     @abstractmethod
     async def find_by_account(self, account_id: UUID) -> List[Transaction]:
         """Find all transactions involving an account."""
@@ -70,6 +105,20 @@ class TransactionRepository(ABC):
     ) -> List[Transaction]:
         """Find transactions by counterparty IBAN."""
 
+    @abstractmethod
+    async def find_transfer_candidate_ids(
+        self,
+        counterparty_iban: str,
+        amount: Decimal,
+        start_date: date,
+        end_date: date,
+    ) -> List[UUID]:
+        """Find ids of transactions with this counterparty IBAN and total amount.
+
+        Only transactions dated between ``start_date`` and ``end_date``
+        (inclusive) are returned, ordered by date.
+        """
+
     @abstractmethod
     async def find_by_metadata(
         self,
@@ -100,11 +149,13 @@ class TransactionRepository(ABC):
         filters
             Filtering criteria (date range, status, account, etc.)
         pagination
-            Page-based pagination. If None, returns all matching results.
+            Page-based pagination, or keyset pagination when it carries a
+            cursor. If None, returns all matching results.
 
         Returns
         -------
-        List of transactions matching the filters, sorted by date descending.
+        List of transactions matching the filters, sorted by date and id
+        descending.
         """
 
     @abstractmethod
@@ -119,5 +170,12 @@ class TransactionRepository(ABC):
         """
 
     @abstractmethod
-    async def count_by_status(self) -> dict[str, int]:
-        """Count transactions by status (posted vs draft)."""
+    async def count_by_status(
+        self,
+        filters: Optional[TransactionFilters] = None,
+    ) -> dict[str, int]:
+        """Count transactions by status (posted vs draft) in one query.
+
+        Returns ``posted``, ``draft`` and ``total``. If ``filters`` is given,
+        also ``filtered``: the number of transactions matching them.
+        """
@@ -11,6 +11,7 @@ from swen.domain.accounting.services.classification_rules import (
 )
 from swen.domain.accounting.services.financial_summary_service import (
     FinancialSummaryService,
+    PeriodTotals,
 )
 from swen.domain.accounting.services.opening_balance import (
     OpeningBalanceCalculator,
@@ -30,6 +31,7 @@ __all__ = [
     "MetadataKeys",
     "OpeningBalanceCalculator",
     "OpeningBalanceService",
+    "PeriodTotals",
     "TransactionAnalyzer",
     "TransactionEditService",
 ]
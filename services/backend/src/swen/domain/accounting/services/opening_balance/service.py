@@ -17,7 +17,7 @@ from uuid import UUID
 from swen.domain.accounting.services.opening_balance.calculator import (
     OpeningBalanceCalculator,
 )
-from swen.domain.accounting.value_objects import TransactionFilters
+from swen.domain.accounting.value_objects import TransactionSource
 from swen.domain.accounting.well_known_accounts import WellKnownAccounts
 from swen.domain.shared.iban import normalize_iban
 
@@ -60,13 +60,12 @@ class OpeningBalanceService:
             return None
 
         transactions = await self._transaction_repo.find_by_metadata(
-            metadata_key="is_opening_balance",
-            metadata_value=True,
+            metadata_key="opening_balance_iban",
+            metadata_value=normalized,
         )
 
         for txn in transactions:
-            txn_iban = normalize_iban(txn.get_metadata_raw("opening_balance_iban"))
-            if txn_iban == normalized:
+            if txn.get_metadata_raw("is_opening_balance"):
                 return txn.date.date() if txn.date else None
 
         return None
@@ -81,14 +80,17 @@ class OpeningBalanceService:
         if not normalized or not transfer_hash:
             return False
 
-        filters = TransactionFilters(source_filter="opening_balance_adjustment")
-        transactions = await self._transaction_repo.find_with_filters(filters)
+        transactions = await self._transaction_repo.find_by_metadata(
+            metadata_key="transfer_identity_hash",
+            metadata_value=transfer_hash,
+        )
 
         for txn in transactions:
-            txn_iban = normalize_iban(txn.get_metadata_raw("opening_balance_iban"))
-            txn_hash = txn.get_metadata_raw("transfer_identity_hash")
+            if txn.source != TransactionSource.OPENING_BALANCE_ADJUSTMENT:
+                continue
 
-            if txn_iban == normalized and txn_hash == transfer_hash:
+            txn_iban = normalize_iban(txn.get_metadata_raw("opening_balance_iban"))
+            if txn_iban == normalized:
                 return True
 
         return False
@@ -6,6 +6,7 @@ Decouples the domain from any particular resolution engine
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from typing import Protocol
 from uuid import UUID
 
@@ -19,7 +20,7 @@ class CounterAccountProposalPort(Protocol):
     """Port: submit a batch of transactions and receive counter-account proposals.
 
     Any resolution engine (ML service, etc.) satisfies this contract by
-    implementing :meth:`classify_batch`.
+    implementing :meth:`classify_batch` and :meth:`classify_batch_streaming`.
     """
 
     async def classify_batch(
@@ -33,3 +34,16 @@ class CounterAccountProposalPort(Protocol):
         or ``None`` if the classifier is unavailable.
         """
         ...
+
+    def classify_batch_streaming(
+        self,
+        user_id: UUID,
+        transactions: list[StoredBankTransaction],
+    ) -> AsyncIterator[list[CounterAccountProposal]]:
+        """Classify a batch of transactions, yielding proposals incrementally.
+
+        Yields proposals as soon as the engine has them, each transaction at
+        most once. Transactions never yielded (classifier unavailable or
+        failed midway) are left to the caller's fallback.
+        """
+        ...
@@ -62,6 +62,27 @@ class TransactionImportRepository(ABC):
         Transaction import if found, None otherwise
         """
 
+    @abstractmethod
+    async def find_by_bank_transaction_ids(
+        self,
+        bank_transaction_ids: List[UUID],
+    ) -> dict[UUID, TransactionImport]:
+        """
+        Find the import records of many stored bank transactions at once.
+
+        Batch variant of ``find_by_bank_transaction_id`` (one query).
+
+        Parameters
+        ----------
+        bank_transaction_ids
+            UUIDs of the stored bank transactions
+
+        Returns
+        -------
+        Mapping from bank transaction ID to its import record; IDs without an
+        import record are absent
+        """
+
     @abstractmethod
     async def find_by_accounting_transaction_id(
         self,
@@ -200,6 +221,24 @@ class TransactionImportRepository(ABC):
             Optional opening-balance adjustment transaction
         """
 
+    @abstractmethod
+    async def save_complete_imports(
+        self,
+        imports: List[tuple[TransactionImport, Optional[Transaction]]],
+    ) -> None:
+        """Atomically persist many new imports and their accounting transactions.
+
+        Batch variant of ``save_complete_import`` for records that do not exist
+        yet: everything is written in one flush, and either all writes are
+        durable on return, or none are.
+
+        Parameters
+        ----------
+        imports
+            Pairs of a new import record and its new accounting transaction
+            (``None`` for skipped or failed imports)
+        """
+
     @abstractmethod
     async def mark_reconciled_as_internal_transfer(
         self,
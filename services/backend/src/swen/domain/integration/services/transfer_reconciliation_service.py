@@ -7,6 +7,7 @@ existing transactions to internal transfers when a new account is linked.
 from __future__ import annotations
 
 import logging
+from datetime import timedelta
 from typing import TYPE_CHECKING, Optional
 
 from swen.domain.accounting.aggregates import Transaction
@@ -73,30 +74,46 @@ class TransferReconciliationService:
         source_iban: str,
         date_tolerance_days: int,
     ) -> Optional[Transaction]:
-        candidates = await self._transaction_repo.find_by_counterparty_iban(source_iban)
-
-        amount = abs(bank_transaction.amount)
         booking_date = bank_transaction.booking_date
+        tolerance = timedelta(days=date_tolerance_days)
+        candidate_ids = await self._transaction_repo.find_transfer_candidate_ids(
+            counterparty_iban=source_iban,
+            amount=abs(bank_transaction.amount),
+            start_date=booking_date - tolerance,
+            end_date=booking_date + tolerance,
+        )
+        if not candidate_ids:
+            return None
 
-        for candidate in candidates:
-            if candidate.total_amount().amount != amount:
-                continue
+        logger.debug("Found potential transfer match: %s", candidate_ids[0])
+        return await self._transaction_repo.find_by_id(candidate_ids[0])
 
-            candidate_date = candidate.date.date()
-            date_diff = abs((booking_date - candidate_date).days)
-            if date_diff > date_tolerance_days:
-                continue
+    async def convert_to_internal_transfer(
+        self,
+        transaction: Transaction,
+        new_asset_account: Account,
+        counterparty_iban: str,
+        source_iban: str,
+    ) -> bool:
+        converted = self._apply_internal_transfer(
+            transaction=transaction,
+            new_asset_account=new_asset_account,
+            counterparty_iban=counterparty_iban,
+            source_iban=source_iban,
+        )
+        if not converted:
+            return False
 
-            logger.debug(
-                "Found potential transfer match: %s (date diff: %d days)",
-                candidate.id,
-                date_diff,
-            )
-            return candidate
+        await self._transaction_repo.save(transaction)
 
-        return None
+        logger.info(
+            "Converted transaction %s to internal transfer to %s",
+            transaction.id,
+            new_asset_account.name,
+        )
+        return True
 
-    async def convert_to_internal_transfer(
+    def _apply_internal_transfer(
         self,
         transaction: Transaction,
         new_asset_account: Account,
@@ -120,16 +137,7 @@ class TransferReconciliationService:
                 "Cannot convert transaction %s: no Income/Expense entry found",
                 transaction.id,
             )
-            return False
-
-        await self._transaction_repo.save(transaction)
-
-        logger.info(
-            "Converted transaction %s to internal transfer to %s",
-            transaction.id,
-            new_asset_account.name,
-        )
-        return True
+        return converted
 
     async def reconcile_for_new_account(
         self,
@@ -138,21 +146,21 @@ class TransferReconciliationService:
     ) -> int:
         candidates = await self._transaction_repo.find_by_counterparty_iban(iban)
 
-        reconciled = 0
+        # Convert in memory, then persist all conversions in one write
+        converted: list[Transaction] = []
         for transaction in candidates:
             if transaction.is_internal_transfer:
                 continue
 
             source_iban = self._get_source_iban_from_transaction(transaction)
             try:
-                success = await self.convert_to_internal_transfer(
+                if self._apply_internal_transfer(
                     transaction=transaction,
                     new_asset_account=asset_account,
                     counterparty_iban=iban,
                     source_iban=source_iban,
-                )
-                if success:
-                    reconciled += 1
+                ):
+                    converted.append(transaction)
             except Exception as e:
                 logger.warning(
                     "Failed to reconcile transaction %s: %s",
@@ -160,6 +168,11 @@ class TransferReconciliationService:
                     e,
                 )
 
+        # No per-row fallback: after a failed flush the session needs a
+        # rollback, which is up to the caller's unit of work
+        await self._transaction_repo.save_all(converted)
+
+        reconciled = len(converted)
         if reconciled > 0:
             logger.info(
                 "Reconciled %d transaction(s) as internal transfers to %s",
@@ -1,6 +1,7 @@
 """Shared value objects used across domains."""
 
+from swen.domain.shared.value_objects.page_cursor import PageCursor
 from swen.domain.shared.value_objects.pagination import Pagination
 from swen.domain.shared.value_objects.secure_string import SecureString
 
-__all__ = ["Pagination", "SecureString"]
+__all__ = ["PageCursor", "Pagination", "SecureString"]
@@ -0,0 +1,40 @@
+"""Keyset cursor value object for paginating date-ordered queries."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+
+
+class PageCursor(BaseModel):
+    """Position after the last row of a page ordered by (date, id) descending.
+
+    The next page starts strictly after this key, so its cost does not depend
+    on how deep the client has scrolled. ``encode()`` gives an opaque token
+    for clients to send back.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    date: datetime
+    id: UUID
+
+    def encode(self) -> str:
+        raw = f"{self.date.isoformat()}|{self.id}".encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> PageCursor:
+        """Parse a token produced by ``encode()``; raises ValueError if invalid."""
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            raw = base64.urlsafe_b64decode(padded.encode()).decode()
+            date_part, id_part = raw.split("|")
+            return cls(date=datetime.fromisoformat(date_part), id=UUID(id_part))
+        except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+            msg = f"Invalid page cursor: {token!r}"
+            raise ValueError(msg) from e
@@ -2,16 +2,25 @@
 
 from __future__ import annotations
 
+from typing import Optional
+
 from pydantic import BaseModel, ConfigDict, field_validator
 
+from swen.domain.shared.value_objects.page_cursor import PageCursor
+
 
 class Pagination(BaseModel):
-    """Page-based pagination parameters."""
+    """Page-based pagination parameters.
+
+    When ``cursor`` is set, the page starts after that key instead of at
+    ``offset`` and ``page`` is ignored.
+    """
 
     model_config = ConfigDict(frozen=True)
 
     page: int = 1
     page_size: int = 50
+    cursor: Optional[PageCursor] = None
 
     @field_validator("page")
     @classmethod
@@ -17,11 +17,16 @@ from swen.infrastructure.banking.local_fints import (
     FinTSInstituteDirectory,
     FinTSInstituteDirectoryError,
     FinTSInstituteInfo,
+    FinTSWorkerPool,
+    FinTSWorkerPoolConfig,
+    FinTSWorkerPoolStats,
     GeldstromAdapter,
     UpdateConfigResult,
     ValidationResult,
+    configure_fints_worker_pool,
     get_fints_institute_directory,
     get_fints_institute_directory_async,
+    get_fints_worker_pool,
     invalidate_fints_directory_cache,
 )
 
@@ -34,6 +39,9 @@ __all__ = [
     "FinTSInstituteDirectory",
     "FinTSInstituteDirectoryError",
     "FinTSInstituteInfo",
+    "FinTSWorkerPool",
+    "FinTSWorkerPoolConfig",
+    "FinTSWorkerPoolStats",
     "GeldstromAdapter",
     "GeldstromApiAdapter",
     "GeldstromApiConfig",
@@ -41,7 +49,9 @@ __all__ = [
     "GeldstromApiConfigStatus",
     "UpdateConfigResult",
     "ValidationResult",
+    "configure_fints_worker_pool",
     "get_fints_institute_directory",
     "get_fints_institute_directory_async",
+    "get_fints_worker_pool",
     "invalidate_fints_directory_cache",
 ]
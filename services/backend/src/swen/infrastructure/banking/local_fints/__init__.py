@@ -25,6 +25,13 @@ from swen.infrastructure.banking.local_fints.value_objects.institute_directory i
     get_fints_institute_directory_async,
     invalidate_fints_directory_cache,
 )
+from swen.infrastructure.banking.local_fints.worker_pool import (
+    FinTSWorkerPool,
+    FinTSWorkerPoolConfig,
+    FinTSWorkerPoolStats,
+    configure_fints_worker_pool,
+    get_fints_worker_pool,
+)
 
 __all__ = [
     "CSVValidationResult",
@@ -36,10 +43,15 @@ __all__ = [
     "FinTSInstituteDirectory",
     "FinTSInstituteDirectoryError",
     "FinTSInstituteInfo",
+    "FinTSWorkerPool",
+    "FinTSWorkerPoolConfig",
+    "FinTSWorkerPoolStats",
     "GeldstromAdapter",
     "UpdateConfigResult",
     "ValidationResult",
+    "configure_fints_worker_pool",
     "get_fints_institute_directory",
     "get_fints_institute_directory_async",
+    "get_fints_worker_pool",
     "invalidate_fints_directory_cache",
 ]
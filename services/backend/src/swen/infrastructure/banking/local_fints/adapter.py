@@ -2,6 +2,10 @@
 
 This adapter implements the BankConnectionPort using the geldstrom library.
 It translates between geldstrom's data structures and our domain model.
+
+geldstrom is synchronous; every call that talks to the bank runs on the
+``FinTSWorkerPool`` so a slow dialogue or TAN approval does not block the
+event loop.
 """
 
 from __future__ import annotations
@@ -9,7 +13,7 @@ from __future__ import annotations
 import logging
 from datetime import date, datetime
 from decimal import Decimal
-from typing import TYPE_CHECKING, Awaitable, Callable
+from typing import TYPE_CHECKING, Awaitable, Callable, TypeVar
 
 from geldstrom import FinTS3Client, TANConfig
 from geldstrom import TANMethod as GeldstromTANMethod
@@ -35,6 +39,10 @@ from swen.domain.banking.value_objects.tan_method import (
     TANMethodType,
 )
 from swen.domain.shared.time import utc_now
+from swen.infrastructure.banking.local_fints.worker_pool import (
+    FinTSWorkerPool,
+    get_fints_worker_pool,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -48,6 +56,11 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Balance per geldstrom account_id: (amount, as_of)
+_Balances = dict[str, tuple[Decimal, datetime]]
+
 
 class GeldstromAdapter(BankConnectionPort):
     """
@@ -74,9 +87,11 @@ class GeldstromAdapter(BankConnectionPort):
         self,
         config_repository: FinTSConfigRepository | None = None,
         fints_endpoint_repo: FinTSEndpointRepository | None = None,
+        worker_pool: FinTSWorkerPool | None = None,
     ) -> None:
         self._config_repository = config_repository
         self._fints_endpoint_repo = fints_endpoint_repo
+        self._worker_pool = worker_pool
         self._client: FinTS3Client | None = None
         self._credentials: BankCredentials | None = None
         self._accounts_cache: list[BankAccount] | None = None
@@ -125,15 +140,19 @@ class GeldstromAdapter(BankConnectionPort):
 
             self._credentials = credentials
 
-            # Connect and fetch accounts (geldstrom is synchronous)
-            geldstrom_accounts = self._client.connect()
+            # Connect, fetch accounts and their balances in one worker call
+            geldstrom_accounts, balances = await self._run_blocking(
+                self._connect_and_fetch,
+                self._client,
+            )
 
             # Cache geldstrom accounts for later lookup
             self._geldstrom_accounts_cache = geldstrom_accounts
 
             # Transform to domain model
-            self._accounts_cache = await self._map_accounts_to_domain(
+            self._accounts_cache = self._map_accounts_to_domain(
                 geldstrom_accounts,
+                balances,
             )
 
             logger.info(
@@ -173,12 +192,18 @@ class GeldstromAdapter(BankConnectionPort):
         try:
             logger.info("Fetching accounts from bank...")
 
-            # Fetch accounts from geldstrom
-            geldstrom_accounts = self._client.list_accounts()
+            # Fetch accounts and their balances from geldstrom
+            geldstrom_accounts, balances = await self._run_blocking(
+                self._list_and_fetch,
+                self._client,
+            )
             self._geldstrom_accounts_cache = geldstrom_accounts
 
             # Transform to domain model
-            domain_accounts = await self._map_accounts_to_domain(geldstrom_accounts)
+            domain_accounts = self._map_accounts_to_domain(
+                geldstrom_accounts,
+                balances,
+            )
             self._accounts_cache = domain_accounts
 
             logger.info("Successfully fetched %d accounts", len(domain_accounts))
@@ -227,7 +252,8 @@ class GeldstromAdapter(BankConnectionPort):
 
             # Fetch transactions from geldstrom
             # TAN handling is automatic via challenge_handler
-            feed = self._client.get_transactions(
+            feed = await self._run_blocking(
+                self._client.get_transactions,
                 geldstrom_account,
                 start_date=start_date,
                 end_date=end_date,
@@ -256,7 +282,7 @@ class GeldstromAdapter(BankConnectionPort):
         """Close the bank connection."""
         if self._client:
             logger.info("Disconnecting from bank")
-            self._client.disconnect()
+            await self._run_blocking(self._client.disconnect)
             self._client = None
             self._credentials = None
             self._accounts_cache = None
@@ -303,7 +329,10 @@ class GeldstromAdapter(BankConnectionPort):
             )
 
             # Query TAN methods (uses sync dialog, no TAN needed)
-            geldstrom_methods = client.get_tan_methods()
+            geldstrom_methods = await self._run_blocking(
+                client.get_tan_methods,
+                bank_code=credentials.blz,
+            )
 
             # Map to domain model
             domain_methods = [self._map_tan_method(m) for m in geldstrom_methods]
@@ -351,33 +380,77 @@ class GeldstromAdapter(BankConnectionPort):
             supports_multiple_tan=geldstrom_method.supports_multiple_tan,
         )
 
-    async def _map_accounts_to_domain(
+    async def _run_blocking(
         self,
+        func: Callable[..., T],
+        *args,
+        bank_code: str | None = None,
+        **kwargs,
+    ) -> T:
+        """Run a blocking geldstrom call on the FinTS worker pool.
+
+        Calls for the same bank code are limited by the pool; the code
+        defaults to the BLZ of the current connection.
+        """
+        if bank_code is None:
+            bank_code = self._credentials.blz if self._credentials else ""
+        pool = self._worker_pool or get_fints_worker_pool()
+        return await pool.run(bank_code, func, *args, **kwargs)
+
+    @classmethod
+    def _connect_and_fetch(
+        cls,
+        client: FinTS3Client,
+    ) -> tuple[Sequence[Account], _Balances]:
+        """Open the dialogue and fetch balances (runs on a worker thread)."""
+        accounts = client.connect()
+        return accounts, cls._fetch_balances(client, accounts)
+
+    @classmethod
+    def _list_and_fetch(
+        cls,
+        client: FinTS3Client,
+    ) -> tuple[Sequence[Account], _Balances]:
+        """List accounts and fetch balances (runs on a worker thread)."""
+        accounts = client.list_accounts()
+        return accounts, cls._fetch_balances(client, accounts)
+
+    @staticmethod
+    def _fetch_balances(
+        client: FinTS3Client,
         geldstrom_accounts: Sequence[Account],
+    ) -> _Balances:
+        balances: _Balances = {}
+        for account in geldstrom_accounts:
+            if not (account.capabilities and account.capabilities.can_fetch_balance):
+                continue
+            try:
+                snapshot = client.get_balance(account)
+                balances[account.account_id] = (
+                    snapshot.booked.amount,
+                    snapshot.as_of,
+                )
+            except Exception as e:
+                logger.warning(
+                    "Could not fetch balance for %s: %s",
+                    account.iban,
+                    e,
+                )
+        return balances
+
+    def _map_accounts_to_domain(
+        self,
+        geldstrom_accounts: Sequence[Account],
+        balances: _Balances,
     ) -> list[BankAccount]:
         domain_accounts = []
 
         for account in geldstrom_accounts:
             try:
-                # Fetch balance for this account
-                balance = None
-                balance_date = None
-                if (
-                    self._client
-                    and account.capabilities
-                    and account.capabilities.can_fetch_balance
-                ):
-                    try:
-                        snapshot = self._client.get_balance(account)
-                        balance = snapshot.booked.amount
-                        balance_date = snapshot.as_of
-                    except Exception as e:
-                        logger.warning(
-                            "Could not fetch balance for %s: %s",
-                            account.iban,
-                            e,
-                        )
-
+                balance, balance_date = balances.get(
+                    account.account_id,
+                    (None, None),
+                )
                 domain_account = self._map_account_to_domain(
                     account,
                     balance,
@@ -0,0 +1,220 @@
+"""Worker pool for blocking geldstrom FinTS calls.
+
+The geldstrom ``FinTS3Client`` is synchronous: a bank dialogue, including
+decoupled TAN polling of up to five minutes, blocks the calling thread.
+``FinTSWorkerPool`` runs these calls on a bounded thread pool so the event
+loop keeps serving other users, with two limits:
+
+- ``max_workers`` bounds the blocking calls running at the same time.
+- ``per_bank_limit`` bounds the calls per bank code (BLZ). With the default
+  of 1, dialogues with the same bank are serialized while different banks
+  run in parallel.
+
+Callers wait for a slot on the event loop, so a cancelled caller that is
+still queued simply leaves the queue. A call that is already running cannot
+be interrupted; the caller is released at once, but the call keeps its
+slots until the bank dialogue ends, so the limits stay accurate.
+
+Threads rather than processes are used because a connected client holds
+the dialogue state between calls and cannot be moved between processes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class FinTSWorkerPoolConfig:
+    """Limits for ``FinTSWorkerPool``.
+
+    Attributes
+    ----------
+    max_workers
+        Blocking FinTS calls running at the same time.
+    per_bank_limit
+        Blocking FinTS calls running at the same time for one bank code.
+    """
+
+    max_workers: int = 8
+    per_bank_limit: int = 1
+
+    def __post_init__(self) -> None:
+        if self.max_workers < 1 or self.per_bank_limit < 1:
+            msg = "max_workers and per_bank_limit must be at least 1"
+            raise ValueError(msg)
+
+
+@dataclass(frozen=True)
+class FinTSWorkerPoolStats:
+    """Queue depth and counters of the FinTS worker pool."""
+
+    max_workers: int
+    per_bank_limit: int
+    running: int
+    queued: int
+    queued_by_bank: dict[str, int]
+    completed_total: int
+    cancelled_total: int
+
+
+class FinTSWorkerPool:
+    """Run blocking FinTS calls off the event loop with per-bank limits."""
+
+    def __init__(self, config: FinTSWorkerPoolConfig | None = None):
+        self._config = config or FinTSWorkerPoolConfig()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._config.max_workers,
+            thread_name_prefix="fints",
+        )
+        self._workers = asyncio.Semaphore(self._config.max_workers)
+        self._bank_slots: dict[str, asyncio.Semaphore] = {}
+        # Callers queued or running per bank; idle slots are dropped at zero
+        self._bank_users: dict[str, int] = defaultdict(int)
+        self._queued_by_bank: dict[str, int] = defaultdict(int)
+        self._running = 0
+        self._completed_total = 0
+        self._cancelled_total = 0
+
+    @property
+    def config(self) -> FinTSWorkerPoolConfig:
+        return self._config
+
+    async def run(
+        self,
+        bank_code: str,
+        func: Callable[..., T],
+        *args,
+        **kwargs,
+    ) -> T:
+        """Run ``func(*args, **kwargs)`` on a worker thread.
+
+        Waits for a free slot for ``bank_code`` and a free worker first.
+        Exceptions raised by ``func`` are re-raised to the caller.
+        """
+        slot = self._acquire_bank_slot(bank_code)
+        self._queued_by_bank[bank_code] += 1
+        try:
+            await slot.acquire()
+            try:
+                await self._workers.acquire()
+            except BaseException:
+                slot.release()
+                raise
+        except asyncio.CancelledError:
+            self._cancelled_total += 1
+            self._release_bank_slot(bank_code)
+            raise
+        except BaseException:
+            self._release_bank_slot(bank_code)
+            raise
+        finally:
+            self._dequeue(bank_code)
+
+        self._running += 1
+        loop = asyncio.get_running_loop()
+        # Keep contextvars (e.g. logging context) visible in the worker thread
+        call = functools.partial(
+            contextvars.copy_context().run,
+            func,
+            *args,
+            **kwargs,
+        )
+        future = loop.run_in_executor(self._executor, call)
+        future.add_done_callback(
+            lambda f: self._finish(bank_code, slot, f),
+        )
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            self._cancelled_total += 1
+            logger.warning(
+                "FinTS call for BLZ %s cancelled; the bank dialogue finishes "
+                "in the background",
+                bank_code,
+            )
+            raise
+
+    def stats(self) -> FinTSWorkerPoolStats:
+        """Current queue depth and counters."""
+        return FinTSWorkerPoolStats(
+            max_workers=self._config.max_workers,
+            per_bank_limit=self._config.per_bank_limit,
+            running=self._running,
+            queued=sum(self._queued_by_bank.values()),
+            queued_by_bank=dict(self._queued_by_bank),
+            completed_total=self._completed_total,
+            cancelled_total=self._cancelled_total,
+        )
+
+    def shutdown(self) -> None:
+        """Stop accepting work; running bank dialogues are not waited for."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _acquire_bank_slot(self, bank_code: str) -> asyncio.Semaphore:
+        slot = self._bank_slots.get(bank_code)
+        if slot is None:
+            slot = asyncio.Semaphore(self._config.per_bank_limit)
+            self._bank_slots[bank_code] = slot
+        self._bank_users[bank_code] += 1
+        return slot
+
+    def _release_bank_slot(self, bank_code: str) -> None:
+        self._bank_users[bank_code] -= 1
+        if self._bank_users[bank_code] <= 0:
+            del self._bank_users[bank_code]
+            self._bank_slots.pop(bank_code, None)
+
+    def _dequeue(self, bank_code: str) -> None:
+        self._queued_by_bank[bank_code] -= 1
+        if self._queued_by_bank[bank_code] <= 0:
+            del self._queued_by_bank[bank_code]
+
+    def _finish(
+        self,
+        bank_code: str,
+        slot: asyncio.Semaphore,
+        future: asyncio.Future,
+    ) -> None:
+        # Mark the result as retrieved if the caller was cancelled meanwhile
+        if not future.cancelled():
+            future.exception()
+        self._running -= 1
+        self._completed_total += 1
+        self._workers.release()
+        slot.release()
+        self._release_bank_slot(bank_code)
+
+
+_worker_pool: FinTSWorkerPool | None = None
+
+
+def get_fints_worker_pool() -> FinTSWorkerPool:
+    """Get the process-wide FinTS worker pool (default limits until configured)."""
+    global _worker_pool  # noqa: PLW0603
+    if _worker_pool is None:
+        _worker_pool = FinTSWorkerPool()
+    return _worker_pool
+
+
+def configure_fints_worker_pool(config: FinTSWorkerPoolConfig) -> FinTSWorkerPool:
+    """Replace the process-wide FinTS worker pool with one using ``config``.
+
+    Called once at startup, before any bank connection is made.
+    """
+    global _worker_pool  # noqa: PLW0603
+    if _worker_pool is not None:
+        _worker_pool.shutdown()
+    _worker_pool = FinTSWorkerPool(config)
+    return _worker_pool
@@ -2,10 +2,16 @@
 
 from swen.infrastructure.integration.ml import (
     MLAccountClassifierTrainingAdapter,
+    MLOutboxConfig,
+    MLOutboxDispatcher,
+    MLOutboxStats,
     MLServiceClient,
 )
 
 __all__ = [
     "MLAccountClassifierTrainingAdapter",
+    "MLOutboxConfig",
+    "MLOutboxDispatcher",
+    "MLOutboxStats",
     "MLServiceClient",
 ]
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING
 
-from swen_ml_contracts import TransactionInput
+from swen_ml_contracts import Classification, TransactionInput
 
 from swen.domain.banking.repositories import StoredBankTransaction
 from swen.domain.integration.ports.counter_account_proposal_port import (
@@ -35,7 +36,34 @@ class MLCounterAccountAdapter(CounterAccountProposalPort):
         if not self._client.enabled:
             return None
 
-        ml_transactions = [
+        response = await self._client.classify_batch(
+            user_id=user_id,
+            transactions=self._to_ml_transactions(transactions),
+        )
+        if response is None:
+            return None
+
+        return self._to_proposals(response.classifications)
+
+    async def classify_batch_streaming(
+        self,
+        user_id: UUID,
+        transactions: list[StoredBankTransaction],
+    ) -> AsyncIterator[list[CounterAccountProposal]]:
+        if not self._client.enabled:
+            return
+
+        async for chunk in self._client.classify_batch_streaming(
+            user_id=user_id,
+            transactions=self._to_ml_transactions(transactions),
+        ):
+            yield self._to_proposals(chunk.classifications)
+
+    @staticmethod
+    def _to_ml_transactions(
+        transactions: list[StoredBankTransaction],
+    ) -> list[TransactionInput]:
+        return [
             TransactionInput(
                 transaction_id=t.id,
                 booking_date=t.transaction.booking_date,
@@ -47,18 +75,15 @@ class MLCounterAccountAdapter(CounterAccountProposalPort):
             for t in transactions
         ]
 
-        response = await self._client.classify_batch(
-            user_id=user_id,
-            transactions=ml_transactions,
-        )
-        if response is None:
-            return None
-
+    @staticmethod
+    def _to_proposals(
+        classifications: list[Classification],
+    ) -> list[CounterAccountProposal]:
         return [
             CounterAccountProposal(
                 transaction_id=c.transaction_id,
                 counter_account_id=c.account_id,
                 confidence=c.confidence,
             )
-            for c in response.classifications
+            for c in classifications
         ]
@@ -1,11 +1,19 @@
 """ML service integration for transaction classification."""
 
 from swen.infrastructure.integration.ml.client import MLServiceClient
+from swen.infrastructure.integration.ml.outbox_dispatcher import (
+    MLOutboxConfig,
+    MLOutboxDispatcher,
+    MLOutboxStats,
+)
 from swen.infrastructure.integration.ml.training_adapter import (
     MLAccountClassifierTrainingAdapter,
 )
 
 __all__ = [
     "MLAccountClassifierTrainingAdapter",
+    "MLOutboxConfig",
+    "MLOutboxDispatcher",
+    "MLOutboxStats",
     "MLServiceClient",
 ]
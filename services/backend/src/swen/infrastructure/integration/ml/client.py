@@ -2,20 +2,25 @@
 
 from __future__ import annotations
 
-import asyncio
 import json
 import logging
-from typing import TYPE_CHECKING, AsyncIterator, Set
+from typing import TYPE_CHECKING, AsyncIterator
 
 import httpx
 from swen_ml_contracts import (
+    MAX_EXAMPLES_PER_BATCH,
+    ClassifyBatchChunk,
     ClassifyBatchRequest,
     ClassifyBatchResponse,
+    ClassifyBatchStreamEnd,
+    ClassifyBatchStreamError,
     EmbedAccountsRequest,
     EmbedAccountsResponse,
     HealthResponse,
     StoreExampleRequest,
     StoreExampleResponse,
+    StoreExamplesBatchRequest,
+    StoreExamplesBatchResponse,
 )
 
 if TYPE_CHECKING:
@@ -25,9 +30,6 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-# Store references to fire-and-forget tasks to prevent garbage collection
-_background_tasks: Set[asyncio.Task] = set()
-
 
 class MLServiceClient:
     """HTTP client wrapper for the ML service API."""
@@ -123,12 +125,13 @@ class MLServiceClient:
         self,
         user_id: UUID,
         transactions: list[TransactionInput],
-    ) -> AsyncIterator[dict]:
-        """Classify batch with SSE streaming for progress updates.
+    ) -> AsyncIterator[ClassifyBatchChunk]:
+        """Classify a batch, yielding results as each pipeline tier finishes.
 
-        Yields dicts with either:
-        - Progress: {"type": "progress", "current": N, "total": M, ...}
-        - Result: {"type": "result", "classifications": [...], ...}
+        Uses the SSE endpoint ``POST /classify/batch/stream``. Every
+        transaction is contained in exactly one chunk. If the service is
+        disabled or fails, the iteration ends early; transactions not yet
+        yielded are then unclassified.
         """
         if not self._enabled:
             return
@@ -139,23 +142,15 @@ class MLServiceClient:
         )
 
         try:
-            # Note: This streaming endpoint doesn't exist yet in ML service
-            # The timeout is set high since classification can take a while
-            async with (
-                httpx.AsyncClient(
-                    base_url=self._base_url,
-                    timeout=httpx.Timeout(timeout=self._timeout, connect=10.0),
-                ) as client,
-                client.stream(
-                    "POST",
-                    "/classify/batch/stream",
-                    content=request.model_dump_json(),
-                    headers={
-                        "Content-Type": "application/json",
-                        "Accept": "text/event-stream",
-                    },
-                ) as response,
-            ):
+            client = await self._get_client()
+            async with client.stream(
+                "POST",
+                "/classify/batch/stream",
+                content=request.model_dump_json(),
+                headers={"Accept": "text/event-stream"},
+                # The read timeout applies per chunk, not to the whole stream
+                timeout=httpx.Timeout(timeout=self._timeout, connect=10.0),
+            ) as response:
                 response.raise_for_status()
 
                 async for line in response.aiter_lines():
@@ -168,13 +163,34 @@ class MLServiceClient:
 
                     try:
                         data = json.loads(data_str)
-                        yield data
                     except json.JSONDecodeError:
                         logger.warning("Invalid SSE data: %s", data_str)
                         continue
 
+                    event_type = data.get("type")
+                    if event_type == "classifications":
+                        yield ClassifyBatchChunk.model_validate(data)
+                    elif event_type == "complete":
+                        end = ClassifyBatchStreamEnd.model_validate(data)
+                        logger.debug(
+                            "ML streaming classification complete in %dms",
+                            end.processing_time_ms,
+                        )
+                        return
+                    elif event_type == "error":
+                        error = ClassifyBatchStreamError.model_validate(data)
+                        logger.warning(
+                            "ML streaming classification failed: %s",
+                            error.detail,
+                        )
+                        return
+
         except Exception as e:
-            logger.warning("ML batch classification streaming failed: %s", e)
+            logger.warning(
+                "ML batch classification streaming failed (%s): %s",
+                type(e).__name__,
+                e,
+            )
 
     # -------------------------------------------------------------------------
     # Example Storage (Learning)
@@ -200,37 +216,35 @@ class MLServiceClient:
             logger.warning("ML store example failed: %s", e)
             return None
 
-    def store_example_fire_and_forget(
+    async def store_examples(
         self,
         user_id: UUID,
-        request: StoreExampleRequest,
-    ) -> None:
-        """Store example without waiting for response (fire-and-forget)."""
-        if not self._enabled:
-            logger.debug("ML service disabled, skipping store_example")
-            return
-
-        logger.debug(
-            "Storing example for user=%s, account=%s (fire-and-forget)",
-            user_id,
-            request.account_number,
-        )
+        requests: list[StoreExampleRequest],
+    ) -> StoreExamplesBatchResponse | None:
+        """Store many posted transactions as training examples.
 
-        async def _store():
-            try:
-                result = await self.store_example(user_id, request)
-                if result:
-                    logger.debug(
-                        "Example stored: user=%s, total=%d",
-                        user_id,
-                        result.total_examples,
-                    )
-            except Exception as e:
-                logger.warning("Fire-and-forget store example failed: %s", e)
-
-        task = asyncio.create_task(_store())
-        _background_tasks.add(task)
-        task.add_done_callback(_background_tasks.discard)
+        Sends one batch request per MAX_EXAMPLES_PER_BATCH examples, one
+        after the other. Returns the response for the last batch.
+        """
+        if not self._enabled or not requests:
+            return None
+        result = None
+        try:
+            client = await self._get_client()
+            for start in range(0, len(requests), MAX_EXAMPLES_PER_BATCH):
+                batch = StoreExamplesBatchRequest(
+                    examples=requests[start : start + MAX_EXAMPLES_PER_BATCH],
+                )
+                response = await client.post(
+                    f"/users/{user_id}/examples:batch",
+                    content=batch.model_dump_json(),
+                )
+                response.raise_for_status()
+                result = StoreExamplesBatchResponse.model_validate(response.json())
+        except Exception as e:
+            logger.warning("ML store examples failed: %s", e)
+            return None
+        return result
 
     # -------------------------------------------------------------------------
     # Account Embeddings (Anchors)
@@ -260,50 +274,18 @@ class MLServiceClient:
             logger.warning("ML embed accounts failed: %s", e)
             return None
 
-    def embed_accounts_fire_and_forget(
-        self,
-        user_id: UUID,
-        accounts: list[AccountOption],
-    ) -> None:
-        """Embed accounts without waiting for response (fire-and-forget)."""
-        if not self._enabled:
-            logger.debug("ML service disabled, skipping embed_accounts")
-            return
-
-        logger.debug(
-            "Embedding %d accounts for user=%s (fire-and-forget)",
-            len(accounts),
-            user_id,
-        )
-
-        async def _embed():
-            try:
-                result = await self.embed_accounts(user_id, accounts)
-                if result:
-                    logger.debug(
-                        "Accounts embedded: user=%s, count=%d",
-                        user_id,
-                        result.embedded,
-                    )
-            except Exception as e:
-                logger.warning("Fire-and-forget embed accounts failed: %s", e)
-
-        task = asyncio.create_task(_embed())
-        _background_tasks.add(task)
-        task.add_done_callback(_background_tasks.discard)
-
     async def delete_account_anchor(
         self,
         user_id: UUID,
         account_id: UUID,
-    ) -> bool:
+    ) -> bool | None:
         """Delete anchor embedding for a specific account.
 
         Called when an account is deactivated or deleted.
-        Returns True if deletion was successful.
+        Returns whether an anchor was deleted, or None if the request failed.
         """
         if not self._enabled:
-            return False
+            return None
         try:
             client = await self._get_client()
             response = await client.delete(
@@ -314,39 +296,7 @@ class MLServiceClient:
             return result.get("deleted", False)
         except Exception as e:
             logger.warning("ML delete account anchor failed: %s", e)
-            return False
-
-    def delete_account_anchor_fire_and_forget(
-        self,
-        user_id: UUID,
-        account_id: UUID,
-    ) -> None:
-        """Delete account anchor without waiting for response (fire-and-forget)."""
-        if not self._enabled:
-            logger.debug("ML service disabled, skipping delete_account_anchor")
-            return
-
-        logger.debug(
-            "Deleting anchor for user=%s, account=%s (fire-and-forget)",
-            user_id,
-            account_id,
-        )
-
-        async def _delete():
-            try:
-                deleted = await self.delete_account_anchor(user_id, account_id)
-                if deleted:
-                    logger.debug(
-                        "Account anchor deleted: user=%s, account=%s",
-                        user_id,
-                        account_id,
-                    )
-            except Exception as e:
-                logger.warning("Fire-and-forget delete account anchor failed: %s", e)
-
-        task = asyncio.create_task(_delete())
-        _background_tasks.add(task)
-        task.add_done_callback(_background_tasks.discard)
+            return None
 
     async def delete_all_anchors(
         self,
@@ -0,0 +1,454 @@
+"""Background delivery of the ML outbox.
+
+``MLAccountClassifierTrainingAdapter`` adds training-data updates to the
+``ml_outbox`` table inside the caller's transaction. ``MLOutboxDispatcher``
+runs as a single task in the API process and delivers them:
+
+- Each round claims up to ``batch_size`` due rows by pushing their due time
+  forward by a lease, so a crashed or concurrent dispatcher cannot send a
+  row twice while it is in flight.
+- Claimed rows are grouped per user. Examples become ``examples:batch``
+  calls, anchor updates one ``accounts/embed`` call; of several updates to
+  the same account only the latest is sent. At most ``max_concurrency``
+  users are delivered at the same time.
+- Delivered rows are deleted, together with any older anchor updates for
+  the same account that are still queued, so an older row retried later
+  cannot overwrite a newer anchor or bring back a deleted one.
+- Failed rows stay, with an exponential backoff capped at
+  ``max_backoff_seconds``, so nothing is lost while the ML service is down.
+  Rows of an unknown kind can never be delivered and are dropped.
+
+``stats()`` reports the queue depth and delivery counters for the admin API.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Optional
+from uuid import UUID
+
+from sqlalchemy import and_, delete, func, or_, select, update
+from swen_ml_contracts import MAX_EXAMPLES_PER_BATCH, AccountOption, StoreExampleRequest
+
+from swen.domain.shared.time import utc_now
+from swen.infrastructure.persistence.sqlalchemy.models.integration.ml_outbox_model import (  # NOQA: E501
+    OUTBOX_DELETE_ANCHOR,
+    OUTBOX_EMBED_ACCOUNT,
+    OUTBOX_STORE_EXAMPLE,
+    MLOutboxModel,
+)
+
+if TYPE_CHECKING:
+    from sqlalchemy import ColumnElement
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from swen.infrastructure.integration.ml.client import MLServiceClient
+
+logger = logging.getLogger(__name__)
+
+_ANCHOR_KINDS = (OUTBOX_EMBED_ACCOUNT, OUTBOX_DELETE_ANCHOR)
+
+
+@dataclass(frozen=True)
+class MLOutboxConfig:
+    """Delivery settings for ``MLOutboxDispatcher``.
+
+    Attributes
+    ----------
+    batch_size
+        Rows claimed per round.
+    max_concurrency
+        Users whose updates are delivered at the same time.
+    poll_seconds
+        Wait between rounds once the queue is drained.
+    lease_seconds
+        How long a claimed row is hidden from other rounds.
+    base_backoff_seconds
+        Delay before the first retry; doubled on every further failure.
+    max_backoff_seconds
+        Upper bound for the retry delay.
+    """
+
+    batch_size: int = 500
+    max_concurrency: int = 4
+    poll_seconds: float = 2.0
+    lease_seconds: float = 120.0
+    base_backoff_seconds: float = 5.0
+    max_backoff_seconds: float = 300.0
+
+    def __post_init__(self) -> None:
+        if self.batch_size < 1 or self.max_concurrency < 1:
+            msg = "batch_size and max_concurrency must be at least 1"
+            raise ValueError(msg)
+
+    def backoff(self, attempts: int) -> timedelta:
+        """Retry delay after the given number of failed attempts."""
+        seconds = self.base_backoff_seconds * 2 ** max(attempts - 1, 0)
+        return timedelta(seconds=min(seconds, self.max_backoff_seconds))
+
+
+@dataclass(frozen=True)
+class MLOutboxStats:
+    """Queue depth and delivery counters of the ML outbox."""
+
+    pending: int
+    due: int
+    retrying: int
+    oldest_pending_seconds: float
+    in_flight: int
+    delivered_total: int
+    failed_total: int
+    last_error: Optional[str]
+
+
+@dataclass(frozen=True)
+class _OutboxItem:
+    id: UUID
+    user_id: UUID
+    kind: str
+    payload: dict[str, Any]
+    attempts: int
+    created_at: datetime
+
+
+@dataclass
+class _CoalescedItems:
+    """One user's claimed rows, grouped by the request that delivers them."""
+
+    examples: list[_OutboxItem] = field(default_factory=list)
+    embeds: list[_OutboxItem] = field(default_factory=list)
+    deletes: list[_OutboxItem] = field(default_factory=list)
+    # Anchor updates made obsolete by a later one for the same account
+    superseded: list[_OutboxItem] = field(default_factory=list)
+    unknown: list[_OutboxItem] = field(default_factory=list)
+
+
+def _coalesce(items: list[_OutboxItem]) -> _CoalescedItems:
+    """Group ``items`` in creation order, keeping the latest anchor update per account.
+
+    Older anchor updates are delivered by sending the latest one.
+    """
+    batch = _CoalescedItems()
+    latest: dict[str, _OutboxItem] = {}
+    for item in sorted(items, key=lambda i: i.created_at):
+        if item.kind == OUTBOX_STORE_EXAMPLE:
+            batch.examples.append(item)
+        elif item.kind in _ANCHOR_KINDS:
+            key = str(item.payload.get("account_id"))
+            if key in latest:
+                batch.superseded.append(latest[key])
+            latest[key] = item
+        else:
+            batch.unknown.append(item)
+
+    for item in latest.values():
+        if item.kind == OUTBOX_EMBED_ACCOUNT:
+            batch.embeds.append(item)
+        else:
+            batch.deletes.append(item)
+    return batch
+
+
+def _older_anchor_updates(
+    delivered: list[_OutboxItem],
+) -> Optional[ColumnElement[bool]]:
+    """Condition matching queued anchor updates older than the delivered ones.
+
+    Returns None if no anchor update was delivered.
+    """
+    newest: dict[tuple[UUID, str], _OutboxItem] = {}
+    for item in delivered:
+        if item.kind not in _ANCHOR_KINDS:
+            continue
+        key = (item.user_id, str(item.payload.get("account_id")))
+        if key not in newest or item.created_at > newest[key].created_at:
+            newest[key] = item
+    if not newest:
+        return None
+
+    return and_(
+        MLOutboxModel.kind.in_(_ANCHOR_KINDS),
+        or_(
+            *(
+                and_(
+                    MLOutboxModel.user_id == user_id,
+                    MLOutboxModel.payload["account_id"].as_string() == account_id,
+                    MLOutboxModel.created_at < item.created_at,
+                )
+                for (user_id, account_id), item in newest.items()
+            ),
+        ),
+    )
+
+
+class MLOutboxDispatcher:
+    """Deliver queued ML training updates in per-user batches."""
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        client: MLServiceClient,
+        config: MLOutboxConfig | None = None,
+    ):
+        self._session_maker = session_maker
+        self._client = client
+        self._config = config or MLOutboxConfig()
+        self._semaphore = asyncio.Semaphore(self._config.max_concurrency)
+        self._stopping = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._in_flight = 0
+        self._delivered_total = 0
+        self._failed_total = 0
+        self._last_error: Optional[str] = None
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start the delivery loop (no-op if ML is disabled or running)."""
+        if self._task is not None or not self._client.enabled:
+            return
+        self._stopping.clear()
+        self._task = asyncio.create_task(self._run(), name="ml-outbox-dispatcher")
+        logger.info("ML outbox dispatcher started")
+
+    async def stop(self) -> None:
+        """Finish the current round and stop. Undelivered rows stay queued."""
+        if self._task is None:
+            return
+        self._stopping.set()
+        await self._task
+        self._task = None
+        logger.info("ML outbox dispatcher stopped")
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                claimed = await self.dispatch_once()
+            except Exception:
+                logger.exception("ML outbox dispatch round failed")
+                claimed = 0
+            # A full round means more rows are probably due: go again
+            if claimed < self._config.batch_size:
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(
+                        self._stopping.wait(),
+                        self._config.poll_seconds,
+                    )
+
+    # -------------------------------------------------------------------------
+    # Delivery
+    # -------------------------------------------------------------------------
+
+    async def dispatch_once(self) -> int:
+        """Claim and deliver one round of due rows. Returns the number claimed."""
+        items = await self._claim()
+        if not items:
+            return 0
+
+        by_user: dict[UUID, list[_OutboxItem]] = defaultdict(list)
+        for item in items:
+            by_user[item.user_id].append(item)
+
+        await asyncio.gather(
+            *(
+                self._deliver_user(user_id, user_items)
+                for user_id, user_items in by_user.items()
+            ),
+        )
+        return len(items)
+
+    async def _claim(self) -> list[_OutboxItem]:
+        now = utc_now()
+        async with self._session_maker() as session:
+            stmt = (
+                select(MLOutboxModel)
+                .where(MLOutboxModel.next_attempt_at <= now)
+                .order_by(MLOutboxModel.next_attempt_at)
+                .limit(self._config.batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            rows = list((await session.execute(stmt)).scalars())
+            items = [
+                _OutboxItem(
+                    id=row.id,
+                    user_id=row.user_id,
+                    kind=row.kind,
+                    payload=row.payload,
+                    attempts=row.attempts,
+                    created_at=row.created_at,
+                )
+                for row in rows
+            ]
+            if items:
+                await session.execute(
+                    update(MLOutboxModel)
+                    .where(MLOutboxModel.id.in_([item.id for item in items]))
+                    .values(
+                        next_attempt_at=now
+                        + timedelta(seconds=self._config.lease_seconds),
+                    ),
+                )
+            await session.commit()
+        return items
+
+    async def _deliver_user(self, user_id: UUID, items: list[_OutboxItem]) -> None:
+        async with self._semaphore:
+            self._in_flight += len(items)
+            try:
+                delivered, failed, dropped = await self._send(user_id, items)
+                await self._settle(delivered, failed, dropped)
+            finally:
+                self._in_flight -= len(items)
+
+    async def _send(
+        self,
+        user_id: UUID,
+        items: list[_OutboxItem],
+    ) -> tuple[
+        list[_OutboxItem],
+        list[tuple[_OutboxItem, str]],
+        list[tuple[_OutboxItem, str]],
+    ]:
+        """Send one user's rows. Returns the delivered, failed and dropped rows."""
+        batch = _coalesce(items)
+        delivered = list(batch.superseded)
+        failed: list[tuple[_OutboxItem, str]] = []
+        dropped = [
+            (item, f"Unknown outbox item kind: {item.kind}") for item in batch.unknown
+        ]
+
+        def record(sent: list[_OutboxItem], error: Optional[str]) -> None:
+            if error is None:
+                delivered.extend(sent)
+            else:
+                failed.extend((item, error) for item in sent)
+
+        if batch.embeds:
+            record(batch.embeds, await self._embed(user_id, batch.embeds))
+        for item in batch.deletes:
+            record([item], await self._delete_anchor(user_id, item))
+        for start in range(0, len(batch.examples), MAX_EXAMPLES_PER_BATCH):
+            chunk = batch.examples[start : start + MAX_EXAMPLES_PER_BATCH]
+            record(chunk, await self._store_examples(user_id, chunk))
+
+        return delivered, failed, dropped
+
+    async def _embed(self, user_id: UUID, items: list[_OutboxItem]) -> Optional[str]:
+        try:
+            accounts = [AccountOption.model_validate(i.payload) for i in items]
+        except ValueError as e:
+            return f"Invalid embed_account payload: {e}"
+        result = await self._client.embed_accounts(user_id, accounts)
+        return None if result is not None else "embed_accounts request failed"
+
+    async def _delete_anchor(self, user_id: UUID, item: _OutboxItem) -> Optional[str]:
+        try:
+            account_id = UUID(str(item.payload["account_id"]))
+        except (KeyError, ValueError) as e:
+            return f"Invalid delete_anchor payload: {e}"
+        result = await self._client.delete_account_anchor(user_id, account_id)
+        return None if result is not None else "delete_account_anchor request failed"
+
+    async def _store_examples(
+        self,
+        user_id: UUID,
+        items: list[_OutboxItem],
+    ) -> Optional[str]:
+        try:
+            requests = [StoreExampleRequest.model_validate(i.payload) for i in items]
+        except ValueError as e:
+            return f"Invalid store_example payload: {e}"
+        result = await self._client.store_examples(user_id, requests)
+        return None if result is not None else "store_examples request failed"
+
+    async def _settle(
+        self,
+        delivered: list[_OutboxItem],
+        failed: list[tuple[_OutboxItem, str]],
+        dropped: list[tuple[_OutboxItem, str]],
+    ) -> None:
+        now = utc_now()
+        # Rows with the same attempt count and error share one UPDATE
+        retries: dict[tuple[int, str], list[UUID]] = defaultdict(list)
+        for item, error in failed:
+            retries[(item.attempts + 1, error)].append(item.id)
+
+        finished = [*delivered, *(item for item, _ in dropped)]
+        superseded = _older_anchor_updates(delivered)
+
+        async with self._session_maker() as session:
+            if finished:
+                await session.execute(
+                    delete(MLOutboxModel).where(
+                        MLOutboxModel.id.in_([item.id for item in finished]),
+                    ),
+                )
+            if superseded is not None:
+                await session.execute(delete(MLOutboxModel).where(superseded))
+            for (attempts, error), ids in retries.items():
+                await session.execute(
+                    update(MLOutboxModel)
+                    .where(MLOutboxModel.id.in_(ids))
+                    .values(
+                        attempts=attempts,
+                        next_attempt_at=now + self._config.backoff(attempts),
+                        last_error=error,
+                    ),
+                )
+            await session.commit()
+
+        self._delivered_total += len(delivered)
+        self._failed_total += len(failed)
+        for item, error in dropped:
+            logger.error("ML outbox: dropping item %s (%s)", item.id, error)
+        if failed:
+            self._last_error = failed[-1][1]
+            logger.warning(
+                "ML outbox: %d item(s) failed and will be retried (%s)",
+                len(failed),
+                self._last_error,
+            )
+
+    # -------------------------------------------------------------------------
+    # Metrics
+    # -------------------------------------------------------------------------
+
+    async def stats(self) -> MLOutboxStats:
+        """Current queue depth (from the table) and this process's counters."""
+        now = utc_now()
+        async with self._session_maker() as session:
+            row = (
+                await session.execute(
+                    select(
+                        func.count(),
+                        func.count().filter(MLOutboxModel.next_attempt_at <= now),
+                        func.count().filter(MLOutboxModel.attempts > 0),
+                        func.min(MLOutboxModel.created_at),
+                    ).select_from(MLOutboxModel),
+                )
+            ).one()
+
+        pending, due, retrying, oldest = row
+        oldest_seconds = 0.0
+        if oldest is not None:
+            if oldest.tzinfo is None:
+                oldest = oldest.replace(tzinfo=timezone.utc)
+            oldest_seconds = max((now - oldest).total_seconds(), 0.0)
+
+        return MLOutboxStats(
+            pending=pending or 0,
+            due=due or 0,
+            retrying=retrying or 0,
+            oldest_pending_seconds=oldest_seconds,
+            in_flight=self._in_flight,
+            delivered_total=self._delivered_total,
+            failed_total=self._failed_total,
+            last_error=self._last_error,
+        )
@@ -2,6 +2,10 @@
 
 Handles example submission and account embeddings. Classification is
 handled separately by ``MLCounterAccountAdapter``.
+
+Fire-and-forget updates are not sent directly: they are added to the
+``ml_outbox`` table on the request's session, so they commit or roll back
+with the change that produced them. ``MLOutboxDispatcher`` delivers them.
 """
 
 from __future__ import annotations
@@ -16,10 +20,18 @@ from swen.application.ports.account_classifier_training import (
     AccountForClassification,
     TransactionExample,
 )
+from swen.infrastructure.persistence.sqlalchemy.models.integration.ml_outbox_model import (  # NOQA: E501
+    OUTBOX_DELETE_ANCHOR,
+    OUTBOX_EMBED_ACCOUNT,
+    OUTBOX_STORE_EXAMPLE,
+    MLOutboxModel,
+)
 
 if TYPE_CHECKING:
     from uuid import UUID
 
+    from sqlalchemy.ext.asyncio import AsyncSession
+
     from swen.infrastructure.integration.ml.client import MLServiceClient
 
 logger = logging.getLogger(__name__)
@@ -28,11 +40,13 @@ logger = logging.getLogger(__name__)
 class MLAccountClassifierTrainingAdapter(AccountClassifierTrainingPort):
     """Infrastructure adapter that implements AccountClassifierTrainingPort.
 
-    Translates domain objects to ML contracts and delegates to the HTTP client.
-    Covers example submission and account embeddings only.
+    Translates domain objects to ML contracts. Fire-and-forget updates go
+    to the outbox on ``session``; ``embed_accounts`` calls the client
+    directly because its caller waits for the result.
     """
 
-    def __init__(self, client: MLServiceClient):
+    def __init__(self, session: AsyncSession, client: MLServiceClient):
+        self._session = session
         self._client = client
 
     @property
@@ -40,27 +54,39 @@ class MLAccountClassifierTrainingAdapter(AccountClassifierTrainingPort):
         return self._client.enabled
 
     def submit_example(self, example: TransactionExample) -> None:
-        """Submit a posted transaction as a training example (fire-and-forget)."""
+        """Queue a posted transaction as a training example."""
+        self.submit_examples([example])
+
+    def submit_examples(self, examples: list[TransactionExample]) -> None:
+        """Queue training examples; the dispatcher batches them per user."""
         if not self._client.enabled:
             return
 
-        request = StoreExampleRequest(
-            transaction_id=example.transaction_id,
-            counterparty_name=example.counterparty_name,
-            counterparty_iban=example.counterparty_iban,
-            purpose=example.purpose,
-            amount=example.amount,
-            account_id=example.account_id,
-            account_number=example.account_number,
-            account_type=example.account_type,
-        )
-
-        self._client.store_example_fire_and_forget(example.user_id, request)
-        logger.debug(
-            "Submitted ML example: txn=%s -> account=%s",
-            example.transaction_id,
-            example.account_number,
-        )
+        for example in examples:
+            # The contract requires a purpose; reject here rather than let a
+            # row fail on every delivery attempt
+            if not example.purpose:
+                logger.debug(
+                    "Skipping ML example without purpose: txn=%s",
+                    example.transaction_id,
+                )
+                continue
+            request = StoreExampleRequest(
+                transaction_id=example.transaction_id,
+                counterparty_name=example.counterparty_name,
+                counterparty_iban=example.counterparty_iban,
+                purpose=example.purpose,
+                amount=example.amount,
+                account_id=example.account_id,
+                account_number=example.account_number,
+                account_type=example.account_type,
+            )
+            self._enqueue(example.user_id, OUTBOX_STORE_EXAMPLE, request)
+            logger.debug(
+                "Queued ML example: txn=%s -> account=%s",
+                example.transaction_id,
+                example.account_number,
+            )
 
     async def embed_accounts(
         self,
@@ -81,21 +107,39 @@ class MLAccountClassifierTrainingAdapter(AccountClassifierTrainingPort):
         user_id: UUID,
         accounts: list[AccountForClassification],
     ) -> None:
-        """Compute and store anchor embeddings for accounts (fire-and-forget)."""
+        """Queue anchor embeddings for accounts."""
         if not self._client.enabled:
             return
 
-        ml_accounts = [AccountOption.model_validate(acc) for acc in accounts]
-
-        self._client.embed_accounts_fire_and_forget(user_id, ml_accounts)
+        for account in accounts:
+            self._enqueue(
+                user_id,
+                OUTBOX_EMBED_ACCOUNT,
+                AccountOption.model_validate(account),
+            )
 
     def delete_account_anchor_fire_and_forget(
         self,
         user_id: UUID,
         account_id: UUID,
     ) -> None:
-        """Delete the anchor embedding for an account (fire-and-forget)."""
+        """Queue deletion of the anchor embedding for an account."""
         if not self._client.enabled:
             return
 
-        self._client.delete_account_anchor_fire_and_forget(user_id, account_id)
+        self._session.add(
+            MLOutboxModel(
+                user_id=user_id,
+                kind=OUTBOX_DELETE_ANCHOR,
+                payload={"account_id": str(account_id)},
+            ),
+        )
+
+    def _enqueue(self, user_id: UUID, kind: str, request) -> None:
+        self._session.add(
+            MLOutboxModel(
+                user_id=user_id,
+                kind=kind,
+                payload=request.model_dump(mode="json"),
+            ),
+        )
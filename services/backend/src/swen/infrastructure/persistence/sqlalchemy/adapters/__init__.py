@@ -2,9 +2,14 @@
 
 from swen.infrastructure.persistence.sqlalchemy.adapters.analytics import (
     SqlAlchemyAnalyticsReadAdapter,
+    SqlAlchemyDashboardReadAdapter,
 )
 from swen.infrastructure.persistence.sqlalchemy.adapters.system import (
     SqlAlchemyDatabaseIntegrityAdapter,
 )
 
-__all__ = ["SqlAlchemyAnalyticsReadAdapter", "SqlAlchemyDatabaseIntegrityAdapter"]
+__all__ = [
+    "SqlAlchemyAnalyticsReadAdapter",
+    "SqlAlchemyDashboardReadAdapter",
+    "SqlAlchemyDatabaseIntegrityAdapter",
+]
@@ -6,5 +6,8 @@ These are infrastructure implementations of application-layer analytics ports.
 from swen.infrastructure.persistence.sqlalchemy.adapters.analytics.sqlalchemy_analytics_read_adapter import (  # NOQA: E501
     SqlAlchemyAnalyticsReadAdapter,
 )
+from swen.infrastructure.persistence.sqlalchemy.adapters.analytics.sqlalchemy_dashboard_read_adapter import (  # NOQA: E501
+    SqlAlchemyDashboardReadAdapter,
+)
 
-__all__ = ["SqlAlchemyAnalyticsReadAdapter"]
+__all__ = ["SqlAlchemyAnalyticsReadAdapter", "SqlAlchemyDashboardReadAdapter"]
@@ -1,13 +1,14 @@
 """SQLAlchemy implementation of AnalyticsReadPort.
 
-We intentionally avoid DB-specific "group by month" functions here (strftime/to_char)
-and instead fetch only the necessary entry rows and aggregate in Python. This:
-- avoids loading full Transaction aggregates (better than find_all())
-- keeps the port stable for future DB backends
-- keeps this adapter implementation portable across SQLite/Postgres today
-
-If/when scale grows, we can replace the Python aggregation with true SQL GROUP BY
-per backend, or switch to rollup tables without changing the port.
+Aggregation happens in the database: every query groups journal entries by
+month (and category or account where needed), so only months x categories rows
+come back regardless of ledger size. Python only fills empty months, runs
+cumulative balances over the grouped rows and computes percentages. Balance
+series (net worth, balance history) read the ``monthly_account_balances``
+rollup instead of journal entries.
+
+Month bucketing is the one DB-specific expression: ``to_char`` on PostgreSQL
+and ``strftime`` on SQLite, both producing ``YYYY-MM`` keys.
 """
 
 from __future__ import annotations
@@ -19,7 +20,7 @@ from decimal import Decimal
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import case, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from swen.application.analytics.dtos import (
@@ -37,16 +38,22 @@ from swen.application.analytics.dtos import (
 )
 from swen.application.ports.analytics import AnalyticsReadPort
 from swen.domain.accounting.entities import AccountType
-from swen.domain.shared.time import ensure_tz_aware, utc_now
+from swen.domain.shared.time import utc_now
 from swen.infrastructure.persistence.sqlalchemy.models.accounting.account_model import (
     AccountModel,
 )
 from swen.infrastructure.persistence.sqlalchemy.models.accounting.journal_entry_model import (  # NOQA: E501
     JournalEntryModel,
 )
+from swen.infrastructure.persistence.sqlalchemy.models.accounting.monthly_account_balance_model import (  # NOQA: E501
+    MonthlyAccountBalanceModel,
+)
 from swen.infrastructure.persistence.sqlalchemy.models.accounting.transaction_model import (  # NOQA: E501
     TransactionModel,
 )
+from swen.infrastructure.persistence.sqlalchemy.models.monthly_balances import (
+    month_key_expression,
+)
 
 if TYPE_CHECKING:
     from swen.domain.shared.current_user import CurrentUser
@@ -70,6 +77,10 @@ def _next_month(dt: datetime) -> datetime:
     return datetime(dt.year, dt.month + 1, 1, tzinfo=dt.tzinfo)
 
 
+# Bucket for rows dated before the requested range (running balances only)
+_OPENING_BUCKET = ""
+
+
 class SqlAlchemyAnalyticsReadAdapter(AnalyticsReadPort):
     """SQLAlchemy analytics read adapter."""
 
@@ -87,13 +98,14 @@ class SqlAlchemyAnalyticsReadAdapter(AnalyticsReadPort):
         start_date, end_date = self._calculate_date_range(months, end_month)
         end_exclusive = _next_month(end_date)
 
+        month = self._month_key(TransactionModel.date)
         stmt = (
             select(
-                TransactionModel.date,
+                month,
                 AccountModel.name,
-                AccountModel.id,
-                JournalEntryModel.debit_amount,
+                func.sum(JournalEntryModel.debit_amount),
             )
+            .select_from(TransactionModel)
             .join(
                 JournalEntryModel,
                 JournalEntryModel.transaction_id == TransactionModel.id,
@@ -107,6 +119,7 @@ class SqlAlchemyAnalyticsReadAdapter(AnalyticsReadPort):
                 TransactionModel.date < end_exclusive,
                 JournalEntryModel.debit_amount > 0,
             )
+            .group_by("month_key", AccountModel.name)
         )
         if not include_drafts:
             stmt = stmt.where(TransactionModel.is_posted.is_(True))
@@ -119,11 +132,9 @@ class SqlAlchemyAnalyticsReadAdapter(AnalyticsReadPort):
         totals_by_category: dict[str, Decimal] = defaultdict(Decimal)
         all_categories: set[str] = set()
 
-        for txn_date_, category_name, _, debit_amount in rows:
-            txn_date = ensure_tz_aware(txn_date_)
-            month_key = _get_month_key(txn_date.year, txn_date.month)
-            monthly_spending[month_key][category_name] += Decimal(debit_amount)
-            totals_by_category[category_name] += Decimal(debit_amount)
+        for month_key, category_name, debit_sum in rows:
+            monthly_spending[month_key][category_name] += Decimal(debit_sum)
+            totals_by_category[category_name] += Decimal(debit_sum)
             all_categories.add(category_name)
 
         # Build data points for each month in range
@@ -168,11 +179,13 @@ class SqlAlchemyAnalyticsReadAdapter(AnalyticsReadPort):
         end_exclusive = _next_month(end_date)
 
         # Query for specific account only
+        month = self._month_key(TransactionModel.date)
         stmt = (
             select(
-                TransactionModel.date,
-                JournalEntryModel.debit_amount,
+                month,
+                func.sum(JournalEntryModel.debit_amount),
             )
+            .select_from(TransactionModel)
             .join(
                 JournalEntryModel,
                 JournalEntryModel.transaction_id == TransactionModel.id,
@@ -187,18 +200,13 @@ class SqlAlchemyAnalyticsReadAdapter(AnalyticsReadPort):
                 TransactionModel.date < end_exclusive,
                 JournalEntryModel.debit_amount > 0,
             )
+            .group_by("month_key")
         )
         if not include_drafts:
             stmt = stmt.where(TransactionModel.is_posted.is_(True))
 
         rows = (await self._session.execute(stmt)).all()
-
-        # Aggregate by month
-        monthly_spending: dict[str, Decimal] = defaultdict(Decimal)
-        for txn_date_, debit_amount in rows:
-            txn_date = ensure_tz_aware(txn_date_)
-            month_key = _get_month_key(txn_date.year, txn_date.month)
-            monthly_spending[month_key] += Decimal(debit_amount)
+        monthly_spending = {month_key: Decimal(total) for month_key, total in rows}
 
         # Build data points for each month in range
         data_points: list[TimeSeriesDataPointDTO] = []
@@ -233,7 +241,7 @@ class SqlAlchemyAnalyticsReadAdapter(AnalyticsReadPort):
             select(
                 AccountModel.name,
                 AccountModel.id,
-                JournalEntryModel.debit_amount,
+                func.sum(JournalEntryModel.debit_amount),
             )
             .join(JournalEntryModel, JournalEntryModel.account_id == AccountModel.id)
             .join(
@@ -248,6 +256,7 @@ class SqlAlchemyAnalyticsReadAdapter(AnalyticsReadPort):
                 TransactionModel.date < end_date,
                 JournalEntryModel.debit_amount > 0,
             )
+            .group_by(AccountModel.name, AccountModel.id)
         )
         if not include_drafts:
             stmt = stmt.where(TransactionModel.is_posted.is_(True))
@@ -256,8 +265,8 @@ class SqlAlchemyAnalyticsReadAdapter(AnalyticsReadPort):
 
         spending_by_category: dict[str, Decimal] = defaultdict(Decimal)
         account_ids: dict[str, str] = {}
-        for category_name, account_id, debit_amount in rows:
-            spending_by_category[category_name] += Decimal(debit_amount)
+        for category_name, account_id, debit_sum in rows:
+            spending_by_category[category_name] += Decimal(debit_sum)
             account_ids[category_name] = str(account_id)
 
         total = sum(spending_by_category.values(), Decimal("0"))
@@ -296,11 +305,13 @@ class SqlAlchemyAnalyticsReadAdapter(AnalyticsReadPort):
         start_date, end_date = self._calculate_date_range(months, end_month)
         end_exclusive = _next_month(end_date)
 
+        month = self._month_key(TransactionModel.date)
         stmt = (
             select(
-                TransactionModel.date,
-                JournalEntryModel.credit_amount,
+                month,
+                func.sum(JournalEntryModel.credit_amount),
             )
+            .select_from(TransactionModel)
             .join(
                 JournalEntryModel,
                 JournalEntryModel.transaction_id == TransactionModel.id,
@@ -314,17 +325,13 @@ class SqlAlchemyAnalyticsReadAdapter(AnalyticsReadPort):
                 TransactionModel.date < end_exclusive,
                 JournalEntryModel.credit_amount > 0,
             )
+            .group_by("month_key")
         )
         if not include_drafts:
             stmt = stmt.where(TransactionModel.is_posted.is_(True))
 
         rows = (await self._session.execute(stmt)).all()
-
-        monthly_income: dict[str, Decimal] = defaultdict(Decimal)
-        for txn_date_, credit_amount in rows:
-            txn_date = ensure_tz_aware(txn_date_)
-            month_key = _get_month_key(txn_date.year, txn_date.month)
-            monthly_income[month_key] += Decimal(credit_amount)
+        monthly_income = {month_key: Decimal(total) for month_key, total in rows}
 
         data_points: list[TimeSeriesDataPointDTO] = []
         current = start_date
@@ -358,7 +365,7 @@ class SqlAlchemyAnalyticsReadAdapter(AnalyticsReadPort):
             select(
                 AccountModel.name,
                 AccountModel.id,
-                JournalEntryModel.credit_amount,
+                func.sum(JournalEntryModel.credit_amount),
             )
             .join(JournalEntryModel, JournalEntryModel.account_id == AccountModel.id)
             .join(
@@ -373,6 +380,7 @@ class SqlAlchemyAnalyticsReadAdapter(AnalyticsReadPort):
                 TransactionModel.date < end_date,
                 JournalEntryModel.credit_amount > 0,
             )
+            .group_by(AccountModel.name, AccountModel.id)
         )
         if not include_drafts:
             stmt = stmt.where(TransactionModel.is_posted.is_(True))
@@ -381,8 +389,8 @@ class SqlAlchemyAnalyticsReadAdapter(AnalyticsReadPort):
 
         income_by_source: dict[str, Decimal] = defaultdict(Decimal)
         account_ids: dict[str, str] = {}
-        for source_name, account_id, credit_amount in rows:
-            income_by_source[source_name] += Decimal(credit_amount)
+        for source_name, account_id, credit_sum in rows:
+            income_by_source[source_name] += Decimal(credit_sum)
             account_ids[source_name] = str(account_id)
 
         total = sum(income_by_source.values(), Decimal("0"))
@@ -420,45 +428,11 @@ class SqlAlchemyAnalyticsReadAdapter(AnalyticsReadPort):
         start_date, end_date = self._calculate_date_range(months, end_month)
         end_exclusive = _next_month(end_date)
 
-        stmt = (
-            select(
-                TransactionModel.date,
-                AccountModel.account_type,
-                JournalEntryModel.debit_amount,
-                JournalEntryModel.credit_amount,
-            )
-            .join(
-                JournalEntryModel,
-                JournalEntryModel.transaction_id == TransactionModel.id,
-            )
-            .join(AccountModel, AccountModel.id == JournalEntryModel.account_id)
-            .where(
-                TransactionModel.user_id == self._user_id,
-                AccountModel.user_id == self._user_id,
-                TransactionModel.date >= start_date,
-                TransactionModel.date < end_exclusive,
-                AccountModel.account_type.in_(
-                    [AccountType.INCOME.value, AccountType.EXPENSE.value],
-                ),
-            )
+        monthly_income, monthly_expenses = await self._query_monthly_income_expenses(
+            start_date,
+            end_exclusive,
+            include_drafts,
         )
-        if not include_drafts:
-            stmt = stmt.where(TransactionModel.is_posted.is_(True))
-
-        rows = (await self._session.execute(stmt)).all()
-
-        monthly_income: dict[str, Decimal] = defaultdict(Decimal)
-        monthly_expenses: dict[str, Decimal] = defaultdict(Decimal)
-        for txn_date_, account_type, debit_amount, credit_amount in rows:
-            txn_date = ensure_tz_aware(txn_date_)
-            month_key = _get_month_key(txn_date.year, txn_date.month)
-
-            if account_type == AccountType.INCOME.value and Decimal(credit_amount) > 0:
-                monthly_income[month_key] += Decimal(credit_amount)
-            elif (
-                account_type == AccountType.EXPENSE.value and Decimal(debit_amount) > 0
-            ):
-                monthly_expenses[month_key] += Decimal(debit_amount)
 
         data_points: list[TimeSeriesDataPointDTO] = []
         current = start_date
@@ -488,45 +462,11 @@ class SqlAlchemyAnalyticsReadAdapter(AnalyticsReadPort):
         start_date, end_date = self._calculate_date_range(months, end_month)
         end_exclusive = _next_month(end_date)
 
-        stmt = (
-            select(
-                TransactionModel.date,
-                AccountModel.account_type,
-                JournalEntryModel.debit_amount,
-                JournalEntryModel.credit_amount,
-            )
-            .join(
-                JournalEntryModel,
-                JournalEntryModel.transaction_id == TransactionModel.id,
-            )
-            .join(AccountModel, AccountModel.id == JournalEntryModel.account_id)
-            .where(
-                TransactionModel.user_id == self._user_id,
-                AccountModel.user_id == self._user_id,
-                TransactionModel.date >= start_date,
-                TransactionModel.date < end_exclusive,
-                AccountModel.account_type.in_(
-                    [AccountType.INCOME.value, AccountType.EXPENSE.value],
-                ),
-            )
+        monthly_income, monthly_expenses = await self._query_monthly_income_expenses(
+            start_date,
+            end_exclusive,
+            include_drafts,
         )
-        if not include_drafts:
-            stmt = stmt.where(TransactionModel.is_posted.is_(True))
-
-        rows = (await self._session.execute(stmt)).all()
-
-        monthly_income: dict[str, Decimal] = defaultdict(Decimal)
-        monthly_expenses: dict[str, Decimal] = defaultdict(Decimal)
-        for txn_date_, account_type, debit_amount, credit_amount in rows:
-            txn_date = ensure_tz_aware(txn_date_)
-            month_key = _get_month_key(txn_date.year, txn_date.month)
-
-            if account_type == AccountType.INCOME.value and Decimal(credit_amount) > 0:
-                monthly_income[month_key] += Decimal(credit_amount)
-            elif (
-                account_type == AccountType.EXPENSE.value and Decimal(debit_amount) > 0
-            ):
-                monthly_expenses[month_key] += Decimal(debit_amount)
 
         data_points: list[TimeSeriesDataPointDTO] = []
         current = start_date
@@ -580,16 +520,15 @@ class SqlAlchemyAnalyticsReadAdapter(AnalyticsReadPort):
         start_date, end_date = self._calculate_date_range(months, end_month)
         end_exclusive = _next_month(end_date)
 
-        asset_ids, liability_ids = await self._load_balance_sheet_accounts()
-        entry_rows = await self._query_balance_sheet_entries(
+        delta_rows = await self._query_monthly_balance_deltas(
+            [AccountType.ASSET.value, AccountType.LIABILITY.value],
+            start_date,
             end_exclusive,
             include_drafts,
         )
 
         data_points = self._calculate_net_worth_series(
-            entry_rows,
-            asset_ids,
-            liability_ids,
+            delta_rows,
             start_date,
             end_date,
         )
@@ -648,44 +587,26 @@ class SqlAlchemyAnalyticsReadAdapter(AnalyticsReadPort):
             f"{month_name[now.month]} {now.year}",
         )
 
-    async def _load_balance_sheet_accounts(self) -> tuple[list[str], list[str]]:
-        account_rows = (
-            await self._session.execute(
-                select(
-                    AccountModel.id,
-                    AccountModel.account_type,
-                ).where(
-                    AccountModel.user_id == self._user_id,
-                    AccountModel.account_type.in_(
-                        [AccountType.ASSET.value, AccountType.LIABILITY.value],
-                    ),
-                ),
-            )
-        ).all()
-
-        asset_ids: list[str] = []
-        liability_ids: list[str] = []
-        for acc_id, acc_type in account_rows:
-            if acc_type == AccountType.ASSET.value:
-                asset_ids.append(str(acc_id))
-            elif acc_type == AccountType.LIABILITY.value:
-                liability_ids.append(str(acc_id))
-
-        return asset_ids, liability_ids
+    def _month_key(self, column):
+        """SQL expression bucketing a timestamp column into a ``YYYY-MM`` key."""
+        return month_key_expression(column, self._session.get_bind().dialect.name)
 
-    async def _query_balance_sheet_entries(
+    async def _query_monthly_income_expenses(
         self,
+        start_date: datetime,
         end_exclusive: datetime,
         include_drafts: bool,
-    ) -> list[tuple]:
+    ) -> tuple[dict[str, Decimal], dict[str, Decimal]]:
+        """Sum income credits and expense debits per month."""
+        month = self._month_key(TransactionModel.date)
         stmt = (
             select(
-                TransactionModel.date,
-                AccountModel.id,
+                month,
                 AccountModel.account_type,
-                JournalEntryModel.debit_amount,
-                JournalEntryModel.credit_amount,
+                func.sum(JournalEntryModel.debit_amount),
+                func.sum(JournalEntryModel.credit_amount),
             )
+            .select_from(TransactionModel)
             .join(
                 JournalEntryModel,
                 JournalEntryModel.transaction_id == TransactionModel.id,
@@ -694,58 +615,90 @@ class SqlAlchemyAnalyticsReadAdapter(AnalyticsReadPort):
             .where(
                 TransactionModel.user_id == self._user_id,
                 AccountModel.user_id == self._user_id,
+                TransactionModel.date >= start_date,
+                TransactionModel.date < end_exclusive,
                 AccountModel.account_type.in_(
-                    [AccountType.ASSET.value, AccountType.LIABILITY.value],
+                    [AccountType.INCOME.value, AccountType.EXPENSE.value],
                 ),
-                TransactionModel.date < end_exclusive,
             )
+            .group_by("month_key", AccountModel.account_type)
         )
         if not include_drafts:
             stmt = stmt.where(TransactionModel.is_posted.is_(True))
 
-        entry_rows = (await self._session.execute(stmt)).all()
+        rows = (await self._session.execute(stmt)).all()
 
-        # Normalize and sort by date
-        normalized = [
-            (ensure_tz_aware(txn_date), acc_id, acc_type, debit_amount, credit_amount)
-            for txn_date, acc_id, acc_type, debit_amount, credit_amount in entry_rows
-        ]
-        return sorted(normalized, key=lambda r: r[0])
+        monthly_income: dict[str, Decimal] = defaultdict(Decimal)
+        monthly_expenses: dict[str, Decimal] = defaultdict(Decimal)
+        for month_key, account_type, debit_sum, credit_sum in rows:
+            if account_type == AccountType.INCOME.value:
+                monthly_income[month_key] += Decimal(credit_sum)
+            elif account_type == AccountType.EXPENSE.value:
+                monthly_expenses[month_key] += Decimal(debit_sum)
+
+        return monthly_income, monthly_expenses
+
+    async def _query_monthly_balance_deltas(
+        self,
+        account_types: list[str],
+        start_date: datetime,
+        end_exclusive: datetime,
+        include_drafts: bool,
+    ) -> list[tuple]:
+        """Sum debit - credit per account and month from the balance rollup.
+
+        Every month before ``start_date`` collapses into a single
+        ``_OPENING_BUCKET`` row per account, so the result stays at
+        months x accounts rows however long the history is.
+        """
+        rollup = MonthlyAccountBalanceModel
+        start_key = _get_month_key(start_date.year, start_date.month)
+        end_key = _get_month_key(end_exclusive.year, end_exclusive.month)
+
+        delta = rollup.posted_debit - rollup.posted_credit
+        if include_drafts:
+            delta = delta + rollup.draft_debit - rollup.draft_credit
+
+        bucket = case(
+            (rollup.month < start_key, _OPENING_BUCKET),
+            else_=rollup.month,
+        ).label("bucket")
+        stmt = (
+            select(bucket, rollup.account_id, func.sum(delta))
+            .join(AccountModel, AccountModel.id == rollup.account_id)
+            .where(
+                rollup.user_id == self._user_id,
+                AccountModel.user_id == self._user_id,
+                AccountModel.account_type.in_(account_types),
+                rollup.month < end_key,
+            )
+            .group_by("bucket", rollup.account_id)
+        )
+
+        return list((await self._session.execute(stmt)).all())
 
     def _calculate_net_worth_series(
         self,
-        entry_rows: list[tuple],
-        asset_ids: list[str],
-        liability_ids: list[str],
+        delta_rows: list[tuple],
         start_date: datetime,
         end_date: datetime,
     ) -> list[TimeSeriesDataPointDTO]:
-        balances_by_id: dict[str, Decimal] = defaultdict(Decimal)
+        # Assets are debit-normal and liabilities credit-normal, so
+        # assets - liabilities is the plain sum of debit - credit over both.
+        deltas_by_month: dict[str, Decimal] = defaultdict(Decimal)
+        for bucket, _acc_id, delta in delta_rows:
+            deltas_by_month[bucket] += Decimal(delta)
+
+        net_worth = deltas_by_month.get(_OPENING_BUCKET, Decimal("0"))
         data_points: list[TimeSeriesDataPointDTO] = []
-        idx = 0
         current = start_date
 
         while current <= end_date:
-            as_of = _next_month(current)
-
-            # Accumulate entries up to this month
-            while idx < len(entry_rows) and entry_rows[idx][0] < as_of:
-                _, acc_id, acc_type, debit_amount, credit_amount = entry_rows[idx]
-                balances_by_id[str(acc_id)] += self._apply_balance_delta(
-                    acc_type,
-                    Decimal(debit_amount),
-                    Decimal(credit_amount),
-                )
-                idx += 1
-
-            net_worth = self._compute_net_worth(
-                balances_by_id,
-                asset_ids,
-                liability_ids,
-            )
+            month_key = _get_month_key(current.year, current.month)
+            net_worth += deltas_by_month.get(month_key, Decimal("0"))
             data_points.append(
                 TimeSeriesDataPointDTO(
-                    period=_get_month_key(current.year, current.month),
+                    period=month_key,
                     period_label=_get_month_label(current.year, current.month),
                     value=net_worth,
                 ),
@@ -754,29 +707,6 @@ class SqlAlchemyAnalyticsReadAdapter(AnalyticsReadPort):
 
         return data_points
 
-    def _apply_balance_delta(
-        self,
-        acc_type: str,
-        debit: Decimal,
-        credit: Decimal,
-    ) -> Decimal:
-        if acc_type == AccountType.ASSET.value:
-            return debit - credit
-        return credit - debit  # credit-normal
-
-    def _compute_net_worth(
-        self,
-        balances_by_id: dict[str, Decimal],
-        asset_ids: list[str],
-        liability_ids: list[str],
-    ) -> Decimal:
-        total_assets = sum((balances_by_id[i] for i in asset_ids), Decimal("0"))
-        total_liabilities = sum(
-            (balances_by_id[i] for i in liability_ids),
-            Decimal("0"),
-        )
-        return total_assets - total_liabilities
-
     def _build_time_series_result(
         self,
         data_points: list[TimeSeriesDataPointDTO],
@@ -823,56 +753,30 @@ class SqlAlchemyAnalyticsReadAdapter(AnalyticsReadPort):
         asset_ids = [str(acc_id) for acc_id, _name in account_rows]
         asset_name_by_id = {str(acc_id): name for acc_id, name in account_rows}
 
-        # Fetch all relevant asset entries up to end_exclusive (no lower bound)
-        stmt = (
-            select(
-                TransactionModel.date,
-                AccountModel.id,
-                JournalEntryModel.debit_amount,
-                JournalEntryModel.credit_amount,
-            )
-            .join(
-                JournalEntryModel,
-                JournalEntryModel.transaction_id == TransactionModel.id,
-            )
-            .join(AccountModel, AccountModel.id == JournalEntryModel.account_id)
-            .where(
-                TransactionModel.user_id == self._user_id,
-                AccountModel.user_id == self._user_id,
-                AccountModel.account_type == AccountType.ASSET.value,
-                TransactionModel.date < end_exclusive,
-            )
+        delta_rows = await self._query_monthly_balance_deltas(
+            [AccountType.ASSET.value],
+            start_date,
+            end_exclusive,
+            include_drafts,
         )
-        if not include_drafts:
-            stmt = stmt.where(TransactionModel.is_posted.is_(True))
-
-        entry_rows = (await self._session.execute(stmt)).all()
-
-        normalized_rows = [
-            (ensure_tz_aware(txn_date), acc_id, debit_amount, credit_amount)
-            for txn_date, acc_id, debit_amount, credit_amount in entry_rows
-        ]
+        deltas_by_month: dict[str, dict[str, Decimal]] = defaultdict(dict)
+        for bucket, acc_id, delta in delta_rows:
+            deltas_by_month[bucket][str(acc_id)] = Decimal(delta)
 
-        entry_rows = sorted(normalized_rows, key=lambda r: r[0])
         balances_by_id: dict[str, Decimal] = defaultdict(Decimal)
+        for acc_id_str, delta in deltas_by_month.get(_OPENING_BUCKET, {}).items():
+            balances_by_id[acc_id_str] += delta
 
         data_points: list[CategoryTimeSeriesDataPointDTO] = []
         totals_by_account: dict[str, Decimal] = {}
         all_account_names: set[str] = set()
 
-        idx = 0
         current = start_date
         while current <= end_date:
             month_key = _get_month_key(current.year, current.month)
-            as_of = _next_month(current)
 
-            while idx < len(entry_rows) and entry_rows[idx][0] < as_of:
-                _txn_date, acc_id, debit_amount, credit_amount = entry_rows[idx]
-                acc_id_str = str(acc_id)
-                balances_by_id[acc_id_str] += Decimal(debit_amount) - Decimal(
-                    credit_amount,
-                )
-                idx += 1
+            for acc_id_str, delta in deltas_by_month.get(month_key, {}).items():
+                balances_by_id[acc_id_str] += delta
 
             categories: dict[str, Decimal] = {}
             total = Decimal("0")
@@ -922,12 +826,12 @@ class SqlAlchemyAnalyticsReadAdapter(AnalyticsReadPort):
 
         stmt = (
             select(
-                TransactionModel.id,
-                TransactionModel.date,
                 AccountModel.name,
                 AccountModel.id,
-                JournalEntryModel.debit_amount,
+                func.sum(JournalEntryModel.debit_amount),
+                func.count(JournalEntryModel.id),
             )
+            .select_from(TransactionModel)
             .join(
                 JournalEntryModel,
                 JournalEntryModel.transaction_id == TransactionModel.id,
@@ -941,6 +845,7 @@ class SqlAlchemyAnalyticsReadAdapter(AnalyticsReadPort):
                 TransactionModel.date < end_exclusive,
                 JournalEntryModel.debit_amount > 0,
             )
+            .group_by(AccountModel.name, AccountModel.id)
         )
         if not include_drafts:
             stmt = stmt.where(TransactionModel.is_posted.is_(True))
@@ -951,10 +856,9 @@ class SqlAlchemyAnalyticsReadAdapter(AnalyticsReadPort):
         txn_count_by_category: dict[str, int] = defaultdict(int)
         account_ids: dict[str, str] = {}
 
-        for _txn_id, _txn_date, category, account_id, debit_amount in rows:
-            amt = Decimal(debit_amount)
-            spending_by_category[category] += amt
-            txn_count_by_category[category] += 1
+        for category, account_id, debit_sum, entry_count in rows:
+            spending_by_category[category] += Decimal(debit_sum)
+            txn_count_by_category[category] += entry_count
             account_ids[category] = str(account_id)
 
         total_spending = sum(spending_by_category.values(), Decimal("0"))
@@ -996,7 +900,7 @@ class SqlAlchemyAnalyticsReadAdapter(AnalyticsReadPort):
     ) -> MonthComparisonResultDTO:
         periods = self._calculate_comparison_periods(month)
         rows = await self._query_comparison_entries(periods, include_drafts)
-        aggregated = self._aggregate_comparison_data(rows, periods)
+        aggregated = self._aggregate_comparison_data(rows)
         return self._build_comparison_result(aggregated, periods)
 
     def _calculate_comparison_periods(
@@ -1039,15 +943,20 @@ class SqlAlchemyAnalyticsReadAdapter(AnalyticsReadPort):
         periods: dict,
         include_drafts: bool,
     ) -> list:
-        """Query income/expense entries for both months."""
+        """Sum income/expense entries per month and category for both months."""
+        in_current_month = case(
+            (TransactionModel.date >= periods["current_start"], True),
+            else_=False,
+        ).label("in_current_month")
         stmt = (
             select(
-                TransactionModel.date,
+                in_current_month,
                 AccountModel.account_type,
                 AccountModel.name,
-                JournalEntryModel.debit_amount,
-                JournalEntryModel.credit_amount,
+                func.sum(JournalEntryModel.debit_amount),
+                func.sum(JournalEntryModel.credit_amount),
             )
+            .select_from(TransactionModel)
             .join(
                 JournalEntryModel,
                 JournalEntryModel.transaction_id == TransactionModel.id,
@@ -1062,6 +971,11 @@ class SqlAlchemyAnalyticsReadAdapter(AnalyticsReadPort):
                     [AccountType.INCOME.value, AccountType.EXPENSE.value],
                 ),
             )
+            .group_by(
+                "in_current_month",
+                AccountModel.account_type,
+                AccountModel.name,
+            )
         )
         if not include_drafts:
             stmt = stmt.where(TransactionModel.is_posted.is_(True))
@@ -1071,7 +985,6 @@ class SqlAlchemyAnalyticsReadAdapter(AnalyticsReadPort):
     def _aggregate_comparison_data(
         self,
         rows: list,
-        periods: dict,
     ) -> dict:
         """Aggregate row data into current/previous totals."""
         current_income = Decimal("0")
@@ -1082,29 +995,18 @@ class SqlAlchemyAnalyticsReadAdapter(AnalyticsReadPort):
         previous_spending = Decimal("0")
         previous_by_category: dict[str, Decimal] = defaultdict(Decimal)
 
-        current_start = periods["current_start"]
-        current_end = periods["current_end"]
-        previous_start = periods["previous_start"]
-        previous_end = periods["previous_end"]
-
-        for row in rows:
-            txn_date, account_type, account_name, debit_amount, credit_amount = row
-            txn_date = ensure_tz_aware(txn_date)
-
-            is_current = current_start <= txn_date < current_end
-            is_previous = previous_start <= txn_date < previous_end
-            if not is_current and not is_previous:
-                continue
-
-            if account_type == AccountType.INCOME.value and Decimal(credit_amount) > 0:
+        for is_current, account_type, account_name, debit_sum, credit_sum in rows:
+            if account_type == AccountType.INCOME.value:
                 if is_current:
-                    current_income += Decimal(credit_amount)
+                    current_income += Decimal(credit_sum)
                 else:
-                    previous_income += Decimal(credit_amount)
+                    previous_income += Decimal(credit_sum)
                 continue
 
-            if account_type == AccountType.EXPENSE.value and Decimal(debit_amount) > 0:
-                amt = Decimal(debit_amount)
+            if account_type == AccountType.EXPENSE.value:
+                amt = Decimal(debit_sum)
+                if not amt:
+                    continue
                 if is_current:
                     current_spending += amt
                     current_by_category[account_name] += amt
@@ -0,0 +1,115 @@
+"""SQLAlchemy implementation of DashboardReadPort.
+
+Period totals are grouped by account in the database and asset balances come
+from the ``monthly_account_balances`` rollup, so both cost the same however
+many transactions the user has.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from decimal import Decimal
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from swen.application.ports.analytics import DashboardReadPort
+from swen.domain.accounting.entities import AccountType
+from swen.domain.accounting.services import PeriodTotals
+from swen.infrastructure.persistence.sqlalchemy.models.accounting.account_model import (
+    AccountModel,
+)
+from swen.infrastructure.persistence.sqlalchemy.models.accounting.journal_entry_model import (  # NOQA: E501
+    JournalEntryModel,
+)
+from swen.infrastructure.persistence.sqlalchemy.models.accounting.monthly_account_balance_model import (  # NOQA: E501
+    MonthlyAccountBalanceModel,
+)
+from swen.infrastructure.persistence.sqlalchemy.models.accounting.transaction_model import (  # NOQA: E501
+    TransactionModel,
+)
+
+if TYPE_CHECKING:
+    from swen.domain.shared.current_user import CurrentUser
+
+
+class SqlAlchemyDashboardReadAdapter(DashboardReadPort):
+    """SQLAlchemy dashboard read adapter."""
+
+    def __init__(self, session: AsyncSession, current_user: CurrentUser):
+        self._session = session
+        self._user_id = current_user.user_id
+
+    async def period_totals(
+        self,
+        *,
+        start_date: datetime,
+        end_date: datetime,
+        include_drafts: bool,
+    ) -> PeriodTotals:
+        stmt = (
+            select(
+                AccountModel.account_type,
+                AccountModel.name,
+                func.sum(JournalEntryModel.debit_amount),
+                func.sum(JournalEntryModel.credit_amount),
+            )
+            .select_from(TransactionModel)
+            .join(
+                JournalEntryModel,
+                JournalEntryModel.transaction_id == TransactionModel.id,
+            )
+            .join(AccountModel, AccountModel.id == JournalEntryModel.account_id)
+            .where(
+                TransactionModel.user_id == self._user_id,
+                AccountModel.user_id == self._user_id,
+                TransactionModel.date >= start_date,
+                TransactionModel.date < end_date,
+                AccountModel.account_type.in_(
+                    [AccountType.INCOME.value, AccountType.EXPENSE.value],
+                ),
+            )
+            .group_by(AccountModel.account_type, AccountModel.name)
+        )
+        if not include_drafts:
+            stmt = stmt.where(TransactionModel.is_posted.is_(True))
+
+        rows = (await self._session.execute(stmt)).all()
+
+        total_income = Decimal("0")
+        total_expenses = Decimal("0")
+        category_spending: dict[str, Decimal] = {}
+        for account_type, name, debit_sum, credit_sum in rows:
+            # Income accrues on the credit side, expenses on the debit side
+            if account_type == AccountType.INCOME.value:
+                total_income += Decimal(credit_sum)
+            elif debit_sum:
+                total_expenses += Decimal(debit_sum)
+                category_spending[name] = Decimal(debit_sum)
+
+        return PeriodTotals(
+            total_income=total_income,
+            total_expenses=total_expenses,
+            category_spending=category_spending,
+        )
+
+    async def asset_balances(self, *, include_drafts: bool) -> dict[UUID, Decimal]:
+        rollup = MonthlyAccountBalanceModel
+        # Asset accounts are debit-normal: balance = debits - credits
+        delta = rollup.posted_debit - rollup.posted_credit
+        if include_drafts:
+            delta = delta + rollup.draft_debit - rollup.draft_credit
+
+        stmt = (
+            select(rollup.account_id, func.sum(delta))
+            .join(AccountModel, AccountModel.id == rollup.account_id)
+            .where(
+                rollup.user_id == self._user_id,
+                AccountModel.account_type == AccountType.ASSET.value,
+            )
+            .group_by(rollup.account_id)
+        )
+        rows = await self._session.execute(stmt)
+        return {account_id: Decimal(balance) for account_id, balance in rows}
@@ -3,13 +3,19 @@
 import asyncio
 import logging
 import sys
+from typing import Optional
+from uuid import UUID
 
 from sqlalchemy.ext.asyncio import create_async_engine
 
 # Import models to register with Base.metadata
 import swen.infrastructure.persistence.sqlalchemy.models  # noqa: F401
 import swen_identity.infrastructure.persistence.sqlalchemy.models  # noqa: F401
+from swen.infrastructure.persistence.sqlalchemy.models import upgrade_schema
 from swen.infrastructure.persistence.sqlalchemy.models.base import Base
+from swen.infrastructure.persistence.sqlalchemy.models.monthly_balances import (
+    rebuild_monthly_balances,
+)
 from swen_config.settings import get_settings
 
 logging.basicConfig(level=logging.INFO)
@@ -30,8 +36,9 @@ async def create_tables() -> None:
     """
     Create all database tables (idempotent).
 
-    Uses SQLAlchemy's create_all() which only creates missing tables.
-    Existing tables and their data are never modified or deleted.
+    Uses SQLAlchemy's create_all() which only creates missing tables, then
+    upgrade_schema() to add columns introduced after a table's first release.
+    Existing data is never deleted.
     """
     # Import models to register with Base.metadata
 
@@ -40,6 +47,7 @@ async def create_tables() -> None:
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(upgrade_schema)
 
     await engine.dispose()
     logger.info("Database schema is up to date (missing tables created if needed)")
@@ -61,6 +69,25 @@ async def drop_tables() -> None:
     logger.info("Database tables dropped successfully")
 
 
+async def rebuild_balances(user_id: Optional[UUID] = None) -> int:
+    """
+    Recompute the monthly account-balance rollup from journal entries.
+
+    The rollup is maintained incrementally on every transaction write; this
+    repairs it after manual data fixes. Limited to one user if given.
+    """
+    engine = _get_engine()
+    scope = f"user {user_id}" if user_id else "all users"
+    logger.info("Rebuilding monthly account balances for %s...", scope)
+
+    async with engine.begin() as conn:
+        rows = await conn.run_sync(rebuild_monthly_balances, user_id)
+
+    await engine.dispose()
+    logger.info("Rebuilt monthly account balances (%d rows)", rows)
+    return rows
+
+
 async def _init_database():
     """Initialize the database and create all tables."""
     settings = get_settings()
@@ -136,3 +163,11 @@ def db_reset():
     """Drop and recreate all database tables."""
     force = "--force" in sys.argv or "-f" in sys.argv
     asyncio.run(_reset_database(force=force))
+
+
+def db_rebuild_balances():
+    """Rebuild the monthly balance rollup (``--user <uuid>`` for one user)."""
+    user_id = None
+    if "--user" in sys.argv:
+        user_id = UUID(sys.argv[sys.argv.index("--user") + 1])
+    asyncio.run(rebuild_balances(user_id))
@@ -3,6 +3,7 @@
 from swen.infrastructure.persistence.sqlalchemy.models.accounting import (
     AccountModel,
     JournalEntryModel,
+    MonthlyAccountBalanceModel,
     TransactionModel,
 )
 from swen.infrastructure.persistence.sqlalchemy.models.banking import (
@@ -13,6 +14,7 @@ from swen.infrastructure.persistence.sqlalchemy.models.banking import (
 from swen.infrastructure.persistence.sqlalchemy.models.base import Base
 from swen.infrastructure.persistence.sqlalchemy.models.integration import (
     AccountMappingModel,
+    MLOutboxModel,
     TransactionImportModel,
 )
 from swen.infrastructure.persistence.sqlalchemy.models.settings import (
@@ -21,6 +23,7 @@ from swen.infrastructure.persistence.sqlalchemy.models.settings import (
 from swen.infrastructure.persistence.sqlalchemy.models.stored_credential_model import (
     StoredCredentialModel,
 )
+from swen.infrastructure.persistence.sqlalchemy.models.upgrades import upgrade_schema
 
 __all__ = [
     "Base",
@@ -30,8 +33,11 @@ __all__ = [
     "AccountModel",
     "TransactionModel",
     "JournalEntryModel",
+    "MonthlyAccountBalanceModel",
     "AccountMappingModel",
+    "MLOutboxModel",
     "TransactionImportModel",
     "StoredCredentialModel",
     "UserSettingsModel",
+    "upgrade_schema",
 ]
@@ -6,6 +6,9 @@ from swen.infrastructure.persistence.sqlalchemy.models.accounting.account_model
 from swen.infrastructure.persistence.sqlalchemy.models.accounting.journal_entry_model import (  # NOQA: E501
     JournalEntryModel,
 )
+from swen.infrastructure.persistence.sqlalchemy.models.accounting.monthly_account_balance_model import (  # NOQA: E501
+    MonthlyAccountBalanceModel,
+)
 from swen.infrastructure.persistence.sqlalchemy.models.accounting.transaction_model import (  # NOQA: E501
     TransactionModel,
 )
@@ -14,4 +17,5 @@ __all__ = [
     "AccountModel",
     "TransactionModel",
     "JournalEntryModel",
+    "MonthlyAccountBalanceModel",
 ]
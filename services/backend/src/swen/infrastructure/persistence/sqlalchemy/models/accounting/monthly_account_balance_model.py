@@ -0,0 +1,67 @@
+"""SQLAlchemy model for the monthly account-balance rollup."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from uuid import UUID
+
+from sqlalchemy import ForeignKey, Index, Numeric, String, Uuid
+from sqlalchemy.orm import Mapped, mapped_column
+
+from swen.infrastructure.persistence.sqlalchemy.models.base import Base
+
+
+class MonthlyAccountBalanceModel(Base):
+    """Debit/credit totals per account and month, split by posting state.
+
+    Derived from journal entries and maintained by the transaction
+    repository on every save and delete. Balance queries read
+    months x accounts rows from here instead of scanning the ledger.
+    """
+
+    __tablename__ = "monthly_account_balances"
+
+    __table_args__ = (
+        Index("ix_monthly_account_balances_user_month", "user_id", "month"),
+    )
+
+    account_id: Mapped[UUID] = mapped_column(
+        Uuid,
+        ForeignKey("accounting_accounts.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    # Calendar month of the transaction date in UTC, as "YYYY-MM"
+    month: Mapped[str] = mapped_column(String(7), primary_key=True)
+
+    user_id: Mapped[UUID] = mapped_column(
+        Uuid,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    posted_debit: Mapped[Decimal] = mapped_column(
+        Numeric(15, 2),
+        nullable=False,
+        default=Decimal("0.00"),
+    )
+    posted_credit: Mapped[Decimal] = mapped_column(
+        Numeric(15, 2),
+        nullable=False,
+        default=Decimal("0.00"),
+    )
+    draft_debit: Mapped[Decimal] = mapped_column(
+        Numeric(15, 2),
+        nullable=False,
+        default=Decimal("0.00"),
+    )
+    draft_credit: Mapped[Decimal] = mapped_column(
+        Numeric(15, 2),
+        nullable=False,
+        default=Decimal("0.00"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<MonthlyAccountBalanceModel(account_id={self.account_id}, "
+            f"month={self.month})>"
+        )
@@ -19,6 +19,9 @@ if TYPE_CHECKING:
         JournalEntryModel,
     )
 
+# transaction_metadata keys mirrored into indexed columns of the same name
+PROMOTED_METADATA_KEYS = ("transfer_identity_hash", "opening_balance_iban")
+
 
 class TransactionModel(Base, TimestampMixin):
     """Database model for accounting transactions."""
@@ -28,12 +31,31 @@ class TransactionModel(Base, TimestampMixin):
     __table_args__ = (
         # Index for user-scoped queries
         Index("ix_transactions_user_id", "user_id"),
-        Index("ix_transactions_user_date", "user_id", "date"),
+        # Date ranges, and keyset pagination on (date, id) for the list view
+        Index("ix_transactions_user_date_id", "user_id", "date", "id"),
         # Indexes for filtering
         Index("ix_transactions_source", "source"),
         Index("ix_transactions_source_iban", "source_iban"),
         Index("ix_transactions_counterparty_iban", "counterparty_iban"),
+        # Window lookup for fuzzy transfer matching
+        Index(
+            "ix_transactions_user_counterparty_iban_date",
+            "user_id",
+            "counterparty_iban",
+            "date",
+        ),
         Index("ix_transactions_is_internal_transfer", "is_internal_transfer"),
+        # Indexes for promoted metadata lookups
+        Index(
+            "ix_transactions_user_transfer_hash",
+            "user_id",
+            "transfer_identity_hash",
+        ),
+        Index(
+            "ix_transactions_user_opening_balance_iban",
+            "user_id",
+            "opening_balance_iban",
+        ),
     )
 
     # Primary key (UUID from domain)
@@ -94,6 +116,19 @@ class TransactionModel(Base, TimestampMixin):
         default=dict,
     )
 
+    # Promoted metadata keys: indexed copies of hot transaction_metadata values,
+    # maintained by the repository on every save
+    transfer_identity_hash: Mapped[str | None] = mapped_column(
+        String(64),
+        nullable=True,
+        comment="Copy of transaction_metadata['transfer_identity_hash']",
+    )
+    opening_balance_iban: Mapped[str | None] = mapped_column(
+        String(34),
+        nullable=True,
+        comment="Copy of transaction_metadata['opening_balance_iban']",
+    )
+
     # State
     is_posted: Mapped[bool] = mapped_column(Boolean, default=False, index=True)
 
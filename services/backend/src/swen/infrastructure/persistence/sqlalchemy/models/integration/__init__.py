@@ -3,11 +3,15 @@
 from swen.infrastructure.persistence.sqlalchemy.models.integration.account_mapping_model import (  # NOQA: E501
     AccountMappingModel,
 )
+from swen.infrastructure.persistence.sqlalchemy.models.integration.ml_outbox_model import (  # NOQA: E501
+    MLOutboxModel,
+)
 from swen.infrastructure.persistence.sqlalchemy.models.integration.transaction_import_model import (  # NOQA: E501
     TransactionImportModel,
 )
 
 __all__ = [
     "AccountMappingModel",
+    "MLOutboxModel",
     "TransactionImportModel",
 ]
@@ -0,0 +1,65 @@
+"""SQLAlchemy model for the backend-to-ML outbox."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy import JSON, DateTime, ForeignKey, Index, Integer, String, Text, Uuid
+from sqlalchemy.orm import Mapped, mapped_column
+
+from swen.domain.shared.time import utc_now
+from swen.infrastructure.persistence.sqlalchemy.models.base import Base
+
+# Outbox item kinds and the ML call each one becomes
+OUTBOX_STORE_EXAMPLE = "store_example"  # payload: StoreExampleRequest
+OUTBOX_EMBED_ACCOUNT = "embed_account"  # payload: AccountOption
+OUTBOX_DELETE_ANCHOR = "delete_anchor"  # payload: {"account_id": ...}
+
+
+class MLOutboxModel(Base):
+    """A pending training-data update for the ML service.
+
+    Rows are added in the same database transaction as the ledger or
+    account change that produced them and deleted once the ML service has
+    accepted them, so updates survive restarts and ML outages.
+    """
+
+    __tablename__ = "ml_outbox"
+
+    __table_args__ = (
+        Index("ix_ml_outbox_next_attempt_at", "next_attempt_at"),
+        Index("ix_ml_outbox_user_id", "user_id"),
+    )
+
+    id: Mapped[UUID] = mapped_column(Uuid, primary_key=True, default=uuid4)
+
+    user_id: Mapped[UUID] = mapped_column(
+        Uuid,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    kind: Mapped[str] = mapped_column(String(32), nullable=False)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
+
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # Due time; also pushed forward while a dispatcher holds the row
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=utc_now,
+    )
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=utc_now,
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<MLOutboxModel(id={self.id}, kind={self.kind}, attempts={self.attempts})>"
+        )
@@ -0,0 +1,215 @@
+"""Maintenance of the monthly account-balance rollup.
+
+The ``monthly_account_balances`` table holds debit and credit totals per
+account and calendar month. The transaction repository collects the
+contribution of every transaction it writes or deletes in a
+MonthlyBalanceDeltas and applies it as a single upsert, so the rollup
+moves in the same database transaction as the ledger.
+
+rebuild_monthly_balances() recomputes the table from journal entries. It
+backs the ``db-rebuild-balances`` command and the first run of
+upgrade_schema() on a database that predates the rollup.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import TYPE_CHECKING, Optional
+from uuid import UUID
+
+from sqlalchemy import case, delete, func, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection
+
+from swen.infrastructure.persistence.sqlalchemy.models.accounting.journal_entry_model import (  # NOQA: E501
+    JournalEntryModel,
+)
+from swen.infrastructure.persistence.sqlalchemy.models.accounting.monthly_account_balance_model import (  # NOQA: E501
+    MonthlyAccountBalanceModel,
+)
+from swen.infrastructure.persistence.sqlalchemy.models.accounting.transaction_model import (  # NOQA: E501
+    TransactionModel,
+)
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+AMOUNT_COLUMNS = ("posted_debit", "posted_credit", "draft_debit", "draft_credit")
+
+
+def month_key(value: datetime) -> str:
+    """Return the ``YYYY-MM`` rollup key for a transaction date."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return f"{value.year:04d}-{value.month:02d}"
+
+
+def month_key_expression(column, dialect_name: str):
+    """SQL expression bucketing a timestamp column into a ``YYYY-MM`` key.
+
+    Labelled ``month_key`` so callers can group by the label name: repeating
+    the expression would bind fresh parameters, which PostgreSQL does not
+    accept as the same grouping key.
+    """
+    if dialect_name == "postgresql":
+        month = func.to_char(func.timezone("UTC", column), "YYYY-MM")
+    else:
+        month = func.strftime("%Y-%m", column)
+    return month.label("month_key")
+
+
+class MonthlyBalanceDeltas:
+    """Accumulates rollup changes for a batch of transaction writes.
+
+    Call remove() with a model's persisted state before mutating it and
+    add() with its new state afterwards, then apply() once the ledger rows
+    have been flushed.
+    """
+
+    def __init__(self) -> None:
+        self._deltas: dict[tuple[UUID, str], list[Decimal]] = defaultdict(
+            lambda: [Decimal("0")] * len(AMOUNT_COLUMNS),
+        )
+        self._user_ids: dict[UUID, UUID] = {}
+
+    def add(self, model: TransactionModel) -> None:
+        self._collect(model, Decimal("1"))
+
+    def remove(self, model: TransactionModel) -> None:
+        self._collect(model, Decimal("-1"))
+
+    async def shift_posting_state(
+        self,
+        session: AsyncSession,
+        transaction_ids: list[UUID],
+        *,
+        to_posted: bool,
+    ) -> None:
+        """Move the given transactions' amounts between draft and posted.
+
+        For set-based status changes that never load the models: the entry
+        totals are grouped per account and month in a single query.
+        """
+        if not transaction_ids:
+            return
+        month = month_key_expression(
+            TransactionModel.date,
+            session.get_bind().dialect.name,
+        )
+        stmt = (
+            select(
+                JournalEntryModel.account_id,
+                month,
+                TransactionModel.user_id,
+                func.sum(JournalEntryModel.debit_amount),
+                func.sum(JournalEntryModel.credit_amount),
+            )
+            .join(
+                TransactionModel,
+                TransactionModel.id == JournalEntryModel.transaction_id,
+            )
+            .where(TransactionModel.id.in_(transaction_ids))
+            .group_by(
+                JournalEntryModel.account_id,
+                "month_key",
+                TransactionModel.user_id,
+            )
+        )
+        sign = Decimal("1") if to_posted else Decimal("-1")
+        for account_id, key_month, user_id, debit, credit in await session.execute(
+            stmt,
+        ):
+            deltas = self._deltas[(account_id, key_month)]
+            deltas[0] += sign * Decimal(debit)
+            deltas[1] += sign * Decimal(credit)
+            deltas[2] -= sign * Decimal(debit)
+            deltas[3] -= sign * Decimal(credit)
+            self._user_ids[account_id] = user_id
+
+    def _collect(self, model: TransactionModel, sign: Decimal) -> None:
+        key_month = month_key(model.date)
+        offset = 0 if model.is_posted else 2
+        for entry in model.entries:
+            deltas = self._deltas[(entry.account_id, key_month)]
+            deltas[offset] += sign * Decimal(entry.debit_amount)
+            deltas[offset + 1] += sign * Decimal(entry.credit_amount)
+            self._user_ids[entry.account_id] = model.user_id
+
+    async def apply(self, session: AsyncSession) -> None:
+        """Upsert the accumulated deltas and reset the accumulator."""
+        rows = [
+            {
+                "account_id": account_id,
+                "month": month,
+                "user_id": self._user_ids[account_id],
+                **dict(zip(AMOUNT_COLUMNS, deltas, strict=True)),
+            }
+            # Sorted so concurrent writers lock rows in the same order
+            for (account_id, month), deltas in sorted(
+                self._deltas.items(),
+                key=lambda item: (str(item[0][0]), item[0][1]),
+            )
+            if any(deltas)
+        ]
+        self._deltas.clear()
+        self._user_ids.clear()
+        if not rows:
+            return
+
+        table = MonthlyAccountBalanceModel.__table__
+        if session.get_bind().dialect.name == "postgresql":
+            stmt = pg_insert(table).values(rows)
+        else:
+            stmt = sqlite_insert(table).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.account_id, table.c.month],
+            set_={name: table.c[name] + stmt.excluded[name] for name in AMOUNT_COLUMNS},
+        )
+        await session.execute(stmt)
+
+
+def rebuild_monthly_balances(
+    connection: Connection,
+    user_id: Optional[UUID] = None,
+) -> int:
+    """Recompute the rollup from journal entries, for one user or everyone.
+
+    Returns the number of rollup rows written.
+    """
+    table = MonthlyAccountBalanceModel.__table__
+    clear = delete(table)
+    if user_id is not None:
+        clear = clear.where(table.c.user_id == user_id)
+    connection.execute(clear)
+
+    posted = TransactionModel.is_posted.is_(True)
+    month = month_key_expression(TransactionModel.date, connection.dialect.name)
+    totals = (
+        select(
+            JournalEntryModel.account_id,
+            month,
+            TransactionModel.user_id,
+            func.sum(case((posted, JournalEntryModel.debit_amount), else_=0)),
+            func.sum(case((posted, JournalEntryModel.credit_amount), else_=0)),
+            func.sum(case((posted, 0), else_=JournalEntryModel.debit_amount)),
+            func.sum(case((posted, 0), else_=JournalEntryModel.credit_amount)),
+        )
+        .join(
+            TransactionModel,
+            TransactionModel.id == JournalEntryModel.transaction_id,
+        )
+        .group_by(JournalEntryModel.account_id, "month_key", TransactionModel.user_id)
+    )
+    if user_id is not None:
+        totals = totals.where(TransactionModel.user_id == user_id)
+
+    result = connection.execute(
+        insert(table).from_select(
+            ["account_id", "month", "user_id", *AMOUNT_COLUMNS],
+            totals,
+        ),
+    )
+    return result.rowcount
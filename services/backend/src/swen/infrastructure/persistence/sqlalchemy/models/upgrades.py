@@ -0,0 +1,96 @@
+"""Idempotent schema upgrades for tables created by older versions.
+
+create_all() only creates missing tables. Columns added to an existing table
+after its first release are applied here, on both PostgreSQL and SQLite, and
+derived tables that create_all() just added to a populated database are filled.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from sqlalchemy import inspect, select, text, update
+from sqlalchemy.engine import Connection
+
+from swen.infrastructure.persistence.sqlalchemy.models.accounting.journal_entry_model import (  # NOQA: E501
+    JournalEntryModel,
+)
+from swen.infrastructure.persistence.sqlalchemy.models.accounting.monthly_account_balance_model import (  # NOQA: E501
+    MonthlyAccountBalanceModel,
+)
+from swen.infrastructure.persistence.sqlalchemy.models.accounting.transaction_model import (  # NOQA: E501
+    PROMOTED_METADATA_KEYS,
+    TransactionModel,
+)
+from swen.infrastructure.persistence.sqlalchemy.models.monthly_balances import (
+    rebuild_monthly_balances,
+)
+
+logger = logging.getLogger(__name__)
+
+# Indexes replaced by a wider one in TransactionModel
+_RETIRED_TRANSACTION_INDEXES = ("ix_transactions_user_date",)
+
+
+def upgrade_schema(connection: Connection) -> None:
+    """Add columns and indexes that tables created by older versions lack.
+
+    Indexes superseded by a newer one are dropped.
+    """
+    table = TransactionModel.__table__
+    columns = inspect(connection).get_columns(table.name)
+    existing = {column["name"] for column in columns}
+
+    added = []
+    for name in PROMOTED_METADATA_KEYS:
+        if name in existing:
+            continue
+        column_type = table.c[name].type.compile(dialect=connection.dialect)
+        connection.execute(
+            text(f"ALTER TABLE {table.name} ADD COLUMN {name} {column_type}"),
+        )
+        added.append(name)
+
+    for index in table.indexes:
+        index.create(connection, checkfirst=True)
+    for name in _RETIRED_TRANSACTION_INDEXES:
+        connection.execute(text(f"DROP INDEX IF EXISTS {name}"))
+
+    if added:
+        _backfill_promoted_metadata(connection, added)
+
+    _fill_monthly_balances(connection)
+
+
+def _backfill_promoted_metadata(connection: Connection, keys: list[str]) -> None:
+    """Copy existing metadata values into newly added promoted columns."""
+    table = TransactionModel.__table__
+    rows = connection.execute(select(table.c.id, table.c.transaction_metadata))
+
+    updated = 0
+    for transaction_id, metadata in rows.all():
+        values = {
+            key: str(metadata[key])
+            for key in keys
+            if metadata and metadata.get(key) is not None
+        }
+        if values:
+            connection.execute(
+                update(table).where(table.c.id == transaction_id).values(**values),
+            )
+            updated += 1
+
+    logger.info("Backfilled %s for %d transactions", ", ".join(keys), updated)
+
+
+def _fill_monthly_balances(connection: Connection) -> None:
+    """Build the balance rollup for ledgers recorded before it existed."""
+    has_rollup = connection.execute(
+        select(MonthlyAccountBalanceModel.account_id).limit(1),
+    ).first()
+    has_entries = connection.execute(
+        select(JournalEntryModel.id).limit(1),
+    ).first()
+    if has_rollup is None and has_entries is not None:
+        rows = rebuild_monthly_balances(connection)
+        logger.info("Built monthly account balances (%d rows)", rows)
@@ -19,6 +19,8 @@ from swen.domain.shared.iban import normalize_iban
 from swen.infrastructure.persistence.sqlalchemy.models import AccountModel
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from swen.domain.shared.current_user import CurrentUser
 
 logger = logging.getLogger(__name__)
@@ -107,6 +109,20 @@ class AccountRepositorySQLAlchemy(AccountRepository):
 
         return self._map_to_domain(model)
 
+    async def find_by_ids(self, account_ids: Iterable[UUID]) -> list[Account]:
+        ids = list(account_ids)
+        if not ids:
+            return []
+
+        stmt = select(AccountModel).where(
+            AccountModel.user_id == self._user_id,
+            AccountModel.id.in_(ids),
+        )
+        result = await self._session.execute(stmt)
+        models = result.scalars().all()
+
+        return [self._map_to_domain(model) for model in models]
+
     async def find_by_name(self, name: str) -> Optional[Account]:
         stmt = select(AccountModel).where(
             AccountModel.user_id == self._user_id,
@@ -7,16 +7,17 @@ automatically filter by the current user's user_id.
 from __future__ import annotations
 
 import logging
-from datetime import datetime
+from datetime import date, datetime, time, timezone
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, Iterable, List, Optional
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import and_, func, select, true, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from swen.domain.accounting.aggregates import Transaction
-from swen.domain.accounting.entities import JournalEntry
+from swen.domain.accounting.entities import Account, JournalEntry
 from swen.domain.accounting.repositories import (
     AccountRepository,
     TransactionRepository,
@@ -33,12 +34,23 @@ from swen.infrastructure.persistence.sqlalchemy.models import (
     JournalEntryModel,
     TransactionModel,
 )
+from swen.infrastructure.persistence.sqlalchemy.models.accounting.transaction_model import (  # NOQA: E501
+    PROMOTED_METADATA_KEYS,
+)
+from swen.infrastructure.persistence.sqlalchemy.models.monthly_balances import (
+    MonthlyBalanceDeltas,
+)
 
 if TYPE_CHECKING:
     from swen.domain.shared.current_user import CurrentUser
 
 logger = logging.getLogger(__name__)
 
+_HEX_DIGITS = frozenset("0123456789abcdef")
+
+# Keep IN lists well below the bind parameter limits of both dialects
+_BULK_CHUNK_SIZE = 500
+
 
 class TransactionRepositorySQLAlchemy(TransactionRepository):
     """SQLAlchemy implementation of accounting transaction repository."""
@@ -59,24 +71,55 @@ class TransactionRepositorySQLAlchemy(TransactionRepository):
     async def _save_no_commit(self, transaction: Transaction) -> None:
         # Check if transaction already exists
         model = await self._find_model_by_id(transaction.id)
+        balances = MonthlyBalanceDeltas()
 
         if model:
             # Update existing
             logger.debug("Updating existing transaction: %s", transaction.id)
+            balances.remove(model)
             await self._update_model_from_domain(model, transaction)
         else:
             # Create new
             logger.debug("Creating new transaction: %s", transaction.description)
             model = await self._create_model_from_domain(transaction)
             self._session.add(model)
+        balances.add(model)
 
         await self._session.flush()
+        await balances.apply(self._session)
         logger.info(
             "Transaction saved: %s (ID: %s)",
             transaction.description,
             transaction.id,
         )
 
+    async def save_all(self, transactions: Iterable[Transaction]) -> None:
+        transactions = list(transactions)
+        if not transactions:
+            return
+
+        # Load every existing row in one query instead of one lookup per save
+        stmt = self._base_user_query().where(
+            TransactionModel.id.in_([transaction.id for transaction in transactions]),
+        )
+        result = await self._session.execute(stmt)
+        models = {model.id: model for model in result.unique().scalars().all()}
+
+        balances = MonthlyBalanceDeltas()
+        for transaction in transactions:
+            model = models.get(transaction.id)
+            if model:
+                balances.remove(model)
+                await self._update_model_from_domain(model, transaction)
+            else:
+                model = await self._create_model_from_domain(transaction)
+                self._session.add(model)
+            balances.add(model)
+
+        await self._session.flush()
+        await balances.apply(self._session)
+        logger.info("Saved %d transactions", len(transactions))
+
     async def find_by_id(self, transaction_id: UUID) -> Optional[Transaction]:
         model = await self._find_model_by_id(transaction_id)
 
@@ -85,9 +128,84 @@ class TransactionRepositorySQLAlchemy(TransactionRepository):
 
         return await self._map_to_domain(model)
 
+    async def find_by_ids(self, transaction_ids: Iterable[UUID]) -> List[Transaction]:
+        ids = list(transaction_ids)
+        models = []
+        for start in range(0, len(ids), _BULK_CHUNK_SIZE):
+            stmt = self._base_user_query().where(
+                TransactionModel.id.in_(ids[start : start + _BULK_CHUNK_SIZE]),
+            )
+            result = await self._session.execute(stmt)
+            models.extend(result.unique().scalars().all())
+        return await self._map_models(models)
+
+    async def set_posted(
+        self,
+        transaction_ids: Iterable[UUID],
+        is_posted: bool,
+    ) -> List[UUID]:
+        ids = list(transaction_ids)
+        changed: List[UUID] = []
+        balances = MonthlyBalanceDeltas()
+        for start in range(0, len(ids), _BULK_CHUNK_SIZE):
+            chunk = ids[start : start + _BULK_CHUNK_SIZE]
+            stmt = (
+                update(TransactionModel)
+                .where(
+                    TransactionModel.user_id == self._user_id,
+                    TransactionModel.id.in_(chunk),
+                    TransactionModel.is_posted == (not is_posted),
+                )
+                .values(is_posted=is_posted)
+                .returning(TransactionModel.id)
+            )
+            chunk_changed = list((await self._session.execute(stmt)).scalars())
+            await balances.shift_posting_state(
+                self._session,
+                chunk_changed,
+                to_posted=is_posted,
+            )
+            changed.extend(chunk_changed)
+
+        await balances.apply(self._session)
+        logger.info(
+            "Set is_posted=%s on %d of %d transactions",
+            is_posted,
+            len(changed),
+            len(ids),
+        )
+        return changed
+
+    async def find_by_id_prefix(
+        self,
+        prefix: str,
+        limit: int = 5,
+    ) -> List[Transaction]:
+        # Every UUID starting with the prefix lies between the prefix padded
+        # with 0s and with fs, so the lookup is a primary-key range scan.
+        hex_prefix = prefix.lower().replace("-", "")
+        if len(hex_prefix) > 32 or any(c not in _HEX_DIGITS for c in hex_prefix):
+            return []
+        lower = UUID(hex_prefix.ljust(32, "0"))
+        upper = UUID(hex_prefix.ljust(32, "f"))
+
+        stmt = (
+            self._base_user_query()
+            .where(TransactionModel.id.between(lower, upper))
+            .order_by(TransactionModel.id)
+            .limit(limit)
+        )
+        result = await self._session.execute(stmt)
+        # Range bounds ignore hyphens; re-check against the canonical form
+        models = [
+            model
+            for model in result.unique().scalars().all()
+            if str(model.id).startswith(prefix.lower())
+        ]
+        return await self._map_models(models)
+
     async def find_by_account(self, account_id: UUID) -> List[Transaction]:
-        stmt = self._base_user_query()
-        stmt = self._apply_account_filter(stmt, account_id)
+        stmt = self._build_filtered_query(TransactionFilters(account_id=account_id))
         return await self._execute_and_map(stmt)
 
     async def find_by_date_range(
@@ -95,8 +213,9 @@ class TransactionRepositorySQLAlchemy(TransactionRepository):
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
     ) -> List[Transaction]:
-        stmt = self._base_user_query()
-        stmt = self._apply_date_filters(stmt, start_date, end_date)
+        stmt = self._build_filtered_query(
+            TransactionFilters(start_date=start_date, end_date=end_date),
+        )
         stmt = stmt.order_by(TransactionModel.date.desc())
         return await self._execute_and_map(stmt)
 
@@ -105,21 +224,22 @@ class TransactionRepositorySQLAlchemy(TransactionRepository):
         return await self._execute_and_map(stmt)
 
     async def find_posted_transactions(self) -> List[Transaction]:
-        stmt = self._base_user_query()
-        stmt = self._apply_status_filter(stmt, "posted")
+        stmt = self._build_filtered_query(TransactionFilters(status="posted"))
         return await self._execute_and_map(stmt)
 
     async def find_draft_transactions(self) -> List[Transaction]:
-        stmt = self._base_user_query()
-        stmt = self._apply_status_filter(stmt, "draft")
+        stmt = self._build_filtered_query(TransactionFilters(status="draft"))
         return await self._execute_and_map(stmt)
 
     async def delete(self, transaction_id: UUID) -> None:
         model = await self._find_model_by_id(transaction_id)
 
         if model:
+            balances = MonthlyBalanceDeltas()
+            balances.remove(model)
             await self._session.delete(model)
             await self._session.flush()
+            await balances.apply(self._session)
             logger.info("Transaction deleted: %s", transaction_id)
 
     async def find_by_counterparty(self, counterparty: str) -> List[Transaction]:
@@ -141,21 +261,63 @@ class TransactionRepositorySQLAlchemy(TransactionRepository):
         )
         return await self._execute_and_map(stmt)
 
+    async def find_transfer_candidate_ids(
+        self,
+        counterparty_iban: str,
+        amount: Decimal,
+        start_date: date,
+        end_date: date,
+    ) -> List[UUID]:
+        normalized = normalize_iban(counterparty_iban)
+        if not normalized:
+            return []
+
+        # Total amount is the sum of debits, matching Transaction.total_amount()
+        stmt = (
+            select(TransactionModel.id)
+            .join(
+                JournalEntryModel,
+                JournalEntryModel.transaction_id == TransactionModel.id,
+            )
+            .where(
+                TransactionModel.user_id == self._user_id,
+                TransactionModel.counterparty_iban == normalized,
+                TransactionModel.date
+                >= datetime.combine(start_date, time.min, tzinfo=timezone.utc),
+                TransactionModel.date
+                <= datetime.combine(end_date, time.max, tzinfo=timezone.utc),
+            )
+            .group_by(TransactionModel.id, TransactionModel.date)
+            .having(func.sum(JournalEntryModel.debit_amount) == amount)
+            .order_by(TransactionModel.date)
+        )
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
+
     async def find_by_metadata(
         self,
         metadata_key: str,
         metadata_value: Optional[Any] = None,
     ) -> List[Transaction]:
+        # Promoted keys have their own indexed column
+        if metadata_key in PROMOTED_METADATA_KEYS:
+            column = getattr(TransactionModel, metadata_key)
+            stmt = self._base_user_query()
+            if metadata_value is None:
+                stmt = stmt.where(column.isnot(None))
+            else:
+                stmt = stmt.where(column == str(metadata_value))
+            return await self._execute_and_map(stmt)
+
         # Fetch all user's transactions and filter in Python for database compatibility
         # This avoids PostgreSQL-specific JSONB operators like has_key() and astext
-        stmt = select(TransactionModel).where(
-            TransactionModel.user_id == self._user_id,
+        stmt = self._base_user_query().where(
             TransactionModel.transaction_metadata.isnot(None),
         )
         result = await self._session.execute(stmt)
         models = result.unique().scalars().all()
 
-        transactions = []
+        matching = []
         for model in models:
             metadata = model.transaction_metadata or {}
 
@@ -172,22 +334,18 @@ class TransactionRepositorySQLAlchemy(TransactionRepository):
                 ):
                     continue
 
-            # Map to domain and add to results
-            transaction = await self._map_to_domain(model)
-            if transaction:
-                transactions.append(transaction)
+            matching.append(model)
 
-        return transactions
+        return await self._map_models(matching)
 
     async def find_by_account_and_counterparty(
         self,
         account_id: UUID,
         counterparty: str,
     ) -> List[Transaction]:
-        stmt = self._base_user_query().where(
-            TransactionModel.counterparty == counterparty,
-        )
-        stmt = self._apply_account_filter(stmt, account_id)
+        stmt = self._build_filtered_query(
+            TransactionFilters(account_id=account_id),
+        ).where(TransactionModel.counterparty == counterparty)
         return await self._execute_and_map(stmt)
 
     async def find_with_filters(
@@ -196,9 +354,16 @@ class TransactionRepositorySQLAlchemy(TransactionRepository):
         pagination: Optional[Pagination] = None,
     ) -> List[Transaction]:
         stmt = self._build_filtered_query(filters)
-        stmt = stmt.order_by(TransactionModel.date.desc())
-
-        if pagination:
+        # id breaks ties between same-date rows so pages never overlap
+        stmt = stmt.order_by(TransactionModel.date.desc(), TransactionModel.id.desc())
+
+        if pagination and pagination.cursor:
+            cursor = pagination.cursor
+            stmt = stmt.where(
+                tuple_(TransactionModel.date, TransactionModel.id)
+                < tuple_(cursor.date, cursor.id),
+            ).limit(pagination.page_size)
+        elif pagination:
             stmt = stmt.offset(pagination.offset).limit(pagination.page_size)
 
         return await self._execute_and_map(stmt)
@@ -212,126 +377,120 @@ class TransactionRepositorySQLAlchemy(TransactionRepository):
         return result.scalar() or 0
 
     def _build_filtered_query(self, filters: TransactionFilters):
-        stmt = self._base_user_query()
-        stmt = self._apply_date_filters(stmt, filters.start_date, filters.end_date)
-        stmt = self._apply_status_filter(stmt, filters.status)
-        stmt = self._apply_account_filter(stmt, filters.account_id)
-        stmt = self._apply_transfer_filter(stmt, filters.exclude_internal_transfers)
-        return self._apply_source_filter(stmt, filters.source_filter)
+        return self._base_user_query().where(*self._filter_conditions(filters))
 
     def _build_filtered_count_query(self, filters: TransactionFilters):
-        stmt = (
+        return (
             select(func.count())
             .select_from(TransactionModel)
-            .where(TransactionModel.user_id == self._user_id)
+            .where(
+                TransactionModel.user_id == self._user_id,
+                *self._filter_conditions(filters),
+            )
         )
-        stmt = self._apply_date_filters(stmt, filters.start_date, filters.end_date)
-        stmt = self._apply_status_filter(stmt, filters.status)
-        stmt = self._apply_account_filter(stmt, filters.account_id)
-        stmt = self._apply_transfer_filter(stmt, filters.exclude_internal_transfers)
-        return self._apply_source_filter(stmt, filters.source_filter)
 
     def _base_user_query(self):
-        return select(TransactionModel).where(
-            TransactionModel.user_id == self._user_id,
+        return (
+            select(TransactionModel)
+            .where(TransactionModel.user_id == self._user_id)
+            .options(selectinload(TransactionModel.entries))
         )
 
-    def _apply_date_filters(
-        self,
-        stmt,
-        start_date: Optional[str],
-        end_date: Optional[str],
-    ):
-        if start_date:
-            start_dt = datetime.fromisoformat(start_date)
-            stmt = stmt.where(TransactionModel.date >= start_dt)
+    def _filter_conditions(self, filters: TransactionFilters) -> list:
+        conditions = []
 
-        if end_date:
-            end_dt = datetime.fromisoformat(end_date)
-            stmt = stmt.where(TransactionModel.date <= end_dt)
+        if filters.start_date:
+            start_dt = datetime.fromisoformat(filters.start_date)
+            conditions.append(TransactionModel.date >= start_dt)
 
-        return stmt
+        if filters.end_date:
+            end_dt = datetime.fromisoformat(filters.end_date)
+            conditions.append(TransactionModel.date <= end_dt)
 
-    def _apply_status_filter(self, stmt, status: Optional[str]):
-        if status == "posted":
-            stmt = stmt.where(TransactionModel.is_posted == True)  # NOQA: E712
-        elif status == "draft":
-            stmt = stmt.where(TransactionModel.is_posted == False)  # NOQA: E712
-        return stmt
+        if filters.status == "posted":
+            conditions.append(TransactionModel.is_posted == True)  # NOQA: E712
+        elif filters.status == "draft":
+            conditions.append(TransactionModel.is_posted == False)  # NOQA: E712
 
-    def _apply_account_filter(self, stmt, account_id: Optional[UUID]):
-        if account_id:
+        if filters.account_id:
             # Subquery to find transaction IDs that have entries for this account
             subq = (
                 select(JournalEntryModel.transaction_id)
-                .where(JournalEntryModel.account_id == account_id)
+                .where(JournalEntryModel.account_id == filters.account_id)
                 .distinct()
                 .scalar_subquery()
             )
-            stmt = stmt.where(TransactionModel.id.in_(subq))
-        return stmt
+            conditions.append(TransactionModel.id.in_(subq))
+
+        if filters.exclude_internal_transfers:
+            conditions.append(
+                TransactionModel.is_internal_transfer == False,  # NOQA: E712
+            )
 
-    def _apply_transfer_filter(self, stmt, exclude_internal_transfers: bool):
-        if exclude_internal_transfers:
-            stmt = stmt.where(TransactionModel.is_internal_transfer == False)  # NOQA: E712
-        return stmt
+        if filters.source_filter:
+            conditions.append(TransactionModel.source == filters.source_filter)
 
-    def _apply_source_filter(self, stmt, source_filter: Optional[str]):
-        if source_filter:
-            stmt = stmt.where(TransactionModel.source == source_filter)
-        return stmt
+        return conditions
 
     async def _execute_and_map(self, stmt) -> List[Transaction]:
         result = await self._session.execute(stmt)
-        models = result.unique().scalars().all()
+        return await self._map_models(result.unique().scalars().all())
+
+    async def _map_models(self, models) -> List[Transaction]:
+        """Map transaction models, loading all their accounts in one query."""
+        accounts = await self._load_accounts(models)
 
         transactions = []
         for model in models:
-            transaction = await self._map_to_domain(model)
+            transaction = await self._map_to_domain(model, accounts)
             if transaction:
                 transactions.append(transaction)
 
         return transactions
 
-    async def count_by_status(self) -> dict[str, int]:
-        # Count posted
-        posted_stmt = (
-            select(func.count())
-            .select_from(TransactionModel)
-            .where(
-                TransactionModel.user_id == self._user_id,
-                TransactionModel.is_posted == True,  # NOQA: E712
+    async def _load_accounts(self, models) -> dict[UUID, Account]:
+        """Build an identity map of the accounts referenced by ``models``."""
+        account_ids = {entry.account_id for model in models for entry in model.entries}
+        accounts = await self._account_repo.find_by_ids(account_ids)
+        return {account.id: account for account in accounts}
+
+    async def count_by_status(
+        self,
+        filters: Optional[TransactionFilters] = None,
+    ) -> dict[str, int]:
+        # One aggregate pass: each count is a FILTER (WHERE ...) over the same rows
+        counts = [
+            func.count().filter(TransactionModel.is_posted == True),  # NOQA: E712
+            func.count().filter(TransactionModel.is_posted == False),  # NOQA: E712
+        ]
+        if filters is not None:
+            conditions = self._filter_conditions(filters)
+            counts.append(
+                func.count().filter(and_(*conditions) if conditions else true()),
             )
-        )
-        posted_result = await self._session.execute(posted_stmt)
-        posted_count = posted_result.scalar() or 0
 
-        # Count drafts
-        draft_stmt = (
-            select(func.count())
+        stmt = (
+            select(*counts)
             .select_from(TransactionModel)
-            .where(
-                TransactionModel.user_id == self._user_id,
-                TransactionModel.is_posted == False,  # NOQA: E712
-            )
+            .where(TransactionModel.user_id == self._user_id)
         )
-        draft_result = await self._session.execute(draft_stmt)
-        draft_count = draft_result.scalar() or 0
+        row = (await self._session.execute(stmt)).one()
+        posted_count, draft_count = row[0] or 0, row[1] or 0
 
-        return {
+        result = {
             "posted": posted_count,
             "draft": draft_count,
             "total": posted_count + draft_count,
         }
+        if filters is not None:
+            result["filtered"] = row[2] or 0
+        return result
 
     async def _find_model_by_id(
         self,
         transaction_id: UUID,
     ) -> Optional[TransactionModel]:
-        stmt = select(TransactionModel).where(
-            TransactionModel.user_id == self._user_id,
-            TransactionModel.id == transaction_id,
-        )
+        stmt = self._base_user_query().where(TransactionModel.id == transaction_id)
         result = await self._session.execute(stmt)
         return result.unique().scalar_one_or_none()
 
@@ -354,6 +513,7 @@ class TransactionRepositorySQLAlchemy(TransactionRepository):
             is_posted=transaction.is_posted,
             created_at=transaction.created_at,
         )
+        self._apply_promoted_metadata(model, transaction.metadata_raw)
 
         # Create journal entry models
         for entry in transaction.entries:
@@ -384,6 +544,7 @@ class TransactionRepositorySQLAlchemy(TransactionRepository):
         model.source_iban = transaction.source_iban
         model.is_internal_transfer = transaction.is_internal_transfer
         model.transaction_metadata = transaction.metadata_raw
+        self._apply_promoted_metadata(model, transaction.metadata_raw)
         model.is_posted = transaction.is_posted
 
         # Clear existing entries
@@ -401,10 +562,27 @@ class TransactionRepositorySQLAlchemy(TransactionRepository):
             )
             model.entries.append(entry_model)
 
-    async def _map_to_domain(self, model: TransactionModel) -> Optional[Transaction]:
+    @staticmethod
+    def _apply_promoted_metadata(
+        model: TransactionModel,
+        metadata: dict[str, Any],
+    ) -> None:
+        """Copy promoted metadata values into their indexed columns."""
+        for key in PROMOTED_METADATA_KEYS:
+            value = metadata.get(key)
+            setattr(model, key, None if value is None else str(value))
+
+    async def _map_to_domain(
+        self,
+        model: TransactionModel,
+        accounts: Optional[dict[UUID, Account]] = None,
+    ) -> Optional[Transaction]:
+        if accounts is None:
+            accounts = await self._load_accounts([model])
+
         entries: List[JournalEntry] = []
         for entry_model in model.entries:
-            entry = await self._reconstitute_journal_entry(entry_model)
+            entry = await self._reconstitute_journal_entry(entry_model, accounts)
             if entry is not None:
                 entries.append(entry)
 
@@ -429,9 +607,13 @@ class TransactionRepositorySQLAlchemy(TransactionRepository):
     async def _reconstitute_journal_entry(
         self,
         entry_model: JournalEntryModel,
+        accounts: Optional[dict[UUID, Account]] = None,
     ) -> Optional[JournalEntry]:
-        # Load account
-        account = await self._account_repo.find_by_id(entry_model.account_id)
+        # Resolve account from the identity map, or load it on its own
+        if accounts is None:
+            account = await self._account_repo.find_by_id(entry_model.account_id)
+        else:
+            account = accounts.get(entry_model.account_id)
         if not account:
             logger.warning(
                 "DATA INTEGRITY: Account %s not found for entry %s in transaction %s",
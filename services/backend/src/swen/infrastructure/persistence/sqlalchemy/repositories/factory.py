@@ -11,6 +11,7 @@ from swen.infrastructure.banking.bank_connection_dispatcher import (
 )
 from swen.infrastructure.persistence.sqlalchemy.adapters.analytics import (
     SqlAlchemyAnalyticsReadAdapter,
+    SqlAlchemyDashboardReadAdapter,
 )
 from swen.infrastructure.persistence.sqlalchemy.repositories.accounting import (
     AccountRepositorySQLAlchemy,
@@ -71,6 +72,7 @@ class SQLAlchemyRepositoryFactory:
         self._bank_account_repo: BankAccountRepositorySQLAlchemy | None = None
         self._bank_transaction_repo: BankTransactionRepositorySQLAlchemy | None = None
         self._analytics_read_adapter: SqlAlchemyAnalyticsReadAdapter | None = None
+        self._dashboard_read_adapter: SqlAlchemyDashboardReadAdapter | None = None
         self._settings_repo: UserSettingsRepositorySQLAlchemy | None = None
         self._fints_config_repo: FinTSConfigRepositorySQLAlchemy | None = None
         self._geldstrom_api_config_repo: (
@@ -164,6 +166,14 @@ class SQLAlchemyRepositoryFactory:
             )
         return self._analytics_read_adapter
 
+    def dashboard_read_port(self) -> SqlAlchemyDashboardReadAdapter:
+        if self._dashboard_read_adapter is None:
+            self._dashboard_read_adapter = SqlAlchemyDashboardReadAdapter(
+                self._session,
+                self._current_user,
+            )
+        return self._dashboard_read_adapter
+
     def user_repository(self) -> UserRepositorySQLAlchemy:
         return UserRepositorySQLAlchemy(self._session)
 
@@ -21,6 +21,9 @@ from swen.infrastructure.persistence.sqlalchemy.models.banking import (
 from swen.infrastructure.persistence.sqlalchemy.models.integration import (
     TransactionImportModel,
 )
+from swen.infrastructure.persistence.sqlalchemy.models.monthly_balances import (
+    MonthlyBalanceDeltas,
+)
 from swen.infrastructure.persistence.sqlalchemy.repositories.accounting import (
     AccountRepositorySQLAlchemy,
     TransactionRepositorySQLAlchemy,
@@ -74,19 +77,7 @@ class TransactionImportRepositorySQLAlchemy(TransactionImportRepository):
             existing.booking_date = transaction_import.booking_date
         else:
             # Create new import
-            model = TransactionImportModel(
-                id=transaction_import.id,
-                user_id=transaction_import.user_id,
-                bank_transaction_id=transaction_import.bank_transaction_id,
-                status=transaction_import.status,
-                accounting_transaction_id=transaction_import.accounting_transaction_id,
-                error_message=transaction_import.error_message,
-                created_at=transaction_import.created_at,
-                updated_at=transaction_import.updated_at,
-                imported_at=transaction_import.imported_at,
-                booking_date=transaction_import.booking_date,
-            )
-            self._session.add(model)
+            self._session.add(self._domain_to_model(transaction_import))
 
         await self._session.flush()
 
@@ -119,6 +110,23 @@ class TransactionImportRepositorySQLAlchemy(TransactionImportRepository):
 
         return self._model_to_domain(model)
 
+    async def find_by_bank_transaction_ids(
+        self,
+        bank_transaction_ids: List[UUID],
+    ) -> dict[UUID, TransactionImport]:
+        if not bank_transaction_ids:
+            return {}
+
+        stmt = select(TransactionImportModel).where(
+            TransactionImportModel.user_id == self._user_id,
+            TransactionImportModel.bank_transaction_id.in_(bank_transaction_ids),
+        )
+        result = await self._session.execute(stmt)
+        return {
+            model.bank_transaction_id: self._model_to_domain(model)
+            for model in result.scalars().all()
+        }
+
     async def find_by_accounting_transaction_id(
         self,
         transaction_id: UUID,
@@ -269,6 +277,23 @@ class TransactionImportRepositorySQLAlchemy(TransactionImportRepository):
             imported_at=model.imported_at,
         )
 
+    def _domain_to_model(
+        self,
+        transaction_import: TransactionImport,
+    ) -> TransactionImportModel:
+        return TransactionImportModel(
+            id=transaction_import.id,
+            user_id=transaction_import.user_id,
+            bank_transaction_id=transaction_import.bank_transaction_id,
+            status=transaction_import.status,
+            accounting_transaction_id=transaction_import.accounting_transaction_id,
+            error_message=transaction_import.error_message,
+            created_at=transaction_import.created_at,
+            updated_at=transaction_import.updated_at,
+            imported_at=transaction_import.imported_at,
+            booking_date=transaction_import.booking_date,
+        )
+
     async def save_complete_import(
         self,
         import_record: TransactionImport,
@@ -284,6 +309,31 @@ class TransactionImportRepositorySQLAlchemy(TransactionImportRepository):
             if ob_adjustment is not None:
                 await transaction_repo._save_no_commit(ob_adjustment)
 
+    async def save_complete_imports(
+        self,
+        imports: List[tuple[TransactionImport, Optional[Transaction]]],
+    ) -> None:
+        for import_record, accounting_tx in imports:
+            self._assert_user_owned(import_record, accounting_tx)
+        transaction_repo = self._get_transaction_repository()
+
+        # The unit of work turns each table's new rows into multi-row INSERTs
+        transaction_models = [
+            await transaction_repo._create_model_from_domain(accounting_tx)
+            for _, accounting_tx in imports
+            if accounting_tx is not None
+        ]
+        balances = MonthlyBalanceDeltas()
+        for model in transaction_models:
+            balances.add(model)
+        models: list[object] = [*transaction_models]
+        models.extend(self._domain_to_model(record) for record, _ in imports)
+
+        async with self._atomic_scope():
+            self._session.add_all(models)
+            await self._session.flush()
+            await balances.apply(self._session)
+
     async def mark_reconciled_as_internal_transfer(
         self,
         import_record: TransactionImport,
@@ -346,7 +396,7 @@ class TransactionImportRepositorySQLAlchemy(TransactionImportRepository):
     def _assert_user_owned(
         self,
         import_record: TransactionImport,
-        accounting_tx: Transaction,
+        accounting_tx: Optional[Transaction],
         ob_adjustment: Optional[Transaction] = None,
     ) -> None:
         if import_record.user_id != self._user_id:
@@ -355,7 +405,7 @@ class TransactionImportRepositorySQLAlchemy(TransactionImportRepository):
                 f"{import_record.user_id}, not {self._user_id}"
             )
             raise PermissionError(msg)
-        if accounting_tx.user_id != self._user_id:
+        if accounting_tx is not None and accounting_tx.user_id != self._user_id:
             msg = (
                 f"Accounting transaction {accounting_tx.id} belongs to user "
                 f"{accounting_tx.user_id}, not {self._user_id}"
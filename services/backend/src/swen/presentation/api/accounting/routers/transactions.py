@@ -11,6 +11,7 @@ from fastapi.responses import StreamingResponse
 
 from swen.application.accounting.commands import (
     BulkPostTransactionsCommand,
+    BulkUnpostTransactionsCommand,
     CreateSimpleTransactionCommand,
     CreateTransactionCommand,
     DeleteTransactionCommand,
@@ -29,9 +30,12 @@ from swen.application.accounting.dtos import (
 from swen.application.accounting.queries import ListTransactionsQuery
 from swen.application.events.base import SyncProgressEvent
 from swen.domain.shared.exceptions import DomainException, ErrorCode
+from swen.domain.shared.value_objects import PageCursor
 from swen.presentation.api.accounting.schemas.transactions import (
     BulkPostRequest,
     BulkPostResponse,
+    BulkUnpostRequest,
+    BulkUnpostResponse,
     ReclassifyDraftsRequest,
     SimpleTransactionToCreateRequest,
     TransactionCreateRequest,
@@ -54,6 +58,14 @@ PageFilter = Annotated[
     int,
     Query(ge=1, description="Page number (1-based)"),
 ]
+CursorFilter = Annotated[
+    str | None,
+    Query(description="next_cursor of the previous page (overrides page)"),
+]
+IncludeTotalsFilter = Annotated[
+    bool,
+    Query(description="Include status and filtered counts (skip for scrolling)"),
+]
 StatusFilter = Annotated[
     str | None,
     Query(description="Filter by status: 'posted' or 'draft'"),
@@ -81,9 +93,11 @@ _PAGE_SIZE = 50  # Transactions per page
         200: {"description": "List of transactions"},
     },
 )
-async def list_transactions(
+async def list_transactions(  # noqa: PLR0913
     factory: RepoFactoryDep,
     page: PageFilter = 1,
+    cursor: CursorFilter = None,
+    include_totals: IncludeTotalsFilter = True,
     status_filter: StatusFilter = None,
     account_number: AccountNumberFilter = None,
     exclude_transfers: ExcludeTransfersFilter = None,
@@ -91,11 +105,22 @@ async def list_transactions(
     """
     List transactions for the current user with pagination.
 
-    Returns 50 transactions per page. Supports filtering by:
+    Returns 50 transactions per page, newest first. Pass the response's
+    `next_cursor` as `cursor` to fetch the following page at constant cost;
+    `page` remains supported for jumping to a page number. Supports filtering by:
     - Status (posted/draft)
     - Account number
     - Internal transfers (excluded by default when not filtering by account)
     """
+    if cursor is not None:
+        try:
+            PageCursor.decode(cursor)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e),
+            ) from e
+
     query = ListTransactionsQuery(
         transaction_repository=factory.transaction_repository(),
         account_repository=factory.account_repository(),
@@ -104,13 +129,14 @@ async def list_transactions(
     filters = TransactionListFilterDTO(
         page=page,
         page_size=_PAGE_SIZE,
+        cursor=cursor,
+        include_totals=include_totals,
         status_filter=status_filter,
         iban_filter=account_number,
         exclude_transfers=exclude_transfers,
     )
 
     result = await query.execute(filters)
-
     return TransactionListResponse.model_validate(result)
 
 
@@ -533,8 +559,9 @@ async def bulk_post_transactions(
     """
     Post multiple draft transactions at once.
 
-    Each posted transaction is submitted as a training example to the ML
-    service, improving future classifications.
+    All drafts are validated before any is posted, so one invalid draft
+    rejects the whole batch. The posted transactions are submitted to the
+    ML service as training examples, improving future classifications.
 
     Specify either `transaction_ids` for specific transactions or
     `post_all_drafts=true` to post all remaining drafts.
@@ -558,6 +585,32 @@ async def bulk_post_transactions(
     )
 
 
+@router.post(
+    "/bulk-unpost",
+    summary="Revert multiple posted transactions to draft",
+    responses={
+        200: {"description": "Transactions unposted"},
+    },
+)
+async def bulk_unpost_transactions(
+    factory: RepoFactoryDep,
+    request: BulkUnpostRequest,
+) -> BulkUnpostResponse:
+    """
+    Unpost multiple transactions at once (revert to draft).
+
+    IDs that are unknown or already drafts are ignored.
+    """
+    command = BulkUnpostTransactionsCommand.from_factory(factory)
+    unposted = await command.execute(transaction_ids=request.transaction_ids)
+
+    logger.info("Bulk unposted %d transactions", len(unposted))
+    return BulkUnpostResponse(
+        unposted_count=len(unposted),
+        transaction_ids=[txn.id for txn in unposted],
+    )
+
+
 def _format_sse_event(event_type: str, data: dict) -> str:
     """Format data as an SSE event string."""
     json_data = json.dumps(data)
@@ -363,3 +363,20 @@ class BulkPostResponse(BaseModel):
             },
         },
     )
+
+
+class BulkUnpostRequest(BaseModel):
+    """Request schema for reverting multiple posted transactions to draft."""
+
+    transaction_ids: list[UUID] = Field(
+        ...,
+        min_length=1,
+        description="Posted transaction IDs to revert to draft",
+    )
+
+
+class BulkUnpostResponse(BaseModel):
+    """Response schema for bulk-unposting transactions."""
+
+    unposted_count: int
+    transaction_ids: list[UUID]
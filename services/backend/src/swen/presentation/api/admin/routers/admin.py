@@ -11,6 +11,7 @@ from swen.presentation.api.admin.routers.admin_fints_provider import (
 )
 from swen.presentation.api.admin.schemas.admin import (
     CreateUserRequest,
+    MLOutboxStatsResponse,
     UpdateRoleRequest,
     UserSummaryResponse,
 )
@@ -19,6 +20,7 @@ from swen.presentation.api.dependencies import (
     DBSessionDep,
     IdentityAdapterFactoryDep,
     IdentityRepoFactoryDep,
+    get_ml_outbox_dispatcher,
 )
 from swen_identity import (
     CannotDeleteSelfError,
@@ -73,6 +75,22 @@ async def list_users(
     ]
 
 
+@router.get(
+    "/ml-outbox",
+    summary="ML outbox queue depth",
+    responses={
+        200: {"description": "Pending ML updates and delivery counters"},
+        403: {"description": "Admin access required"},
+    },
+)
+async def get_ml_outbox_stats(
+    _admin: AdminUserDep,  # Used for authorization check
+) -> MLOutboxStatsResponse:
+    """Show how many training updates are waiting for the ML service."""
+    stats = await get_ml_outbox_dispatcher().stats()
+    return MLOutboxStatsResponse.model_validate(stats)
+
+
 @router.post(
     "/users",
     status_code=status.HTTP_201_CREATED,
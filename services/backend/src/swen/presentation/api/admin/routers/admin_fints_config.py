@@ -10,9 +10,11 @@ from swen.application.system.queries import (
     GetFinTSConfigurationQuery,
     GetFinTSConfigurationStatusQuery,
 )
+from swen.infrastructure.banking import get_fints_worker_pool
 from swen.presentation.api.admin.schemas.fints_config import (
     ConfigStatusResponse,
     FinTSConfigResponse,
+    FinTSWorkerPoolStatsResponse,
     UpdateLocalFinTSConfigResponse,
 )
 from swen.presentation.api.dependencies import (
@@ -117,3 +119,20 @@ async def get_local_fints_configuration_status(
     result = await query.execute()
 
     return ConfigStatusResponse.model_validate(result)
+
+
+@router.get(
+    "/workers",
+    summary="Local FinTS worker pool queue depth",
+    responses={
+        200: {"description": "Running and queued bank dialogues"},
+        403: {"description": "Admin access required"},
+    },
+)
+async def get_local_fints_workers(
+    _admin: AdminUserDep,
+) -> FinTSWorkerPoolStatsResponse:
+    """Show how many bank dialogues are running and waiting (admin only)."""
+    return FinTSWorkerPoolStatsResponse.model_validate(
+        get_fints_worker_pool().stats(),
+    )
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Optional
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, EmailStr, Field
@@ -27,3 +28,20 @@ class UserSummaryResponse(BaseModel):
     created_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class MLOutboxStatsResponse(BaseModel):
+    """Response schema for the ML outbox queue depth and delivery counters."""
+
+    pending: int = Field(description="Updates waiting for delivery")
+    due: int = Field(description="Pending updates that are due now")
+    retrying: int = Field(description="Pending updates that failed before")
+    oldest_pending_seconds: float = Field(
+        description="Age of the oldest pending update",
+    )
+    in_flight: int = Field(description="Updates being delivered right now")
+    delivered_total: int = Field(description="Delivered since process start")
+    failed_total: int = Field(description="Failed attempts since process start")
+    last_error: Optional[str] = None
+
+    model_config = ConfigDict(from_attributes=True)
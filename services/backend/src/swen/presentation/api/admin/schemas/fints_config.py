@@ -28,3 +28,17 @@ class UpdateLocalFinTSConfigResponse(BaseModel):
     message: str
     institute_count: int | None = None
     file_size_kb: int | None = None
+
+
+class FinTSWorkerPoolStatsResponse(BaseModel):
+    """Queue depth of the local FinTS worker pool."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    max_workers: int
+    per_bank_limit: int
+    running: int
+    queued: int
+    queued_by_bank: dict[str, int]
+    completed_total: int
+    cancelled_total: int
@@ -52,10 +52,7 @@ async def get_dashboard_summary(
     Either specify `days` to look back, or `month` for a specific month.
     If neither specified, defaults to current month.
     """
-    query = DashboardSummaryQuery(
-        account_repository=factory.account_repository(),
-        transaction_repository=factory.transaction_repository(),
-    )
+    query = DashboardSummaryQuery.from_factory(factory)
 
     summary = await query.execute(
         days=days,
@@ -83,10 +80,7 @@ async def get_spending_breakdown(
 
     Shows how much was spent in each expense category.
     """
-    query = DashboardSummaryQuery(
-        account_repository=factory.account_repository(),
-        transaction_repository=factory.transaction_repository(),
-    )
+    query = DashboardSummaryQuery.from_factory(factory)
 
     summary = await query.execute(
         days=days,
@@ -116,10 +110,7 @@ async def get_balances(
 
     Shows the current balance of each bank/asset account.
     """
-    query = DashboardSummaryQuery(
-        account_repository=factory.account_repository(),
-        transaction_repository=factory.transaction_repository(),
-    )
+    query = DashboardSummaryQuery.from_factory(factory)
 
     # Get summary for balances (no date filter needed)
     summary = await query.execute(show_drafts=True)
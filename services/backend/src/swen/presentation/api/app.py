@@ -19,7 +19,8 @@ from fastapi import APIRouter, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.ext.asyncio import AsyncEngine
 
-from swen.infrastructure.persistence.sqlalchemy.models import Base
+from swen.infrastructure.banking import configure_fints_worker_pool
+from swen.infrastructure.persistence.sqlalchemy.models import Base, upgrade_schema
 from swen.presentation.api.accounting.routers import (
     accounts_router as accounting_accounts_router,
 )
@@ -35,7 +36,12 @@ from swen.presentation.api.analytics.routers.dashboard import router as dashboar
 from swen.presentation.api.analytics.routers.exports import router as exports_router
 from swen.presentation.api.auth.routers.auth import router as auth_router
 from swen.presentation.api.banking.routers import bank_connections_router
-from swen.presentation.api.dependencies import get_engine, get_ml_client
+from swen.presentation.api.dependencies import (
+    get_engine,
+    get_fints_worker_pool_config,
+    get_ml_client,
+    get_ml_outbox_dispatcher,
+)
 from swen.presentation.api.exception_handlers import (
     setup_exception_handlers,
 )
@@ -111,10 +117,15 @@ async def lifespan(_: FastAPI) -> AsyncGenerator[None, None]:
     engine = get_engine()
     await _init_database_schema(engine)
     await _check_ml_service_health()
+    fints_worker_pool = configure_fints_worker_pool(get_fints_worker_pool_config())
+    outbox_dispatcher = get_ml_outbox_dispatcher()
+    outbox_dispatcher.start()
     yield
 
-    # Shutdown - dispose the shared engine and its connection pool
+    # Shutdown - stop ML delivery, then dispose the shared engine and its pool
     logger.info("Shutting down SWEN API...")
+    await outbox_dispatcher.stop()
+    fints_worker_pool.shutdown()
     await engine.dispose()
     logger.info("Database connections closed")
 
@@ -125,6 +136,7 @@ async def _init_database_schema(engine: AsyncEngine) -> None:
     try:
         async with engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
+            await conn.run_sync(upgrade_schema)
     except ConnectionRefusedError:
         logger.critical("Could not connect to the database.")
         raise SystemExit(1) from None
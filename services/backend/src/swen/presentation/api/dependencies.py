@@ -22,14 +22,18 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from swen.application.factories import RepositoryFactory
+from swen.application.integration.services.bank_account_sync import SyncBatchConfig
 from swen.application.ports import AccountClassifierTrainingPort
 from swen.domain.integration.ports.counter_account_proposal_port import (
     CounterAccountProposalPort,
 )
 from swen.domain.shared.current_user import CurrentUser
 from swen.infrastructure.adapters.identity import IdentityAdapter
+from swen.infrastructure.banking import FinTSWorkerPoolConfig
 from swen.infrastructure.integration import (
     MLAccountClassifierTrainingAdapter,
+    MLOutboxConfig,
+    MLOutboxDispatcher,
     MLServiceClient,
 )
 from swen.infrastructure.integration.adapters.counter_account_resolution.ml import (
@@ -288,13 +292,36 @@ def get_ml_client() -> MLServiceClient:
     )
 
 
-@lru_cache(maxsize=1)
-def get_classifier_training_port() -> AccountClassifierTrainingPort | None:
-    """Get the account classifier training port (singleton)."""
+def get_classifier_training_port(
+    session: AsyncSession = Depends(get_db_session),
+) -> AccountClassifierTrainingPort | None:
+    """Get the account classifier training port (request-scoped).
+
+    Bound to the request's session so queued ML updates commit with it.
+    """
     settings = get_settings()
     if not settings.ml_service_enabled:
         return None
-    return MLAccountClassifierTrainingAdapter(client=get_ml_client())
+    return MLAccountClassifierTrainingAdapter(
+        session=session,
+        client=get_ml_client(),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_ml_outbox_dispatcher() -> MLOutboxDispatcher:
+    """Get the ML outbox dispatcher (singleton)."""
+    settings = get_settings()
+    return MLOutboxDispatcher(
+        session_maker=get_session_maker(),
+        client=get_ml_client(),
+        config=MLOutboxConfig(
+            batch_size=settings.ml_outbox_batch_size,
+            max_concurrency=settings.ml_outbox_max_concurrency,
+            poll_seconds=settings.ml_outbox_poll_seconds,
+            max_backoff_seconds=settings.ml_outbox_max_backoff_seconds,
+        ),
+    )
 
 
 @lru_cache(maxsize=1)
@@ -303,6 +330,29 @@ def get_counter_account_proposal_port() -> CounterAccountProposalPort:
     return MLCounterAccountAdapter(ml_client=get_ml_client())
 
 
+@lru_cache(maxsize=1)
+def get_sync_batch_config() -> SyncBatchConfig:
+    """Get the sync batch sizing configuration (singleton)."""
+    settings = get_settings()
+    return SyncBatchConfig(
+        initial_size=settings.sync_batch_size,
+        min_size=settings.sync_batch_min_size,
+        max_size=settings.sync_batch_max_size,
+        target_seconds=settings.sync_batch_target_seconds,
+        pipeline_depth=settings.sync_pipeline_depth,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_fints_worker_pool_config() -> FinTSWorkerPoolConfig:
+    """Get the local FinTS worker pool limits (singleton)."""
+    settings = get_settings()
+    return FinTSWorkerPoolConfig(
+        max_workers=settings.fints_max_workers,
+        per_bank_limit=settings.fints_per_bank_limit,
+    )
+
+
 # DB session
 DBSessionDep = Annotated[AsyncSession, Depends(get_db_session)]
 # Settings Dependency
@@ -332,3 +382,4 @@ CounterAccountPortDep = Annotated[
     CounterAccountProposalPort,
     Depends(get_counter_account_proposal_port),
 ]
+SyncBatchConfigDep = Annotated[SyncBatchConfig, Depends(get_sync_batch_config)]
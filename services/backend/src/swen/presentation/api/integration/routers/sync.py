@@ -20,7 +20,11 @@ from swen.domain.shared.exceptions import DomainException, ErrorCode
 from swen.infrastructure.integration.adapters.event_publisher import (
     SseSyncEventPublisher,
 )
-from swen.presentation.api.dependencies import CounterAccountPortDep, RepoFactoryDep
+from swen.presentation.api.dependencies import (
+    CounterAccountPortDep,
+    RepoFactoryDep,
+    SyncBatchConfigDep,
+)
 from swen.presentation.api.integration.schemas.sync import (
     SyncRunRequest,
     SyncStatusResponse,
@@ -45,6 +49,7 @@ router = APIRouter()
 async def run_sync_streaming(
     factory: RepoFactoryDep,
     resolution_port: CounterAccountPortDep,
+    batch_config: SyncBatchConfigDep,
     request: Optional[SyncRunRequest] = None,
 ) -> StreamingResponse:
     """
@@ -112,6 +117,7 @@ async def run_sync_streaming(
                 factory,
                 resolution_port=resolution_port,
                 publisher=publisher,
+                batch_config=batch_config,
             )
         except DomainException as e:
             logger.exception("Failed to create sync command: %s", e)
@@ -125,7 +125,24 @@ class Settings(BaseSettings):
     # ML Service (for transaction classification)
     ml_service_enabled: bool = False
     ml_service_url: str = "http://localhost:8001"
+    # Must exceed the ML service's SWEN_ML_ENRICHMENT_BATCH_DEADLINE_SECONDS
     ml_service_timeout: float = 10.0
+    # Delivery of queued training updates (ML_OUTBOX_ prefix)
+    ml_outbox_batch_size: int = 500
+    ml_outbox_max_concurrency: int = 4
+    ml_outbox_poll_seconds: float = 2.0
+    ml_outbox_max_backoff_seconds: float = 300.0
+
+    # Sync classification batches (SYNC_ prefix)
+    sync_batch_size: int = 20
+    sync_batch_min_size: int = 5
+    sync_batch_max_size: int = 200
+    sync_batch_target_seconds: float = 5.0  # 0 = fixed sync_batch_size
+    sync_pipeline_depth: int = 2
+
+    # Local FinTS worker pool (FINTS_ prefix)
+    fints_max_workers: int = 8
+    fints_per_bank_limit: int = 1
 
     # Registration
     registration_mode: Literal["open", "admin_only"] = "admin_only"
@@ -6,6 +6,9 @@ Covers:
 - Empty-import branch: update_last_used called, SyncResult with zero imports,
   no classification events
 - Batch processing: _process_batch_loop resolves + imports in interleaved batches
+- Pipelining: the next batch is classified while the current one is imported,
+  progress events stay ordered and classification errors propagate
+- Streaming: chunks of a batch are imported as soon as they are resolved
 
 Note: AccountSyncStartedEvent is now emitted by SyncBankAccountsCommand via
 the SyncNotificationService, not by BankAccountSyncService directly.
@@ -13,6 +16,7 @@ the SyncNotificationService, not by BankAccountSyncService directly.
 
 from __future__ import annotations
 
+import asyncio
 from types import SimpleNamespace
 from typing import cast
 from unittest.mock import AsyncMock, MagicMock
@@ -22,11 +26,15 @@ import pytest
 from swen.application.events import (
     AccountSyncFetchedEvent,
     ClassificationCompletedEvent,
+    ClassificationProgressEvent,
     ClassificationStartedEvent,
 )
 from swen.application.integration.services.bank_account_sync.bank_account_sync_service import (
     BankAccountSyncService,
 )
+from swen.application.integration.services.bank_account_sync.batch_sizing import (
+    SyncBatchConfig,
+)
 from swen.application.integration.services.sync_notification_service import (
     SyncNotificationService,
 )
@@ -71,6 +79,7 @@ def _make_service(
     stored_transactions=None,
     resolve_batch_return=None,
     import_results=None,
+    batch_config=None,
 ) -> tuple[BankAccountSyncService, SyncNotificationService]:
     """Build a BankAccountSyncService with all dependencies mocked.
 
@@ -103,6 +112,14 @@ def _make_service(
     batch_service = AsyncMock()
     batch_service.resolve_batch.return_value = resolve_batch_return
 
+    async def resolve_batch_streaming(batch):
+        # One chunk per batch unless a test overrides this
+        yield batch, await batch_service.resolve_batch(batch)
+
+    batch_service.resolve_batch_streaming = MagicMock(
+        side_effect=resolve_batch_streaming
+    )
+
     import_service = AsyncMock()
     import_service.import_batch.return_value = import_results
     # compute_stats is a sync method — override so it returns a plain tuple, not a coroutine
@@ -130,6 +147,7 @@ def _make_service(
         credential_repo=credential_repo,
         import_repo=import_repo,
         notifier=notifier,
+        batch_config=batch_config,
     )
     return service, notifier
 
@@ -371,3 +389,167 @@ class TestBatchProcessing:
         call_kwargs = cast(AsyncMock, service._import_service.import_batch).call_args
         assert call_kwargs.kwargs["resolved"] == resolved
         assert call_kwargs.kwargs["source_iban"] == _IBAN
+
+
+class TestPipelining:
+    """_process_batch_loop overlaps classification of the next batch with the
+    import of the current one."""
+
+    @staticmethod
+    def _fixed_batches(size: int) -> SyncBatchConfig:
+        return SyncBatchConfig(initial_size=size, min_size=1, target_seconds=0)
+
+    @pytest.mark.asyncio
+    async def test_progress_events_cover_all_batches_in_order(self):
+        publisher = InMemorySyncEventPublisher()
+        stored = [_make_stored_transaction() for _ in range(5)]
+
+        service, notifier = _make_service(
+            publisher=publisher,
+            bank_transactions=[MagicMock()],
+            stored_transactions=stored,
+            batch_config=self._fixed_batches(2),
+        )
+        await notifier.emit_account_sync_started_event(_IBAN, "Test Account")
+
+        await service.sync_account(
+            mapping=_make_mapping(),
+            days=None,
+            auto_post=False,
+        )
+
+        resolve_batch = cast(AsyncMock, service._batch_service.resolve_batch)
+        assert [c.args[0] for c in resolve_batch.call_args_list] == [
+            stored[0:2],
+            stored[2:4],
+            stored[4:5],
+        ]
+        progress = [
+            e.current
+            for e in publisher.events
+            if isinstance(e, ClassificationProgressEvent)
+        ]
+        assert progress == [2, 4, 5]
+        assert isinstance(publisher.events[-1], ClassificationCompletedEvent)
+        cast(AsyncMock, service._batch_service.preload).assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_next_batch_is_classified_during_import(self):
+        publisher = InMemorySyncEventPublisher()
+        stored = [_make_stored_transaction() for _ in range(4)]
+
+        service, notifier = _make_service(
+            publisher=publisher,
+            bank_transactions=[MagicMock()],
+            stored_transactions=stored,
+            batch_config=self._fixed_batches(2),
+        )
+        await notifier.emit_account_sync_started_event(_IBAN, "Test Account")
+
+        second_batch_classified = asyncio.Event()
+
+        async def resolve_batch(batch):
+            if batch == stored[2:4]:
+                second_batch_classified.set()
+            return {}
+
+        async def import_batch(stored_transactions, **_kwargs):
+            if stored_transactions == stored[0:2]:
+                # Would time out if classification waited for this import
+                await asyncio.wait_for(second_batch_classified.wait(), timeout=1)
+            return []
+
+        cast(
+            AsyncMock, service._batch_service.resolve_batch
+        ).side_effect = resolve_batch
+        cast(AsyncMock, service._import_service.import_batch).side_effect = import_batch
+
+        await service.sync_account(
+            mapping=_make_mapping(),
+            days=None,
+            auto_post=False,
+        )
+
+        assert cast(AsyncMock, service._import_service.import_batch).await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_classification_error_propagates(self):
+        publisher = InMemorySyncEventPublisher()
+        stored = [_make_stored_transaction() for _ in range(4)]
+
+        service, notifier = _make_service(
+            publisher=publisher,
+            bank_transactions=[MagicMock()],
+            stored_transactions=stored,
+            batch_config=self._fixed_batches(2),
+        )
+        await notifier.emit_account_sync_started_event(_IBAN, "Test Account")
+        cast(AsyncMock, service._batch_service.resolve_batch).side_effect = [
+            {},
+            RuntimeError("ML service exploded"),
+        ]
+
+        with pytest.raises(RuntimeError, match="ML service exploded"):
+            await service.sync_account(
+                mapping=_make_mapping(),
+                days=None,
+                auto_post=False,
+            )
+
+        import_batch = cast(AsyncMock, service._import_service.import_batch)
+        assert import_batch.await_count == 1
+
+
+class TestStreaming:
+    """Chunks streamed by the batch service are imported one by one."""
+
+    @pytest.mark.asyncio
+    async def test_chunk_is_imported_before_batch_is_fully_classified(self):
+        publisher = InMemorySyncEventPublisher()
+        stored = [_make_stored_transaction() for _ in range(3)]
+
+        service, notifier = _make_service(
+            publisher=publisher,
+            bank_transactions=[MagicMock()],
+            stored_transactions=stored,
+            batch_config=SyncBatchConfig(initial_size=3, target_seconds=0),
+        )
+        await notifier.emit_account_sync_started_event(_IBAN, "Test Account")
+
+        first_chunk_imported = asyncio.Event()
+
+        async def resolve_batch_streaming(batch):
+            yield batch[:1], {"fast": MagicMock()}
+            # Would time out if the import waited for the whole batch
+            await asyncio.wait_for(first_chunk_imported.wait(), timeout=1)
+            yield batch[1:], {"slow": MagicMock()}
+
+        async def import_batch(stored_transactions, **_kwargs):
+            if stored_transactions == stored[:1]:
+                first_chunk_imported.set()
+            return []
+
+        cast(
+            MagicMock, service._batch_service.resolve_batch_streaming
+        ).side_effect = resolve_batch_streaming
+        cast(AsyncMock, service._import_service.import_batch).side_effect = import_batch
+
+        await service.sync_account(
+            mapping=_make_mapping(),
+            days=None,
+            auto_post=False,
+        )
+
+        import_calls = cast(
+            AsyncMock, service._import_service.import_batch
+        ).call_args_list
+        assert [c.kwargs["stored_transactions"] for c in import_calls] == [
+            stored[:1],
+            stored[1:],
+        ]
+        progress = [
+            e.current
+            for e in publisher.events
+            if isinstance(e, ClassificationProgressEvent)
+        ]
+        assert progress == [1, 3]
@@ -0,0 +1,125 @@
+"""Unit tests for BulkPostTransactionsCommand and BulkUnpostTransactionsCommand."""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from swen.application.accounting.commands import (
+    BulkPostTransactionsCommand,
+    BulkUnpostTransactionsCommand,
+)
+from swen.domain.shared.exceptions import ValidationError
+
+
+def _mock_transaction(*, is_posted: bool) -> MagicMock:
+    txn = MagicMock()
+    txn.id = uuid4()
+    txn.is_posted = is_posted
+    return txn
+
+
+@pytest.fixture
+def mock_transaction_repo():
+    """Create a mock transaction repository."""
+    repo = AsyncMock()
+    repo.set_posted.side_effect = lambda ids, **_: list(ids)
+    return repo
+
+
+class TestBulkPostTransactionsCommand:
+    """Tests for BulkPostTransactionsCommand."""
+
+    @pytest.mark.asyncio
+    async def test_posts_all_drafts_with_one_update(
+        self,
+        mock_transaction_repo,
+        mock_uow,
+        monkeypatch,
+    ):
+        """Drafts are validated in memory and written with one set-based call."""
+        drafts = [_mock_transaction(is_posted=False) for _ in range(3)]
+        mock_transaction_repo.find_draft_transactions.return_value = drafts
+        ml_port = MagicMock()
+        ml_port.enabled = True
+        command = BulkPostTransactionsCommand(
+            mock_transaction_repo,
+            mock_uow,
+            ml_port=ml_port,
+        )
+        submitted = MagicMock()
+        monkeypatch.setattr(command._ml_example_service, "submit_examples", submitted)
+        monkeypatch.setattr(
+            "swen.application.accounting.commands.post_transaction_command."
+            "TransactionDTO.from_transaction",
+            lambda txn: txn,
+        )
+
+        posted = await command.execute(post_all_drafts=True)
+
+        assert posted == drafts
+        for txn in drafts:
+            txn.post.assert_called_once_with()
+        mock_transaction_repo.set_posted.assert_awaited_once_with(
+            [txn.id for txn in drafts],
+            is_posted=True,
+        )
+        mock_transaction_repo.save.assert_not_awaited()
+        submitted.assert_called_once_with(drafts)
+
+    @pytest.mark.asyncio
+    async def test_invalid_draft_aborts_before_writing(
+        self,
+        mock_transaction_repo,
+        mock_uow,
+    ):
+        """A draft failing validation rejects the batch without a write."""
+        valid = _mock_transaction(is_posted=False)
+        invalid = _mock_transaction(is_posted=False)
+        invalid.post.side_effect = ValidationError("unbalanced")
+        mock_transaction_repo.find_by_ids.return_value = [valid, invalid]
+        command = BulkPostTransactionsCommand(mock_transaction_repo, mock_uow)
+
+        with pytest.raises(ValidationError):
+            await command.execute(transaction_ids=[valid.id, invalid.id])
+
+        mock_transaction_repo.set_posted.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_requires_ids_or_post_all(self, mock_transaction_repo, mock_uow):
+        command = BulkPostTransactionsCommand(mock_transaction_repo, mock_uow)
+
+        with pytest.raises(ValidationError):
+            await command.execute()
+
+
+class TestBulkUnpostTransactionsCommand:
+    """Tests for BulkUnpostTransactionsCommand."""
+
+    @pytest.mark.asyncio
+    async def test_unposts_only_posted_transactions(
+        self,
+        mock_transaction_repo,
+        mock_uow,
+        monkeypatch,
+    ):
+        posted = _mock_transaction(is_posted=True)
+        draft = _mock_transaction(is_posted=False)
+        # Returned out of order; the result follows the requested order
+        mock_transaction_repo.find_by_ids.return_value = [draft, posted]
+        monkeypatch.setattr(
+            "swen.application.accounting.commands.post_transaction_command."
+            "TransactionDTO.from_transaction",
+            lambda txn: txn,
+        )
+        command = BulkUnpostTransactionsCommand(mock_transaction_repo, mock_uow)
+
+        unposted = await command.execute(transaction_ids=[posted.id, draft.id])
+
+        assert unposted == [posted]
+        posted.unpost.assert_called_once_with()
+        draft.unpost.assert_not_called()
+        mock_transaction_repo.set_posted.assert_awaited_once_with(
+            [posted.id],
+            is_posted=False,
+        )
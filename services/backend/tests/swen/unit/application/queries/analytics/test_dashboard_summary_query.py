@@ -0,0 +1,112 @@
+"""Unit tests for DashboardSummaryQuery."""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from swen.application.analytics.queries import DashboardSummaryQuery
+from swen.domain.accounting.entities import Account, AccountType
+from swen.domain.accounting.services import PeriodTotals
+from swen.domain.accounting.value_objects import TransactionFilters
+from swen.domain.shared.value_objects import Pagination
+
+USER_ID = uuid4()
+
+
+def _make_query(transaction_repo, dashboard_port, accounts):
+    account_repo = AsyncMock()
+    account_repo.find_all_active.return_value = accounts
+    return DashboardSummaryQuery(
+        account_repository=account_repo,
+        transaction_repository=transaction_repo,
+        dashboard_read_port=dashboard_port,
+    )
+
+
+class TestDashboardSummaryQuery:
+    @pytest.mark.asyncio
+    async def test_assembles_summary_from_aggregates(self):
+        checking = Account("Checking", AccountType.ASSET, "1000", USER_ID)
+        savings = Account("Savings", AccountType.ASSET, "1100", USER_ID)
+        groceries = Account("Groceries", AccountType.EXPENSE, "4000", USER_ID)
+
+        transaction_repo = AsyncMock()
+        transaction_repo.count_by_status.return_value = {
+            "posted": 7,
+            "draft": 3,
+            "total": 10,
+        }
+        transaction_repo.find_with_filters.return_value = []
+        dashboard_port = AsyncMock()
+        dashboard_port.period_totals.return_value = PeriodTotals(
+            total_income=Decimal("2000"),
+            total_expenses=Decimal("150"),
+            category_spending={"Groceries": Decimal("100"), "Rent": Decimal("50")},
+        )
+        dashboard_port.asset_balances.return_value = {checking.id: Decimal("1850")}
+        query = _make_query(
+            transaction_repo,
+            dashboard_port,
+            [checking, groceries, savings],
+        )
+
+        summary = await query.execute(month="2025-03", show_drafts=True)
+
+        dashboard_port.period_totals.assert_awaited_once_with(
+            start_date=datetime(2025, 3, 1, tzinfo=timezone.utc),
+            end_date=datetime(2025, 4, 1, tzinfo=timezone.utc),
+            include_drafts=True,
+        )
+        transaction_repo.find_with_filters.assert_awaited_once_with(
+            TransactionFilters(status=None),
+            Pagination(page_size=10),
+        )
+        transaction_repo.find_all.assert_not_awaited()
+        assert summary.net_income == Decimal("1850")
+        assert [(b.name, b.balance) for b in summary.account_balances] == [
+            ("Checking", Decimal("1850")),
+            ("Savings", Decimal("0")),
+        ]
+        assert [c.category for c in summary.category_spending] == [
+            "Groceries",
+            "Rent",
+        ]
+        assert summary.posted_count == 7
+        assert summary.draft_count == 3
+
+    @pytest.mark.asyncio
+    async def test_hiding_drafts_filters_every_aggregate(self):
+        transaction_repo = AsyncMock()
+        transaction_repo.count_by_status.return_value = {
+            "posted": 7,
+            "draft": 3,
+            "total": 10,
+        }
+        transaction_repo.find_with_filters.return_value = []
+        dashboard_port = AsyncMock()
+        dashboard_port.period_totals.return_value = PeriodTotals()
+        dashboard_port.asset_balances.return_value = {}
+        query = _make_query(transaction_repo, dashboard_port, [])
+
+        summary = await query.execute(show_drafts=False)
+
+        assert summary.draft_count == 0
+        assert dashboard_port.period_totals.await_args.kwargs["include_drafts"] is False
+        dashboard_port.asset_balances.assert_awaited_once_with(include_drafts=False)
+        transaction_repo.find_with_filters.assert_awaited_once_with(
+            TransactionFilters(status="posted"),
+            Pagination(page_size=10),
+        )
+
+
+class TestDashboardSummaryQueryDependencyInjection:
+    def test_from_factory_creates_query(self):
+        mock_factory = Mock()
+
+        query = DashboardSummaryQuery.from_factory(mock_factory)
+
+        assert query is not None
+        mock_factory.dashboard_read_port.assert_called_once()
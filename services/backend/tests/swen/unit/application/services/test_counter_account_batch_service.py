@@ -0,0 +1,332 @@
+"""Tests for CounterAccountBatchService.
+
+Covers:
+- Internal transfer detection via account mappings
+- Proposal validation and fallback handling
+- Query count: mappings and accounts are loaded once and every batch is
+  resolved in memory
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+
+from swen.application.integration.services.counter_account_batch_service import (
+    CounterAccountBatchService,
+)
+from swen.domain.accounting.entities import Account, AccountType
+from swen.domain.accounting.well_known_accounts import WellKnownAccounts
+from swen.domain.integration.entities import AccountMapping
+from swen.domain.integration.value_objects import CounterAccountProposal
+
+_OWN_IBAN = "DE89370400440532013000"
+
+
+@pytest.fixture
+def user_id():
+    return uuid4()
+
+
+@pytest.fixture
+def savings_account(user_id):
+    return Account(
+        name="Savings",
+        account_type=AccountType.ASSET,
+        account_number="1100",
+        user_id=user_id,
+    )
+
+
+@pytest.fixture
+def groceries_account(user_id):
+    return Account(
+        name="Groceries",
+        account_type=AccountType.EXPENSE,
+        account_number="6000",
+        user_id=user_id,
+    )
+
+
+@pytest.fixture
+def salary_account(user_id):
+    return Account(
+        name="Salary",
+        account_type=AccountType.INCOME,
+        account_number="4000",
+        user_id=user_id,
+    )
+
+
+@pytest.fixture
+def fallback_expense_account(user_id):
+    return Account(
+        name="Fallback Expense",
+        account_type=AccountType.EXPENSE,
+        account_number=WellKnownAccounts.FALLBACK_EXPENSE,
+        user_id=user_id,
+    )
+
+
+@pytest.fixture
+def fallback_income_account(user_id):
+    return Account(
+        name="Fallback Income",
+        account_type=AccountType.INCOME,
+        account_number=WellKnownAccounts.FALLBACK_INCOME,
+        user_id=user_id,
+    )
+
+
+@pytest.fixture
+def account_repo(
+    savings_account,
+    groceries_account,
+    salary_account,
+    fallback_expense_account,
+    fallback_income_account,
+):
+    repo = AsyncMock()
+    repo.find_all.return_value = [
+        savings_account,
+        groceries_account,
+        salary_account,
+        fallback_expense_account,
+        fallback_income_account,
+    ]
+    return repo
+
+
+@pytest.fixture
+def mapping_repo(user_id, savings_account):
+    repo = AsyncMock()
+    repo.find_all.return_value = [
+        AccountMapping(
+            iban=_OWN_IBAN,
+            accounting_account_id=savings_account.id,
+            account_name="Savings",
+            user_id=user_id,
+        ),
+    ]
+    return repo
+
+
+def _stored(*, applicant_iban: str | None = None, is_debit: bool = True):
+    transaction = SimpleNamespace(
+        applicant_iban=applicant_iban,
+        is_debit=lambda: is_debit,
+    )
+    return SimpleNamespace(id=uuid4(), transaction=transaction)
+
+
+def _proposal(stored, account_id: UUID | None, confidence: float = 0.9):
+    return CounterAccountProposal(
+        transaction_id=stored.id,
+        counter_account_id=account_id,
+        confidence=confidence,
+    )
+
+
+def _make_service(user_id, account_repo, mapping_repo, port):
+    return CounterAccountBatchService(
+        proposal_port=port,
+        account_repository=account_repo,
+        mapping_repository=mapping_repo,
+        current_user=SimpleNamespace(user_id=user_id),
+    )
+
+
+@pytest.mark.asyncio
+async def test_detects_internal_transfer_from_mapping(
+    user_id,
+    account_repo,
+    mapping_repo,
+    savings_account,
+):
+    port = AsyncMock()
+    service = _make_service(user_id, account_repo, mapping_repo, port)
+    stored = _stored(applicant_iban=" de89370400440532013000 ")
+
+    resolved = await service.resolve_batch([stored])
+
+    assert resolved[stored.id].account is savings_account
+    assert resolved[stored.id].confidence is None
+    port.classify_batch.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_invalid_and_missing_proposals_fall_back(
+    user_id,
+    account_repo,
+    mapping_repo,
+    groceries_account,
+    salary_account,
+    fallback_expense_account,
+    fallback_income_account,
+):
+    valid = _stored(is_debit=True)
+    wrong_direction = _stored(is_debit=True)
+    unknown_account = _stored(is_debit=False)
+    no_proposal = _stored(is_debit=False)
+    port = AsyncMock()
+    port.classify_batch.return_value = [
+        _proposal(valid, groceries_account.id),
+        _proposal(wrong_direction, salary_account.id),
+        _proposal(unknown_account, uuid4()),
+    ]
+    service = _make_service(user_id, account_repo, mapping_repo, port)
+
+    resolved = await service.resolve_batch(
+        [valid, wrong_direction, unknown_account, no_proposal],
+    )
+
+    assert resolved[valid.id].account is groceries_account
+    assert resolved[wrong_direction.id].account is fallback_expense_account
+    assert resolved[unknown_account.id].account is fallback_income_account
+    assert resolved[no_proposal.id].account is fallback_income_account
+
+
+@pytest.mark.asyncio
+async def test_port_unavailable_uses_fallback_for_all(
+    user_id,
+    account_repo,
+    mapping_repo,
+    fallback_expense_account,
+    fallback_income_account,
+):
+    outflow = _stored(is_debit=True)
+    inflow = _stored(is_debit=False)
+    port = AsyncMock()
+    port.classify_batch.return_value = None
+    service = _make_service(user_id, account_repo, mapping_repo, port)
+
+    resolved = await service.resolve_batch([outflow, inflow])
+
+    assert resolved[outflow.id].account is fallback_expense_account
+    assert resolved[inflow.id].account is fallback_income_account
+
+
+@pytest.mark.asyncio
+async def test_missing_fallback_account_raises(
+    user_id, mapping_repo, groceries_account
+):
+    account_repo = AsyncMock()
+    account_repo.find_all.return_value = [groceries_account]
+    port = AsyncMock()
+    port.classify_batch.return_value = None
+    service = _make_service(user_id, account_repo, mapping_repo, port)
+
+    with pytest.raises(ValueError, match="Fallback account"):
+        await service.resolve_batch([_stored()])
+
+
+@pytest.mark.asyncio
+async def test_batches_resolve_without_per_transaction_queries(
+    user_id,
+    account_repo,
+    mapping_repo,
+    groceries_account,
+):
+    """Regression test: resolving used to run several queries per transaction."""
+
+    async def classify_batch(user_id, transactions):
+        return [_proposal(s, groceries_account.id) for s in transactions]
+
+    port = AsyncMock()
+    port.classify_batch.side_effect = classify_batch
+    service = _make_service(user_id, account_repo, mapping_repo, port)
+
+    await service.preload()
+    for _ in range(3):
+        batch = [_stored(applicant_iban=_OWN_IBAN)]
+        batch += [_stored(applicant_iban="DE02120300000000202051") for _ in range(4)]
+        batch += [_stored(is_debit=False)]
+        resolved = await service.resolve_batch(batch)
+        assert len(resolved) == len(batch)
+
+    assert mapping_repo.method_calls == [("find_all", (), {})]
+    assert account_repo.method_calls == [("find_all", (), {})]
+
+
+@pytest.mark.asyncio
+async def test_preload_refreshes_snapshot(user_id, account_repo, mapping_repo):
+    port = AsyncMock()
+    port.classify_batch.return_value = None
+    service = _make_service(user_id, account_repo, mapping_repo, port)
+
+    await service.resolve_batch([_stored()])
+    await service.resolve_batch([_stored()])
+    assert account_repo.find_all.await_count == 1
+
+    await service.preload()
+    await service.resolve_batch([_stored()])
+    assert account_repo.find_all.await_count == 2
+    assert mapping_repo.find_all.await_count == 2
+
+
+def _streaming_port(*chunks):
+    """Port whose ``classify_batch_streaming`` yields the given proposal lists."""
+
+    async def classify_batch_streaming(user_id, transactions):
+        for chunk in chunks:
+            yield chunk
+
+    port = AsyncMock()
+    port.classify_batch_streaming = MagicMock(side_effect=classify_batch_streaming)
+    return port
+
+
+@pytest.mark.asyncio
+async def test_streaming_yields_internal_then_proposal_chunks(
+    user_id,
+    account_repo,
+    mapping_repo,
+    savings_account,
+    groceries_account,
+    fallback_expense_account,
+):
+    internal = _stored(applicant_iban=_OWN_IBAN)
+    fast = _stored(is_debit=True)
+    slow = _stored(is_debit=True)
+    port = _streaming_port(
+        [_proposal(fast, groceries_account.id)],
+        [_proposal(slow, None, confidence=0.0)],
+    )
+    service = _make_service(user_id, account_repo, mapping_repo, port)
+
+    chunks = [c async for c in service.resolve_batch_streaming([internal, fast, slow])]
+
+    assert [batch for batch, _ in chunks] == [[internal], [fast], [slow]]
+    assert chunks[0][1][internal.id].account is savings_account
+    assert chunks[1][1][fast.id].account is groceries_account
+    assert chunks[2][1][slow.id].account is fallback_expense_account
+    port.classify_batch_streaming.assert_called_once_with(
+        user_id=user_id,
+        transactions=[fast, slow],
+    )
+
+
+@pytest.mark.asyncio
+async def test_streaming_falls_back_for_transactions_never_proposed(
+    user_id,
+    account_repo,
+    mapping_repo,
+    groceries_account,
+    fallback_income_account,
+):
+    proposed = _stored(is_debit=True)
+    dropped = _stored(is_debit=False)
+    port = _streaming_port(
+        [_proposal(proposed, groceries_account.id)],
+        # Duplicates and unknown ids are ignored
+        [_proposal(proposed, groceries_account.id), _proposal(_stored(), None)],
+    )
+    service = _make_service(user_id, account_repo, mapping_repo, port)
+
+    chunks = [c async for c in service.resolve_batch_streaming([proposed, dropped])]
+
+    assert [batch for batch, _ in chunks] == [[proposed], [dropped]]
+    assert chunks[1][1][dropped.id].account is fallback_income_account
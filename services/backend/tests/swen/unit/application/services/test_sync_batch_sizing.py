@@ -0,0 +1,71 @@
+"""Tests for SyncBatchConfig and AdaptiveBatchSizer."""
+
+import pytest
+
+from swen.application.integration.services.bank_account_sync.batch_sizing import (
+    AdaptiveBatchSizer,
+    SyncBatchConfig,
+)
+
+
+def test_starts_with_initial_size_clamped_to_bounds():
+    assert AdaptiveBatchSizer(SyncBatchConfig(initial_size=20)).size == 20
+    assert AdaptiveBatchSizer(SyncBatchConfig(initial_size=1, min_size=5)).size == 5
+    assert AdaptiveBatchSizer(SyncBatchConfig(initial_size=500, max_size=50)).size == 50
+
+
+def test_grows_towards_target_but_at_most_doubles():
+    sizer = AdaptiveBatchSizer(SyncBatchConfig(initial_size=10, target_seconds=5.0))
+
+    # 10 items in 0.5s -> 0.05s/item -> 100 would fit, but growth is capped
+    sizer.record(10, 0.5)
+    assert sizer.size == 20
+
+    sizer.record(20, 1.0)
+    assert sizer.size == 40
+
+
+def test_shrinks_when_round_trips_are_slow():
+    sizer = AdaptiveBatchSizer(SyncBatchConfig(initial_size=100, target_seconds=2.0))
+
+    # 100 items in 10s -> 0.1s/item -> 20 items per 2s
+    sizer.record(100, 10.0)
+    assert sizer.size == 20
+
+
+def test_respects_min_and_max_size():
+    config = SyncBatchConfig(
+        initial_size=10,
+        min_size=5,
+        max_size=15,
+        target_seconds=1.0,
+    )
+    sizer = AdaptiveBatchSizer(config)
+
+    sizer.record(10, 0.01)
+    assert sizer.size == 15
+
+    sizer.record(15, 60.0)
+    sizer.record(5, 60.0)
+    assert sizer.size == 5
+
+
+def test_zero_target_keeps_fixed_size():
+    sizer = AdaptiveBatchSizer(SyncBatchConfig(initial_size=7, target_seconds=0))
+
+    sizer.record(7, 30.0)
+
+    assert sizer.size == 7
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"min_size": 0},
+        {"min_size": 10, "max_size": 5},
+        {"pipeline_depth": 0},
+    ],
+)
+def test_config_rejects_invalid_values(kwargs):
+    with pytest.raises(ValueError):
+        SyncBatchConfig(**kwargs)
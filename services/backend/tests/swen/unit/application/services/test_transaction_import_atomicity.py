@@ -58,7 +58,7 @@ async def test_import_persists_success_atomically():
     mapping_repo.find_by_iban.return_value = None
     import_repo.find_by_bank_transaction_id.return_value = None
     transaction_repo.find_by_metadata.return_value = []
-    transaction_repo.find_by_counterparty_iban.return_value = []
+    transaction_repo.find_transfer_candidate_ids.return_value = []
 
     ob_service = OpeningBalanceService(
         account_repository=account_repo,
@@ -132,7 +132,7 @@ async def test_import_uses_save_complete_import_for_persistence():
     mapping_repo.find_by_iban.return_value = None
     import_repo.find_by_bank_transaction_id.return_value = None
     transaction_repo.find_by_metadata.return_value = []
-    transaction_repo.find_by_counterparty_iban.return_value = []
+    transaction_repo.find_transfer_candidate_ids.return_value = []
 
     ob_service = OpeningBalanceService(
         account_repository=account_repo,
@@ -0,0 +1,216 @@
+"""Tests for the set-based bulk path of TransactionImportService.import_batch."""
+
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+
+from swen.application.factories import BankImportTransactionFactory
+from swen.application.integration.services import TransactionImportService
+from swen.domain.accounting.entities import Account, AccountType
+from swen.domain.accounting.services import OpeningBalanceService
+from swen.domain.accounting.value_objects import Currency
+from swen.domain.banking.repositories import StoredBankTransaction
+from swen.domain.banking.value_objects import BankTransaction
+from swen.domain.integration.services import (
+    TransferReconciliationService,
+)
+from swen.domain.integration.value_objects import ImportStatus, ResolvedCounterAccount
+from swen.domain.shared.current_user import CurrentUser
+
+TEST_USER_ID = UUID("12345678-1234-5678-1234-567812345678")
+SOURCE_IBAN = "DE89370400440532013000"
+
+
+def _stored(amount: str = "-12.50", purpose: str = "REWE") -> StoredBankTransaction:
+    tx = BankTransaction(
+        booking_date=date(2025, 1, 1),
+        value_date=date(2025, 1, 1),
+        amount=Decimal(amount),
+        currency="EUR",
+        purpose=purpose,
+    )
+    return StoredBankTransaction(
+        id=uuid4(),
+        identity_hash=tx.compute_identity_hash(SOURCE_IBAN),
+        hash_sequence=1,
+        transaction=tx,
+        is_imported=False,
+        is_new=True,
+    )
+
+
+@pytest.fixture
+def service_with_mocks():
+    bank_account_service = AsyncMock()
+    account_repo = AsyncMock()
+    transaction_repo = AsyncMock()
+    import_repo = AsyncMock()
+    current_user = CurrentUser(user_id=TEST_USER_ID, email="test@example.com")
+
+    asset_account = Account(
+        name="DKB Girokonto",
+        account_type=AccountType.ASSET,
+        account_number="1200",
+        user_id=TEST_USER_ID,
+        default_currency=Currency("EUR"),
+        iban=SOURCE_IBAN,
+    )
+    expense_account = Account(
+        name="Lebensmittel",
+        account_type=AccountType.EXPENSE,
+        account_number="4000",
+        user_id=TEST_USER_ID,
+        default_currency=Currency("EUR"),
+    )
+    bank_account_service.get_or_create_asset_account.return_value = asset_account
+    import_repo.find_by_bank_transaction_ids.return_value = {}
+
+    service = TransactionImportService(
+        bank_account_import_service=bank_account_service,
+        transfer_reconciliation_service=TransferReconciliationService(
+            transaction_repository=transaction_repo,
+        ),
+        opening_balance_service=OpeningBalanceService(
+            account_repository=account_repo,
+            transaction_repository=transaction_repo,
+            user_id=TEST_USER_ID,
+        ),
+        transaction_factory=BankImportTransactionFactory(current_user=current_user),
+        account_repository=account_repo,
+        transaction_repository=transaction_repo,
+        import_repository=import_repo,
+        current_user=current_user,
+    )
+    return service, {
+        "bank_account_service": bank_account_service,
+        "import_repo": import_repo,
+        "expense_account": expense_account,
+    }
+
+
+def _resolved(stored_list, account) -> dict:
+    return {
+        s.id: ResolvedCounterAccount(account=account, confidence=None)
+        for s in stored_list
+    }
+
+
+@pytest.mark.asyncio
+async def test_bulk_uses_one_lookup_and_one_write(service_with_mocks):
+    svc, deps = service_with_mocks
+    stored_list = [_stored(purpose=f"REWE {i}") for i in range(3)]
+
+    results = await svc.import_batch(
+        stored_transactions=stored_list,
+        source_iban=SOURCE_IBAN,
+        resolved=_resolved(stored_list, deps["expense_account"]),
+        bulk=True,
+    )
+
+    assert [r.status for r in results] == [ImportStatus.SUCCESS] * 3
+    import_repo = deps["import_repo"]
+    import_repo.find_by_bank_transaction_ids.assert_awaited_once_with(
+        [s.id for s in stored_list],
+    )
+    import_repo.find_by_bank_transaction_id.assert_not_called()
+    import_repo.save_complete_import.assert_not_called()
+    deps["bank_account_service"].get_or_create_asset_account.assert_awaited_once_with(
+        iban=SOURCE_IBAN
+    )
+
+    import_repo.save_complete_imports.assert_awaited_once()
+    (saved,) = import_repo.save_complete_imports.await_args.args
+    assert [record.bank_transaction_id for record, _ in saved] == [
+        s.id for s in stored_list
+    ]
+    assert all(
+        tx is r.accounting_transaction
+        for (_, tx), r in zip(saved, results, strict=True)
+    )
+
+
+@pytest.mark.asyncio
+async def test_bulk_reports_duplicates_and_skips(service_with_mocks):
+    svc, deps = service_with_mocks
+    already = _stored()
+    zero = _stored(amount="0")
+    new = _stored(purpose="EDEKA")
+    existing_import = MagicMock()
+    existing_import.status = ImportStatus.SUCCESS
+    deps["import_repo"].find_by_bank_transaction_ids.return_value = {
+        already.id: existing_import,
+    }
+    stored_list = [already, zero, new]
+
+    results = await svc.import_batch(
+        stored_transactions=stored_list,
+        source_iban=SOURCE_IBAN,
+        resolved=_resolved(stored_list, deps["expense_account"]),
+        bulk=True,
+    )
+
+    assert [r.status for r in results] == [
+        ImportStatus.DUPLICATE,
+        ImportStatus.SKIPPED,
+        ImportStatus.SUCCESS,
+    ]
+    (saved,) = deps["import_repo"].save_complete_imports.await_args.args
+    assert [(record.status, tx is None) for record, tx in saved] == [
+        (ImportStatus.SKIPPED, True),
+        (ImportStatus.SUCCESS, False),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_bulk_write_failure_is_isolated_per_transaction(service_with_mocks):
+    svc, deps = service_with_mocks
+    good = _stored(purpose="REWE")
+    bad = _stored(purpose="EDEKA")
+    import_repo = deps["import_repo"]
+    import_repo.save_complete_imports.side_effect = RuntimeError("constraint")
+
+    async def save_complete_import(import_record, accounting_tx):
+        if import_record.bank_transaction_id == bad.id:
+            msg = "constraint"
+            raise RuntimeError(msg)
+
+    import_repo.save_complete_import.side_effect = save_complete_import
+    stored_list = [good, bad]
+
+    results = await svc.import_batch(
+        stored_transactions=stored_list,
+        source_iban=SOURCE_IBAN,
+        resolved=_resolved(stored_list, deps["expense_account"]),
+        bulk=True,
+    )
+
+    assert results[0].status == ImportStatus.SUCCESS
+    assert results[1].status == ImportStatus.FAILED
+    assert "constraint" in (results[1].error_message or "")
+    assert import_repo.save_complete_import.await_count == 2
+    (failed_record,) = import_repo.save.await_args.args
+    assert failed_record.bank_transaction_id == bad.id
+
+
+@pytest.mark.asyncio
+async def test_bulk_fails_all_when_asset_account_is_missing(service_with_mocks):
+    svc, deps = service_with_mocks
+    deps["bank_account_service"].get_or_create_asset_account.side_effect = ValueError(
+        "No account mapping found"
+    )
+    stored_list = [_stored(), _stored(amount="0")]
+
+    results = await svc.import_batch(
+        stored_transactions=stored_list,
+        source_iban=SOURCE_IBAN,
+        resolved=_resolved(stored_list, deps["expense_account"]),
+        bulk=True,
+    )
+
+    assert [r.status for r in results] == [ImportStatus.FAILED, ImportStatus.SKIPPED]
+    assert "No account mapping" in (results[0].error_message or "")
@@ -0,0 +1,160 @@
+"""Unit tests for asset-account reconciliation in TransferReconciliationService."""
+
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from swen.domain.accounting.aggregates import Transaction
+from swen.domain.accounting.entities import Account, AccountType
+from swen.domain.accounting.value_objects import Currency, Money
+from swen.domain.banking.value_objects import BankTransaction
+from swen.domain.integration.services import TransferReconciliationService
+
+TEST_USER_ID = uuid4()
+OWN_IBAN = "DE51120700700756557355"
+SAVINGS_IBAN = "DE89370400440532013000"
+
+
+def _make_expense_transaction(amount: Decimal = Decimal("100.00")) -> Transaction:
+    expense_account = Account(
+        name="Sonstiges",
+        account_type=AccountType.EXPENSE,
+        account_number="4900",
+        user_id=TEST_USER_ID,
+    )
+    bank_account = Account(
+        name="Girokonto",
+        account_type=AccountType.ASSET,
+        account_number="1000",
+        user_id=TEST_USER_ID,
+        iban=OWN_IBAN,
+    )
+    transaction = Transaction(
+        description="Transfer to savings",
+        user_id=TEST_USER_ID,
+        counterparty_iban=SAVINGS_IBAN,
+        source_iban=OWN_IBAN,
+    )
+    money = Money(amount=amount, currency=Currency("EUR"))
+    transaction.add_debit(expense_account, money)
+    transaction.add_credit(bank_account, money)
+    return transaction
+
+
+def _make_savings_account() -> Account:
+    return Account(
+        name="Tagesgeld",
+        account_type=AccountType.ASSET,
+        account_number="1100",
+        user_id=TEST_USER_ID,
+        iban=SAVINGS_IBAN,
+    )
+
+
+class TestFuzzyMatch:
+    @pytest.mark.asyncio
+    async def test_queries_candidate_window_and_loads_first_match(self):
+        transaction_repo = AsyncMock()
+        transaction_repo.find_by_metadata.return_value = []
+        match = _make_expense_transaction()
+        match_id = uuid4()
+        transaction_repo.find_transfer_candidate_ids.return_value = [match_id]
+        transaction_repo.find_by_id.return_value = match
+        service = TransferReconciliationService(transaction_repo)
+
+        booking_date = date(2025, 3, 10)
+        bank_transaction = BankTransaction(
+            booking_date=booking_date,
+            value_date=booking_date,
+            amount=Decimal("-100.00"),
+            currency="EUR",
+            purpose="Umbuchung",
+        )
+
+        result = await service.find_matching_transfer(
+            bank_transaction=bank_transaction,
+            source_iban=SAVINGS_IBAN,
+            counterparty_iban=OWN_IBAN,
+        )
+
+        assert result is match
+        transaction_repo.find_transfer_candidate_ids.assert_awaited_once_with(
+            counterparty_iban=SAVINGS_IBAN,
+            amount=Decimal("100.00"),
+            start_date=booking_date - timedelta(days=2),
+            end_date=booking_date + timedelta(days=2),
+        )
+        transaction_repo.find_by_id.assert_awaited_once_with(match_id)
+
+    @pytest.mark.asyncio
+    async def test_no_candidates_skips_aggregate_load(self):
+        transaction_repo = AsyncMock()
+        transaction_repo.find_by_metadata.return_value = []
+        transaction_repo.find_transfer_candidate_ids.return_value = []
+        service = TransferReconciliationService(transaction_repo)
+
+        bank_transaction = BankTransaction(
+            booking_date=date(2025, 3, 10),
+            value_date=date(2025, 3, 10),
+            amount=Decimal("-100.00"),
+            currency="EUR",
+            purpose="Umbuchung",
+        )
+
+        result = await service.find_matching_transfer(
+            bank_transaction=bank_transaction,
+            source_iban=SAVINGS_IBAN,
+            counterparty_iban=OWN_IBAN,
+        )
+
+        assert result is None
+        transaction_repo.find_by_id.assert_not_awaited()
+
+
+class TestReconcileForNewAccount:
+    @pytest.mark.asyncio
+    async def test_saves_all_conversions_in_one_write(self):
+        transaction_repo = AsyncMock()
+        first = _make_expense_transaction()
+        second = _make_expense_transaction(Decimal("50.00"))
+        already_reconciled = _make_expense_transaction()
+        already_reconciled._is_internal_transfer = True
+        transaction_repo.find_by_counterparty_iban.return_value = [
+            first,
+            already_reconciled,
+            second,
+        ]
+        service = TransferReconciliationService(transaction_repo)
+
+        reconciled = await service.reconcile_for_new_account(
+            iban=SAVINGS_IBAN,
+            asset_account=_make_savings_account(),
+        )
+
+        assert reconciled == 2
+        transaction_repo.save.assert_not_awaited()
+        transaction_repo.save_all.assert_awaited_once_with([first, second])
+        assert first.is_internal_transfer is True
+        assert second.is_internal_transfer is True
+
+    @pytest.mark.asyncio
+    async def test_bulk_save_failure_propagates(self):
+        transaction_repo = AsyncMock()
+        transaction_repo.find_by_counterparty_iban.return_value = [
+            _make_expense_transaction(),
+        ]
+        transaction_repo.save_all.side_effect = RuntimeError("bulk write failed")
+        service = TransferReconciliationService(transaction_repo)
+
+        # The session needs a rollback after a failed flush, so per-row
+        # saves would fail too; the caller's unit of work handles it
+        with pytest.raises(RuntimeError, match="bulk write failed"):
+            await service.reconcile_for_new_account(
+                iban=SAVINGS_IBAN,
+                asset_account=_make_savings_account(),
+            )
+
+        transaction_repo.save.assert_not_awaited()
@@ -0,0 +1,124 @@
+"""Tests for the FinTS worker pool."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from swen.infrastructure.banking.local_fints.worker_pool import (
+    FinTSWorkerPool,
+    FinTSWorkerPoolConfig,
+)
+
+
+@pytest.fixture
+def pool():
+    pool = FinTSWorkerPool(FinTSWorkerPoolConfig(max_workers=4, per_bank_limit=1))
+    yield pool
+    pool.shutdown()
+
+
+async def _wait_until(predicate, limit_seconds: float = 2.0) -> None:
+    deadline = time.monotonic() + limit_seconds
+    while not predicate():
+        if time.monotonic() > deadline:
+            msg = "condition not reached"
+            raise AssertionError(msg)
+        await asyncio.sleep(0.01)
+
+
+class TestFinTSWorkerPool:
+    @pytest.mark.asyncio
+    async def test_runs_call_off_the_event_loop_thread(self, pool):
+        loop_thread = threading.get_ident()
+
+        result = await pool.run("12345678", threading.get_ident)
+
+        assert result != loop_thread
+        assert pool.stats().completed_total == 1
+
+    @pytest.mark.asyncio
+    async def test_exceptions_reach_the_caller(self, pool):
+        def fail():
+            msg = "bank said no"
+            raise RuntimeError(msg)
+
+        with pytest.raises(RuntimeError, match="bank said no"):
+            await pool.run("12345678", fail)
+
+        assert pool.stats().running == 0
+
+    @pytest.mark.asyncio
+    async def test_same_bank_is_serialized(self, pool):
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def dialogue():
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+
+        await asyncio.gather(*(pool.run("12345678", dialogue) for _ in range(3)))
+
+        assert peak == 1
+
+    @pytest.mark.asyncio
+    async def test_different_banks_run_in_parallel(self, pool):
+        # Both calls must be inside the barrier at once, or it times out
+        barrier = threading.Barrier(2, timeout=2)
+
+        await asyncio.gather(
+            pool.run("12345678", barrier.wait),
+            pool.run("87654321", barrier.wait),
+        )
+
+    @pytest.mark.asyncio
+    async def test_queued_call_can_be_cancelled(self, pool):
+        release = threading.Event()
+        started = []
+        running = asyncio.create_task(pool.run("12345678", release.wait, 2))
+        queued = asyncio.create_task(pool.run("12345678", started.append, 1))
+        await _wait_until(lambda: pool.stats().queued == 1)
+
+        stats = pool.stats()
+        assert stats.running == 1
+        assert stats.queued_by_bank == {"12345678": 1}
+
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        release.set()
+        await running
+
+        assert started == []
+        stats = pool.stats()
+        assert stats.queued == 0
+        assert stats.running == 0
+        assert stats.cancelled_total == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_running_call_keeps_bank_slot_until_done(self, pool):
+        release = threading.Event()
+        running = asyncio.create_task(pool.run("12345678", release.wait, 2))
+        await _wait_until(lambda: pool.stats().running == 1)
+
+        running.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await running
+        follow_up = asyncio.create_task(pool.run("12345678", lambda: "next"))
+        await _wait_until(lambda: pool.stats().queued == 1)
+
+        # The next dialogue with the bank waits for the abandoned one
+        assert not follow_up.done()
+        release.set()
+        assert await follow_up == "next"
+
+    def test_config_rejects_empty_pool(self):
+        with pytest.raises(ValueError):
+            FinTSWorkerPoolConfig(max_workers=0)
@@ -573,3 +573,42 @@ class TestDatetimeToDateConversion:
         call_kwargs = mock_client.get_transactions.call_args.kwargs
         expected_today = datetime.now(tz=timezone.utc).date()
         assert call_kwargs["end_date"] == expected_today
+
+
+class TestWorkerPoolUsage:
+    """Blocking geldstrom calls run on the FinTS worker pool."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_transactions_runs_on_worker_thread(self):
+        import threading
+
+        from swen.infrastructure.banking.local_fints.worker_pool import (
+            FinTSWorkerPool,
+        )
+
+        pool = FinTSWorkerPool()
+        adapter = GeldstromAdapter(worker_pool=pool)
+        threads = []
+
+        def get_transactions(*_args, **_kwargs):
+            threads.append(threading.get_ident())
+            return Mock(entries=[])
+
+        adapter._client = Mock(get_transactions=get_transactions)
+        adapter._geldstrom_accounts_cache = [
+            Account(
+                account_id="123456:00",
+                iban="DE89370400440532013000",
+                bank_route=BankRoute(country_code="DE", bank_code="37040044"),
+            ),
+        ]
+
+        await adapter.fetch_transactions(
+            account_iban="DE89370400440532013000",
+            start_date=date(2025, 9, 3),
+        )
+
+        assert threads
+        assert threads[0] != threading.get_ident()
+        assert pool.stats().completed_total == 1
+        pool.shutdown()
@@ -0,0 +1,198 @@
+"""Database-free tests for ML outbox coalescing, batching and backoff."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from swen_ml_contracts import MAX_EXAMPLES_PER_BATCH
+
+from swen.infrastructure.integration.ml import MLOutboxConfig, MLOutboxDispatcher
+from swen.infrastructure.integration.ml.outbox_dispatcher import _OutboxItem
+from swen.infrastructure.persistence.sqlalchemy.models.integration.ml_outbox_model import (  # NOQA: E501
+    OUTBOX_DELETE_ANCHOR,
+    OUTBOX_EMBED_ACCOUNT,
+    OUTBOX_STORE_EXAMPLE,
+)
+
+USER_ID = uuid4()
+_T0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _mock_client() -> MagicMock:
+    client = MagicMock()
+    client.enabled = True
+    client.store_examples = AsyncMock(return_value=MagicMock())
+    client.embed_accounts = AsyncMock(return_value=MagicMock())
+    client.delete_account_anchor = AsyncMock(return_value=True)
+    return client
+
+
+def _item(kind: str, payload: dict, second: int = 0) -> _OutboxItem:
+    return _OutboxItem(
+        id=uuid4(),
+        user_id=USER_ID,
+        kind=kind,
+        payload=payload,
+        attempts=0,
+        created_at=_T0 + timedelta(seconds=second),
+    )
+
+
+def _embed(account_id, name: str = "Lebensmittel", second: int = 0) -> _OutboxItem:
+    payload = {
+        "account_id": str(account_id),
+        "account_number": "4000",
+        "name": name,
+        "account_type": "expense",
+    }
+    return _item(OUTBOX_EMBED_ACCOUNT, payload, second)
+
+
+def _delete(account_id, second: int = 0) -> _OutboxItem:
+    return _item(OUTBOX_DELETE_ANCHOR, {"account_id": str(account_id)}, second)
+
+
+def _example(second: int = 0) -> _OutboxItem:
+    payload = {
+        "transaction_id": str(uuid4()),
+        "purpose": "REWE SAGT DANKE",
+        "amount": "-12.50",
+        "account_id": str(uuid4()),
+        "account_number": "4000",
+        "account_type": "expense",
+    }
+    return _item(OUTBOX_STORE_EXAMPLE, payload, second)
+
+
+def _dispatcher(client: MagicMock) -> MLOutboxDispatcher:
+    # _send never touches the database
+    return MLOutboxDispatcher(MagicMock(), client)
+
+
+class TestCoalescing:
+    @pytest.mark.asyncio
+    async def test_only_latest_anchor_update_per_account_is_sent(self):
+        client = _mock_client()
+        renamed, deleted = uuid4(), uuid4()
+        items = [
+            _embed(renamed, second=0),
+            _embed(deleted, second=1),
+            _embed(renamed, name="Supermarkt", second=2),
+            _delete(deleted, second=3),
+        ]
+
+        delivered, failed, _ = await _dispatcher(client)._send(USER_ID, items)
+
+        _, accounts = client.embed_accounts.await_args.args
+        assert [(a.account_id, a.name) for a in accounts] == [(renamed, "Supermarkt")]
+        client.delete_account_anchor.assert_awaited_once_with(USER_ID, deleted)
+        # Superseded updates count as delivered without a request of their own
+        assert {item.id for item in delivered} == {item.id for item in items}
+        assert failed == []
+
+    @pytest.mark.asyncio
+    async def test_latest_update_wins_regardless_of_claim_order(self):
+        client = _mock_client()
+        account_id = uuid4()
+        newer = _embed(account_id, name="Neu", second=5)
+        older = _embed(account_id, name="Alt", second=1)
+
+        await _dispatcher(client)._send(USER_ID, [newer, older])
+
+        _, accounts = client.embed_accounts.await_args.args
+        assert [a.name for a in accounts] == ["Neu"]
+
+
+class TestBatching:
+    @pytest.mark.asyncio
+    async def test_examples_are_sent_in_contract_sized_batches(self):
+        client = _mock_client()
+        items = [_example(second=i) for i in range(MAX_EXAMPLES_PER_BATCH + 1)]
+
+        delivered, failed, _ = await _dispatcher(client)._send(USER_ID, items)
+
+        sizes = [len(call.args[1]) for call in client.store_examples.await_args_list]
+        assert sizes == [MAX_EXAMPLES_PER_BATCH, 1]
+        assert len(delivered) == len(items)
+        assert failed == []
+
+    @pytest.mark.asyncio
+    async def test_failed_request_fails_only_its_batch(self):
+        client = _mock_client()
+        client.store_examples.return_value = None
+        example = _example()
+        embed = _embed(uuid4())
+
+        dispatcher = _dispatcher(client)
+        delivered, failed, _ = await dispatcher._send(USER_ID, [example, embed])
+
+        assert delivered == [embed]
+        assert failed == [(example, "store_examples request failed")]
+
+    @pytest.mark.asyncio
+    async def test_invalid_payload_and_unknown_kind_are_not_sent(self):
+        client = _mock_client()
+        broken = _item(OUTBOX_DELETE_ANCHOR, {"account_id": "not-a-uuid"})
+        unknown = _item("rename_user", {})
+
+        dispatcher = _dispatcher(client)
+        delivered, failed, dropped = await dispatcher._send(USER_ID, [broken, unknown])
+
+        client.delete_account_anchor.assert_not_awaited()
+        assert delivered == []
+        ((failed_item, error),) = failed
+        assert failed_item is broken
+        assert error.startswith("Invalid delete_anchor payload")
+        # An unknown kind can never be delivered, so it is not retried
+        assert dropped == [(unknown, "Unknown outbox item kind: rename_user")]
+
+
+class TestBackoff:
+    def test_doubles_per_attempt(self):
+        config = MLOutboxConfig(base_backoff_seconds=5.0, max_backoff_seconds=300.0)
+
+        assert [config.backoff(n).total_seconds() for n in (1, 2, 3, 4)] == [
+            5.0,
+            10.0,
+            20.0,
+            40.0,
+        ]
+
+    def test_is_capped(self):
+        config = MLOutboxConfig(base_backoff_seconds=5.0, max_backoff_seconds=60.0)
+
+        assert config.backoff(10) == timedelta(seconds=60)
+
+    def test_config_rejects_empty_batches(self):
+        with pytest.raises(ValueError):
+            MLOutboxConfig(batch_size=0)
+
+
+class TestLifecycle:
+    @pytest.mark.asyncio
+    async def test_stop_interrupts_the_poll_wait(self):
+        client = _mock_client()
+        config = MLOutboxConfig(poll_seconds=60.0)
+        dispatcher = MLOutboxDispatcher(MagicMock(), client, config)
+        dispatcher.dispatch_once = AsyncMock(return_value=0)
+
+        dispatcher.start()
+        # Let the loop run one round and start waiting for the next
+        await asyncio.sleep(0)
+        await asyncio.wait_for(dispatcher.stop(), timeout=1.0)
+
+        dispatcher.dispatch_once.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_disabled_client_does_not_start(self):
+        client = _mock_client()
+        client.enabled = False
+        dispatcher = MLOutboxDispatcher(MagicMock(), client)
+        dispatcher.dispatch_once = AsyncMock(return_value=0)
+
+        dispatcher.start()
+        await dispatcher.stop()
+
+        dispatcher.dispatch_once.assert_not_awaited()
@@ -0,0 +1,261 @@
+"""Tests for the ML outbox: queuing in the adapter and delivery by the dispatcher."""
+
+from datetime import timedelta
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from swen.application.ports.account_classifier_training import (
+    AccountForClassification,
+    TransactionExample,
+)
+from swen.infrastructure.integration.ml import (
+    MLAccountClassifierTrainingAdapter,
+    MLOutboxConfig,
+    MLOutboxDispatcher,
+)
+from swen.infrastructure.persistence.sqlalchemy.models.integration.ml_outbox_model import (  # NOQA: E501
+    OUTBOX_DELETE_ANCHOR,
+    OUTBOX_EMBED_ACCOUNT,
+    OUTBOX_STORE_EXAMPLE,
+    MLOutboxModel,
+)
+from tests.shared.fixtures.database import TEST_USER_ID
+
+
+def _mock_client() -> MagicMock:
+    client = MagicMock()
+    client.enabled = True
+    client.store_examples = AsyncMock(return_value=MagicMock())
+    client.embed_accounts = AsyncMock(return_value=MagicMock())
+    client.delete_account_anchor = AsyncMock(return_value=True)
+    return client
+
+
+def _example(purpose: str = "REWE SAGT DANKE") -> TransactionExample:
+    return TransactionExample(
+        user_id=TEST_USER_ID,
+        account_id=uuid4(),
+        account_number="4000",
+        account_type="expense",
+        transaction_id=uuid4(),
+        purpose=purpose,
+        amount=Decimal("-12.50"),
+        counterparty_name="REWE",
+    )
+
+
+def _account(account_id=None, name: str = "Lebensmittel") -> AccountForClassification:
+    return AccountForClassification(
+        account_id=account_id or uuid4(),
+        account_number="4000",
+        name=name,
+        account_type="expense",
+    )
+
+
+async def _outbox_rows(session: AsyncSession) -> list[MLOutboxModel]:
+    session.expire_all()
+    result = await session.execute(
+        select(MLOutboxModel).order_by(MLOutboxModel.created_at),
+    )
+    return list(result.scalars())
+
+
+@pytest.fixture
+def session_maker(async_session, async_engine):
+    """Session factory for the dispatcher (after test users are seeded)."""
+    return async_sessionmaker(
+        async_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+
+
+class TestTrainingAdapterQueue:
+    """The adapter queues updates on the caller's session."""
+
+    @pytest.mark.asyncio
+    async def test_updates_are_queued_with_the_session(self, async_session):
+        adapter = MLAccountClassifierTrainingAdapter(
+            session=async_session,
+            client=_mock_client(),
+        )
+        account_id = uuid4()
+
+        adapter.submit_examples([_example(), _example(purpose="")])
+        adapter.embed_accounts_fire_and_forget(TEST_USER_ID, [_account()])
+        adapter.delete_account_anchor_fire_and_forget(TEST_USER_ID, account_id)
+        await async_session.commit()
+
+        rows = await _outbox_rows(async_session)
+        # The example without purpose is never queued
+        assert sorted(row.kind for row in rows) == sorted(
+            [OUTBOX_STORE_EXAMPLE, OUTBOX_EMBED_ACCOUNT, OUTBOX_DELETE_ANCHOR],
+        )
+        delete_row = next(r for r in rows if r.kind == OUTBOX_DELETE_ANCHOR)
+        assert delete_row.payload == {"account_id": str(account_id)}
+        assert all(row.attempts == 0 for row in rows)
+
+    @pytest.mark.asyncio
+    async def test_rollback_discards_queued_updates(self, async_session):
+        adapter = MLAccountClassifierTrainingAdapter(
+            session=async_session,
+            client=_mock_client(),
+        )
+
+        adapter.submit_example(_example())
+        await async_session.rollback()
+
+        assert await _outbox_rows(async_session) == []
+
+    @pytest.mark.asyncio
+    async def test_disabled_client_queues_nothing(self, async_session):
+        client = _mock_client()
+        client.enabled = False
+        adapter = MLAccountClassifierTrainingAdapter(
+            session=async_session,
+            client=client,
+        )
+
+        adapter.submit_example(_example())
+        await async_session.commit()
+
+        assert await _outbox_rows(async_session) == []
+
+
+class TestMLOutboxDispatcher:
+    """Delivery, retry and coalescing of queued updates."""
+
+    @pytest.mark.asyncio
+    async def test_delivers_examples_in_one_batch_and_deletes_rows(
+        self,
+        async_session,
+        session_maker,
+    ):
+        client = _mock_client()
+        adapter = MLAccountClassifierTrainingAdapter(async_session, client)
+        adapter.submit_examples([_example() for _ in range(3)])
+        await async_session.commit()
+        dispatcher = MLOutboxDispatcher(session_maker, client)
+
+        claimed = await dispatcher.dispatch_once()
+
+        assert claimed == 3
+        client.store_examples.assert_awaited_once()
+        user_id, requests = client.store_examples.await_args.args
+        assert user_id == TEST_USER_ID
+        assert len(requests) == 3
+        assert await _outbox_rows(async_session) == []
+        stats = await dispatcher.stats()
+        assert stats.pending == 0
+        assert stats.delivered_total == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_delivery_is_kept_with_backoff(
+        self,
+        async_session,
+        session_maker,
+    ):
+        client = _mock_client()
+        client.store_examples.return_value = None
+        adapter = MLAccountClassifierTrainingAdapter(async_session, client)
+        adapter.submit_example(_example())
+        await async_session.commit()
+        config = MLOutboxConfig(base_backoff_seconds=60.0)
+        dispatcher = MLOutboxDispatcher(session_maker, client, config)
+
+        await dispatcher.dispatch_once()
+
+        (row,) = await _outbox_rows(async_session)
+        assert row.attempts == 1
+        assert row.last_error == "store_examples request failed"
+        assert row.next_attempt_at >= row.created_at + timedelta(seconds=60)
+        # Not due again yet
+        assert await dispatcher.dispatch_once() == 0
+        stats = await dispatcher.stats()
+        assert stats.pending == 1
+        assert stats.retrying == 1
+        assert stats.due == 0
+        assert stats.failed_total == 1
+
+    @pytest.mark.asyncio
+    async def test_only_latest_anchor_update_per_account_is_sent(
+        self,
+        async_session,
+        session_maker,
+    ):
+        client = _mock_client()
+        adapter = MLAccountClassifierTrainingAdapter(async_session, client)
+        renamed = uuid4()
+        deleted = uuid4()
+        adapter.embed_accounts_fire_and_forget(TEST_USER_ID, [_account(renamed)])
+        await async_session.commit()
+        adapter.embed_accounts_fire_and_forget(
+            TEST_USER_ID,
+            [_account(renamed, name="Supermarkt"), _account(deleted)],
+        )
+        await async_session.commit()
+        adapter.delete_account_anchor_fire_and_forget(TEST_USER_ID, deleted)
+        await async_session.commit()
+        dispatcher = MLOutboxDispatcher(session_maker, client)
+
+        assert await dispatcher.dispatch_once() == 4
+
+        client.embed_accounts.assert_awaited_once()
+        _, accounts = client.embed_accounts.await_args.args
+        assert [(a.account_id, a.name) for a in accounts] == [
+            (renamed, "Supermarkt"),
+        ]
+        client.delete_account_anchor.assert_awaited_once_with(TEST_USER_ID, deleted)
+        assert await _outbox_rows(async_session) == []
+
+    @pytest.mark.asyncio
+    async def test_delivered_update_removes_older_retried_ones(
+        self,
+        async_session,
+        session_maker,
+    ):
+        client = _mock_client()
+        client.embed_accounts.return_value = None
+        adapter = MLAccountClassifierTrainingAdapter(async_session, client)
+        account_id = uuid4()
+        adapter.embed_accounts_fire_and_forget(TEST_USER_ID, [_account(account_id)])
+        await async_session.commit()
+        config = MLOutboxConfig(base_backoff_seconds=60.0)
+        dispatcher = MLOutboxDispatcher(session_maker, client, config)
+        # The embed fails and backs off
+        await dispatcher.dispatch_once()
+        adapter.delete_account_anchor_fire_and_forget(TEST_USER_ID, account_id)
+        await async_session.commit()
+
+        # Only the delete is due; delivering it discards the older embed
+        assert await dispatcher.dispatch_once() == 1
+
+        client.delete_account_anchor.assert_awaited_once_with(TEST_USER_ID, account_id)
+        assert await _outbox_rows(async_session) == []
+
+    @pytest.mark.asyncio
+    async def test_unknown_kind_is_dropped(self, async_session, session_maker):
+        client = _mock_client()
+        async_session.add(
+            MLOutboxModel(user_id=TEST_USER_ID, kind="rename_user", payload={}),
+        )
+        await async_session.commit()
+        dispatcher = MLOutboxDispatcher(session_maker, client)
+
+        assert await dispatcher.dispatch_once() == 1
+
+        assert await _outbox_rows(async_session) == []
+        assert (await dispatcher.stats()).failed_total == 0
+
+    def test_backoff_is_capped(self):
+        config = MLOutboxConfig(base_backoff_seconds=5.0, max_backoff_seconds=60.0)
+
+        assert config.backoff(1) == timedelta(seconds=5)
+        assert config.backoff(3) == timedelta(seconds=20)
+        assert config.backoff(10) == timedelta(seconds=60)
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import time
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from uuid import uuid4
 
@@ -20,6 +21,9 @@ from swen.infrastructure.persistence.sqlalchemy.models.accounting.journal_entry_
 from swen.infrastructure.persistence.sqlalchemy.models.accounting.transaction_model import (
     TransactionModel,
 )
+from swen.infrastructure.persistence.sqlalchemy.models.monthly_balances import (
+    rebuild_monthly_balances,
+)
 
 
 def _mk_account(*, user_id, name: str, account_type: str) -> AccountModel:
@@ -88,6 +92,13 @@ def _mk_entry_credit(*, tx_id, account_id, credit: Decimal) -> JournalEntryModel
     )
 
 
+async def _rebuild_balance_rollup(session) -> None:
+    # Rows added straight through the session bypass the repository,
+    # so the balance rollup has to be derived from them explicitly.
+    connection = await session.connection()
+    await connection.run_sync(rebuild_monthly_balances)
+
+
 @pytest.mark.asyncio
 async def test_spending_over_time_aggregates_by_month(async_session, current_user):
     groceries = _mk_account(
@@ -699,6 +710,7 @@ async def test_balance_history_over_time_tracks_asset_balances_and_sorting(
         ],
     )
     await async_session.flush()
+    await _rebuild_balance_rollup(async_session)
 
     adapter = SqlAlchemyAnalyticsReadAdapter(async_session, current_user)
     res = await adapter.balance_history_over_time(months=1, end_month="2024-12")
@@ -757,6 +769,7 @@ async def test_net_worth_over_time_assets_minus_liabilities(
         ],
     )
     await async_session.flush()
+    await _rebuild_balance_rollup(async_session)
 
     adapter = SqlAlchemyAnalyticsReadAdapter(async_session, current_user)
     res = await adapter.net_worth_over_time(months=1, end_month="2024-12")
@@ -828,6 +841,7 @@ async def test_net_worth_over_time_handles_negative_liability_overpayment(
         ],
     )
     await async_session.flush()
+    await _rebuild_balance_rollup(async_session)
 
     adapter = SqlAlchemyAnalyticsReadAdapter(async_session, current_user)
     res = await adapter.net_worth_over_time(months=1, end_month="2024-12")
@@ -838,3 +852,145 @@ async def test_net_worth_over_time_handles_negative_liability_overpayment(
     # The overpayment should ADD to net worth, not subtract
     assert res.data_points[0].value == Decimal("10200.00")
     assert res.total == Decimal("10200.00")
+
+
+@pytest.mark.asyncio
+async def test_balance_series_carry_history_from_before_the_range(
+    async_session,
+    current_user,
+):
+    checking = _mk_account(
+        user_id=current_user.user_id,
+        name="Checking Account",
+        account_type="asset",
+    )
+    async_session.add(checking)
+
+    tx_old = _mk_tx(
+        user_id=current_user.user_id,
+        dt=datetime(2020, 6, 1, tzinfo=timezone.utc),
+        posted=True,
+    )
+    tx_in_range = _mk_tx(
+        user_id=current_user.user_id,
+        dt=datetime(2024, 12, 5, tzinfo=timezone.utc),
+        posted=True,
+    )
+    async_session.add_all([tx_old, tx_in_range])
+    async_session.add_all(
+        [
+            _mk_entry(tx_id=tx_old.id, account_id=checking.id, debit=Decimal("1000")),
+            _mk_entry_credit(
+                tx_id=tx_in_range.id,
+                account_id=checking.id,
+                credit=Decimal("250"),
+            ),
+        ],
+    )
+    await async_session.flush()
+    await _rebuild_balance_rollup(async_session)
+
+    adapter = SqlAlchemyAnalyticsReadAdapter(async_session, current_user)
+    net_worth = await adapter.net_worth_over_time(months=2, end_month="2024-12")
+    history = await adapter.balance_history_over_time(months=2, end_month="2024-12")
+
+    assert [dp.value for dp in net_worth.data_points] == [
+        Decimal("1000"),
+        Decimal("750"),
+    ]
+    assert [dp.total for dp in history.data_points] == [
+        Decimal("1000"),
+        Decimal("750"),
+    ]
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_time_series_over_ten_year_ledger(async_session, current_user):
+    """Benchmark: ten years of daily bookings, timed per analytics query.
+
+    Run with ``pytest -m slow -s`` to see the timings. The database returns
+    months x categories rows, so query time should stay flat as history grows.
+    """
+    checking = _mk_account(
+        user_id=current_user.user_id,
+        name="Checking Account",
+        account_type="asset",
+    )
+    salary = _mk_account(
+        user_id=current_user.user_id,
+        name="Salary",
+        account_type="income",
+    )
+    categories = [
+        _mk_account(
+            user_id=current_user.user_id,
+            name=f"Category {i}",
+            account_type="expense",
+        )
+        for i in range(10)
+    ]
+    async_session.add_all([checking, salary, *categories])
+
+    start = datetime(2015, 1, 1, tzinfo=timezone.utc)
+    spent = Decimal("0")
+    for day in range(3652):
+        tx = _mk_tx(user_id=current_user.user_id, dt=start + timedelta(days=day))
+        amount = Decimal(10 + day % 40)
+        async_session.add(tx)
+        async_session.add_all(
+            [
+                _mk_entry(
+                    tx_id=tx.id,
+                    account_id=categories[day % len(categories)].id,
+                    debit=amount,
+                ),
+                _mk_entry_credit(tx_id=tx.id, account_id=checking.id, credit=amount),
+            ],
+        )
+        spent += amount
+    for month in range(120):
+        tx = _mk_tx(
+            user_id=current_user.user_id,
+            dt=datetime(2015 + month // 12, month % 12 + 1, 1, tzinfo=timezone.utc),
+        )
+        async_session.add(tx)
+        async_session.add_all(
+            [
+                _mk_entry(tx_id=tx.id, account_id=checking.id, debit=Decimal("2000")),
+                _mk_entry_income_credit(
+                    tx_id=tx.id,
+                    account_id=salary.id,
+                    credit=Decimal("2000"),
+                ),
+            ],
+        )
+    await async_session.flush()
+    await _rebuild_balance_rollup(async_session)
+
+    adapter = SqlAlchemyAnalyticsReadAdapter(async_session, current_user)
+    queries = {
+        "spending_over_time": adapter.spending_over_time(
+            months=120,
+            end_month="2024-12",
+        ),
+        "net_income_over_time": adapter.net_income_over_time(
+            months=120,
+            end_month="2024-12",
+        ),
+        "net_worth_over_time": adapter.net_worth_over_time(
+            months=12,
+            end_month="2024-12",
+        ),
+        "top_expenses": adapter.top_expenses(months=120, end_month="2024-12"),
+    }
+    results = {}
+    for name, query in queries.items():
+        started = time.perf_counter()
+        results[name] = await query
+        print(f"{name}: {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    expected_net_worth = Decimal("2000") * 120 - spent
+    assert results["net_worth_over_time"].data_points[-1].value == expected_net_worth
+    assert sum(results["spending_over_time"].totals_by_category.values()) == spent
+    assert results["top_expenses"].total_spending == spent
@@ -0,0 +1,140 @@
+"""Tests for SqlAlchemyDashboardReadAdapter (dashboard read port adapter)."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from swen.infrastructure.persistence.sqlalchemy.adapters.analytics import (
+    SqlAlchemyDashboardReadAdapter,
+)
+from swen.infrastructure.persistence.sqlalchemy.models.accounting.account_model import (
+    AccountModel,
+)
+from swen.infrastructure.persistence.sqlalchemy.models.accounting.journal_entry_model import (
+    JournalEntryModel,
+)
+from swen.infrastructure.persistence.sqlalchemy.models.accounting.transaction_model import (
+    TransactionModel,
+)
+from swen.infrastructure.persistence.sqlalchemy.models.monthly_balances import (
+    rebuild_monthly_balances,
+)
+
+
+def _mk_account(*, user_id, name: str, account_type: str) -> AccountModel:
+    return AccountModel(
+        id=uuid4(),
+        user_id=user_id,
+        name=name,
+        account_type=account_type,
+        account_number=None,
+        iban=None,
+        description=None,
+        default_currency="EUR",
+        is_active=True,
+        parent_id=None,
+        created_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+    )
+
+
+def _mk_tx(*, user_id, dt: datetime, posted: bool = True) -> TransactionModel:
+    return TransactionModel(
+        id=uuid4(),
+        user_id=user_id,
+        description="Test",
+        date=dt,
+        counterparty=None,
+        counterparty_iban=None,
+        source="manual",
+        source_iban=None,
+        is_internal_transfer=False,
+        transaction_metadata={},
+        is_posted=posted,
+        created_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+    )
+
+
+def _mk_entry(*, tx_id, account_id, debit=Decimal("0"), credit=Decimal("0")):
+    return JournalEntryModel(
+        id=uuid4(),
+        transaction_id=tx_id,
+        account_id=account_id,
+        debit_amount=debit,
+        credit_amount=credit,
+        currency="EUR",
+    )
+
+
+@pytest.fixture
+async def ledger(async_session, current_user):
+    """Salary and groceries in March, rent in February, one March draft."""
+    user_id = current_user.user_id
+    checking = _mk_account(user_id=user_id, name="Checking", account_type="asset")
+    salary = _mk_account(user_id=user_id, name="Salary", account_type="income")
+    groceries = _mk_account(
+        user_id=user_id,
+        name="Groceries",
+        account_type="expense",
+    )
+    rent = _mk_account(user_id=user_id, name="Rent", account_type="expense")
+    async_session.add_all([checking, salary, groceries, rent])
+
+    bookings = [
+        (datetime(2025, 2, 1, tzinfo=timezone.utc), rent, Decimal("800"), True),
+        (datetime(2025, 3, 1, tzinfo=timezone.utc), salary, Decimal("3000"), True),
+        (datetime(2025, 3, 5, tzinfo=timezone.utc), groceries, Decimal("120"), True),
+        (datetime(2025, 3, 9, tzinfo=timezone.utc), groceries, Decimal("30"), False),
+    ]
+    for dt, account, amount, posted in bookings:
+        tx = _mk_tx(user_id=user_id, dt=dt, posted=posted)
+        async_session.add(tx)
+        if account is salary:
+            entries = [
+                _mk_entry(tx_id=tx.id, account_id=checking.id, debit=amount),
+                _mk_entry(tx_id=tx.id, account_id=salary.id, credit=amount),
+            ]
+        else:
+            entries = [
+                _mk_entry(tx_id=tx.id, account_id=account.id, debit=amount),
+                _mk_entry(tx_id=tx.id, account_id=checking.id, credit=amount),
+            ]
+        async_session.add_all(entries)
+    await async_session.flush()
+
+    connection = await async_session.connection()
+    await connection.run_sync(rebuild_monthly_balances)
+    return checking
+
+
+@pytest.mark.asyncio
+async def test_period_totals_group_by_category(async_session, current_user, ledger):
+    adapter = SqlAlchemyDashboardReadAdapter(async_session, current_user)
+
+    totals = await adapter.period_totals(
+        start_date=datetime(2025, 3, 1, tzinfo=timezone.utc),
+        end_date=datetime(2025, 4, 1, tzinfo=timezone.utc),
+        include_drafts=False,
+    )
+
+    assert totals.total_income == Decimal("3000")
+    assert totals.total_expenses == Decimal("120")
+    assert totals.category_spending == {"Groceries": Decimal("120")}
+
+
+@pytest.mark.asyncio
+async def test_asset_balances_respect_draft_setting(
+    async_session,
+    current_user,
+    ledger,
+):
+    adapter = SqlAlchemyDashboardReadAdapter(async_session, current_user)
+
+    posted = await adapter.asset_balances(include_drafts=False)
+    with_drafts = await adapter.asset_balances(include_drafts=True)
+
+    assert posted == {ledger.id: Decimal("2080")}
+    assert with_drafts == {ledger.id: Decimal("2050")}
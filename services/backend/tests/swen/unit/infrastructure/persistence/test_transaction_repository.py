@@ -4,16 +4,26 @@ Unit tests for TransactionRepositorySQLAlchemy.
 These tests verify the persistence layer for accounting transactions.
 """
 
+from datetime import date, datetime, timezone
 from decimal import Decimal
+from unittest.mock import patch
+from uuid import uuid4
 
 import pytest
 from sqlalchemy import select
 
 from swen.domain.accounting.aggregates import Transaction
 from swen.domain.accounting.entities import Account, AccountType
-from swen.domain.accounting.value_objects import Currency, Money
+from swen.domain.accounting.value_objects import (
+    Currency,
+    Money,
+    TransactionFilters,
+)
+from swen.domain.shared.value_objects import PageCursor, Pagination
 from swen.infrastructure.persistence.sqlalchemy.models import (
     JournalEntryModel,
+    MonthlyAccountBalanceModel,
+    TransactionModel,
 )
 from swen.infrastructure.persistence.sqlalchemy.repositories import (
     AccountRepositorySQLAlchemy,
@@ -174,6 +184,42 @@ class TestTransactionRepositorySQLAlchemy:
         assert retrieved_list[0].id == transaction.id
         assert retrieved_list[0].counterparty_iban == "DE89370400440532013000"
 
+    @pytest.mark.asyncio
+    async def test_find_transfer_candidate_ids(self, async_session, setup_accounts):
+        """Only same-amount transactions inside the date window are candidates."""
+        accounts = setup_accounts
+        transaction_repo = TransactionRepositorySQLAlchemy(
+            async_session,
+            accounts["repo"],
+            accounts["current_user"],
+        )
+
+        def _make(day: int, amount: str) -> Transaction:
+            transaction = Transaction(
+                f"Transfer {day}",
+                TEST_USER_ID,
+                date=datetime(2025, 3, day, 12, tzinfo=timezone.utc),
+                counterparty_iban="DE89370400440532013000",
+            )
+            transaction.add_debit(accounts["expense"], Money(Decimal(amount)))
+            transaction.add_credit(accounts["checking"], Money(Decimal(amount)))
+            return transaction
+
+        match = _make(11, "250.00")
+        wrong_amount = _make(10, "99.00")
+        outside_window = _make(20, "250.00")
+        for transaction in (match, wrong_amount, outside_window):
+            await transaction_repo.save(transaction)
+
+        candidate_ids = await transaction_repo.find_transfer_candidate_ids(
+            counterparty_iban="DE89 3704 0044 0532 0130 00",
+            amount=Decimal("250.00"),
+            start_date=date(2025, 3, 8),
+            end_date=date(2025, 3, 12),
+        )
+
+        assert candidate_ids == [match.id]
+
     @pytest.mark.asyncio
     async def test_find_posted_transactions(self, async_session, setup_accounts):
         """Test finding only posted transactions."""
@@ -337,6 +383,234 @@ class TestTransactionRepositorySQLAlchemy:
             "source": "manual",  # Default source
         }
 
+    @pytest.mark.asyncio
+    async def test_find_by_metadata_uses_promoted_column(
+        self,
+        async_session,
+        setup_accounts,
+    ):
+        """Promoted metadata keys are mirrored into indexed columns on save."""
+        accounts = setup_accounts
+        transaction_repo = TransactionRepositorySQLAlchemy(
+            async_session,
+            accounts["repo"],
+            accounts["current_user"],
+        )
+
+        transfer = Transaction(
+            "Transfer",
+            user_id=TEST_USER_ID,
+            metadata={"transfer_identity_hash": "a" * 64},
+        )
+        transfer.add_debit(accounts["expense"], Money(Decimal("20.00")))
+        transfer.add_credit(accounts["checking"], Money(Decimal("20.00")))
+        other = Transaction(
+            "Other",
+            user_id=TEST_USER_ID,
+            metadata={"transfer_identity_hash": "b" * 64},
+        )
+        other.add_debit(accounts["expense"], Money(Decimal("20.00")))
+        other.add_credit(accounts["checking"], Money(Decimal("20.00")))
+        await transaction_repo.save(transfer)
+        await transaction_repo.save(other)
+
+        model = await async_session.get(TransactionModel, transfer.id)
+        assert model.transfer_identity_hash == "a" * 64
+
+        found = await transaction_repo.find_by_metadata(
+            "transfer_identity_hash",
+            "a" * 64,
+        )
+        assert [txn.id for txn in found] == [transfer.id]
+
+        transfer.remove_metadata_raw("transfer_identity_hash")
+        await transaction_repo.save(transfer)
+
+        found = await transaction_repo.find_by_metadata("transfer_identity_hash")
+        assert [txn.id for txn in found] == [other.id]
+
+    @pytest.mark.asyncio
+    async def test_find_by_id_prefix(self, async_session, setup_accounts):
+        """Short ID prefixes resolve through a bounded ID range query."""
+        accounts = setup_accounts
+        transaction_repo = TransactionRepositorySQLAlchemy(
+            async_session,
+            accounts["repo"],
+            accounts["current_user"],
+        )
+
+        transaction = Transaction("Prefixed", TEST_USER_ID)
+        transaction.add_debit(accounts["expense"], Money(Decimal("3.00")))
+        transaction.add_credit(accounts["checking"], Money(Decimal("3.00")))
+        await transaction_repo.save(transaction)
+        full_id = str(transaction.id)
+
+        for prefix in (full_id[:8], full_id[:13], full_id.upper()[:6]):
+            found = await transaction_repo.find_by_id_prefix(prefix)
+            assert [txn.id for txn in found] == [transaction.id]
+
+        assert await transaction_repo.find_by_id_prefix("not-hex") == []
+        assert await transaction_repo.find_by_id_prefix(full_id[:7] + "-") == []
+
+    @pytest.mark.asyncio
+    async def test_keyset_pages_cover_same_date_rows_once(
+        self,
+        async_session,
+        setup_accounts,
+    ):
+        """Cursor pages walk (date, id) descending without gaps or repeats."""
+        accounts = setup_accounts
+        transaction_repo = TransactionRepositorySQLAlchemy(
+            async_session,
+            accounts["repo"],
+            accounts["current_user"],
+        )
+
+        same_day = datetime(2025, 3, 15, tzinfo=timezone.utc)
+        saved = []
+        for i in range(5):
+            txn = Transaction(f"Txn {i}", TEST_USER_ID, date=same_day)
+            txn.add_debit(accounts["expense"], Money(Decimal("1.00")))
+            txn.add_credit(accounts["checking"], Money(Decimal("1.00")))
+            saved.append(txn)
+        await transaction_repo.save_all(saved)
+
+        seen = []
+        cursor = None
+        while True:
+            page = await transaction_repo.find_with_filters(
+                TransactionFilters(),
+                Pagination(page_size=2, cursor=cursor),
+            )
+            seen.extend(txn.id for txn in page)
+            if len(page) < 2:
+                break
+            cursor = PageCursor(date=page[-1].date, id=page[-1].id)
+
+        assert seen == sorted((txn.id for txn in saved), reverse=True)
+
+    @pytest.mark.asyncio
+    async def test_count_by_status_with_filters(self, async_session, setup_accounts):
+        """Status and filtered counts come back together."""
+        accounts = setup_accounts
+        transaction_repo = TransactionRepositorySQLAlchemy(
+            async_session,
+            accounts["repo"],
+            accounts["current_user"],
+        )
+
+        for posted in (True, True, False):
+            txn = Transaction("Counted", TEST_USER_ID)
+            txn.add_debit(accounts["expense"], Money(Decimal("5.00")))
+            txn.add_credit(accounts["checking"], Money(Decimal("5.00")))
+            if posted:
+                txn.post()
+            await transaction_repo.save(txn)
+
+        counts = await transaction_repo.count_by_status(
+            TransactionFilters(status="draft"),
+        )
+
+        assert counts == {"posted": 2, "draft": 1, "total": 3, "filtered": 1}
+        assert "filtered" not in await transaction_repo.count_by_status()
+
+    @pytest.mark.asyncio
+    async def test_monthly_balance_rollup_follows_writes(
+        self,
+        async_session,
+        setup_accounts,
+    ):
+        """Saving, posting and deleting keep the monthly rollup in step."""
+        accounts = setup_accounts
+        transaction_repo = TransactionRepositorySQLAlchemy(
+            async_session,
+            accounts["repo"],
+            accounts["current_user"],
+        )
+
+        async def rollup_row():
+            result = await async_session.execute(
+                select(MonthlyAccountBalanceModel).where(
+                    MonthlyAccountBalanceModel.account_id == accounts["checking"].id,
+                    MonthlyAccountBalanceModel.month == "2025-03",
+                ),
+            )
+            row = result.scalar_one()
+            await async_session.refresh(row)
+            return row
+
+        march = datetime(2025, 3, 15, tzinfo=timezone.utc)
+        first = Transaction("First", TEST_USER_ID, date=march)
+        first.add_debit(accounts["expense"], Money(Decimal("40.00")))
+        first.add_credit(accounts["checking"], Money(Decimal("40.00")))
+        second = Transaction("Second", TEST_USER_ID, date=march)
+        second.add_debit(accounts["expense"], Money(Decimal("10.00")))
+        second.add_credit(accounts["checking"], Money(Decimal("10.00")))
+        await transaction_repo.save_all([first, second])
+
+        row = await rollup_row()
+        assert row.draft_credit == Decimal("50.00")
+        assert row.posted_credit == Decimal("0.00")
+
+        first.post()
+        await transaction_repo.save(first)
+
+        row = await rollup_row()
+        assert row.draft_credit == Decimal("10.00")
+        assert row.posted_credit == Decimal("40.00")
+
+        await transaction_repo.delete(first.id)
+
+        row = await rollup_row()
+        assert row.draft_credit == Decimal("10.00")
+        assert row.posted_credit == Decimal("0.00")
+
+    @pytest.mark.asyncio
+    async def test_set_posted_updates_rows_and_rollup(
+        self,
+        async_session,
+        setup_accounts,
+    ):
+        """Bulk posting flips only drafts and moves their rollup amounts."""
+        accounts = setup_accounts
+        transaction_repo = TransactionRepositorySQLAlchemy(
+            async_session,
+            accounts["repo"],
+            accounts["current_user"],
+        )
+
+        march = datetime(2025, 3, 15, tzinfo=timezone.utc)
+        drafts = []
+        for amount in ("25.00", "15.00"):
+            txn = Transaction(f"Draft {amount}", TEST_USER_ID, date=march)
+            txn.add_debit(accounts["expense"], Money(Decimal(amount)))
+            txn.add_credit(accounts["checking"], Money(Decimal(amount)))
+            drafts.append(txn)
+        already_posted = Transaction("Posted", TEST_USER_ID, date=march)
+        already_posted.add_debit(accounts["expense"], Money(Decimal("5.00")))
+        already_posted.add_credit(accounts["checking"], Money(Decimal("5.00")))
+        already_posted.post()
+        await transaction_repo.save_all([*drafts, already_posted])
+
+        changed = await transaction_repo.set_posted(
+            [txn.id for txn in drafts] + [already_posted.id, uuid4()],
+            is_posted=True,
+        )
+
+        assert set(changed) == {txn.id for txn in drafts}
+        reloaded = await transaction_repo.find_by_ids([txn.id for txn in drafts])
+        assert all(txn.is_posted for txn in reloaded)
+        result = await async_session.execute(
+            select(MonthlyAccountBalanceModel).where(
+                MonthlyAccountBalanceModel.account_id == accounts["checking"].id,
+                MonthlyAccountBalanceModel.month == "2025-03",
+            ),
+        )
+        row = result.scalar_one()
+        await async_session.refresh(row)
+        assert row.posted_credit == Decimal("45.00")
+        assert row.draft_credit == Decimal("0.00")
+
     @pytest.mark.asyncio
     async def test_transaction_preserves_entry_currency(
         self,
@@ -405,6 +679,45 @@ class TestTransactionRepositorySQLAlchemy:
         entries_after = result.scalars().all()
         assert len(entries_after) == 0
 
+    @pytest.mark.asyncio
+    async def test_mapping_loads_accounts_once_per_page(
+        self,
+        async_session,
+        setup_accounts,
+    ):
+        """Regression test: every journal entry used to load its account."""
+        accounts = setup_accounts
+        account_repo = accounts["repo"]
+        transaction_repo = TransactionRepositorySQLAlchemy(
+            async_session,
+            account_repo,
+            accounts["current_user"],
+        )
+        for i in range(5):
+            tx = Transaction(f"Purchase {i}", TEST_USER_ID)
+            tx.add_debit(accounts["expense"], Money(Decimal("10.00")))
+            tx.add_credit(accounts["checking"], Money(Decimal("10.00")))
+            await transaction_repo.save(tx)
+
+        with (
+            patch.object(
+                account_repo, "find_by_id", wraps=account_repo.find_by_id
+            ) as find_by_id,
+            patch.object(
+                account_repo, "find_by_ids", wraps=account_repo.find_by_ids
+            ) as find_by_ids,
+        ):
+            transactions = await transaction_repo.find_all()
+
+        assert len(transactions) == 5
+        assert all(len(tx.entries) == 2 for tx in transactions)
+        find_by_id.assert_not_called()
+        find_by_ids.assert_awaited_once()
+        assert set(find_by_ids.await_args.args[0]) == {
+            accounts["checking"].id,
+            accounts["expense"].id,
+        }
+
 
 class TestJournalEntryDataIntegrity:
     """Tests for journal entry data integrity constraints and validation."""
@@ -9,17 +9,23 @@ from swen_ml_contracts.classify import (
     Classification,
     ClassificationStats,
     ClassificationTier,
+    ClassifyBatchChunk,
     ClassifyBatchRequest,
     ClassifyBatchResponse,
+    ClassifyBatchStreamEnd,
+    ClassifyBatchStreamError,
     TransactionInput,
 )
 from swen_ml_contracts.common import AccountOption
 from swen_ml_contracts.examples import (
+    MAX_EXAMPLES_PER_BATCH,
     DeleteAccountResponse,
     DeleteUserResponse,
     HealthResponse,
     StoreExampleRequest,
     StoreExampleResponse,
+    StoreExamplesBatchRequest,
+    StoreExamplesBatchResponse,
     UserStatsResponse,
 )
 
@@ -33,9 +39,15 @@ __all__ = [
     "ClassificationStats",
     "ClassificationTier",
     "ClassifyBatchResponse",
+    "ClassifyBatchChunk",
+    "ClassifyBatchStreamEnd",
+    "ClassifyBatchStreamError",
     # Examples
     "StoreExampleRequest",
     "StoreExampleResponse",
+    "StoreExamplesBatchRequest",
+    "StoreExamplesBatchResponse",
+    "MAX_EXAMPLES_PER_BATCH",
     "UserStatsResponse",
     "DeleteAccountResponse",
     "DeleteUserResponse",
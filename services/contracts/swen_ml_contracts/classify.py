@@ -78,3 +78,36 @@ class ClassifyBatchResponse(BaseModel):
     classifications: list[Classification]
     stats: ClassificationStats
     processing_time_ms: int = Field(..., ge=0)
+
+
+class ClassifyBatchChunk(BaseModel):
+    """Streamed part of a batch classification.
+
+    ``POST /classify/batch/stream`` sends one chunk per pipeline tier as soon
+    as that tier has finished, holding the transactions it resolved.
+    Transactions no tier resolved follow in a last chunk, as classifications
+    with ``tier="unresolved"``.
+    """
+
+    type: Literal["classifications"] = "classifications"
+    classifications: list[Classification]
+    completed: int = Field(..., ge=0)  # transactions sent so far, incl. this chunk
+    total: int = Field(..., ge=0)
+
+
+class ClassifyBatchStreamEnd(BaseModel):
+    """Final event of a streamed batch classification."""
+
+    type: Literal["complete"] = "complete"
+    stats: ClassificationStats
+    processing_time_ms: int = Field(..., ge=0)
+
+
+class ClassifyBatchStreamError(BaseModel):
+    """Sent instead of ``ClassifyBatchStreamEnd`` if classification failed.
+
+    Chunks sent before the error remain valid.
+    """
+
+    type: Literal["error"] = "error"
+    detail: str
@@ -40,6 +40,32 @@ class StoreExampleResponse(BaseModel):
     message: str
 
 
+# Upper bound per batch request; callers split larger batches.
+MAX_EXAMPLES_PER_BATCH = 500
+
+
+class StoreExamplesBatchRequest(BaseModel):
+    """Store several posted transactions as training examples at once.
+
+    Called when a user bulk-posts drafts. The texts are encoded together
+    and inserted with one statement.
+    """
+
+    examples: list[StoreExampleRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_EXAMPLES_PER_BATCH,
+    )
+
+
+class StoreExamplesBatchResponse(BaseModel):
+    """Response after storing a batch of examples."""
+
+    stored: int
+    total_examples: int
+    message: str
+
+
 # -----------------------------------------------------------------------------
 # User Statistics
 # -----------------------------------------------------------------------------
@@ -94,3 +120,16 @@ class HealthResponse(BaseModel):
 
     # Cache stats
     users_cached: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    cache_evictions: int = 0
+
+    # Encoder embedding cache stats
+    encoder_cache_hits: int = 0
+    encoder_cache_misses: int = 0
+
+    # Search enrichment cache stats
+    enrichment_cache_hits: int = 0
+    enrichment_cache_misses: int = 0
+    enrichment_cache_hit_ratio: float = 0.0
+    enrichment_search_seconds_saved: float = 0.0
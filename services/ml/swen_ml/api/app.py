@@ -5,16 +5,22 @@ from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
-from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
 from swen_ml.config.settings import get_settings
-from swen_ml.inference import ClassificationOrchestrator, SharedInfrastructure
-from swen_ml.inference._models import create_encoder
+from swen_ml.inference import (
+    ClassificationOrchestrator,
+    SharedInfrastructure,
+    UserDataCache,
+)
+from swen_ml.inference._models import CachedEncoder, EncoderScheduler, create_encoder
 from swen_ml.inference.classification.enrichment import (
+    EnrichmentCache,
     FileKeywordAdapter,
     SearXNGAdapter,
+    TokenBucket,
 )
-from swen_ml.storage import Base, get_engine
+from swen_ml.storage import Base, backfill_embedding_packs, get_engine, upgrade_schema
 
 
 def configure_logging() -> None:
@@ -48,6 +54,9 @@ async def _init_database(engine: AsyncEngine) -> None:
     logger.info("Initializing database tables...")
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(upgrade_schema)
+    async with AsyncSession(engine) as session:
+        await backfill_embedding_packs(session, get_settings().embedding_pack_dtype)
     logger.info("Database tables ready")
 
 
@@ -64,10 +73,25 @@ def _log_settings() -> None:
     logger.info("  Encoder:")
     logger.info("    Backend: %s", settings.encoder_backend)
     logger.info("    Model: %s", settings.encoder_model)
-    if settings.encoder_backend == "huggingface":
+    if settings.encoder_backend in ("huggingface", "onnx"):
         logger.info("    Pooling: %s", settings.encoder_pooling)
         logger.info("    Normalize: %s", settings.encoder_normalize)
         logger.info("    Max length: %d", settings.encoder_max_length)
+    if settings.encoder_backend == "onnx":
+        logger.info("    Quantize: %s", settings.encoder_onnx_quantize)
+        logger.info("    Threads: %s", settings.encoder_num_threads or "auto")
+    logger.info("    Batch size: %d", settings.encoder_batch_size)
+    logger.info(
+        "    Request batching: up to %d texts, %.1fms",
+        settings.encoder_queue_max_batch_size,
+        settings.encoder_queue_max_wait_ms,
+    )
+    logger.info(
+        "    Cache: %d entries, disk: %s",
+        settings.encoder_cache_size,
+        settings.encoder_cache_path or "off",
+    )
+    logger.info("  User cache: %d users", settings.user_cache_max_users)
     logger.info("  Thresholds:")
     logger.info("    Example high conf: %.2f", settings.example_high_confidence)
     logger.info("    Example accept: %.2f", settings.example_accept_threshold)
@@ -77,7 +101,22 @@ def _log_settings() -> None:
     if settings.enrichment_enabled:
         logger.info("    SearXNG URL: %s", settings.enrichment_searxng_url)
         logger.info("    Cache TTL: %d days", settings.enrichment_cache_ttl_days)
-        logger.info("    Rate limit: %.1fs", settings.enrichment_rate_limit_seconds)
+        logger.info("    Memory cache: %d entries", settings.enrichment_memory_cache_size)
+        logger.info(
+            "    Rate limit: %.1fs (burst %d)",
+            settings.enrichment_rate_limit_seconds,
+            settings.enrichment_rate_limit_burst,
+        )
+        logger.info(
+            "    Connections: %d, retries: %d",
+            settings.enrichment_max_connections,
+            settings.enrichment_max_retries,
+        )
+        logger.info(
+            "    Concurrency: %d, batch deadline: %.0fs",
+            settings.enrichment_max_concurrency,
+            settings.enrichment_batch_deadline_seconds,
+        )
     logger.info("=" * 60)
 
 
@@ -111,6 +150,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Initialize enrichment adapters (if enabled)
     keyword_adapter = None
     searxng_adapter = None
+    enrichment_cache = None
     if settings.enrichment_enabled:
         logger.info(
             "Initializing enrichment adapters: %s",
@@ -119,18 +159,43 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         searxng_adapter = SearXNGAdapter(
             base_url=settings.enrichment_searxng_url,
             timeout=settings.enrichment_search_timeout,
+            connect_timeout=settings.enrichment_connect_timeout,
+            max_connections=settings.enrichment_max_connections,
+            max_keepalive_connections=settings.enrichment_max_connections,
+            max_retries=settings.enrichment_max_retries,
+            retry_backoff_seconds=settings.enrichment_retry_backoff_seconds,
+            rate_limiter=TokenBucket(
+                interval_seconds=settings.enrichment_rate_limit_seconds,
+                burst=settings.enrichment_rate_limit_burst,
+            ),
         )
         keyword_adapter = FileKeywordAdapter()
+        enrichment_cache = EnrichmentCache(
+            max_entries=settings.enrichment_memory_cache_size,
+            ttl_days=settings.enrichment_cache_ttl_days,
+            negative_ttl_days=settings.enrichment_negative_cache_ttl_days,
+            max_db_entries=settings.enrichment_max_cache_size,
+        )
         logger.info("Enrichment adapters ready (keyword + search)")
     else:
         logger.info("Enrichment disabled")
 
+    # All request handlers encode through one scheduler (batched, off the event loop)
+    encoder_scheduler = EncoderScheduler(
+        encoder,
+        max_batch_size=settings.encoder_queue_max_batch_size,
+        max_wait_ms=settings.encoder_queue_max_wait_ms,
+    )
+
     # Create shared infrastructure
     infra = SharedInfrastructure(
         encoder=encoder,
         settings=settings,
+        encoder_scheduler=encoder_scheduler,
         keyword_adapter=keyword_adapter,
         searxng_adapter=searxng_adapter,
+        user_cache=UserDataCache(max_users=settings.user_cache_max_users),
+        enrichment_cache=enrichment_cache,
     )
 
     # Create orchestrator and store in app state
@@ -147,11 +212,15 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     logger.info("Shutting down")
     del app.state.classification
+    await app.state.infra.encoder_scheduler.aclose()
     del app.state.infra
+    if isinstance(app.state.encoder, CachedEncoder):
+        app.state.encoder.close()
     del app.state.encoder
     if app.state.keyword_adapter:
         del app.state.keyword_adapter
     if app.state.searxng_adapter:
+        await app.state.searxng_adapter.aclose()
         del app.state.searxng_adapter
 
     # Close database connections
@@ -24,13 +24,15 @@ async def embed_accounts(
 ) -> EmbedAccountsResponse:
     """Compute and store anchor embeddings for accounts."""
     encoder = http_request.app.state.encoder
+    user_cache = http_request.app.state.infra.user_cache
+    scheduler = http_request.app.state.infra.encoder_scheduler
 
     if not request.accounts:
         return EmbedAccountsResponse(embedded=0, message="No accounts provided")
 
     # Create service from factory
     repos = RepositoryFactory(session, user_id)
-    service = AccountEmbeddingService.from_factory(encoder, repos)
+    service = AccountEmbeddingService.from_factory(encoder, repos, user_cache, scheduler)
 
     # Embed accounts
     embedded_count = await service.embed_accounts(request.accounts)
@@ -56,8 +58,9 @@ async def delete_account_anchor(
 ) -> dict[str, bool]:
     """Delete anchor embedding for a specific account."""
     encoder = http_request.app.state.encoder
+    user_cache = http_request.app.state.infra.user_cache
     repos = RepositoryFactory(session, user_id)
-    service = AccountEmbeddingService.from_factory(encoder, repos)
+    service = AccountEmbeddingService.from_factory(encoder, repos, user_cache)
 
     deleted = await service.delete_account(account_id)
 
@@ -79,8 +82,9 @@ async def delete_all_anchors(
 ) -> dict[str, int]:
     """Delete all anchor embeddings for a user."""
     encoder = http_request.app.state.encoder
+    user_cache = http_request.app.state.infra.user_cache
     repos = RepositoryFactory(session, user_id)
-    service = AccountEmbeddingService.from_factory(encoder, repos)
+    service = AccountEmbeddingService.from_factory(encoder, repos, user_cache)
     count = await service.delete_all()
 
     logger.info("Delete all anchors for user=%s, count=%d", user_id, count)
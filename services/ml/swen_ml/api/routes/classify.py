@@ -3,19 +3,25 @@
 import logging
 import time
 from collections import Counter
+from collections.abc import AsyncIterator
 
 from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 from swen_ml_contracts import (
     Classification,
     ClassificationStats,
     ClassificationTier,
+    ClassifyBatchChunk,
     ClassifyBatchRequest,
     ClassifyBatchResponse,
+    ClassifyBatchStreamEnd,
+    ClassifyBatchStreamError,
 )
 
 from swen_ml.inference import ClassificationOrchestrator, ClassificationResult
-from swen_ml.storage import get_session
+from swen_ml.storage import get_session, get_session_context
 
 logger = logging.getLogger(__name__)
 
@@ -108,3 +114,93 @@ async def classify_transactions(
         stats=stats,
         processing_time_ms=elapsed_ms,
     )
+
+
+def _format_sse_event(event: BaseModel) -> str:
+    """Format a stream event as a Server-Sent Event."""
+    return f"data: {event.model_dump_json()}\n\n"
+
+
+@router.post(
+    "/classify/batch/stream",
+    responses={
+        200: {
+            "description": "SSE stream of classification chunks",
+            "content": {"text/event-stream": {}},
+        },
+    },
+)
+async def classify_transactions_streaming(
+    request: ClassifyBatchRequest,
+    http_request: Request,
+) -> StreamingResponse:
+    """Classify a batch of transactions, streaming results per tier.
+
+    Emits a ``ClassifyBatchChunk`` as soon as a tier has resolved some
+    transactions, so example-tier hits arrive while the enrichment tier is
+    still running. Ends with a ``ClassifyBatchStreamEnd``, or with a
+    ``ClassifyBatchStreamError`` if classification failed.
+    """
+    logger.info(
+        "POST /classify/batch/stream: user=%s, transactions=%d",
+        request.user_id,
+        len(request.transactions),
+    )
+    orchestrator: ClassificationOrchestrator = http_request.app.state.classification
+
+    async def event_generator() -> AsyncIterator[str]:
+        start_time = time.perf_counter()
+        total = len(request.transactions)
+        classifications: list[Classification] = []
+
+        try:
+            # The session must outlive the endpoint, so it is opened here
+            async with get_session_context() as session:
+                async for tier_name, results in orchestrator.classify_streaming(
+                    session=session,
+                    transactions=request.transactions,
+                    user_id=request.user_id,
+                ):
+                    if not results:
+                        continue
+                    chunk = [_to_classification(result) for result in results]
+                    classifications.extend(chunk)
+                    logger.debug(
+                        "Streaming %d classifications from %s tier",
+                        len(chunk),
+                        tier_name,
+                    )
+                    yield _format_sse_event(
+                        ClassifyBatchChunk(
+                            classifications=chunk,
+                            completed=len(classifications),
+                            total=total,
+                        )
+                    )
+        except Exception as e:
+            logger.exception("Streaming classification failed: %s", e)
+            yield _format_sse_event(
+                ClassifyBatchStreamError(detail=type(e).__name__)
+            )
+            return
+
+        stats = _compute_stats(classifications)
+        elapsed_ms = int((time.perf_counter() - start_time) * 1000)
+        logger.info(
+            "Classification complete: %d transactions in %dms, tiers=%s",
+            len(classifications),
+            elapsed_ms,
+            stats.by_tier,
+        )
+        yield _format_sse_event(
+            ClassifyBatchStreamEnd(stats=stats, processing_time_ms=elapsed_ms)
+        )
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # Disable nginx buffering
+        },
+    )
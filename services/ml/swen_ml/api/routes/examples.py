@@ -5,10 +5,15 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
-from swen_ml_contracts import StoreExampleRequest, StoreExampleResponse
+from swen_ml_contracts import (
+    StoreExampleRequest,
+    StoreExampleResponse,
+    StoreExamplesBatchRequest,
+    StoreExamplesBatchResponse,
+)
 
 from swen_ml.storage import RepositoryFactory, get_session
-from swen_ml.training import ExampleEmbeddingService
+from swen_ml.training import ExampleEmbeddingService, ExampleInput
 
 logger = logging.getLogger(__name__)
 
@@ -24,10 +29,12 @@ async def store_example(
 ) -> StoreExampleResponse:
     """Store a posted transaction as a training example."""
     encoder = http_request.app.state.encoder
+    user_cache = http_request.app.state.infra.user_cache
+    scheduler = http_request.app.state.infra.encoder_scheduler
 
     # Create service from factory
     repos = RepositoryFactory(session, user_id)
-    service = ExampleEmbeddingService.from_factory(encoder, repos)
+    service = ExampleEmbeddingService.from_factory(encoder, repos, user_cache, scheduler)
 
     # Store example
     total = await service.store_example(
@@ -50,3 +57,44 @@ async def store_example(
         total_examples=total,
         message=f"Stored example for account {request.account_number}",
     )
+
+
+@router.post("/users/{user_id}/examples:batch", response_model=StoreExamplesBatchResponse)
+async def store_examples_batch(
+    user_id: UUID,
+    request: StoreExamplesBatchRequest,
+    http_request: Request,
+    session: AsyncSession = Depends(get_session),
+) -> StoreExamplesBatchResponse:
+    """Store many posted transactions as training examples in one pass.
+
+    All texts are encoded in a single call and written with one insert.
+    """
+    encoder = http_request.app.state.encoder
+    user_cache = http_request.app.state.infra.user_cache
+    scheduler = http_request.app.state.infra.encoder_scheduler
+
+    repos = RepositoryFactory(session, user_id)
+    service = ExampleEmbeddingService.from_factory(encoder, repos, user_cache, scheduler)
+
+    total = await service.store_examples(
+        [
+            ExampleInput(
+                counterparty_name=example.counterparty_name,
+                purpose=example.purpose,
+                account_id=example.account_id,
+                account_number=example.account_number,
+                account_type=example.account_type,
+            )
+            for example in request.examples
+        ]
+    )
+    stored = len(request.examples)
+
+    logger.info("Stored %d examples for user=%s, total=%d", stored, user_id, total)
+
+    return StoreExamplesBatchResponse(
+        stored=stored,
+        total_examples=total,
+        message=f"Stored {stored} examples",
+    )
@@ -2,6 +2,9 @@ from fastapi import APIRouter, Request, Response
 from swen_ml_contracts import HealthResponse
 
 from swen_ml.config.settings import get_settings
+from swen_ml.inference import UserDataCache
+from swen_ml.inference._models import CachedEncoder, EncoderCacheStats
+from swen_ml.inference.classification.enrichment import EnrichmentCacheStats
 
 router = APIRouter()
 
@@ -11,7 +14,15 @@ async def health_check(request: Request, response: Response) -> HealthResponse:
     """Check service health and model status."""
     settings = get_settings()
 
-    encoder_loaded = hasattr(request.app.state, "encoder")
+    encoder = getattr(request.app.state, "encoder", None)
+    encoder_loaded = encoder is not None
+    encoder_stats = encoder.stats if isinstance(encoder, CachedEncoder) else EncoderCacheStats()
+    infra = getattr(request.app.state, "infra", None)
+    user_cache = infra.user_cache if infra is not None else UserDataCache(max_users=0)
+    enrichment_cache = infra.enrichment_cache if infra is not None else None
+    enrichment_stats = (
+        enrichment_cache.stats if enrichment_cache is not None else EnrichmentCacheStats()
+    )
 
     if not encoder_loaded:
         response.status_code = 503
@@ -21,5 +32,14 @@ async def health_check(request: Request, response: Response) -> HealthResponse:
         version="0.1.0",
         embedding_model_loaded=encoder_loaded,
         embedding_model_name=settings.encoder_model,
-        users_cached=0,  # TODO: Get from cache
+        users_cached=len(user_cache),
+        cache_hits=user_cache.stats.hits,
+        cache_misses=user_cache.stats.misses,
+        cache_evictions=user_cache.stats.evictions,
+        encoder_cache_hits=encoder_stats.hits,
+        encoder_cache_misses=encoder_stats.misses,
+        enrichment_cache_hits=enrichment_stats.hits,
+        enrichment_cache_misses=enrichment_stats.misses,
+        enrichment_cache_hit_ratio=enrichment_stats.hit_ratio,
+        enrichment_search_seconds_saved=enrichment_stats.search_seconds_saved,
     )
@@ -33,13 +33,32 @@ class Settings(BaseSettings):
     # Data directory for evaluations
     data_dir: Path = Path("data")
     # For huggingface we need to use pooling and stuff
-    encoder_backend: Literal["sentence-transformers", "huggingface"]
+    encoder_backend: Literal["sentence-transformers", "huggingface", "onnx"]
     encoder_model: str = "paraphrase-multilingual-MiniLM-L12-v2"
-    # HuggingFace-specific options (ignored for sentence-transformers)
+    # HuggingFace/ONNX options (ignored for sentence-transformers)
     encoder_pooling: Literal["mean", "cls", "max"] = "mean"
     encoder_normalize: bool = True
-    encoder_max_length: int = 512
+    # Bank texts (counterparty + purpose + enrichment) stay well below 256 tokens
+    encoder_max_length: int = 256
+    # Maximum number of texts per forward pass (applies to both backends)
+    encoder_batch_size: int = 32
+    # Encode requests from concurrent handlers are collected for up to
+    # encoder_queue_max_wait_ms (or encoder_queue_max_batch_size texts) and run
+    # as one batch in a worker thread
+    encoder_queue_max_batch_size: int = 64
+    encoder_queue_max_wait_ms: float = 5.0
     device: str = "cpu"  # cuda, or mps -> untested!
+    # ONNX backend: exported models are cached here; int8 weights by default
+    encoder_onnx_cache_dir: Path = Path("data/onnx")
+    encoder_onnx_quantize: bool = True
+    # Intra-op threads for the ONNX backend (0 = ONNX Runtime default)
+    encoder_num_threads: int = 0
+    # Embeddings cached per (model, normalized text); 0 disables the memory cache.
+    # Set encoder_cache_path to also keep them in a SQLite file across restarts.
+    encoder_cache_size: int = 10000
+    encoder_cache_path: Path | None = None
+    # Storage precision of the packed embedding matrices (float16 halves the size)
+    embedding_pack_dtype: Literal["float32", "float16"] = "float32"
 
     example_high_confidence: float = 0.85
     example_accept_threshold: float = 0.70
@@ -47,13 +66,32 @@ class Settings(BaseSettings):
     anchor_accept_threshold: float = 0.35
     noise_threshold: float = 0.30
 
+    # Number of users whose embeddings and noise model are kept in memory
+    user_cache_max_users: int = 64
+
     # Search enrichment
     enrichment_enabled: bool = True
     enrichment_searxng_url: str = "http://localhost:8888"
     enrichment_cache_ttl_days: int = 7
     enrichment_max_cache_size: int = 10000
+    enrichment_memory_cache_size: int = 2048
+    enrichment_negative_cache_ttl_days: int = 1
     enrichment_search_timeout: float = 5.0
+    # Pooled SearXNG client: connection limits and retries on 429/5xx/transport errors
+    enrichment_connect_timeout: float = 2.0
+    enrichment_max_connections: int = 10
+    enrichment_max_retries: int = 2
+    enrichment_retry_backoff_seconds: float = 0.5
+    # Token bucket shared by all requests: one search per interval on average,
+    # with short bursts of up to enrichment_rate_limit_burst searches (at least 1).
+    # An interval of 0 disables the rate limit.
     enrichment_rate_limit_seconds: float = 1.0
+    enrichment_rate_limit_burst: int = 3
+    enrichment_max_concurrency: int = 4
+    # Searches still running after this many seconds are skipped for the batch.
+    # Keep it below the backend's ML_SERVICE_TIMEOUT (10s by default), so a
+    # classify batch answers before the backend gives up on it.
+    enrichment_batch_deadline_seconds: float = 8.0
 
     model_config = SettingsConfigDict(
         env_file=resolve_env_file_path(),
@@ -17,6 +17,8 @@ class Anchor(BaseModel):
     name: str
     account_type: str  # "expense", "income", "equity"
     embedding: NDArray[np.float32]
+    # Hash of encoder fingerprint + embedded text; unchanged anchors are not re-encoded
+    text_hash: str | None = None
 
     @field_validator("embedding", mode="before")
     @classmethod
@@ -1,5 +1,6 @@
 """Evaluation CLI for swen_ml."""
 
+import asyncio
 import time
 from pathlib import Path
 
@@ -9,7 +10,7 @@ import typer
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
-from transformers import pipeline
+from transformers import AutoModel, AutoTokenizer, pipeline
 
 from swen_ml.config.settings import get_settings
 from swen_ml.evaluation.metrics import category_accuracy, tier_accuracy
@@ -20,7 +21,12 @@ from swen_ml.evaluation.runner import (
     run_with_examples,
 )
 from swen_ml.inference import MerchantExtractor, RecurringDetector
-from swen_ml.inference._models import Encoder, NLIClassifier, create_encoder
+from swen_ml.inference._models import (
+    Encoder,
+    HuggingFaceEncoder,
+    NLIClassifier,
+    create_encoder,
+)
 from swen_ml.inference.classification.enrichment import (
     SearXNGAdapter,
     extract_enrichment_text,
@@ -709,6 +715,206 @@ def neighbors(
         console.print("[dim]Use --all to show all transactions[/dim]")
 
 
+@app.command("encoder-benchmark")
+def encoder_benchmark(
+    csv_path: Path | None = typer.Option(
+        None,
+        "--file",
+        "-f",
+        help="Path to transactions CSV (default: evaluation data)",
+    ),
+    repeat: int = typer.Option(
+        4, "--repeat", "-r", help="Repeat the texts to simulate a large sync"
+    ),
+    runs: int = typer.Option(3, "--runs", help="Timed runs per configuration"),
+) -> None:
+    """Compare HuggingFace encoder throughput with and without micro-batching.
+
+    The baseline encodes all texts as a single padded batch; the bucketed run
+    uses the configured encoder_batch_size with length-sorted micro-batches.
+    Both share the same model, so the embeddings must match.
+
+    Examples:
+        uv run python -m swen_ml.evaluation encoder-benchmark
+
+        # Larger input, more timed runs
+        uv run python -m swen_ml.evaluation encoder-benchmark -r 10 --runs 5
+    """
+    settings = get_settings()
+
+    if csv_path is None:
+        csv_path = _DEFAULT_EVAL_DATA / "transactions.csv"
+
+    if not csv_path.exists():
+        console.print(f"[red]Error: File not found: {csv_path}[/red]")
+        raise typer.Exit(1)
+
+    df = pd.read_csv(csv_path)
+    texts = []
+    for _, row in df.iterrows():
+        parts = [row.get("counterparty"), row.get("purpose")]
+        text = " ".join(str(p) for p in parts if p is not None and str(p) != "nan")
+        texts.append(text or "(empty)")
+    texts = texts * max(repeat, 1)
+
+    console.print(f"[dim]Loading HuggingFace model: {settings.encoder_model}[/dim]")
+    tokenizer = AutoTokenizer.from_pretrained(settings.encoder_model)
+    model = AutoModel.from_pretrained(settings.encoder_model)
+
+    configs = {
+        "single batch": len(texts),
+        f"bucketed ({settings.encoder_batch_size})": settings.encoder_batch_size,
+    }
+    results: dict[str, tuple[float, np.ndarray]] = {}
+    for label, batch_size in configs.items():
+        encoder = HuggingFaceEncoder(
+            model=model,
+            tokenizer=tokenizer,
+            model_name=settings.encoder_model,
+            pooling=settings.encoder_pooling,
+            normalize=settings.encoder_normalize,
+            max_length=settings.encoder_max_length,
+            batch_size=batch_size,
+        )
+        encoder.warmup()
+        timings = []
+        for _ in range(max(runs, 1)):
+            start = time.perf_counter()
+            embeddings = encoder.encode(texts)
+            timings.append(time.perf_counter() - start)
+        results[label] = (min(timings), embeddings)
+
+    table = Table(title=f"Encoder throughput ({len(texts)} texts, best of {runs})")
+    table.add_column("Configuration")
+    table.add_column("Seconds", justify="right")
+    table.add_column("Texts/s", justify="right")
+    for label, (seconds, _) in results.items():
+        table.add_row(label, f"{seconds:.2f}", f"{len(texts) / seconds:.0f}")
+    console.print(table)
+
+    (base_s, base_emb), (bucket_s, bucket_emb) = results.values()
+    max_diff = float(np.abs(base_emb - bucket_emb).max())
+    console.print(f"Speedup: [bold]{base_s / bucket_s:.2f}x[/bold]")
+    console.print(f"[dim]Max embedding difference: {max_diff:.2e}[/dim]")
+
+
+@app.command("onnx-eval")
+def onnx_eval(
+    n_folds: int = typer.Option(5, "--folds", "-k", help="Number of CV folds"),
+    runs: int = typer.Option(3, "--runs", help="Timed encode runs per encoder"),
+) -> None:
+    """Compare the ONNX encoder backend with the fp32 PyTorch encoder.
+
+    Runs cold start and cross-validation with both encoders on the evaluation
+    data and reports the accuracy difference, prediction agreement, embedding
+    similarity and CPU encode latency. The ONNX model is exported (and
+    quantized, see SWEN_ML_ENCODER_ONNX_QUANTIZE) on first use.
+
+    Examples:
+        uv run python -m swen_ml.evaluation onnx-eval
+
+        # Quicker run
+        uv run python -m swen_ml.evaluation onnx-eval -k 3 --runs 1
+    """
+    if not _DEFAULT_EVAL_DATA.exists():
+        console.print(
+            f"[red]Error: Data directory not found: {_DEFAULT_EVAL_DATA}[/red]"
+        )
+        raise typer.Exit(1)
+
+    settings = get_settings()
+    baseline_backend = (
+        settings.encoder_backend
+        if settings.encoder_backend != "onnx"
+        else "sentence-transformers"
+    )
+    # Disable the embedding cache so that both encoders really run
+    uncached = {"encoder_cache_size": 0, "encoder_cache_path": None}
+    backends = {
+        f"{baseline_backend} (fp32)": settings.model_copy(
+            update={**uncached, "encoder_backend": baseline_backend}
+        ),
+        f"onnx ({'int8' if settings.encoder_onnx_quantize else 'fp32'})": (
+            settings.model_copy(update={**uncached, "encoder_backend": "onnx"})
+        ),
+    }
+
+    transactions, accounts, expected = load_evaluation_data(_DEFAULT_EVAL_DATA)
+    texts = [
+        " ".join(filter(None, [t.counterparty_name, t.purpose])) or "(empty)"
+        for t in transactions
+    ]
+    console.print(
+        f"[dim]Loaded {len(transactions)} transactions, "
+        f"{len(accounts)} accounts[/dim]\n"
+    )
+
+    results = {}
+    for label, backend_settings in backends.items():
+        console.print(f"[dim]Loading encoder: {label} / {settings.encoder_model}[/dim]")
+        encoder = create_encoder(backend_settings)
+        encoder.warmup()
+
+        timings = []
+        for _ in range(max(runs, 1)):
+            start = time.perf_counter()
+            embeddings = encoder.encode(texts)
+            timings.append(time.perf_counter() - start)
+
+        console.print(f"[dim]Running classification with {label}...[/dim]")
+        cold = run_cold_start(transactions, accounts, expected, encoder)
+        folds = run_with_examples(
+            transactions, accounts, expected, encoder, n_folds=n_folds
+        )
+        results[label] = (
+            cold,
+            aggregate_cv_results(folds),
+            min(timings),
+            embeddings,
+        )
+
+    table = Table(title=f"Encoder comparison ({len(texts)} texts)")
+    table.add_column("Encoder")
+    table.add_column("Cold start", justify="right")
+    table.add_column(f"{n_folds}-fold CV", justify="right")
+    table.add_column("ms / text", justify="right")
+    for label, (cold, cv, seconds, _) in results.items():
+        table.add_row(
+            label,
+            f"{cold.metrics.accuracy:.1%}",
+            f"{cv.accuracy:.1%}",
+            f"{seconds / len(texts) * 1000:.2f}",
+        )
+    console.print()
+    console.print(table)
+
+    (base_cold, base_cv, base_s, base_emb), (onnx_cold, onnx_cv, onnx_s, onnx_emb) = (
+        results.values()
+    )
+    agreement = np.mean(
+        [
+            a.account_number == b.account_number
+            for a, b in zip(base_cold.classifications, onnx_cold.classifications)
+        ]
+    )
+    cosine = np.sum(base_emb * onnx_emb, axis=1) / (
+        np.linalg.norm(base_emb, axis=1) * np.linalg.norm(onnx_emb, axis=1)
+    )
+
+    console.print(
+        f"Cold start accuracy delta: "
+        f"[bold]{onnx_cold.metrics.accuracy - base_cold.metrics.accuracy:+.1%}[/bold]"
+    )
+    console.print(
+        f"CV accuracy delta: [bold]{onnx_cv.accuracy - base_cv.accuracy:+.1%}[/bold]"
+    )
+    console.print(f"Cold start prediction agreement: {agreement:.1%}")
+    console.print(
+        f"Embedding cosine similarity: mean {cosine.mean():.4f}, min {cosine.min():.4f}"
+    )
+    console.print(f"Speedup: [bold]{base_s / onnx_s:.2f}x[/bold]")
+
+
 @app.command("anchor-eval")
 def anchor_eval(
     top_k: int = typer.Option(3, "--top", "-k", help="Show top K account matches"),
@@ -1430,102 +1636,105 @@ def search_eval(
 
     detailed_results: list[dict] = []
 
-    with console.status("[bold]Processing transactions...") as status:
-        for i in range(n_txns):
-            cp = counterparties[i]
-            purpose = purposes[i]
-            expected = expected_accounts[i]
+    try:
+        with console.status("[bold]Processing transactions...") as status:
+            for i in range(n_txns):
+                cp = counterparties[i]
+                purpose = purposes[i]
+                expected = expected_accounts[i]
 
-            # Baseline text
-            baseline_text = f"{cp} {purpose}".strip()
+                # Baseline text
+                baseline_text = f"{cp} {purpose}".strip()
 
-            # Search for counterparty
-            search_query = clean_counterparty(cp) or cp
-            status.update(f"[bold]Searching: {search_query[:30]}...")
+                # Search for counterparty
+                search_query = clean_counterparty(cp) or cp
+                status.update(f"[bold]Searching: {search_query[:30]}...")
 
-            search_results = search_client.search_sync(search_query)
+                search_results = search_client.search_sync(search_query)
 
-            # Build enhanced text using smart extraction
-            if search_results:
-                snippets = extract_enrichment_text(search_results, max_length=300)
-                enhanced_text = f"{baseline_text} {snippets}"
-            else:
-                snippets = ""
-                enhanced_text = baseline_text
-                no_results_count += 1
-
-            # Log the enrichment
-            console.print(f"\n[dim]#{i + 1}[/dim] [cyan]{search_query[:40]}[/cyan]")
-            if snippets:
-                console.print(f"    [green]+ {snippets[:80]}...[/green]")
-            else:
-                console.print("    [yellow](no results)[/yellow]")
-
-            # Rate limit: wait 2 seconds between searches
-            time.sleep(2.0)
-
-            # Classify using chosen method
-            if use_nli:
-                # NLI zero-shot classification using full account descriptions
-                assert nli is not None
-                scores = nli.classify([baseline_text, enhanced_text], nli_labels)
-                baseline_pred_idx = int(np.argmax(scores[0]))
-                enhanced_pred_idx = int(np.argmax(scores[1]))
-                baseline_sim = float(scores[0, baseline_pred_idx])
-                enhanced_sim = float(scores[1, enhanced_pred_idx])
-            else:
-                # Embedding similarity
-                assert encoder is not None
-                assert acc_normalized is not None
-                texts_to_embed = [baseline_text, enhanced_text]
-                embeddings = encoder.encode(texts_to_embed)
-
-                # Normalize
-                norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
-                norms[norms == 0] = 1
-                normalized = embeddings / norms
-
-                # Compute similarities
-                baseline_sims = normalized[0] @ acc_normalized.T
-                enhanced_sims = normalized[1] @ acc_normalized.T
-
-                baseline_pred_idx = int(np.argmax(baseline_sims))
-                enhanced_pred_idx = int(np.argmax(enhanced_sims))
-                baseline_sim = float(baseline_sims[baseline_pred_idx])
-                enhanced_sim = float(enhanced_sims[enhanced_pred_idx])
-
-            baseline_pred = acc_numbers[baseline_pred_idx]
-            enhanced_pred = acc_numbers[enhanced_pred_idx]
-
-            # Track results
-            baseline_is_correct = baseline_pred == expected
-            enhanced_is_correct = enhanced_pred == expected
-
-            if baseline_is_correct:
-                baseline_correct += 1
-            if enhanced_is_correct:
-                enhanced_correct += 1
-
-            if not baseline_is_correct and enhanced_is_correct:
-                search_helped += 1
-            if baseline_is_correct and not enhanced_is_correct:
-                search_hurt += 1
-
-            detailed_results.append(
-                {
-                    "idx": i,
-                    "counterparty": cp,
-                    "expected": expected,
-                    "baseline_pred": baseline_pred,
-                    "enhanced_pred": enhanced_pred,
-                    "baseline_sim": baseline_sim,
-                    "enhanced_sim": enhanced_sim,
-                    "baseline_correct": baseline_is_correct,
-                    "enhanced_correct": enhanced_is_correct,
-                    "search_results": len(search_results),
-                    "snippets": snippets[:200] if search_results else "",
-                }
-            )
+                # Build enhanced text using smart extraction
+                if search_results:
+                    snippets = extract_enrichment_text(search_results, max_length=300)
+                    enhanced_text = f"{baseline_text} {snippets}"
+                else:
+                    snippets = ""
+                    enhanced_text = baseline_text
+                    no_results_count += 1
+
+                # Log the enrichment
+                console.print(f"\n[dim]#{i + 1}[/dim] [cyan]{search_query[:40]}[/cyan]")
+                if snippets:
+                    console.print(f"    [green]+ {snippets[:80]}...[/green]")
+                else:
+                    console.print("    [yellow](no results)[/yellow]")
+
+                # Rate limit: wait 2 seconds between searches
+                time.sleep(2.0)
+
+                # Classify using chosen method
+                if use_nli:
+                    # NLI zero-shot classification using full account descriptions
+                    assert nli is not None
+                    scores = nli.classify([baseline_text, enhanced_text], nli_labels)
+                    baseline_pred_idx = int(np.argmax(scores[0]))
+                    enhanced_pred_idx = int(np.argmax(scores[1]))
+                    baseline_sim = float(scores[0, baseline_pred_idx])
+                    enhanced_sim = float(scores[1, enhanced_pred_idx])
+                else:
+                    # Embedding similarity
+                    assert encoder is not None
+                    assert acc_normalized is not None
+                    texts_to_embed = [baseline_text, enhanced_text]
+                    embeddings = encoder.encode(texts_to_embed)
+
+                    # Normalize
+                    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+                    norms[norms == 0] = 1
+                    normalized = embeddings / norms
+
+                    # Compute similarities
+                    baseline_sims = normalized[0] @ acc_normalized.T
+                    enhanced_sims = normalized[1] @ acc_normalized.T
+
+                    baseline_pred_idx = int(np.argmax(baseline_sims))
+                    enhanced_pred_idx = int(np.argmax(enhanced_sims))
+                    baseline_sim = float(baseline_sims[baseline_pred_idx])
+                    enhanced_sim = float(enhanced_sims[enhanced_pred_idx])
+
+                baseline_pred = acc_numbers[baseline_pred_idx]
+                enhanced_pred = acc_numbers[enhanced_pred_idx]
+
+                # Track results
+                baseline_is_correct = baseline_pred == expected
+                enhanced_is_correct = enhanced_pred == expected
+
+                if baseline_is_correct:
+                    baseline_correct += 1
+                if enhanced_is_correct:
+                    enhanced_correct += 1
+
+                if not baseline_is_correct and enhanced_is_correct:
+                    search_helped += 1
+                if baseline_is_correct and not enhanced_is_correct:
+                    search_hurt += 1
+
+                detailed_results.append(
+                    {
+                        "idx": i,
+                        "counterparty": cp,
+                        "expected": expected,
+                        "baseline_pred": baseline_pred,
+                        "enhanced_pred": enhanced_pred,
+                        "baseline_sim": baseline_sim,
+                        "enhanced_sim": enhanced_sim,
+                        "baseline_correct": baseline_is_correct,
+                        "enhanced_correct": enhanced_is_correct,
+                        "search_results": len(search_results),
+                        "snippets": snippets[:200] if search_results else "",
+                    }
+                )
+    finally:
+        asyncio.run(search_client.aclose())
 
     # Display results
     console.print()
@@ -10,6 +10,7 @@ from .classification import (
     PipelineContext,
     TextCleaner,
     TransactionContext,
+    UserDataCache,
     build_results,
 )
 from .merchant_extraction import (
@@ -31,6 +32,7 @@ __all__ = [
     "MerchantExtractor",
     "RecurringDetector",
     "SharedInfrastructure",
+    "UserDataCache",
     # Classification components (evaluation)
     "TextCleaner",
     "NoiseModel",
@@ -6,7 +6,10 @@ This module provides model abstractions for:
 """
 
 from .encoder import (
+    CachedEncoder,
     Encoder,
+    EncoderCacheStats,
+    EncoderScheduler,
     HuggingFaceEncoder,
     SentenceTransformerEncoder,
     create_encoder,
@@ -14,7 +17,10 @@ from .encoder import (
 from .nli import NLIClassifier
 
 __all__ = [
+    "CachedEncoder",
     "Encoder",
+    "EncoderCacheStats",
+    "EncoderScheduler",
     "HuggingFaceEncoder",
     "NLIClassifier",
     "SentenceTransformerEncoder",
@@ -11,14 +11,20 @@ Usage:
     embeddings = encoder.encode(["text1", "text2"])
 """
 
+from .cached import CachedEncoder, EncoderCacheStats
 from .factory import create_encoder
 from .huggingface import HuggingFaceEncoder
 from .protocol import Encoder
+from .scheduler import EncoderScheduler, SchedulerStats
 from .sentence_transformer import SentenceTransformerEncoder
 
 __all__ = [
+    "CachedEncoder",
     "Encoder",
+    "EncoderCacheStats",
+    "EncoderScheduler",
     "HuggingFaceEncoder",
+    "SchedulerStats",
     "SentenceTransformerEncoder",
     "create_encoder",
 ]
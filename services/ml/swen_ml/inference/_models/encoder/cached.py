@@ -0,0 +1,194 @@
+"""Caching encoder wrapper."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .protocol import Encoder
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class EncoderCacheStats:
+    """Counters describing encoder cache effectiveness."""
+
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+
+class _DiskStore:
+    """SQLite file mapping cache keys to float32 embedding blobs."""
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get_many(self, keys: list[str]) -> dict[str, NDArray[np.float32]]:
+        found: dict[str, NDArray[np.float32]] = {}
+        # Stay well below SQLite's bound parameter limit
+        for start in range(0, len(keys), 500):
+            chunk = keys[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                chunk,
+            )
+            for key, blob in rows:
+                found[key] = np.frombuffer(blob, dtype=np.float32)
+        return found
+
+    def put_many(self, items: list[tuple[str, NDArray[np.float32]]]) -> None:
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+            [(key, vector.astype(np.float32).tobytes()) for key, vector in items],
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+class CachedEncoder:
+    """Encoder wrapper that caches embeddings per text.
+
+    Texts are normalized (surrounding and repeated whitespace removed) and
+    keyed by a hash of the encoder fingerprint and the normalized text, so a
+    changed backend or encoder setting never reuses old embeddings. Lookups go to
+    a bounded in-memory LRU first, then to an optional on-disk store; only
+    the remaining misses are encoded, in one batch, by the wrapped encoder.
+    Results are returned in input order.
+
+    Thread-safe, so it can be shared between requests.
+    """
+
+    def __init__(
+        self,
+        encoder: Encoder,
+        max_entries: int = 10000,
+        disk_path: Path | None = None,
+    ):
+        self._encoder = encoder
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, NDArray[np.float32]] = OrderedDict()
+        self._disk = _DiskStore(disk_path) if disk_path is not None else None
+        self._lock = threading.Lock()
+        self.stats = EncoderCacheStats()
+
+    @property
+    def encoder(self) -> Encoder:
+        """Return the wrapped encoder."""
+        return self._encoder
+
+    @property
+    def dimension(self) -> int:
+        """Return the embedding dimension."""
+        return self._encoder.dimension
+
+    @property
+    def model_name(self) -> str:
+        """Return the model identifier."""
+        return self._encoder.model_name
+
+    @property
+    def fingerprint(self) -> str:
+        """Return the identity of the produced embeddings."""
+        return self._encoder.fingerprint
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        return " ".join(text.split())
+
+    def _key(self, text: str) -> str:
+        return hashlib.sha256(f"{self.fingerprint}\0{text}".encode()).hexdigest()
+
+    def encode(self, texts: list[str]) -> NDArray[np.float32]:
+        """Encode texts to embeddings, reusing cached embeddings.
+
+        Parameters
+        ----------
+        texts
+            List of texts to encode.
+
+        Returns
+        -------
+        NDArray[np.float32]
+            Embeddings with shape (n_texts, dimension).
+        """
+        if not texts:
+            return np.zeros((0, self.dimension), dtype=np.float32)
+
+        normalized = [self.normalize(t) for t in texts]
+        keys = [self._key(t) for t in normalized]
+        found: dict[str, NDArray[np.float32]] = {}
+
+        with self._lock:
+            for key in keys:
+                vector = self._entries.get(key)
+                if vector is not None:
+                    self._entries.move_to_end(key)
+                    found[key] = vector
+            self.stats.memory_hits += sum(1 for key in keys if key in found)
+
+            # Unique misses in first-seen order
+            missing = {key: text for key, text in zip(keys, normalized) if key not in found}
+            if missing and self._disk is not None:
+                from_disk = self._disk.get_many(list(missing))
+                self.stats.disk_hits += sum(1 for key in keys if key in from_disk)
+                for key, vector in from_disk.items():
+                    found[key] = vector
+                    self._put(key, vector)
+                    del missing[key]
+            self.stats.misses += sum(1 for key in keys if key in missing)
+
+        if missing:
+            encoded = self._encoder.encode(list(missing.values()))
+            with self._lock:
+                for key, vector in zip(missing, encoded):
+                    found[key] = vector
+                    self._put(key, vector)
+                if self._disk is not None:
+                    self._disk.put_many(list(zip(missing, encoded)))
+
+        return np.stack([found[key] for key in keys]).astype(np.float32, copy=False)
+
+    def _put(self, key: str, vector: NDArray[np.float32]) -> None:
+        if self._max_entries <= 0:
+            return
+
+        # Copy so cached rows do not keep the whole batch output alive
+        self._entries[key] = np.array(vector, dtype=np.float32)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def warmup(self) -> None:
+        """Warm up the wrapped encoder (bypasses the cache)."""
+        self._encoder.warmup()
+
+    def close(self) -> None:
+        """Close the on-disk store, if any."""
+        if self._disk is not None:
+            self._disk.close()
+            self._disk = None
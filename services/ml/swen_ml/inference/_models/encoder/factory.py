@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Literal
 
+from .cached import CachedEncoder
 from .huggingface import HuggingFaceEncoder
 from .protocol import Encoder
 from .sentence_transformer import SentenceTransformerEncoder
@@ -14,12 +15,15 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-EncoderBackend = Literal["sentence-transformers", "huggingface"]
+EncoderBackend = Literal["sentence-transformers", "huggingface", "onnx"]
 
 
 def create_encoder(settings: Settings) -> Encoder:
     """Create an encoder based on settings.
 
+    The encoder is wrapped in a ``CachedEncoder`` unless both the memory and
+    the disk cache are disabled.
+
     Parameters
     ----------
     settings
@@ -34,14 +38,28 @@ def create_encoder(settings: Settings) -> Encoder:
     ------
     ValueError
         If the encoder backend is not supported.
+    ImportError
+        If the onnx backend is selected without the ``onnx`` extra installed.
     """
+    encoder = _create_base_encoder(settings)
+
+    if settings.encoder_cache_size <= 0 and settings.encoder_cache_path is None:
+        return encoder
+    return CachedEncoder(
+        encoder,
+        max_entries=settings.encoder_cache_size,
+        disk_path=settings.encoder_cache_path,
+    )
+
+
+def _create_base_encoder(settings: Settings) -> Encoder:
     backend = settings.encoder_backend
     model = settings.encoder_model
 
     logger.info("Creating encoder: backend=%s, model=%s", backend, model)
 
     if backend == "sentence-transformers":
-        return SentenceTransformerEncoder.load(model)
+        return SentenceTransformerEncoder.load(model, batch_size=settings.encoder_batch_size)
 
     if backend == "huggingface":
         return HuggingFaceEncoder.load(
@@ -49,6 +67,26 @@ def create_encoder(settings: Settings) -> Encoder:
             pooling=settings.encoder_pooling,
             normalize=settings.encoder_normalize,
             max_length=settings.encoder_max_length,
+            batch_size=settings.encoder_batch_size,
+        )
+
+    if backend == "onnx":
+        # onnxruntime is an optional dependency (swen-ml[onnx])
+        try:
+            from .onnx_runtime import OnnxEncoder
+        except ImportError as e:
+            msg = "The onnx encoder backend requires the 'onnx' extra (swen-ml[onnx])"
+            raise ImportError(msg) from e
+
+        return OnnxEncoder.load(
+            model_name=model,
+            cache_dir=settings.encoder_onnx_cache_dir,
+            quantize=settings.encoder_onnx_quantize,
+            num_threads=settings.encoder_num_threads,
+            pooling=settings.encoder_pooling,
+            normalize=settings.encoder_normalize,
+            max_length=settings.encoder_max_length,
+            batch_size=settings.encoder_batch_size,
         )
 
     msg = f"Unknown encoder backend: {backend}"
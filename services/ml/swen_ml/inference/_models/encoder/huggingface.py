@@ -25,6 +25,11 @@ class HuggingFaceEncoder:
     - mean: Average over all tokens (weighted by attention mask)
     - cls: Use the [CLS] token embedding
     - max: Max pooling over tokens
+
+    Inputs are sorted by token length and encoded in micro-batches of at most
+    ``batch_size`` texts, so short texts are not padded to the length of the
+    longest text in the request and large requests do not become one huge
+    tensor. Outputs are returned in input order.
     """
 
     def __init__(
@@ -34,7 +39,8 @@ class HuggingFaceEncoder:
         model_name: str,
         pooling: PoolingStrategy = "mean",
         normalize: bool = True,
-        max_length: int = 512,
+        max_length: int = 256,
+        batch_size: int = 32,
     ):
         self._model: PreTrainedModel = model
         self._tokenizer: Any = tokenizer  # Tokenizers have complex callable types
@@ -42,6 +48,7 @@ class HuggingFaceEncoder:
         self._pooling = pooling
         self._normalize = normalize
         self._max_length = max_length
+        self._batch_size = max(batch_size, 1)
         self._dimension: int | None = None
         self._device = "cuda" if torch.cuda.is_available() else "cpu"
 
@@ -55,7 +62,8 @@ class HuggingFaceEncoder:
         model_name: str,
         pooling: PoolingStrategy = "mean",
         normalize: bool = True,
-        max_length: int = 512,
+        max_length: int = 256,
+        batch_size: int = 32,
     ) -> HuggingFaceEncoder:
         """Load a HuggingFace model by name.
 
@@ -71,6 +79,8 @@ class HuggingFaceEncoder:
             Whether to L2-normalize embeddings (recommended for cosine similarity)
         max_length
             Maximum sequence length for tokenization
+        batch_size
+            Maximum number of texts per forward pass
         """
         logger.info(
             "Loading HuggingFace model: %s (pooling=%s, normalize=%s)",
@@ -87,6 +97,7 @@ class HuggingFaceEncoder:
             pooling=pooling,
             normalize=normalize,
             max_length=max_length,
+            batch_size=batch_size,
         )
 
     @property
@@ -105,6 +116,14 @@ class HuggingFaceEncoder:
         """Return the model identifier."""
         return self._model_name
 
+    @property
+    def fingerprint(self) -> str:
+        """Return the identity of the produced embeddings."""
+        return (
+            f"huggingface:{self._model_name}:pooling={self._pooling}"
+            f":normalize={self._normalize}:max_length={self._max_length}"
+        )
+
     def encode(self, texts: list[str]) -> NDArray[np.float32]:
         """Encode texts to embeddings.
 
@@ -121,6 +140,24 @@ class HuggingFaceEncoder:
         if not texts:
             return np.zeros((0, self.dimension), dtype=np.float32)
 
+        # Sort by token length so that each micro-batch pads to similar lengths
+        token_ids = self._tokenizer(
+            texts,
+            truncation=True,
+            max_length=self._max_length,
+        )["input_ids"]
+        order = np.argsort([len(ids) for ids in token_ids], kind="stable")
+
+        embeddings = np.empty((len(texts), self.dimension), dtype=np.float32)
+        with torch.inference_mode():
+            for start in range(0, len(texts), self._batch_size):
+                indices = order[start : start + self._batch_size]
+                embeddings[indices] = self._encode_batch([texts[i] for i in indices])
+
+        return embeddings
+
+    def _encode_batch(self, texts: list[str]) -> NDArray[np.float32]:
+        """Encode one micro-batch (caller provides the inference context)."""
         # Tokenize
         encoded = self._tokenizer(
             texts,
@@ -134,8 +171,7 @@ class HuggingFaceEncoder:
         encoded = {k: v.to(self._device) for k, v in encoded.items()}
 
         # Forward pass
-        with torch.no_grad():
-            outputs = self._model(**encoded)
+        outputs = self._model(**encoded)
 
         # Get embeddings based on pooling strategy
         embeddings = self._pool(
@@ -147,7 +183,7 @@ class HuggingFaceEncoder:
         if self._normalize:
             embeddings = torch.nn.functional.normalize(embeddings, p=2, dim=1)
 
-        return embeddings.cpu().numpy().astype(np.float32)
+        return embeddings.float().cpu().numpy()
 
     def _pool(
         self,
@@ -0,0 +1,289 @@
+"""ONNX Runtime encoder implementation (optional int8 quantization)."""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+from pathlib import Path
+from typing import Any, Literal
+
+import numpy as np
+import onnxruntime as ort
+from numpy.typing import NDArray
+
+logger = logging.getLogger(__name__)
+
+PoolingStrategy = Literal["mean", "cls", "max"]
+
+_MODEL_INPUTS = ("input_ids", "attention_mask", "token_type_ids")
+_EXPORT_VERSION = 1
+
+
+class OnnxEncoder:
+    """Encoder running an exported transformer through ONNX Runtime on CPU.
+
+    The model is exported to ONNX once and, by default, dynamically quantized
+    to int8 weights. Artifacts (model, tokenizer and a small manifest) are
+    cached in ``cache_dir`` so later starts skip the export and do not load
+    PyTorch weights at all.
+
+    Pooling and normalization follow the same settings as the HuggingFace
+    backend. Inputs are sorted by token length and run in micro-batches of at
+    most ``batch_size`` texts, like ``HuggingFaceEncoder``.
+    """
+
+    def __init__(
+        self,
+        session: ort.InferenceSession,
+        tokenizer: Any,
+        model_name: str,
+        dimension: int,
+        pooling: PoolingStrategy = "mean",
+        normalize: bool = True,
+        max_length: int = 256,
+        batch_size: int = 32,
+        quantize: bool = True,
+    ):
+        self._session = session
+        self._tokenizer = tokenizer
+        self._model_name = model_name
+        self._dimension = dimension
+        self._pooling = pooling
+        self._normalize = normalize
+        self._max_length = max_length
+        self._batch_size = max(batch_size, 1)
+        self._quantize = quantize
+        self._input_names = [i.name for i in session.get_inputs()]
+
+    @classmethod
+    def load(
+        cls,
+        model_name: str,
+        cache_dir: Path,
+        quantize: bool = True,
+        num_threads: int = 0,
+        pooling: PoolingStrategy = "mean",
+        normalize: bool = True,
+        max_length: int = 256,
+        batch_size: int = 32,
+    ) -> OnnxEncoder:
+        """Load the ONNX model for ``model_name``, exporting it on first use.
+
+        Parameters
+        ----------
+        model_name
+            Model identifier from HuggingFace Hub or local path. Bare names of
+            sentence-transformers models (e.g. "paraphrase-multilingual-MiniLM-L12-v2")
+            are resolved to the "sentence-transformers/" organization.
+        cache_dir
+            Directory for exported artifacts (one subdirectory per model and precision).
+        quantize
+            Apply dynamic int8 quantization to the exported model.
+        num_threads
+            Intra-op threads for ONNX Runtime (0 lets ONNX Runtime decide).
+        pooling
+            Pooling strategy: "mean", "cls", or "max"
+        normalize
+            Whether to L2-normalize embeddings
+        max_length
+            Maximum sequence length for tokenization
+        batch_size
+            Maximum number of texts per inference call
+        """
+        from transformers import AutoTokenizer
+
+        artifact_dir = cls.artifact_dir(cache_dir, model_name, quantize)
+        manifest_path = artifact_dir / "manifest.json"
+        manifest = json.loads(manifest_path.read_text()) if manifest_path.exists() else None
+
+        if manifest is None or manifest.get("version") != _EXPORT_VERSION:
+            manifest = _export(model_name, artifact_dir, quantize)
+            manifest_path.write_text(json.dumps(manifest))
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.intra_op_num_threads = max(num_threads, 0)
+        options.inter_op_num_threads = 1
+        session = ort.InferenceSession(
+            str(artifact_dir / manifest["model_file"]),
+            options,
+            providers=["CPUExecutionProvider"],
+        )
+        logger.info(
+            "Loaded ONNX model: %s (%s, threads=%s)",
+            model_name,
+            "int8" if quantize else "fp32",
+            num_threads or "auto",
+        )
+
+        return cls(
+            session=session,
+            tokenizer=AutoTokenizer.from_pretrained(artifact_dir),
+            model_name=model_name,
+            dimension=manifest["dimension"],
+            pooling=pooling,
+            normalize=normalize,
+            max_length=max_length,
+            batch_size=batch_size,
+            quantize=quantize,
+        )
+
+    @staticmethod
+    def artifact_dir(cache_dir: Path, model_name: str, quantize: bool) -> Path:
+        """Return the artifact directory for a model and precision."""
+        slug = re.sub(r"[^A-Za-z0-9_.-]+", "--", model_name.strip("/"))
+        return cache_dir / f"{slug}-{'int8' if quantize else 'fp32'}"
+
+    @property
+    def dimension(self) -> int:
+        """Return the embedding dimension."""
+        return self._dimension
+
+    @property
+    def model_name(self) -> str:
+        """Return the model identifier."""
+        return self._model_name
+
+    @property
+    def fingerprint(self) -> str:
+        """Return the identity of the produced embeddings.
+
+        Differs from the other backends and between precisions, pooling and
+        truncation settings, so cached embeddings are never mixed.
+        """
+        precision = "int8" if self._quantize else "fp32"
+        return (
+            f"onnx:{self._model_name}:{precision}:v{_EXPORT_VERSION}"
+            f":pooling={self._pooling}:normalize={self._normalize}"
+            f":max_length={self._max_length}"
+        )
+
+    def encode(self, texts: list[str]) -> NDArray[np.float32]:
+        """Encode texts to embeddings.
+
+        Parameters
+        ----------
+        texts
+            List of texts to encode.
+
+        Returns
+        -------
+        NDArray[np.float32]
+            Embeddings with shape (n_texts, dimension).
+        """
+        if not texts:
+            return np.zeros((0, self.dimension), dtype=np.float32)
+
+        # Sort by token length so that each micro-batch pads to similar lengths
+        token_ids = self._tokenizer(
+            texts,
+            truncation=True,
+            max_length=self._max_length,
+        )["input_ids"]
+        order = np.argsort([len(ids) for ids in token_ids], kind="stable")
+
+        embeddings = np.empty((len(texts), self.dimension), dtype=np.float32)
+        for start in range(0, len(texts), self._batch_size):
+            indices = order[start : start + self._batch_size]
+            embeddings[indices] = self._encode_batch([texts[i] for i in indices])
+
+        return embeddings
+
+    def _encode_batch(self, texts: list[str]) -> NDArray[np.float32]:
+        encoded = self._tokenizer(
+            texts,
+            padding=True,
+            truncation=True,
+            max_length=self._max_length,
+            return_tensors="np",
+        )
+        inputs = {name: encoded[name].astype(np.int64) for name in self._input_names}
+        hidden_states = self._session.run(None, inputs)[0]
+        embeddings = self._pool(hidden_states, encoded["attention_mask"])
+
+        if self._normalize:
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings = embeddings / np.clip(norms, 1e-12, None)
+
+        return embeddings.astype(np.float32)
+
+    def _pool(
+        self,
+        hidden_states: NDArray[np.float32],
+        attention_mask: NDArray[np.int64],
+    ) -> NDArray[np.float32]:
+        """Apply the pooling strategy (same semantics as HuggingFaceEncoder)."""
+        if self._pooling == "cls":
+            return hidden_states[:, 0]
+
+        mask = attention_mask[..., None].astype(hidden_states.dtype)
+        if self._pooling == "max":
+            return np.where(mask > 0, hidden_states, -np.inf).max(axis=1)
+
+        # Default: mean pooling
+        return (hidden_states * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+
+    def warmup(self) -> None:
+        """Perform warmup inference."""
+        _ = self.encode(["warmup"])
+        logger.debug("ONNX encoder warmed up")
+
+
+def _resolve_model_name(model_name: str) -> str:
+    if "/" in model_name or Path(model_name).exists():
+        return model_name
+    return f"sentence-transformers/{model_name}"
+
+
+def _export(model_name: str, artifact_dir: Path, quantize: bool) -> dict[str, Any]:
+    """Export a HuggingFace model to ONNX (and quantize it) into ``artifact_dir``."""
+    import torch
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    from transformers import AutoModel, AutoTokenizer
+
+    source = _resolve_model_name(model_name)
+    logger.info("Exporting %s to ONNX (quantize=%s): %s", source, quantize, artifact_dir)
+    artifact_dir.mkdir(parents=True, exist_ok=True)
+
+    tokenizer = AutoTokenizer.from_pretrained(source)
+    model = AutoModel.from_pretrained(source).eval()
+    sample = tokenizer(["Miete Wohnung Januar"], return_tensors="pt")
+    input_names = [name for name in _MODEL_INPUTS if name in sample]
+
+    class _LastHiddenState(torch.nn.Module):
+        def __init__(self, model: torch.nn.Module):
+            super().__init__()
+            self.model = model
+
+        def forward(self, *args: torch.Tensor) -> torch.Tensor:
+            return self.model(**dict(zip(input_names, args))).last_hidden_state
+
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["last_hidden_state"] = {0: "batch", 1: "sequence"}
+    fp32_path = artifact_dir / "model.onnx"
+    with torch.inference_mode():
+        torch.onnx.export(
+            _LastHiddenState(model),
+            tuple(sample[name] for name in input_names),
+            str(fp32_path),
+            input_names=input_names,
+            output_names=["last_hidden_state"],
+            dynamic_axes=dynamic_axes,
+            opset_version=17,
+            dynamo=False,
+        )
+
+    model_file = fp32_path.name
+    if quantize:
+        model_file = "model.int8.onnx"
+        quantize_dynamic(fp32_path, artifact_dir / model_file, weight_type=QuantType.QInt8)
+        fp32_path.unlink()
+
+    tokenizer.save_pretrained(artifact_dir)
+    return {
+        "version": _EXPORT_VERSION,
+        "source": source,
+        "model_file": model_file,
+        "dimension": int(model.config.hidden_size),
+    }
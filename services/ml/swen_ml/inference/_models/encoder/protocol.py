@@ -24,6 +24,16 @@ class Encoder(Protocol):
         """Return the model identifier."""
         ...
 
+    @property
+    def fingerprint(self) -> str:
+        """Return the identity of the produced embeddings.
+
+        Covers the backend, the model and every setting that changes the
+        vectors (pooling, normalization, truncation, precision). Stored
+        embeddings are only comparable if their fingerprints match.
+        """
+        ...
+
     def encode(self, texts: list[str]) -> NDArray[np.float32]:
         """Encode texts to embeddings.
 
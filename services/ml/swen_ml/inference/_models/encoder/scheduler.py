@@ -0,0 +1,175 @@
+"""Cross-request batching scheduler for an encoder."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .protocol import Encoder
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SchedulerStats:
+    """Counters describing how well requests are being batched."""
+
+    requests: int = 0
+    batches: int = 0
+    texts: int = 0
+
+    @property
+    def avg_batch_size(self) -> float:
+        return self.texts / self.batches if self.batches else 0.0
+
+
+@dataclass
+class _EncodeRequest:
+    texts: list[str]
+    future: asyncio.Future[NDArray[np.float32]]
+
+
+class EncoderScheduler:
+    """Collects encode requests from concurrent handlers into shared batches.
+
+    ``encode`` enqueues the texts and awaits the result. A single collector
+    task takes the first queued request, keeps collecting for up to
+    ``max_wait_ms`` (or until ``max_batch_size`` texts are queued), and runs
+    one ``encoder.encode`` call for all of them in a dedicated worker thread,
+    so the event loop never blocks on the model. While a batch is running,
+    new requests queue up and form the next batch.
+
+    The collector starts on first use, on the running event loop. Call
+    ``aclose()`` on shutdown.
+    """
+
+    def __init__(
+        self,
+        encoder: Encoder,
+        max_batch_size: int = 64,
+        max_wait_ms: float = 5.0,
+    ):
+        self._encoder = encoder
+        self._max_batch_size = max(max_batch_size, 1)
+        self._max_wait = max(max_wait_ms, 0.0) / 1000
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="encoder")
+        self._queue: asyncio.Queue[_EncodeRequest] = asyncio.Queue()
+        self._collector: asyncio.Task[None] | None = None
+        self.stats = SchedulerStats()
+
+    @property
+    def encoder(self) -> Encoder:
+        """Return the wrapped encoder."""
+        return self._encoder
+
+    @property
+    def dimension(self) -> int:
+        """Return the embedding dimension."""
+        return self._encoder.dimension
+
+    @property
+    def model_name(self) -> str:
+        """Return the model identifier."""
+        return self._encoder.model_name
+
+    @property
+    def fingerprint(self) -> str:
+        """Return the identity of the produced embeddings."""
+        return self._encoder.fingerprint
+
+    async def encode(self, texts: list[str]) -> NDArray[np.float32]:
+        """Encode texts to embeddings as part of a shared batch.
+
+        Parameters
+        ----------
+        texts
+            List of texts to encode.
+
+        Returns
+        -------
+        NDArray[np.float32]
+            Embeddings with shape (n_texts, dimension).
+        """
+        if not texts:
+            return np.zeros((0, self.dimension), dtype=np.float32)
+
+        if self._collector is None:
+            self._collector = asyncio.create_task(self._collect())
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait(_EncodeRequest(list(texts), future))
+        self.stats.requests += 1
+        return await future
+
+    async def aclose(self) -> None:
+        """Stop the collector, fail pending requests and stop the worker thread."""
+        if self._collector is not None:
+            self._collector.cancel()
+            await asyncio.gather(self._collector, return_exceptions=True)
+            self._collector = None
+
+        while not self._queue.empty():
+            request = self._queue.get_nowait()
+            if not request.future.done():
+                request.future.set_exception(RuntimeError("Encoder scheduler closed"))
+
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _next_batch(self) -> list[_EncodeRequest]:
+        """Wait for a request, then collect more until the batch is full or time is up."""
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        n_texts = len(batch[0].texts)
+        deadline = loop.time() + self._max_wait
+
+        while n_texts < self._max_batch_size:
+            if self._queue.empty():
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    request = await asyncio.wait_for(self._queue.get(), timeout)
+                except TimeoutError:
+                    break
+            else:
+                request = self._queue.get_nowait()
+            batch.append(request)
+            n_texts += len(request.texts)
+
+        # Callers may have been cancelled while waiting
+        return [r for r in batch if not r.future.done()]
+
+    async def _collect(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._next_batch()
+            if not batch:
+                continue
+
+            texts = [text for request in batch for text in request.texts]
+            try:
+                embeddings = await loop.run_in_executor(self._executor, self._encoder.encode, texts)
+            except asyncio.CancelledError:
+                for request in batch:
+                    request.future.cancel()
+                raise
+            except Exception as e:
+                logger.exception("Encoding a batch of %d texts failed", len(texts))
+                for request in batch:
+                    if not request.future.done():
+                        request.future.set_exception(e)
+                continue
+
+            self.stats.batches += 1
+            self.stats.texts += len(texts)
+
+            offset = 0
+            for request in batch:
+                if not request.future.done():
+                    request.future.set_result(embeddings[offset : offset + len(request.texts)])
+                offset += len(request.texts)
@@ -18,13 +18,14 @@ class SentenceTransformerEncoder:
     and normalization automatically for models designed for semantic similarity.
     """
 
-    def __init__(self, model: SentenceTransformer, model_name: str):
+    def __init__(self, model: SentenceTransformer, model_name: str, batch_size: int = 32):
         self._model = model
         self._model_name = model_name
+        self._batch_size = max(batch_size, 1)
         self._dimension: int | None = None
 
     @classmethod
-    def load(cls, model_name: str) -> SentenceTransformerEncoder:
+    def load(cls, model_name: str, batch_size: int = 32) -> SentenceTransformerEncoder:
         """Load a SentenceTransformer model by name.
 
         Parameters
@@ -33,10 +34,13 @@ class SentenceTransformerEncoder:
             Model identifier from HuggingFace Hub or local path.
             Examples: "paraphrase-multilingual-MiniLM-L12-v2",
                       "sentence-transformers/all-MiniLM-L6-v2"
+        batch_size
+            Maximum number of texts per forward pass. sentence-transformers
+            already sorts inputs by length before batching.
         """
         logger.info("Loading SentenceTransformer model: %s", model_name)
         model = SentenceTransformer(model_name)
-        return cls(model, model_name)
+        return cls(model, model_name, batch_size=batch_size)
 
     @property
     def dimension(self) -> int:
@@ -54,6 +58,12 @@ class SentenceTransformerEncoder:
         """Return the model identifier."""
         return self._model_name
 
+    @property
+    def fingerprint(self) -> str:
+        """Return the identity of the produced embeddings."""
+        max_length = getattr(self._model, "max_seq_length", None)
+        return f"sentence-transformers:{self._model_name}:max_length={max_length}"
+
     def encode(self, texts: list[str]) -> NDArray[np.float32]:
         """Encode texts to embeddings.
 
@@ -72,6 +82,7 @@ class SentenceTransformerEncoder:
 
         embeddings = self._model.encode(
             texts,
+            batch_size=self._batch_size,
             convert_to_numpy=True,
             show_progress_bar=False,
             normalize_embeddings=True,
@@ -3,6 +3,7 @@ from .context import EmbeddingStore, PipelineContext, TransactionContext
 from .orchestrator import ClassificationOrchestrator, build_results
 from .preprocessing import NoiseModel, TextCleaner
 from .result import ClassificationResult
+from .user_cache import UserData, UserDataCache
 
 __all__ = [
     # Orchestrator
@@ -20,4 +21,7 @@ __all__ = [
     "ClassificationResult",
     # Utilities
     "build_results",
+    # User cache
+    "UserData",
+    "UserDataCache",
 ]
@@ -41,14 +41,14 @@ class AnchorClassifier(BaseClassifier):
             parts.append(ctx.search_enrichment)
         return " ".join(parts)
 
-    def _classify_group(
+    async def _classify_group(
         self,
         group: list[TransactionContext],
         store: EmbeddingStore,
     ) -> int:
         # Build texts (with enrichment) and compute embeddings
         texts = [self._build_text(ctx) for ctx in group]
-        embeddings = self.pipeline_ctx.encoder.encode(texts)
+        embeddings = await self.pipeline_ctx.encode(texts)
 
         # Compute similarities and find best matches
         similarities = embeddings @ store.embeddings.T
@@ -40,7 +40,7 @@ class BaseClassifier(ABC):
         """Build the query text used for similarity lookup."""
 
     @abstractmethod
-    def _classify_group(
+    async def _classify_group(
         self,
         group: list[TransactionContext],
         store: EmbeddingStore,
@@ -50,7 +50,7 @@ class BaseClassifier(ABC):
         Returns the number of newly resolved transactions.
         """
 
-    def _on_empty_direction_store(
+    async def _on_empty_direction_store(
         self,
         group: list[TransactionContext],
         is_debit: bool,
@@ -89,9 +89,9 @@ class BaseClassifier(ABC):
                     "expense" if is_debit else "income",
                     len(group),
                 )
-                self._on_empty_direction_store(group, is_debit)
+                await self._on_empty_direction_store(group, is_debit)
                 continue
-            n_total += self._classify_group(group, filtered)
+            n_total += await self._classify_group(group, filtered)
 
         logger.debug(
             "%s: %d/%d resolved (threshold=%.2f)",
@@ -48,25 +48,25 @@ class ExampleClassifier(BaseClassifier):
             parts.append(ctx.cleaned_purpose)
         return " ".join(parts)
 
-    def _on_empty_direction_store(
+    async def _on_empty_direction_store(
         self,
         group: list[TransactionContext],
         is_debit: bool,
     ) -> None:
         # Pre-compute and cache embeddings so the anchor tier can reuse them.
         texts = [self._build_text(ctx) for ctx in group]
-        embeddings = self.pipeline_ctx.encoder.encode(texts)
+        embeddings = await self.pipeline_ctx.encode(texts)
         for ctx, emb in zip(group, embeddings):
             ctx.embedding = emb
 
-    def _classify_group(
+    async def _classify_group(
         self,
         group: list[TransactionContext],
         store: EmbeddingStore,
     ) -> int:
         # Build texts and compute embeddings
         texts = [self._build_text(ctx) for ctx in group]
-        embeddings = self.pipeline_ctx.encoder.encode(texts)
+        embeddings = await self.pipeline_ctx.encode(texts)
 
         # Compute similarities: (N, dim) @ (M, dim).T = (N, M)
         similarities = embeddings @ store.embeddings.T
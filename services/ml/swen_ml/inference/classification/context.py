@@ -13,14 +13,19 @@ from swen_ml_contracts import TransactionInput
 from swen_ml.inference.classification.preprocessing.text_cleaner import (
     NoiseModel,
 )
+from swen_ml.inference.classification.user_cache import UserData
 from swen_ml.storage.protocols import EmbeddingRepository
 
 if TYPE_CHECKING:
-    from swen_ml.inference._models import Encoder
-    from swen_ml.inference.classification.enrichment import KeywordPort, SearXNGAdapter
+    from swen_ml.inference._models import Encoder, EncoderScheduler
+    from swen_ml.inference.classification.enrichment import (
+        EnrichmentCache,
+        KeywordPort,
+        SearXNGAdapter,
+    )
     from swen_ml.inference.classification.preprocessing.text_cleaner import NoiseModel
     from swen_ml.inference.shared import SharedInfrastructure
-    from swen_ml.storage import RepositoryFactory
+    from swen_ml.storage import EnrichmentRepository, RepositoryFactory
 
 
 @dataclass
@@ -64,6 +69,50 @@ class EmbeddingStore:
             account_types=account_types,
         )
 
+    def append(self, other: EmbeddingStore) -> EmbeddingStore:
+        """Return a new store with the rows of ``other`` appended."""
+        if len(other) == 0:
+            return self
+        if len(self) == 0:
+            return other
+
+        return EmbeddingStore(
+            embeddings=np.vstack([self.embeddings, other.embeddings]),
+            account_ids=self.account_ids + other.account_ids,
+            account_numbers=self.account_numbers + other.account_numbers,
+            labels=self.labels + other.labels,
+            account_types=self.account_types + other.account_types,
+        )
+
+    def upsert(self, other: EmbeddingStore) -> EmbeddingStore:
+        """Return a new store where rows of ``other`` replace rows with the same account id.
+
+        Only meaningful for stores with one row per account (anchors).
+        """
+        replaced = set(other.account_ids)
+        kept = self._select([i not in replaced for i in self.account_ids])
+        return kept.append(other)
+
+    def without_account(self, account_id: str) -> EmbeddingStore:
+        """Return a new store without the rows belonging to ``account_id``."""
+        return self._select([i != account_id for i in self.account_ids])
+
+    def _select(self, keep: list[bool]) -> EmbeddingStore:
+        if all(keep):
+            return self
+
+        mask = np.array(keep, dtype=bool)
+        if not mask.any():
+            return EmbeddingStore.empty()
+
+        return EmbeddingStore(
+            embeddings=self.embeddings[mask],
+            account_ids=[i for i, m in zip(self.account_ids, mask) if m],
+            account_numbers=[n for n, m in zip(self.account_numbers, mask) if m],
+            labels=[lbl for lbl, m in zip(self.labels, mask) if m],
+            account_types=[t for t, m in zip(self.account_types, mask) if m],
+        )
+
     def filter_for_direction(self, is_debit: bool) -> EmbeddingStore:
         """Return a new store with only candidates valid for this direction.
 
@@ -82,19 +131,7 @@ class EmbeddingStore:
             return EmbeddingStore.empty()
 
         excluded = "income" if is_debit else "expense"
-        mask = np.array([t != excluded for t in self.account_types], dtype=bool)
-        if not mask.any():
-            return EmbeddingStore.empty()
-        if mask.all():
-            return self
-
-        return EmbeddingStore(
-            embeddings=self.embeddings[mask],
-            account_ids=[i for i, m in zip(self.account_ids, mask) if m],
-            account_numbers=[n for n, m in zip(self.account_numbers, mask) if m],
-            labels=[lbl for lbl, m in zip(self.labels, mask) if m],
-            account_types=[t for t, m in zip(self.account_types, mask) if m],
-        )
+        return self._select([t != excluded for t in self.account_types])
 
 
 @dataclass
@@ -164,7 +201,21 @@ class PipelineContext:
     anchor_store: EmbeddingStore
     keyword_adapter: KeywordPort | None = None
     searxng_adapter: SearXNGAdapter | None = None
+    enrichment_cache: EnrichmentCache | None = None
+    enrichment_repository: EnrichmentRepository | None = None
+    enrichment_max_concurrency: int = 4
+    enrichment_deadline_seconds: float | None = None
     confidence_threshold: float = 0.85
+    encoder_scheduler: EncoderScheduler | None = None
+
+    async def encode(self, texts: list[str]) -> NDArray[np.float32]:
+        """Encode texts, through the shared scheduler when there is one.
+
+        Without a scheduler (e.g. in evaluation) the encoder runs inline.
+        """
+        if self.encoder_scheduler is not None:
+            return await self.encoder_scheduler.encode(texts)
+        return self.encoder.encode(texts)
 
     @classmethod
     async def from_repositories(
@@ -172,18 +223,28 @@ class PipelineContext:
         infra: SharedInfrastructure,
         repos: RepositoryFactory,
     ) -> PipelineContext:
-        """Load user-specific data from repositories."""
-
-        noise_model = await NoiseModel.from_repository(repos.noise)
-        example_store = await EmbeddingStore.from_repository(repos.example)
-        anchor_store = await EmbeddingStore.from_repository(repos.anchor)
+        """Load user-specific data from the user cache or the repositories."""
+        user_data = infra.user_cache.get(repos.user_id)
+        if user_data is None:
+            generation = infra.user_cache.generation(repos.user_id)
+            user_data = UserData(
+                noise_model=await NoiseModel.from_repository(repos.noise),
+                example_store=await EmbeddingStore.from_repository(repos.example),
+                anchor_store=await EmbeddingStore.from_repository(repos.anchor),
+            )
+            infra.user_cache.put(repos.user_id, user_data, generation)
 
         return cls(
             encoder=infra.encoder,
-            noise_model=noise_model,
-            example_store=example_store,
-            anchor_store=anchor_store,
+            noise_model=user_data.noise_model,
+            example_store=user_data.example_store,
+            anchor_store=user_data.anchor_store,
             keyword_adapter=infra.keyword_adapter,
             searxng_adapter=infra.searxng_adapter,
+            enrichment_cache=infra.enrichment_cache,
+            enrichment_repository=repos.enrichment(infra.settings.enrichment_cache_ttl_days),
+            enrichment_max_concurrency=infra.settings.enrichment_max_concurrency,
+            enrichment_deadline_seconds=infra.settings.enrichment_batch_deadline_seconds,
             confidence_threshold=infra.settings.example_high_confidence,
+            encoder_scheduler=infra.encoder_scheduler,
         )
@@ -1,13 +1,18 @@
 """Search enrichment for classification pipeline."""
 
+from .cache import EnrichmentCache, EnrichmentCacheStats
 from .keywords import FileKeywordAdapter, KeywordPort
-from .search import SearchPort, SearchResult, SearXNGAdapter
+from .search import SearchError, SearchPort, SearchResult, SearXNGAdapter, TokenBucket
 from .service import Enrichment, EnrichmentService, extract_enrichment_text
 
 __all__ = [
+    "EnrichmentCache",
+    "EnrichmentCacheStats",
+    "SearchError",
     "SearchPort",
     "SearchResult",
     "SearXNGAdapter",
+    "TokenBucket",
     "KeywordPort",
     "FileKeywordAdapter",
     "EnrichmentService",
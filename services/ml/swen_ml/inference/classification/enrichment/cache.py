@@ -0,0 +1,93 @@
+"""In-process cache for search enrichment results."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+
+@dataclass
+class EnrichmentCacheStats:
+    """Counters describing enrichment cache effectiveness."""
+
+    memory_hits: int = 0
+    db_hits: int = 0
+    misses: int = 0
+    searches: int = 0
+    search_seconds: float = 0.0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.db_hits
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @property
+    def avg_search_seconds(self) -> float:
+        return self.search_seconds / self.searches if self.searches else 0.0
+
+    @property
+    def search_seconds_saved(self) -> float:
+        """Estimated search time avoided by cache hits."""
+        return self.hits * self.avg_search_seconds
+
+
+class EnrichmentCache:
+    """Bounded LRU of enrichment texts keyed by normalized query.
+
+    Sits in front of the ``enrichment_cache`` table and carries its settings.
+    An empty string is a negative entry: the query was searched and yielded
+    nothing usable. Negative entries expire after ``negative_ttl_days``.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 2048,
+        ttl_days: int = 7,
+        negative_ttl_days: int = 1,
+        max_db_entries: int = 10000,
+    ):
+        self._max_entries = max_entries
+        self.ttl_days = ttl_days
+        self.negative_ttl_days = negative_ttl_days
+        self.max_db_entries = max_db_entries
+        self._entries: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self.stats = EnrichmentCacheStats()
+
+    @staticmethod
+    def normalize(query: str) -> str:
+        return query.lower().strip()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, query: str) -> str | None:
+        """Return the cached text ("" for negative entries) or None on a miss."""
+        key = self.normalize(query)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        text, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return text
+
+    def put(self, query: str, text: str) -> None:
+        if self._max_entries <= 0:
+            return
+
+        ttl_days = self.ttl_days if text else self.negative_ttl_days
+        key = self.normalize(query)
+        self._entries[key] = (text, time.monotonic() + ttl_days * 86400)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
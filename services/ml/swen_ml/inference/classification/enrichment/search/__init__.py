@@ -1,8 +1,11 @@
-from .port import SearchPort, SearchResult
+from .port import SearchError, SearchPort, SearchResult
+from .rate_limit import TokenBucket
 from .searxng import SearXNGAdapter
 
 __all__ = [
+    "SearchError",
     "SearchPort",
     "SearchResult",
     "SearXNGAdapter",
+    "TokenBucket",
 ]
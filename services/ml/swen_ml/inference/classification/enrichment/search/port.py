@@ -12,9 +12,17 @@ class SearchResult:
     score: float
 
 
+class SearchError(Exception):
+    """The search backend could not be reached or returned an error."""
+
+
 class SearchPort(Protocol):
     """Port for search enrichment backends."""
 
     async def search(self, query: str) -> list[SearchResult]:
-        """Execute search and return results."""
+        """Execute search and return results.
+
+        Raises SearchError if the backend fails, so that failures are not
+        mistaken for queries without results.
+        """
         ...
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Async token-bucket rate limiter.
+
+    Refills one token every ``interval_seconds`` up to ``burst`` tokens.
+    A single instance is shared by all concurrent callers, so the rate holds
+    across requests. Waiters are served in arrival order.
+    """
+
+    def __init__(self, interval_seconds: float, burst: int = 1):
+        self._interval = interval_seconds
+        self._burst = max(burst, 1)
+        self._tokens = float(self._burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        if self._interval <= 0:
+            return
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                refill = (now - self._updated) / self._interval
+                self._tokens = min(float(self._burst), self._tokens + refill)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) * self._interval)
@@ -1,14 +1,33 @@
 from __future__ import annotations
 
+import asyncio
+import importlib.util
+import logging
 from typing import Any
 
 import httpx
 
-from .port import SearchPort, SearchResult
+from .port import SearchError, SearchPort, SearchResult
+from .rate_limit import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 needs the optional h2 package (httpx[http2])
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+_MAX_RETRY_AFTER_SECONDS = 10.0
 
 
 class SearXNGAdapter(SearchPort):
-    """SearXNG search adapter."""
+    """SearXNG search adapter.
+
+    Async searches share one pooled keep-alive client, created on first use.
+    Call ``aclose()`` on shutdown to release its connections. Responses with
+    status 429 or 5xx and transport errors are retried with exponential
+    backoff (honouring ``Retry-After``), each attempt going through the rate
+    limiter. ``connect_timeout`` defaults to ``timeout``.
+    """
 
     def __init__(
         self,
@@ -16,11 +35,48 @@ class SearXNGAdapter(SearchPort):
         timeout: float = 10.0,
         language: str = "de",
         max_results: int = 1,
+        rate_limiter: TokenBucket | None = None,
+        connect_timeout: float | None = None,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 5,
+        max_retries: int = 2,
+        retry_backoff_seconds: float = 0.5,
+        http2: bool = True,
     ):
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.language = language
         self.max_results = max_results
+        self.rate_limiter = rate_limiter
+        self.connect_timeout = timeout if connect_timeout is None else connect_timeout
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.max_retries = max(max_retries, 0)
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.http2 = http2 and _HTTP2_AVAILABLE
+        self._client: httpx.AsyncClient | None = None
+
+    def _timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(self.timeout, connect=self.connect_timeout)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self._timeout(),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                ),
+                http2=self.http2,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled client, if one was opened."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     def _parse_web_results(
         self,
@@ -68,28 +124,52 @@ class SearXNGAdapter(SearchPort):
         if not query or not query.strip():
             return []
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        client = self._get_client()
+        params = {"q": query, "format": "json", "language": self.language}
+
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire()
+
+            retry_after = None
             try:
-                resp = await client.get(
-                    f"{self.base_url}/search",
-                    params={
-                        "q": query,
-                        "format": "json",
-                        "language": self.language,
-                    },
-                )
-                resp.raise_for_status()
-                data = resp.json()
-            except (httpx.HTTPError, httpx.TimeoutException):
-                return []
+                resp = await client.get("/search", params=params)
+                if resp.status_code not in _RETRY_STATUS_CODES or attempt == self.max_retries:
+                    resp.raise_for_status()
+                    return self._parse_response(resp.json())
+                retry_after = self._retry_after(resp)
+                reason = f"HTTP {resp.status_code}"
+            except httpx.TransportError as e:
+                if attempt == self.max_retries:
+                    raise SearchError(str(e)) from e
+                reason = type(e).__name__
+            except (httpx.HTTPError, ValueError) as e:
+                raise SearchError(str(e)) from e
 
-        return self._parse_response(data)
+            delay = retry_after or self.retry_backoff_seconds * 2**attempt
+            logger.debug(
+                "Search for %r failed (%s), retrying in %.1fs",
+                query[:20],
+                reason,
+                delay,
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    @staticmethod
+    def _retry_after(resp: httpx.Response) -> float | None:
+        try:
+            seconds = float(resp.headers.get("Retry-After", ""))
+        except ValueError:
+            return None
+        return min(max(seconds, 0.0), _MAX_RETRY_AFTER_SECONDS)
 
     def search_sync(self, query: str) -> list[SearchResult]:
         if not query or not query.strip():
             return []
 
-        with httpx.Client(timeout=self.timeout) as client:
+        with httpx.Client(timeout=self._timeout()) as client:
             try:
                 resp = client.get(
                     f"{self.base_url}/search",
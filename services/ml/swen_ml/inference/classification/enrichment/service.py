@@ -4,10 +4,11 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Literal
 
-from .search import SearchResult
+from .search import SearchError, SearchResult
 
 if TYPE_CHECKING:
     from swen_ml.inference.classification.context import (
@@ -76,6 +77,12 @@ class EnrichmentService:
     def __init__(self, pipeline_ctx: PipelineContext):
         self.search_adapter = pipeline_ctx.searxng_adapter
         self.keyword_adapter = pipeline_ctx.keyword_adapter
+        self.cache = pipeline_ctx.enrichment_cache
+        # The database cache is only used behind the in-process cache
+        self.repository = pipeline_ctx.enrichment_repository if self.cache is not None else None
+        self.max_concurrency = max(pipeline_ctx.enrichment_max_concurrency, 1)
+        self.deadline_seconds = pipeline_ctx.enrichment_deadline_seconds
+        self._cache_writes = 0
 
     def _keyword_enrich(
         self,
@@ -116,16 +123,15 @@ class EnrichmentService:
             return None
 
         query = cleaned_counterparty
-        results = await self.search_adapter.search(query)
-
-        if not results:
-            return None
-
-        text = extract_enrichment_text(results)
+        text = await self._cached_text(query)
+        if text is None:
+            results = await self._search(query)
+            if results is None:
+                return None
+            text = await self._store(query, results)
         if not text:
             return None
 
-        await asyncio.sleep(1.0)  # Rate limiting for search backend
         return Enrichment(
             cleaned_counterparty=cleaned_counterparty,
             cleaned_purpose=cleaned_purpose,
@@ -133,6 +139,116 @@ class EnrichmentService:
             source="search",
         )
 
+    async def _cached_text(self, query: str) -> str | None:
+        """Look up a query in memory, then in the database.
+
+        Returns the cached text ("" for a cached negative result) or None.
+        """
+        if self.cache is None:
+            return None
+
+        text = self.cache.get(query)
+        if text is not None:
+            self.cache.stats.memory_hits += 1
+            return text
+
+        if self.repository is not None:
+            cached = await self.repository.get(query)
+            if cached is not None:
+                self.cache.put(query, cached.enrichment_text)
+                self.cache.stats.db_hits += 1
+                return cached.enrichment_text
+
+        self.cache.stats.misses += 1
+        return None
+
+    async def _search(self, query: str) -> list[SearchResult] | None:
+        """Run a search; returns None if the search backend failed.
+
+        Does not touch the database, so it is safe to run concurrently.
+        """
+        if not self.search_adapter:
+            return None
+
+        start = time.perf_counter()
+        try:
+            results = await self.search_adapter.search(query)
+        except SearchError as e:
+            logger.debug("  Search failed for %r: %s", query[:20], e)
+            return None
+
+        if self.cache is not None:
+            self.cache.stats.searches += 1
+            self.cache.stats.search_seconds += time.perf_counter() - start
+        return results
+
+    async def _store(self, query: str, results: list[SearchResult]) -> str:
+        """Cache search results and return the enrichment text ("" if none)."""
+        text = extract_enrichment_text(results)
+        if self.cache is None:
+            return text
+
+        self.cache.put(query, text)
+        if self.repository is not None:
+            await self.repository.set(
+                query,
+                text,
+                source_urls=[r.url for r in results if r.url],
+                ttl_days=self.cache.ttl_days if text else self.cache.negative_ttl_days,
+            )
+            self._cache_writes += 1
+
+        return text
+
+    async def _search_texts(self, queries: list[str], deadline: float | None) -> dict[str, str]:
+        """Resolve enrichment texts for unique queries.
+
+        Cache lookups and writes run sequentially (they share the request's
+        database session); only the searches themselves fan out, bounded by
+        ``max_concurrency`` and rate limited by the search adapter. Searches
+        still running at ``deadline`` (event loop time) are cancelled.
+        """
+        texts: dict[str, str] = {}
+        misses: list[str] = []
+        for query in queries:
+            cached = await self._cached_text(query)
+            if cached is None:
+                misses.append(query)
+            else:
+                texts[query] = cached
+
+        if not misses:
+            return texts
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def search(query: str) -> list[SearchResult] | None:
+            async with semaphore:
+                return await self._search(query)
+
+        tasks = {asyncio.create_task(search(query)): query for query in misses}
+        timeout = None
+        if deadline is not None:
+            timeout = max(deadline - asyncio.get_running_loop().time(), 0.0)
+        done, not_done = await asyncio.wait(tasks, timeout=timeout)
+
+        if not_done:
+            for task in not_done:
+                task.cancel()
+            await asyncio.gather(*not_done, return_exceptions=True)
+            logger.info(
+                "Enrichment deadline reached: skipped %d/%d searches",
+                len(not_done),
+                len(misses),
+            )
+
+        for task in done:
+            results = task.result()
+            if results is not None:
+                texts[tasks[task]] = await self._store(tasks[task], results)
+
+        return texts
+
     async def enrich(self, ctx: TransactionContext) -> bool:
         cleaned_counterparty = ctx.cleaned_counterparty or ""
         cleaned_purpose = ctx.cleaned_purpose or ""
@@ -173,15 +289,55 @@ class EnrichmentService:
         if not unresolved:
             return 0
 
+        deadline = None
+        if self.deadline_seconds is not None:
+            deadline = asyncio.get_running_loop().time() + self.deadline_seconds
+
+        # Keyword enrichment first; group the rest by counterparty so that
+        # identical counterparties are searched only once.
         n_enriched = 0
+        pending: dict[str, list[TransactionContext]] = {}
         for ctx in unresolved:
-            # Check if context has any text to enrich
-            if not ctx.cleaned_counterparty and not ctx.cleaned_purpose:
+            cleaned_counterparty = ctx.cleaned_counterparty or ""
+            cleaned_purpose = ctx.cleaned_purpose or ""
+            if not cleaned_counterparty and not cleaned_purpose:
                 continue
 
-            # Enrich and track if search was used
-            enriched = await self.enrich(ctx)
-            if enriched:
+            enrichment = self._keyword_enrich(cleaned_counterparty, cleaned_purpose)
+            if enrichment:
+                enrichment.log()
+                ctx.search_enrichment = enrichment.text
+                n_enriched += 1
+            elif self.search_adapter and cleaned_counterparty:
+                pending.setdefault(cleaned_counterparty, []).append(ctx)
+
+        texts = await self._search_texts(list(pending), deadline) if pending else {}
+
+        for query, group in pending.items():
+            text = texts.get(query)
+            for ctx in group:
+                if not text:
+                    logger.debug("  No enrichment for %r", query[:20])
+                    continue
+                Enrichment(
+                    cleaned_counterparty=query,
+                    cleaned_purpose=ctx.cleaned_purpose or "",
+                    text=text,
+                    source="search",
+                ).log()
+                ctx.search_enrichment = text
                 n_enriched += 1
 
+        if self._cache_writes and self.cache is not None and self.repository is not None:
+            await self.repository.evict_if_needed(self.cache.max_db_entries)
+            self._cache_writes = 0
+
+        if self.cache is not None:
+            stats = self.cache.stats
+            logger.debug(
+                "Enrichment cache: hit ratio %.0f%%, ~%.1fs search time saved",
+                stats.hit_ratio * 100,
+                stats.search_seconds_saved,
+            )
+
         return n_enriched
@@ -12,6 +12,7 @@ For evaluation and testing, use the pipeline components directly:
 from __future__ import annotations
 
 import logging
+from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING
 from uuid import UUID
 
@@ -126,12 +127,49 @@ class ClassificationOrchestrator:
         Returns:
             List of ClassificationResult, one per transaction
         """
-        n_txns = len(transactions)
+        pipeline_ctx, contexts = await self._prepare(session, transactions, user_id)
+        async for _tier_name, _resolved in self._run_tiers(pipeline_ctx, contexts):
+            pass
+        return build_results(contexts)
+
+    async def classify_streaming(
+        self,
+        session: AsyncSession,
+        transactions: list[TransactionInput],
+        user_id: UUID,
+    ) -> AsyncIterator[tuple[str, list[ClassificationResult]]]:
+        """Classify a batch of transactions, yielding results per tier.
+
+        Runs the same pipeline as ``classify``, but yields the transactions
+        a tier resolved as soon as that tier has finished, so example-tier
+        hits are available while the enrichment tier is still running.
+        Transactions no tier could resolve are yielded last, with tier name
+        ``"unresolved"``.
+
+        Args:
+            session: Database session for loading user data
+            transactions: Transactions to classify
+            user_id: User ID for loading user-specific data
 
+        Yields:
+            Tuples of (tier name, results resolved by that tier); every
+            transaction appears in exactly one of them
+        """
+        pipeline_ctx, contexts = await self._prepare(session, transactions, user_id)
+        async for tier_name, resolved in self._run_tiers(pipeline_ctx, contexts):
+            yield tier_name, build_results(resolved)
+
+    async def _prepare(
+        self,
+        session: AsyncSession,
+        transactions: list[TransactionInput],
+        user_id: UUID,
+    ) -> tuple[PipelineContext, list[TransactionContext]]:
+        """Load user data, update the noise model and build the contexts."""
         logger.info(
             "Starting classification: user=%s, transactions=%d",
             user_id,
-            n_txns,
+            len(transactions),
         )
 
         # Load user data from database (repos are user-scoped)
@@ -147,20 +185,34 @@ class ClassificationOrchestrator:
             anchor_accounts = pipeline_ctx.anchor_store.account_numbers
             logger.debug("  Anchors: %s", ", ".join(anchor_accounts))
 
-        # Observe new transactions to update noise model
-        texts = self._extract_texts(transactions)
-        pipeline_ctx.noise_model.observe_batch(texts)
+        # Observe new transactions on a copy, so the cached noise model only
+        # changes once the updated one has been saved
+        noise_model = pipeline_ctx.noise_model.copy()
+        noise_model.observe_batch(self._extract_texts(transactions))
 
-        # Save updated noise model
-        await repos.noise.save(
-            token_frequencies=dict(pipeline_ctx.noise_model.token_doc_freq),
-            document_count=pipeline_ctx.noise_model.doc_count,
-        )
+        user_cache = self._infra.user_cache
+        with user_cache.writing(user_id):
+            await repos.noise.save(
+                token_frequencies=dict(noise_model.token_doc_freq),
+                document_count=noise_model.doc_count,
+            )
+            user_cache.set_noise_model(user_id, noise_model)
+        pipeline_ctx.noise_model = noise_model
 
-        # Initialize transaction contexts
         contexts = [TransactionContext.from_input(txn) for txn in transactions]
+        return pipeline_ctx, contexts
 
-        # Build and execute tiers
+    async def _run_tiers(
+        self,
+        pipeline_ctx: PipelineContext,
+        contexts: list[TransactionContext],
+    ) -> AsyncIterator[tuple[str, list[TransactionContext]]]:
+        """Run the tiers over ``contexts``, mutating them in place.
+
+        After each tier, yields the tier name and the contexts it resolved
+        (possibly none). Contexts left unresolved are yielded last under
+        ``"unresolved"``.
+        """
         anchor_threshold = self._infra.settings.anchor_accept_threshold
         tiers = [
             PreprocessingTier(pipeline_ctx),
@@ -169,23 +221,28 @@ class ClassificationOrchestrator:
             AnchorTier(pipeline_ctx, accept_threshold=anchor_threshold),
         ]
 
+        pending = list(contexts)
         for tier in tiers:
             await tier.process(contexts)
 
+            resolved = [c for c in pending if c.resolved]
+            pending = [c for c in pending if not c.resolved]
+            yield tier.name, resolved
+
             # Early exit if all resolved
-            if all(c.resolved for c in contexts):
+            if not pending:
                 logger.info("All transactions resolved by %s tier", tier.name)
                 break
 
         # Final summary
-        n_resolved = sum(1 for c in contexts if c.resolved)
         logger.info(
             "Classification complete: %d/%d resolved",
-            n_resolved,
-            n_txns,
+            len(contexts) - len(pending),
+            len(contexts),
         )
 
-        return build_results(contexts)
+        if pending:
+            yield "unresolved", pending
 
     @staticmethod
     def _extract_texts(transactions: list[TransactionInput]) -> list[str]:
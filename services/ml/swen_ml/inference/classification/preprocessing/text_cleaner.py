@@ -66,6 +66,10 @@ class NoiseModel:
     token_doc_freq: Counter[str] = field(default_factory=Counter)
     _noise_cache: set[str] | None = field(default=None, repr=False)
 
+    def copy(self) -> NoiseModel:
+        """Return an independent copy (e.g. to update a shared model)."""
+        return NoiseModel(doc_count=self.doc_count, token_doc_freq=Counter(self.token_doc_freq))
+
     def observe_batch(self, texts: list[str]):
         for text in texts:
             tokens = set(tokenize(text))
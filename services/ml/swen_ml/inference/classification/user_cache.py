@@ -0,0 +1,153 @@
+"""Process-resident cache of per-user classification data.
+
+Loading a user's examples and anchors means reading every row, decoding each
+embedding and stacking them into a matrix. The backend sends many small
+classify batches during a sync, so the assembled stores are kept in memory
+between requests and updated by the write endpoints instead of being rebuilt.
+
+Write endpoints update a cached entry only after their repository write has
+committed, and drop it if the write fails. Every write also bumps a per-user
+generation; an entry loaded while a write was in flight is not stored, as it
+may predate that write's commit.
+
+The cache is per process. With several uvicorn workers, a write handled by one
+worker is only visible to the others after their entry is evicted, so run the
+ML service with a single worker (the default) when using the cache.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from .context import EmbeddingStore
+    from .preprocessing import NoiseModel
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class UserData:
+    """User-specific data needed to build a PipelineContext."""
+
+    noise_model: NoiseModel
+    example_store: EmbeddingStore
+    anchor_store: EmbeddingStore
+
+
+@dataclass
+class CacheStats:
+    """Counters describing cache effectiveness."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class UserDataCache:
+    """Bounded LRU cache of UserData keyed by user id.
+
+    Stores and noise models are treated as immutable: updates replace the
+    cached object with a new one, so a classification that already holds a reference keeps working
+    on a consistent snapshot.
+    """
+
+    def __init__(self, max_users: int = 64):
+        self._max_users = max_users
+        self._entries: OrderedDict[UUID, UserData] = OrderedDict()
+        self._generations: dict[UUID, int] = {}
+        self.stats = CacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, user_id: UUID) -> UserData | None:
+        data = self._entries.get(user_id)
+        if data is None:
+            self.stats.misses += 1
+            return None
+
+        self._entries.move_to_end(user_id)
+        self.stats.hits += 1
+        return data
+
+    def generation(self, user_id: UUID) -> int:
+        """Write generation of a user; pass it to ``put`` after loading."""
+        return self._generations.get(user_id, 0)
+
+    def put(self, user_id: UUID, data: UserData, generation: int | None = None) -> None:
+        if self._max_users <= 0:
+            return
+        if generation is not None and generation != self.generation(user_id):
+            # A write started or finished while the data was loaded
+            logger.debug("Not caching stale data for user=%s", user_id)
+            return
+
+        self._entries[user_id] = data
+        self._entries.move_to_end(user_id)
+
+        while len(self._entries) > self._max_users:
+            evicted, _ = self._entries.popitem(last=False)
+            self.stats.evictions += 1
+            logger.debug("Evicted cached data for user=%s", evicted)
+
+    def invalidate(self, user_id: UUID) -> None:
+        self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    @contextmanager
+    def writing(self, user_id: UUID) -> Iterator[None]:
+        """Bracket a repository write and the cache update that follows it.
+
+        Apply the incremental update inside the block, after the write has
+        committed. If the block raises, the user's entry is dropped.
+        """
+        self._bump(user_id)
+        try:
+            yield
+        except BaseException:
+            self.invalidate(user_id)
+            raise
+        finally:
+            self._bump(user_id)
+
+    def _bump(self, user_id: UUID) -> None:
+        self._generations[user_id] = self.generation(user_id) + 1
+
+    # -------------------------------------------------------------------------
+    # Incremental updates (no-ops when the user is not cached)
+    # -------------------------------------------------------------------------
+
+    def add_examples(self, user_id: UUID, examples: EmbeddingStore) -> None:
+        data = self._entries.get(user_id)
+        if data is not None:
+            data.example_store = data.example_store.append(examples)
+
+    def upsert_anchors(self, user_id: UUID, anchors: EmbeddingStore) -> None:
+        data = self._entries.get(user_id)
+        if data is not None:
+            data.anchor_store = data.anchor_store.upsert(anchors)
+
+    def remove_anchor(self, user_id: UUID, account_id: UUID) -> None:
+        data = self._entries.get(user_id)
+        if data is not None:
+            data.anchor_store = data.anchor_store.without_account(str(account_id))
+
+    def clear_anchors(self, user_id: UUID) -> None:
+        data = self._entries.get(user_id)
+        if data is not None:
+            data.anchor_store = data.anchor_store.empty()
+
+    def set_noise_model(self, user_id: UUID, noise_model: NoiseModel) -> None:
+        data = self._entries.get(user_id)
+        if data is not None:
+            data.noise_model = noise_model
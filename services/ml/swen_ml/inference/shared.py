@@ -1,12 +1,18 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
+from swen_ml.inference.classification.user_cache import UserDataCache
+
 if TYPE_CHECKING:
     from swen_ml.config.settings import Settings
-    from swen_ml.inference._models import Encoder
-    from swen_ml.inference.classification.enrichment import KeywordPort, SearXNGAdapter
+    from swen_ml.inference._models import Encoder, EncoderScheduler
+    from swen_ml.inference.classification.enrichment import (
+        EnrichmentCache,
+        KeywordPort,
+        SearXNGAdapter,
+    )
 
 
 @dataclass
@@ -15,5 +21,8 @@ class SharedInfrastructure:
 
     encoder: Encoder
     settings: Settings
+    encoder_scheduler: EncoderScheduler | None = None
     keyword_adapter: KeywordPort | None = None
     searxng_adapter: SearXNGAdapter | None = None
+    user_cache: UserDataCache = field(default_factory=UserDataCache)
+    enrichment_cache: EnrichmentCache | None = None
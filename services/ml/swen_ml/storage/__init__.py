@@ -6,16 +6,20 @@ from .sqlalchemy import (
     AnchorRepository,
     AnchorTable,
     Base,
+    EmbeddingPackRepository,
+    EmbeddingPackTable,
     EnrichmentCacheTable,
     EnrichmentRepository,
     ExampleRepository,
     ExampleTable,
     NoiseRepository,
     NoiseTable,
+    backfill_embedding_packs,
     get_engine,
     get_session,
     get_session_context,
     get_session_maker,
+    upgrade_schema,
 )
 
 __all__ = [
@@ -29,6 +33,7 @@ __all__ = [
     # SQLAlchemy tables
     "AnchorTable",
     "Base",
+    "EmbeddingPackTable",
     "EnrichmentCacheTable",
     "ExampleTable",
     "NoiseTable",
@@ -37,8 +42,11 @@ __all__ = [
     "get_session",
     "get_session_context",
     "get_session_maker",
+    "upgrade_schema",
+    "backfill_embedding_packs",
     # Repositories
     "AnchorRepository",
+    "EmbeddingPackRepository",
     "EnrichmentRepository",
     "ExampleRepository",
     "NoiseRepository",
@@ -2,6 +2,8 @@ from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from swen_ml.config.settings import get_settings
+
 from .sqlalchemy.repositories.anchor import AnchorRepository
 from .sqlalchemy.repositories.enrichment import EnrichmentRepository
 from .sqlalchemy.repositories.example import ExampleRepository
@@ -15,6 +17,11 @@ class RepositoryFactory:
         self._session = session
         self._user_id = user_id
 
+    @property
+    def user_id(self) -> UUID:
+        """User the repositories are scoped to."""
+        return self._user_id
+
     @property
     def noise(self) -> NoiseRepository:
         """Get noise model repository."""
@@ -23,12 +30,16 @@ class RepositoryFactory:
     @property
     def example(self) -> ExampleRepository:
         """Get example embeddings repository."""
-        return ExampleRepository(self._session, self._user_id)
+        return ExampleRepository(
+            self._session, self._user_id, pack_dtype=get_settings().embedding_pack_dtype
+        )
 
     @property
     def anchor(self) -> AnchorRepository:
         """Get anchor embeddings repository."""
-        return AnchorRepository(self._session, self._user_id)
+        return AnchorRepository(
+            self._session, self._user_id, pack_dtype=get_settings().embedding_pack_dtype
+        )
 
     def enrichment(self, ttl_days: int = 30) -> EnrichmentRepository:
         """Get enrichment cache repository."""
@@ -3,11 +3,21 @@
 from .engine import get_engine, get_session, get_session_context, get_session_maker
 from .repositories import (
     AnchorRepository,
+    EmbeddingPackRepository,
     EnrichmentRepository,
     ExampleRepository,
     NoiseRepository,
+    backfill_embedding_packs,
+)
+from .tables import (
+    AnchorTable,
+    Base,
+    EmbeddingPackTable,
+    EnrichmentCacheTable,
+    ExampleTable,
+    NoiseTable,
+    upgrade_schema,
 )
-from .tables import AnchorTable, Base, EnrichmentCacheTable, ExampleTable, NoiseTable
 
 __all__ = [
     # Engine
@@ -18,12 +28,16 @@ __all__ = [
     # Tables
     "AnchorTable",
     "Base",
+    "EmbeddingPackTable",
     "EnrichmentCacheTable",
     "ExampleTable",
     "NoiseTable",
+    "upgrade_schema",
     # Repositories
     "AnchorRepository",
+    "EmbeddingPackRepository",
     "EnrichmentRepository",
     "ExampleRepository",
     "NoiseRepository",
+    "backfill_embedding_packs",
 ]
@@ -1,13 +1,17 @@
 """Database repositories for ML storage."""
 
 from .anchor import AnchorRepository
+from .backfill import backfill_embedding_packs
 from .enrichment import EnrichmentRepository
 from .example import ExampleRepository
 from .noise import NoiseRepository
+from .pack import EmbeddingPackRepository
 
 __all__ = [
     "AnchorRepository",
+    "EmbeddingPackRepository",
     "EnrichmentRepository",
     "ExampleRepository",
     "NoiseRepository",
+    "backfill_embedding_packs",
 ]
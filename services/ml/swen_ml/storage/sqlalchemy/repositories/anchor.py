@@ -2,20 +2,29 @@ from uuid import UUID
 
 import numpy as np
 from numpy.typing import NDArray
-from sqlalchemy import delete, select
+from sqlalchemy import delete, func, select
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from swen_ml.data_models import Anchor
+from swen_ml.storage.sqlalchemy.repositories.pack import EmbeddingPackRepository, PackDtype
 from swen_ml.storage.sqlalchemy.tables import AnchorTable
 
+_UPSERT_CHUNK_ROWS = 1000
+
 
 class AnchorRepository:
-    """Repository for account anchor embeddings."""
+    """Repository for account anchor embeddings.
+
+    Rows in ``anchor_embeddings`` are the source of truth. Anchors are few and
+    updated in place, so the packed copy in ``embedding_packs`` is rebuilt
+    from the rows on every write.
+    """
 
-    def __init__(self, session: AsyncSession, user_id: UUID):
+    def __init__(self, session: AsyncSession, user_id: UUID, pack_dtype: PackDtype = "float32"):
         self._session = session
         self._user_id = user_id
+        self._pack = EmbeddingPackRepository(session, user_id, "anchor", dtype=pack_dtype)
 
     async def upsert(
         self,
@@ -24,28 +33,56 @@ class AnchorRepository:
         account_number: str,
         name: str,
         account_type: str,
+        text_hash: str | None = None,
     ):
         """Insert or update a single anchor embedding."""
-        embedding_bytes = embedding.astype(np.float32).tobytes()
-
-        stmt = insert(AnchorTable).values(
-            user_id=self._user_id,
-            account_id=account_id,
-            embedding=embedding_bytes,
-            account_number=account_number,
-            name=name,
-            account_type=account_type,
+        await self.upsert_many(
+            [
+                Anchor(
+                    account_id=account_id,
+                    account_number=account_number,
+                    name=name,
+                    account_type=account_type,
+                    embedding=embedding,
+                    text_hash=text_hash,
+                )
+            ]
         )
-        stmt = stmt.on_conflict_do_update(
-            index_elements=["user_id", "account_id"],
-            set_={
-                "embedding": embedding_bytes,
-                "account_number": account_number,
-                "name": name,
-                "account_type": account_type,
-            },
-        )
-        await self._session.execute(stmt)
+
+    async def upsert_many(self, anchors: list[Anchor]) -> None:
+        """Insert or update anchors with one multi-row statement and one commit."""
+        if not anchors:
+            return
+
+        rows = [
+            {
+                "user_id": self._user_id,
+                "account_id": anchor.account_id,
+                "embedding": anchor.embedding_bytes(),
+                "account_number": anchor.account_number,
+                "name": anchor.name,
+                "account_type": anchor.account_type,
+                "text_hash": anchor.text_hash,
+            }
+            for anchor in anchors
+        ]
+        # Stay below the PostgreSQL bind parameter limit (7 per row)
+        for start in range(0, len(rows), _UPSERT_CHUNK_ROWS):
+            stmt = insert(AnchorTable).values(rows[start : start + _UPSERT_CHUNK_ROWS])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["user_id", "account_id"],
+                set_={
+                    "embedding": stmt.excluded.embedding,
+                    "account_number": stmt.excluded.account_number,
+                    "name": stmt.excluded.name,
+                    "account_type": stmt.excluded.account_type,
+                    "text_hash": stmt.excluded.text_hash,
+                    "updated_at": func.now(),
+                },
+            )
+            await self._session.execute(stmt)
+
+        await self._rebuild_pack()
         await self._session.commit()
 
     async def delete(self, account_id: UUID) -> bool:
@@ -55,6 +92,7 @@ class AnchorRepository:
             AnchorTable.account_id == account_id,
         )
         result = await self._session.execute(stmt)
+        await self._rebuild_pack()
         await self._session.commit()
         return (result.rowcount or 0) > 0  # type: ignore[union-attr]
 
@@ -62,6 +100,7 @@ class AnchorRepository:
         """Delete all anchors for the user. Returns count of deleted."""
         stmt = delete(AnchorTable).where(AnchorTable.user_id == self._user_id)
         result = await self._session.execute(stmt)
+        await self._pack.clear()
         await self._session.commit()
         return result.rowcount or 0  # type: ignore[union-attr, return-value]
 
@@ -78,6 +117,7 @@ class AnchorRepository:
                 name=row.name,
                 account_type=row.account_type,
                 embedding=np.frombuffer(row.embedding, dtype=np.float32),
+                text_hash=row.text_hash,
             )
             for row in rows
         ]
@@ -87,9 +127,30 @@ class AnchorRepository:
     ) -> tuple[NDArray[np.float32], list[str], list[str], list[str], list[str]]:
         """Get all anchors as a numpy matrix for efficient similarity computation.
 
+        Reads the packed matrix with a single query, falling back to the row
+        table when no up-to-date pack exists.
+
         Returns:
             Tuple of (embeddings_matrix, account_ids, account_numbers, names, account_types)
         """
+        packed = await self._pack.load()
+        if packed is not None:
+            return packed
+        return await self._get_embeddings_matrix_from_rows()
+
+    async def rebuild_pack(self) -> None:
+        """Rebuild the packed copy from the rows and commit."""
+        await self._rebuild_pack()
+        await self._session.commit()
+
+    async def _rebuild_pack(self) -> None:
+        # Lock first so the rows read include those of earlier pack writers
+        await self._pack.lock()
+        await self._pack.replace(*await self._get_embeddings_matrix_from_rows())
+
+    async def _get_embeddings_matrix_from_rows(
+        self,
+    ) -> tuple[NDArray[np.float32], list[str], list[str], list[str], list[str]]:
         anchors = await self.get_all()
 
         if not anchors:
@@ -0,0 +1,44 @@
+import logging
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from swen_ml.storage.sqlalchemy.repositories.anchor import AnchorRepository
+from swen_ml.storage.sqlalchemy.repositories.example import ExampleRepository
+from swen_ml.storage.sqlalchemy.repositories.pack import PACK_FORMAT_VERSION, PackDtype
+from swen_ml.storage.sqlalchemy.tables import AnchorTable, EmbeddingPackTable, ExampleTable
+
+logger = logging.getLogger(__name__)
+
+
+async def backfill_embedding_packs(session: AsyncSession, pack_dtype: PackDtype = "float32") -> int:
+    """Build the packs of users whose rows have no up-to-date pack.
+
+    Run at startup, after the schema upgrade, so that the read path never has
+    to write. Each pack is committed on its own. Returns the number of packs
+    rebuilt.
+    """
+    rebuilt = 0
+    for kind, table, repository_cls in (
+        ("example", ExampleTable, ExampleRepository),
+        ("anchor", AnchorTable, AnchorRepository),
+    ):
+        up_to_date = (
+            select(EmbeddingPackTable.user_id)
+            .where(EmbeddingPackTable.kind == kind)
+            .group_by(EmbeddingPackTable.user_id)
+            .having(
+                func.min(EmbeddingPackTable.format_version) == PACK_FORMAT_VERSION,
+                func.max(EmbeddingPackTable.format_version) == PACK_FORMAT_VERSION,
+            )
+        )
+        stmt = select(table.user_id).distinct().where(table.user_id.not_in(up_to_date))
+        user_ids = (await session.execute(stmt)).scalars().all()
+
+        for user_id in user_ids:
+            await repository_cls(session, user_id, pack_dtype=pack_dtype).rebuild_pack()
+            rebuilt += 1
+
+    if rebuilt:
+        logger.info("Backfilled %d embedding pack(s)", rebuilt)
+    return rebuilt
@@ -62,11 +62,16 @@ class EnrichmentRepository:
         query: str,
         enrichment_text: str,
         source_urls: list[str] | None = None,
+        ttl_days: int | None = None,
     ):
-        """Store enrichment in cache."""
+        """Store enrichment in cache.
+
+        An empty ``enrichment_text`` records a negative result (the query was
+        searched but yielded nothing). ``ttl_days`` overrides the default TTL.
+        """
         query_hash = self._hash_query(query)
         now = datetime.now(UTC)
-        expires_at = now + timedelta(days=self._ttl_days)
+        expires_at = now + timedelta(days=self._ttl_days if ttl_days is None else ttl_days)
 
         stmt = insert(EnrichmentCacheTable).values(
             query_hash=query_hash,
@@ -91,9 +96,7 @@ class EnrichmentRepository:
     async def cleanup_expired(self) -> int:
         """Remove expired entries. Returns count of deleted."""
         now = datetime.now(UTC)
-        stmt = delete(EnrichmentCacheTable).where(
-            EnrichmentCacheTable.expires_at <= now
-        )
+        stmt = delete(EnrichmentCacheTable).where(EnrichmentCacheTable.expires_at <= now)
         result = await self._session.execute(stmt)
         await self._session.commit()
         return result.rowcount or 0  # type: ignore[union-attr, return-value]
@@ -2,19 +2,28 @@ from uuid import UUID
 
 import numpy as np
 from numpy.typing import NDArray
-from sqlalchemy import func, select
+from sqlalchemy import func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from swen_ml.data_models import Example
+from swen_ml.storage.sqlalchemy.repositories.pack import EmbeddingPackRepository, PackDtype
 from swen_ml.storage.sqlalchemy.tables import ExampleTable
 
+_INSERT_CHUNK_ROWS = 1000
+
 
 class ExampleRepository:
-    """Repository for user training examples."""
+    """Repository for user training examples.
+
+    Rows in ``user_examples`` are the source of truth. A packed copy in
+    ``embedding_packs`` is maintained alongside for fast matrix loading and
+    rebuilt from the rows whenever it is missing or outdated.
+    """
 
-    def __init__(self, session: AsyncSession, user_id: UUID):
+    def __init__(self, session: AsyncSession, user_id: UUID, pack_dtype: PackDtype = "float32"):
         self._session = session
         self._user_id = user_id
+        self._pack = EmbeddingPackRepository(session, user_id, "example", dtype=pack_dtype)
 
     async def add(
         self,
@@ -25,15 +34,53 @@ class ExampleRepository:
         text: str,
     ):
         """Add a new training example."""
-        example = ExampleTable(
-            user_id=self._user_id,
-            embedding=embedding.astype(np.float32).tobytes(),
-            account_id=account_id,
-            account_number=account_number,
-            account_type=account_type,
-            text=text,
+        await self.add_many(
+            embedding.reshape(1, -1),
+            [account_id],
+            [account_number],
+            [account_type],
+            [text],
+        )
+
+    async def add_many(
+        self,
+        embeddings: NDArray[np.float32],
+        account_ids: list[str],
+        account_numbers: list[str],
+        account_types: list[str],
+        texts: list[str],
+    ) -> None:
+        """Add training examples with one multi-row insert and one commit."""
+        if not account_ids:
+            return
+
+        matrix = embeddings.astype(np.float32)
+        rows = [
+            {
+                "user_id": self._user_id,
+                "embedding": matrix[i].tobytes(),
+                "account_id": account_ids[i],
+                "account_number": account_numbers[i],
+                "account_type": account_types[i],
+                "text": texts[i],
+            }
+            for i in range(len(account_ids))
+        ]
+        # Stay below the PostgreSQL bind parameter limit (6 per row)
+        for start in range(0, len(rows), _INSERT_CHUNK_ROWS):
+            await self._session.execute(
+                insert(ExampleTable).values(rows[start : start + _INSERT_CHUNK_ROWS])
+            )
+
+        appended = await self._pack.append(
+            matrix,
+            account_ids,
+            account_numbers,
+            texts,
+            account_types,
         )
-        self._session.add(example)
+        if not appended:
+            await self._rebuild_pack()
         await self._session.commit()
 
     async def get_all(self) -> list[Example]:
@@ -58,9 +105,31 @@ class ExampleRepository:
     ) -> tuple[NDArray[np.float32], list[str], list[str], list[str], list[str]]:
         """Get all examples as a numpy matrix for efficient similarity computation.
 
+        Reads the packed matrix with a single query. Users without an
+        up-to-date pack are served from the row table; reads never write, the
+        pack is rebuilt by the next write or by ``backfill_embedding_packs``.
+
         Returns:
             Tuple of (embeddings_matrix, account_ids, account_numbers, texts, account_types)
         """
+        packed = await self._pack.load()
+        if packed is not None:
+            return packed
+        return await self._get_embeddings_matrix_from_rows()
+
+    async def rebuild_pack(self) -> None:
+        """Rebuild the packed copy from the rows and commit."""
+        await self._rebuild_pack()
+        await self._session.commit()
+
+    async def _rebuild_pack(self) -> None:
+        # Lock first so the rows read include those of earlier pack writers
+        await self._pack.lock()
+        await self._pack.replace(*await self._get_embeddings_matrix_from_rows())
+
+    async def _get_embeddings_matrix_from_rows(
+        self,
+    ) -> tuple[NDArray[np.float32], list[str], list[str], list[str], list[str]]:
         examples = await self.get_all()
 
         if not examples:
@@ -0,0 +1,248 @@
+from typing import Literal
+from uuid import UUID
+
+import numpy as np
+from numpy.typing import NDArray
+from sqlalchemy import LargeBinary, delete, func, select, type_coerce, update
+from sqlalchemy.dialects.postgresql import JSONB, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from swen_ml.storage.sqlalchemy.tables import EmbeddingPackTable
+
+# Bump when the pack layout changes; outdated packs are rebuilt from the row tables.
+PACK_FORMAT_VERSION = 1
+
+PackKind = Literal["example", "anchor"]
+PackDtype = Literal["float32", "float16"]
+
+EmbeddingMatrix = tuple[NDArray[np.float32], list[str], list[str], list[str], list[str]]
+
+
+class EmbeddingPackRepository:
+    """Repository for packed per-user embedding matrices.
+
+    Embeddings are stored as contiguous matrix blobs of at most ``chunk_rows``
+    rows each. Appends fill the last chunk before starting a new one. None of
+    the write methods commit; callers commit together with the row table write.
+
+    Writers hold a transaction-scoped advisory lock per user and kind (see
+    ``lock``), and chunk inserts are upserts, so concurrent first writes do
+    not collide on the chunk key.
+
+    Only column selects and core statements are used, so packs are never held
+    in the session identity map and stale chunks cannot leak between calls.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        user_id: UUID,
+        kind: PackKind,
+        dtype: PackDtype = "float32",
+        chunk_rows: int = 4096,
+    ):
+        self._session = session
+        self._user_id = user_id
+        self._kind = kind
+        self._dtype = dtype
+        self._chunk_rows = chunk_rows
+
+    def _where(self):
+        return (
+            EmbeddingPackTable.user_id == self._user_id,
+            EmbeddingPackTable.kind == self._kind,
+        )
+
+    async def lock(self) -> None:
+        """Serialize pack writers for this user and kind until the transaction ends.
+
+        Call before reading the row table for a rebuild, so the rebuild sees
+        the rows committed by a writer that held the lock before.
+        """
+        key = f"embedding_packs:{self._user_id}:{self._kind}"
+        await self._session.execute(
+            select(func.pg_advisory_xact_lock(func.hashtextextended(key, 0)))
+        )
+
+    async def load(self) -> EmbeddingMatrix | None:
+        """Load the packed matrix.
+
+        Returns None if no pack exists or it uses an outdated format, in which
+        case the caller should rebuild it from the row table.
+        """
+        stmt = (
+            select(*EmbeddingPackTable.__table__.c)
+            .where(*self._where())
+            .order_by(EmbeddingPackTable.chunk_index)
+        )
+        result = await self._session.execute(stmt)
+        chunks = result.all()
+
+        if not chunks or any(c.format_version != PACK_FORMAT_VERSION for c in chunks):
+            return None
+        if len({(c.dtype, c.dimension) for c in chunks}) > 1:
+            return None
+
+        dtype, dimension = chunks[0].dtype, chunks[0].dimension
+        blob = chunks[0].matrix if len(chunks) == 1 else b"".join(c.matrix for c in chunks)
+        matrix = np.frombuffer(blob, dtype=dtype).reshape(-1, dimension)
+        if matrix.dtype != np.float32:
+            matrix = matrix.astype(np.float32)
+
+        account_ids: list[str] = []
+        account_numbers: list[str] = []
+        labels: list[str] = []
+        account_types: list[str] = []
+        for chunk in chunks:
+            account_ids.extend(chunk.account_ids)
+            account_numbers.extend(chunk.account_numbers)
+            labels.extend(chunk.labels)
+            account_types.extend(chunk.account_types)
+
+        return matrix, account_ids, account_numbers, labels, account_types
+
+    async def append(
+        self,
+        embeddings: NDArray[np.float32],
+        account_ids: list[str],
+        account_numbers: list[str],
+        labels: list[str],
+        account_types: list[str],
+    ) -> bool:
+        """Append rows to the pack.
+
+        Returns False (and writes nothing) if there is no up-to-date pack to
+        append to; the caller must then rebuild the pack with ``replace``.
+        """
+        await self.lock()
+        # Only the metadata of the last chunk is read; its blob stays in the database
+        stmt = (
+            select(
+                EmbeddingPackTable.chunk_index,
+                EmbeddingPackTable.format_version,
+                EmbeddingPackTable.dtype,
+                EmbeddingPackTable.dimension,
+                EmbeddingPackTable.row_count,
+            )
+            .where(*self._where())
+            .order_by(EmbeddingPackTable.chunk_index.desc())
+            .limit(1)
+        )
+        result = await self._session.execute(stmt)
+        last = result.one_or_none()
+
+        if (
+            last is None
+            or last.format_version != PACK_FORMAT_VERSION
+            or last.dtype != self._dtype
+            or last.dimension != embeddings.shape[1]
+        ):
+            return False
+
+        matrix = embeddings.astype(self._dtype)
+        free = max(self._chunk_rows - last.row_count, 0)
+        if free:
+            # Concatenate in SQL so only the new rows are sent
+            table = EmbeddingPackTable
+            stmt = (
+                update(table)
+                .where(*self._where(), table.chunk_index == last.chunk_index)
+                .values(
+                    matrix=table.matrix.op("||")(type_coerce(matrix[:free].tobytes(), LargeBinary)),
+                    row_count=table.row_count + len(matrix[:free]),
+                    account_ids=table.account_ids.op("||")(type_coerce(account_ids[:free], JSONB)),
+                    account_numbers=table.account_numbers.op("||")(
+                        type_coerce(account_numbers[:free], JSONB)
+                    ),
+                    labels=table.labels.op("||")(type_coerce(labels[:free], JSONB)),
+                    account_types=table.account_types.op("||")(
+                        type_coerce(account_types[:free], JSONB)
+                    ),
+                )
+            )
+            await self._session.execute(stmt)
+
+        await self._insert_chunks(
+            last.chunk_index + 1,
+            matrix[free:],
+            account_ids[free:],
+            account_numbers[free:],
+            labels[free:],
+            account_types[free:],
+        )
+        return True
+
+    async def replace(
+        self,
+        embeddings: NDArray[np.float32],
+        account_ids: list[str],
+        account_numbers: list[str],
+        labels: list[str],
+        account_types: list[str],
+    ) -> None:
+        """Replace the whole pack with the given rows."""
+        await self.lock()
+        chunk_count = 0
+        if len(account_ids) > 0:
+            chunk_count = await self._insert_chunks(
+                0,
+                embeddings.astype(self._dtype),
+                account_ids,
+                account_numbers,
+                labels,
+                account_types,
+            )
+        await self._delete_from(chunk_count)
+
+    async def clear(self) -> None:
+        """Delete all chunks of the pack."""
+        await self.lock()
+        await self._delete_from(0)
+
+    async def _delete_from(self, chunk_index: int) -> None:
+        await self._session.execute(
+            delete(EmbeddingPackTable).where(
+                *self._where(), EmbeddingPackTable.chunk_index >= chunk_index
+            )
+        )
+
+    async def _insert_chunks(
+        self,
+        first_index: int,
+        matrix: NDArray,
+        account_ids: list[str],
+        account_numbers: list[str],
+        labels: list[str],
+        account_types: list[str],
+    ) -> int:
+        """Upsert chunks starting at ``first_index``. Returns the number written."""
+        rows = [
+            {
+                "user_id": self._user_id,
+                "kind": self._kind,
+                "chunk_index": first_index + offset,
+                "format_version": PACK_FORMAT_VERSION,
+                "dtype": self._dtype,
+                "dimension": matrix.shape[1],
+                "row_count": len(account_ids[start : start + self._chunk_rows]),
+                "matrix": matrix[start : start + self._chunk_rows].tobytes(),
+                "account_ids": account_ids[start : start + self._chunk_rows],
+                "account_numbers": account_numbers[start : start + self._chunk_rows],
+                "labels": labels[start : start + self._chunk_rows],
+                "account_types": account_types[start : start + self._chunk_rows],
+            }
+            for offset, start in enumerate(range(0, len(account_ids), self._chunk_rows))
+        ]
+        if rows:
+            stmt = insert(EmbeddingPackTable)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["user_id", "kind", "chunk_index"],
+                set_={
+                    column: stmt.excluded[column]
+                    for column in rows[0]
+                    if column not in ("user_id", "kind", "chunk_index")
+                }
+                | {"updated_at": func.now()},
+            )
+            await self._session.execute(stmt, rows)
+        return len(rows)
@@ -6,7 +6,7 @@ These are thin persistence mappings. Domain logic lives in Pydantic models.
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import DateTime, Index, Integer, LargeBinary, String, Text, func
+from sqlalchemy import Connection, DateTime, Index, Integer, LargeBinary, String, Text, func, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -28,6 +28,8 @@ class AnchorTable(Base):
     # an income account is never proposed as the counter-account for a
     # money-out (debit) transaction.
     account_type: Mapped[str] = mapped_column(String(20), nullable=False)
+    # Hash of encoder fingerprint + embedded text (see AccountEmbeddingService)
+    text_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
@@ -49,6 +51,35 @@ class ExampleTable(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
 
+class EmbeddingPackTable(Base):
+    """Packed per-user embedding matrices.
+
+    Read-optimised copy of ``user_examples`` / ``anchor_embeddings``: each row
+    holds a contiguous matrix blob for up to a fixed number of embeddings plus
+    the parallel label arrays, so a user's store loads with a single query.
+    The row tables stay the source of truth and are used to rebuild packs.
+    """
+
+    __tablename__ = "embedding_packs"
+
+    user_id: Mapped[UUID] = mapped_column(primary_key=True)
+    # "example" or "anchor"
+    kind: Mapped[str] = mapped_column(String(20), primary_key=True)
+    chunk_index: Mapped[int] = mapped_column(Integer, primary_key=True)
+    format_version: Mapped[int] = mapped_column(Integer, nullable=False)
+    dtype: Mapped[str] = mapped_column(String(10), nullable=False)
+    dimension: Mapped[int] = mapped_column(Integer, nullable=False)
+    row_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    matrix: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    account_ids: Mapped[list] = mapped_column(JSONB, nullable=False)
+    account_numbers: Mapped[list] = mapped_column(JSONB, nullable=False)
+    labels: Mapped[list] = mapped_column(JSONB, nullable=False)
+    account_types: Mapped[list] = mapped_column(JSONB, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+
 class NoiseTable(Base):
     """User noise models table."""
 
@@ -76,3 +107,14 @@ class EnrichmentCacheTable(Base):
     hit_count: Mapped[int] = mapped_column(Integer, default=0)
 
     __table_args__ = (Index("ix_enrichment_cache_expires", "expires_at"),)
+
+
+# create_all() only creates missing tables. Columns added to existing tables
+# after their first release are applied by these idempotent statements.
+_SCHEMA_UPGRADES = ("ALTER TABLE anchor_embeddings ADD COLUMN IF NOT EXISTS text_hash VARCHAR(64)",)
+
+
+def upgrade_schema(connection: Connection) -> None:
+    """Add columns that tables created by older versions are missing."""
+    for statement in _SCHEMA_UPGRADES:
+        connection.execute(text(statement))
@@ -4,12 +4,16 @@ import asyncio
 import logging
 import sys
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from swen_ml.config.settings import get_settings
 
 # Import tables to register with Base.metadata
 from swen_ml.storage.sqlalchemy import tables  # noqa: F401
 from swen_ml.storage.sqlalchemy.base import Base
 from swen_ml.storage.sqlalchemy.engine import get_engine
+from swen_ml.storage.sqlalchemy.repositories import backfill_embedding_packs
+from swen_ml.storage.sqlalchemy.tables import upgrade_schema
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -22,6 +26,9 @@ async def create_tables() -> None:
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(upgrade_schema)
+    async with AsyncSession(engine) as session:
+        await backfill_embedding_packs(session, get_settings().embedding_pack_dtype)
 
     await engine.dispose()
     logger.info("Database schema is up to date")
@@ -1,9 +1,10 @@
 """Training services for embeddings."""
 
 from .account_embedding_service import AccountEmbeddingService
-from .example_embedding_service import ExampleEmbeddingService
+from .example_embedding_service import ExampleEmbeddingService, ExampleInput
 
 __all__ = [
     "AccountEmbeddingService",
     "ExampleEmbeddingService",
+    "ExampleInput",
 ]
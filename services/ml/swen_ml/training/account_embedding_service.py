@@ -2,14 +2,23 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
+from contextlib import AbstractContextManager, nullcontext
 from typing import TYPE_CHECKING
 from uuid import UUID
 
+import numpy as np
 from swen_ml_contracts import AccountOption
 
+from swen_ml.data_models import Anchor
+from swen_ml.inference.classification.context import EmbeddingStore
+
 if TYPE_CHECKING:
-    from swen_ml.inference._models import Encoder
+    from numpy.typing import NDArray
+
+    from swen_ml.inference._models import Encoder, EncoderScheduler
+    from swen_ml.inference.classification.user_cache import UserDataCache
     from swen_ml.storage import AnchorRepository, RepositoryFactory
 
 logger = logging.getLogger(__name__)
@@ -18,48 +27,131 @@ logger = logging.getLogger(__name__)
 class AccountEmbeddingService:
     """Service for managing account anchor embeddings."""
 
-    def __init__(self, encoder: Encoder, repository: AnchorRepository):
+    def __init__(
+        self,
+        encoder: Encoder,
+        repository: AnchorRepository,
+        user_id: UUID | None = None,
+        user_cache: UserDataCache | None = None,
+        scheduler: EncoderScheduler | None = None,
+    ):
         self.encoder = encoder
         self.repository = repository
+        self.user_id = user_id
+        self.user_cache = user_cache
+        self.scheduler = scheduler
 
     @classmethod
     def from_factory(
         cls,
         encoder: Encoder,
         factory: RepositoryFactory,
+        user_cache: UserDataCache | None = None,
+        scheduler: EncoderScheduler | None = None,
     ) -> AccountEmbeddingService:
-        return cls(encoder=encoder, repository=factory.anchor)
+        return cls(
+            encoder=encoder,
+            repository=factory.anchor,
+            user_id=factory.user_id,
+            user_cache=user_cache,
+            scheduler=scheduler,
+        )
+
+    async def _encode(self, texts: list[str]) -> NDArray[np.float32]:
+        if self.scheduler is not None:
+            return await self.scheduler.encode(texts)
+        return self.encoder.encode(texts)
+
+    def _cache_write(self) -> AbstractContextManager[None]:
+        # Cache updates made inside happen only after the repository commit
+        if self.user_cache is None or self.user_id is None:
+            return nullcontext()
+        return self.user_cache.writing(self.user_id)
+
+    def _text_hash(self, text: str) -> str:
+        # Include the encoder fingerprint so that a model, backend or encoder
+        # setting change re-embeds every anchor
+        return hashlib.sha256(f"{self.encoder.fingerprint}\0{text}".encode()).hexdigest()
 
     async def embed_accounts(self, accounts: list[AccountOption]) -> int:
+        """Embed and store anchors for the given accounts.
+
+        Accounts whose text (name + description) is unchanged since the last
+        embedding with the same encoder fingerprint are not re-encoded; the remaining texts
+        are encoded in one batch and all changes are written in one statement.
+        Returns the number of accounts whose anchors are now up to date.
+        """
         if not accounts:
             return 0
 
-        embedded_count = 0
+        # One row per account (the last occurrence wins), as a single statement
+        # cannot update the same row twice
+        accounts = list({a.account_id: a for a in accounts}.values())
+        existing = {a.account_id: a for a in await self.repository.get_all()}
+
+        anchors: list[Anchor] = []
+        to_encode: list[tuple[Anchor, str]] = []
         for account in accounts:
             # Build text from account name + description
             text = account.name
             if account.description:
                 text = f"{account.name}: {account.description}"
 
-            # Encode
-            embedding = self.encoder.encode([text])[0]
-
-            # Upsert into database
-            await self.repository.upsert(
+            text_hash = self._text_hash(text)
+            previous = existing.get(account.account_id)
+            unchanged = previous is not None and previous.text_hash == text_hash
+            anchor = Anchor(
                 account_id=account.account_id,
-                embedding=embedding,
                 account_number=account.account_number,
                 name=account.name,
                 account_type=account.account_type,
+                embedding=previous.embedding if unchanged else np.empty(0, dtype=np.float32),
+                text_hash=text_hash,
             )
-            embedded_count += 1
-
-        logger.info("Embedded %d account anchors", embedded_count)
-
-        return embedded_count
+            if not unchanged:
+                to_encode.append((anchor, text))
+            elif (previous.account_number, previous.name, previous.account_type) == (
+                anchor.account_number,
+                anchor.name,
+                anchor.account_type,
+            ):
+                continue
+            anchors.append(anchor)
+
+        if to_encode:
+            embeddings = await self._encode([text for _, text in to_encode])
+            for (anchor, _), embedding in zip(to_encode, embeddings):
+                anchor.embedding = embedding
+
+        with self._cache_write():
+            await self.repository.upsert_many(anchors)
+
+            if anchors and self.user_cache is not None and self.user_id is not None:
+                self.user_cache.upsert_anchors(
+                    self.user_id,
+                    EmbeddingStore(
+                        embeddings=np.vstack([a.embedding for a in anchors]).astype(np.float32),
+                        account_ids=[str(a.account_id) for a in anchors],
+                        account_numbers=[a.account_number for a in anchors],
+                        labels=[a.name for a in anchors],
+                        account_types=[a.account_type for a in anchors],
+                    ),
+                )
+
+        logger.info(
+            "Embedded %d account anchors (%d encoded, %d unchanged)",
+            len(accounts),
+            len(to_encode),
+            len(accounts) - len(anchors),
+        )
+
+        return len(accounts)
 
     async def delete_account(self, account_id: UUID) -> bool:
-        deleted = await self.repository.delete(account_id)
+        with self._cache_write():
+            deleted = await self.repository.delete(account_id)
+            if self.user_cache is not None and self.user_id is not None:
+                self.user_cache.remove_anchor(self.user_id, account_id)
 
         if deleted:
             logger.info("Deleted anchor for account=%s", account_id)
@@ -69,7 +161,10 @@ class AccountEmbeddingService:
         return deleted
 
     async def delete_all(self) -> int:
-        count = await self.repository.delete_all()
+        with self._cache_write():
+            count = await self.repository.delete_all()
+            if self.user_cache is not None and self.user_id is not None:
+                self.user_cache.clear_anchors(self.user_id)
 
         if count > 0:
             logger.info("Deleted %d anchors", count)
@@ -3,30 +3,79 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 from uuid import UUID
 
+from swen_ml.inference.classification.context import EmbeddingStore
+
 if TYPE_CHECKING:
-    from swen_ml.inference._models import Encoder
+    import numpy as np
+    from numpy.typing import NDArray
+
+    from swen_ml.inference._models import Encoder, EncoderScheduler
+    from swen_ml.inference.classification.user_cache import UserDataCache
     from swen_ml.storage import ExampleRepository, RepositoryFactory
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class ExampleInput:
+    """Fields of one example to encode and store."""
+
+    counterparty_name: str | None
+    purpose: str
+    account_id: UUID
+    account_number: str
+    account_type: str
+
+
 class ExampleEmbeddingService:
     """Service for managing example embeddings."""
 
-    def __init__(self, encoder: Encoder, repository: ExampleRepository):
+    def __init__(
+        self,
+        encoder: Encoder,
+        repository: ExampleRepository,
+        user_id: UUID | None = None,
+        user_cache: UserDataCache | None = None,
+        scheduler: EncoderScheduler | None = None,
+    ):
         self.encoder = encoder
         self.repository = repository
+        self.user_id = user_id
+        self.user_cache = user_cache
+        self.scheduler = scheduler
 
     @classmethod
     def from_factory(
         cls,
         encoder: Encoder,
         factory: RepositoryFactory,
+        user_cache: UserDataCache | None = None,
+        scheduler: EncoderScheduler | None = None,
     ) -> ExampleEmbeddingService:
-        return cls(encoder=encoder, repository=factory.example)
+        return cls(
+            encoder=encoder,
+            repository=factory.example,
+            user_id=factory.user_id,
+            user_cache=user_cache,
+            scheduler=scheduler,
+        )
+
+    async def _encode(self, texts: list[str]) -> NDArray[np.float32]:
+        if self.scheduler is not None:
+            return await self.scheduler.encode(texts)
+        return self.encoder.encode(texts)
+
+    def _cache_write(self) -> AbstractContextManager[None]:
+        # Cache updates made inside happen only after the repository commit
+        if self.user_cache is None or self.user_id is None:
+            return nullcontext()
+        return self.user_cache.writing(self.user_id)
 
     async def store_example(
         self,
@@ -36,24 +85,64 @@ class ExampleEmbeddingService:
         account_number: str,
         account_type: str,
     ) -> int:
-        parts = []
-        if counterparty_name:
-            parts.append(counterparty_name)
-        parts.append(purpose)
-        text = " ".join(parts)
+        return await self.store_examples(
+            [
+                ExampleInput(
+                    counterparty_name=counterparty_name,
+                    purpose=purpose,
+                    account_id=account_id,
+                    account_number=account_number,
+                    account_type=account_type,
+                )
+            ]
+        )
+
+    async def store_examples(self, examples: Sequence[ExampleInput]) -> int:
+        """Encode all texts in one call and store them in one insert.
+
+        Returns the user's total example count afterwards.
+        """
+        if not examples:
+            return await self.repository.count()
+
+        texts = [_example_text(e.counterparty_name, e.purpose) for e in examples]
+        account_ids = [str(e.account_id) for e in examples]
+        account_numbers = [e.account_number for e in examples]
+        account_types = [e.account_type for e in examples]
 
         # Encode
-        embedding = self.encoder.encode([text])[0]
+        embeddings = await self._encode(texts)
 
         # Store in database
-        await self.repository.add(
-            embedding=embedding,
-            account_id=str(account_id),
-            account_number=account_number,
-            account_type=account_type,
-            text=text,
-        )
+        with self._cache_write():
+            await self.repository.add_many(
+                embeddings=embeddings,
+                account_ids=account_ids,
+                account_numbers=account_numbers,
+                account_types=account_types,
+                texts=texts,
+            )
+
+            if self.user_cache is not None and self.user_id is not None:
+                self.user_cache.add_examples(
+                    self.user_id,
+                    EmbeddingStore(
+                        embeddings=embeddings,
+                        account_ids=account_ids,
+                        account_numbers=account_numbers,
+                        labels=texts,
+                        account_types=account_types,
+                    ),
+                )
 
         total = await self.repository.count()
-        logger.info("Stored example for account=%s, total=%d", account_number, total)
+        logger.info("Stored %d example(s), total=%d", len(examples), total)
         return total
+
+
+def _example_text(counterparty_name: str | None, purpose: str) -> str:
+    parts = []
+    if counterparty_name:
+        parts.append(counterparty_name)
+    parts.append(purpose)
+    return " ".join(parts)
@@ -0,0 +1,104 @@
+"""Tests for embedding account anchors."""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import numpy as np
+from swen_ml_contracts import AccountOption
+
+from swen_ml.training.account_embedding_service import AccountEmbeddingService
+
+DIMENSION = 4
+
+
+class _FakeEncoder:
+    dimension = DIMENSION
+
+    def __init__(self, fingerprint: str = "fake:v1"):
+        self.fingerprint = fingerprint
+        self.calls: list[list[str]] = []
+
+    def encode(self, texts: list[str]) -> np.ndarray:
+        self.calls.append(list(texts))
+        return np.ones((len(texts), DIMENSION), dtype=np.float32)
+
+
+def _account(name: str, description: str | None = None, **kwargs) -> AccountOption:
+    fields = {
+        "account_id": uuid4(),
+        "account_number": "4000",
+        "name": name,
+        "account_type": "expense",
+        "description": description,
+    }
+    return AccountOption(**(fields | kwargs))
+
+
+def _repository(existing=()) -> MagicMock:
+    repository = MagicMock()
+    repository.get_all = AsyncMock(return_value=list(existing))
+    repository.upsert_many = AsyncMock()
+    return repository
+
+
+async def _stored_anchors(encoder: _FakeEncoder, accounts: list[AccountOption]) -> list:
+    repository = _repository()
+    await AccountEmbeddingService(encoder, repository).embed_accounts(accounts)
+    return repository.upsert_many.await_args.args[0]
+
+
+class TestEmbedAccounts:
+    async def test_encodes_all_texts_in_one_batch(self):
+        encoder = _FakeEncoder()
+        food, rent = _account("Lebensmittel", "Supermarkt"), _account("Miete")
+        repository = _repository()
+
+        count = await AccountEmbeddingService(encoder, repository).embed_accounts([food, rent])
+
+        assert count == 2
+        assert encoder.calls == [["Lebensmittel: Supermarkt", "Miete"]]
+        (anchors,) = repository.upsert_many.await_args.args
+        assert [a.account_id for a in anchors] == [food.account_id, rent.account_id]
+
+    async def test_unchanged_accounts_are_neither_encoded_nor_written(self):
+        encoder = _FakeEncoder()
+        account = _account("Lebensmittel")
+        (previous,) = await _stored_anchors(encoder, [account])
+        repository = _repository([previous])
+
+        await AccountEmbeddingService(encoder, repository).embed_accounts([account])
+
+        assert len(encoder.calls) == 1
+        repository.upsert_many.assert_awaited_once_with([])
+
+    async def test_renumbered_account_keeps_its_embedding(self):
+        encoder = _FakeEncoder()
+        account = _account("Lebensmittel")
+        (previous,) = await _stored_anchors(encoder, [account])
+        repository = _repository([previous])
+        renumbered = account.model_copy(update={"account_number": "4100"})
+
+        await AccountEmbeddingService(encoder, repository).embed_accounts([renumbered])
+
+        assert len(encoder.calls) == 1
+        (anchors,) = repository.upsert_many.await_args.args
+        assert [a.account_number for a in anchors] == ["4100"]
+
+    async def test_changed_encoder_fingerprint_re_embeds(self):
+        account = _account("Lebensmittel")
+        (previous,) = await _stored_anchors(_FakeEncoder("onnx:int8"), [account])
+        encoder = _FakeEncoder("onnx:fp32")
+        repository = _repository([previous])
+
+        await AccountEmbeddingService(encoder, repository).embed_accounts([account])
+
+        assert encoder.calls == [["Lebensmittel"]]
+
+    async def test_duplicate_accounts_are_written_once(self):
+        encoder = _FakeEncoder()
+        account = _account("Lebensmittel")
+        renamed = account.model_copy(update={"name": "Supermarkt"})
+
+        anchors = await _stored_anchors(encoder, [account, renamed])
+
+        assert [a.name for a in anchors] == ["Supermarkt"]
@@ -0,0 +1,99 @@
+"""Tests for the caching encoder wrapper."""
+
+import numpy as np
+
+from swen_ml.inference._models import CachedEncoder
+
+DIMENSION = 4
+
+
+class _FakeEncoder:
+    dimension = DIMENSION
+    model_name = "fake-model"
+
+    def __init__(self, fingerprint: str = "fake:v1"):
+        self.fingerprint = fingerprint
+        self.calls: list[list[str]] = []
+
+    def encode(self, texts: list[str]) -> np.ndarray:
+        self.calls.append(list(texts))
+        # One distinct row per text, derived from its length
+        return np.array([[len(t)] * DIMENSION for t in texts], dtype=np.float32)
+
+
+class TestCachedEncoder:
+    def test_only_misses_are_encoded_in_one_batch(self):
+        inner = _FakeEncoder()
+        encoder = CachedEncoder(inner)
+        encoder.encode(["REWE"])
+
+        result = encoder.encode(["Miete Januar", "REWE", "Miete Januar"])
+
+        assert inner.calls == [["REWE"], ["Miete Januar"]]
+        np.testing.assert_array_equal(result[:, 0], [12, 4, 12])
+        assert (encoder.stats.memory_hits, encoder.stats.misses) == (1, 3)
+
+    def test_texts_differing_in_whitespace_share_an_entry(self):
+        inner = _FakeEncoder()
+        encoder = CachedEncoder(inner)
+
+        encoder.encode(["  REWE   SAGT DANKE "])
+        encoder.encode(["REWE SAGT DANKE"])
+
+        assert inner.calls == [["REWE SAGT DANKE"]]
+
+    def test_evicts_least_recently_used(self):
+        inner = _FakeEncoder()
+        encoder = CachedEncoder(inner, max_entries=2)
+        encoder.encode(["a", "b"])
+        encoder.encode(["a"])
+
+        encoder.encode(["c"])
+        encoder.encode(["a", "b"])
+
+        assert len(encoder) == 2
+        assert inner.calls[-1] == ["b"]
+
+    def test_empty_input_does_not_call_the_encoder(self):
+        inner = _FakeEncoder()
+
+        result = CachedEncoder(inner).encode([])
+
+        assert result.shape == (0, DIMENSION)
+        assert inner.calls == []
+
+
+class TestFingerprint:
+    def test_key_includes_the_encoder_fingerprint(self):
+        v1 = CachedEncoder(_FakeEncoder("onnx:int8"))
+        v2 = CachedEncoder(_FakeEncoder("onnx:fp32"))
+
+        assert v1._key("REWE") != v2._key("REWE")
+
+    def test_disk_entries_of_another_fingerprint_are_not_reused(self, tmp_path):
+        path = tmp_path / "embeddings.sqlite"
+        first = CachedEncoder(_FakeEncoder("onnx:int8"), disk_path=path)
+        first.encode(["REWE"])
+        first.close()
+
+        inner = _FakeEncoder("onnx:fp32")
+        second = CachedEncoder(inner, disk_path=path)
+        second.encode(["REWE"])
+        second.close()
+
+        assert inner.calls == [["REWE"]]
+
+    def test_disk_entries_survive_a_restart(self, tmp_path):
+        path = tmp_path / "embeddings.sqlite"
+        first = CachedEncoder(_FakeEncoder(), disk_path=path)
+        first.encode(["REWE"])
+        first.close()
+
+        inner = _FakeEncoder()
+        second = CachedEncoder(inner, disk_path=path)
+        result = second.encode(["REWE"])
+        second.close()
+
+        assert inner.calls == []
+        assert second.stats.disk_hits == 1
+        np.testing.assert_array_equal(result[0], [4] * DIMENSION)
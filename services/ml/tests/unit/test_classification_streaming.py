@@ -0,0 +1,235 @@
+"""Tests for per-tier streaming classification."""
+
+import json
+from contextlib import asynccontextmanager
+from datetime import date
+from decimal import Decimal
+from unittest.mock import MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+from swen_ml_contracts import TransactionInput
+
+from swen_ml.api.routes import classify as classify_route
+from swen_ml.inference.classification import orchestrator as orchestrator_module
+from swen_ml.inference.classification.context import ClassificationMatch, TransactionContext
+from swen_ml.inference.classification.orchestrator import ClassificationOrchestrator
+from swen_ml.inference.classification.result import ClassificationResult
+
+ACCOUNT_ID = uuid4()
+
+
+def _transaction(purpose: str) -> TransactionInput:
+    return TransactionInput(
+        transaction_id=uuid4(),
+        booking_date=date(2026, 1, 15),
+        purpose=purpose,
+        amount=Decimal("-12.50"),
+    )
+
+
+class _FakeTier:
+    """Resolves the transactions whose purpose is in ``resolves``."""
+
+    def __init__(self, name: str, resolves: set[str], calls: list[str]):
+        self.name = name
+        self._resolves = resolves
+        self._calls = calls
+
+    async def process(self, contexts: list[TransactionContext]) -> None:
+        self._calls.append(self.name)
+        for ctx in contexts:
+            if ctx.resolved or ctx.raw_purpose not in self._resolves:
+                continue
+            match = ClassificationMatch(
+                account_id=str(ACCOUNT_ID), account_number="4000", confidence=0.9
+            )
+            resolved_by = "anchor" if self.name == "anchor" else "example"
+            if resolved_by == "anchor":
+                ctx.anchor_match = match
+            else:
+                ctx.example_match = match
+            ctx.resolved = True
+            ctx.resolved_by = resolved_by
+
+
+@pytest.fixture
+def tier_calls(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Replace the pipeline tiers with fakes and record which ones ran."""
+    calls: list[str] = []
+    monkeypatch.setattr(
+        orchestrator_module,
+        "PreprocessingTier",
+        lambda ctx: _FakeTier("preprocessing", set(), calls),
+    )
+    monkeypatch.setattr(
+        orchestrator_module,
+        "ExampleTier",
+        lambda ctx: _FakeTier("example", {"REWE"}, calls),
+    )
+    monkeypatch.setattr(
+        orchestrator_module,
+        "EnrichmentTier",
+        lambda ctx: _FakeTier("enrichment", set(), calls),
+    )
+    monkeypatch.setattr(
+        orchestrator_module,
+        "AnchorTier",
+        lambda ctx, accept_threshold: _FakeTier("anchor", {"Miete"}, calls),
+    )
+    return calls
+
+
+def _orchestrator(
+    monkeypatch: pytest.MonkeyPatch,
+    transactions: list[TransactionInput],
+) -> ClassificationOrchestrator:
+    orchestrator = ClassificationOrchestrator(MagicMock())
+    contexts = [TransactionContext.from_input(txn) for txn in transactions]
+
+    async def prepare(session, txns, user_id):
+        return MagicMock(), contexts
+
+    monkeypatch.setattr(orchestrator, "_prepare", prepare)
+    return orchestrator
+
+
+class TestClassifyStreaming:
+    async def test_yields_each_transaction_once_per_resolving_tier(self, monkeypatch, tier_calls):
+        rewe, rent, unknown = _transaction("REWE"), _transaction("Miete"), _transaction("???")
+        orchestrator = _orchestrator(monkeypatch, [rewe, rent, unknown])
+
+        chunks = [
+            (tier, [r.transaction_id for r in results])
+            async for tier, results in orchestrator.classify_streaming(
+                session=MagicMock(), transactions=[rewe, rent, unknown], user_id=uuid4()
+            )
+        ]
+
+        assert chunks == [
+            ("preprocessing", []),
+            ("example", [rewe.transaction_id]),
+            ("enrichment", []),
+            ("anchor", [rent.transaction_id]),
+            ("unresolved", [unknown.transaction_id]),
+        ]
+
+    async def test_unresolved_results_have_no_account(self, monkeypatch, tier_calls):
+        unknown = _transaction("???")
+        orchestrator = _orchestrator(monkeypatch, [unknown])
+
+        chunks = [
+            chunk
+            async for chunk in orchestrator.classify_streaming(
+                session=MagicMock(), transactions=[unknown], user_id=uuid4()
+            )
+        ]
+
+        tier, (result,) = chunks[-1]
+        assert tier == "unresolved"
+        assert result.account_id is None
+        assert result.resolved_by is None
+
+    async def test_stops_once_everything_is_resolved(self, monkeypatch, tier_calls):
+        rewe = _transaction("REWE")
+        orchestrator = _orchestrator(monkeypatch, [rewe])
+
+        tiers = [
+            tier
+            async for tier, _ in orchestrator.classify_streaming(
+                session=MagicMock(), transactions=[rewe], user_id=uuid4()
+            )
+        ]
+
+        assert tiers == ["preprocessing", "example"]
+        assert tier_calls == ["preprocessing", "example"]
+
+
+class _StreamingOrchestrator:
+    def __init__(self, chunks: list[tuple[str, list[ClassificationResult]]], error=None):
+        self._chunks = chunks
+        self._error = error
+
+    async def classify_streaming(self, session, transactions, user_id):
+        for chunk in self._chunks:
+            yield chunk
+        if self._error is not None:
+            raise self._error
+
+
+def _result(transaction_id: UUID, resolved_by: str | None) -> ClassificationResult:
+    return ClassificationResult(
+        transaction_id=transaction_id,
+        account_id=ACCOUNT_ID if resolved_by else None,
+        account_number="4000" if resolved_by else None,
+        confidence=0.9 if resolved_by else 0.0,
+        resolved_by=resolved_by,
+    )
+
+
+def _events(response) -> list[dict]:
+    return [
+        json.loads(line.removeprefix("data: "))
+        for line in response.text.splitlines()
+        if line.startswith("data: ")
+    ]
+
+
+@pytest.fixture
+def no_database(monkeypatch: pytest.MonkeyPatch) -> None:
+    @asynccontextmanager
+    async def session_context():
+        yield MagicMock()
+
+    monkeypatch.setattr(classify_route, "get_session_context", session_context)
+
+
+class TestClassifyBatchStreamRoute:
+    def test_sends_a_chunk_per_tier_then_the_end_event(self, test_app, test_client, no_database):
+        rewe, unknown = _transaction("REWE"), _transaction("???")
+        test_app.state.classification = _StreamingOrchestrator(
+            [
+                ("preprocessing", []),
+                ("example", [_result(rewe.transaction_id, "example")]),
+                ("unresolved", [_result(unknown.transaction_id, None)]),
+            ]
+        )
+
+        response = test_client.post(
+            "/classify/batch/stream",
+            json={
+                "user_id": str(uuid4()),
+                "transactions": [
+                    rewe.model_dump(mode="json"),
+                    unknown.model_dump(mode="json"),
+                ],
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = _events(response)
+        # Tiers that resolved nothing send no chunk
+        assert [e["type"] for e in events] == ["classifications", "classifications", "complete"]
+        first, second, end = events
+        assert first["classifications"][0]["tier"] == "example"
+        assert (first["completed"], first["total"]) == (1, 2)
+        assert second["classifications"][0]["tier"] == "unresolved"
+        assert (second["completed"], second["total"]) == (2, 2)
+        assert end["stats"]["by_tier"] == {"example": 1, "unresolved": 1}
+
+    def test_failure_ends_the_stream_with_an_error_event(self, test_app, test_client, no_database):
+        rewe = _transaction("REWE")
+        test_app.state.classification = _StreamingOrchestrator(
+            [("example", [_result(rewe.transaction_id, "example")])],
+            error=RuntimeError("encoder crashed"),
+        )
+
+        response = test_client.post(
+            "/classify/batch/stream",
+            json={"user_id": str(uuid4()), "transactions": [rewe.model_dump(mode="json")]},
+        )
+
+        events = _events(response)
+        assert [e["type"] for e in events] == ["classifications", "error"]
+        assert events[-1]["detail"] == "RuntimeError"
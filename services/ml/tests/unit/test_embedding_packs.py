@@ -0,0 +1,207 @@
+"""Tests for packed per-user embedding matrices."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import numpy as np
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql.dml import Delete, Insert, Update
+
+from swen_ml.storage import EmbeddingPackRepository, ExampleRepository
+from swen_ml.storage.sqlalchemy.repositories.pack import PACK_FORMAT_VERSION
+
+DIMENSION = 4
+
+
+def _session(result: MagicMock | None = None) -> MagicMock:
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=result or MagicMock())
+    session.commit = AsyncMock()
+    return session
+
+
+def _statements(session: MagicMock, kind: type) -> list:
+    return [
+        call.args[0] for call in session.execute.await_args_list if isinstance(call.args[0], kind)
+    ]
+
+
+def _params(stmt) -> dict:
+    return stmt.compile(dialect=postgresql.dialect()).params
+
+
+def _rows(count: int, start: int = 0) -> tuple:
+    ids = [f"acc-{start + i}" for i in range(count)]
+    return (
+        np.arange(start, start + count, dtype=np.float32).repeat(DIMENSION).reshape(-1, DIMENSION),
+        ids,
+        ["4000"] * count,
+        [f"text {i}" for i in ids],
+        ["expense"] * count,
+    )
+
+
+def _last_chunk(**overrides) -> SimpleNamespace:
+    chunk = {
+        "chunk_index": 0,
+        "format_version": PACK_FORMAT_VERSION,
+        "dtype": "float32",
+        "dimension": DIMENSION,
+        "row_count": 2,
+    }
+    return SimpleNamespace(**(chunk | overrides))
+
+
+class TestAppend:
+    async def test_sends_only_the_new_rows(self):
+        result = MagicMock()
+        result.one_or_none.return_value = _last_chunk(row_count=2)
+        session = _session(result)
+        pack = EmbeddingPackRepository(session, uuid4(), "example", chunk_rows=3)
+        matrix, *metadata = _rows(2, start=2)
+
+        assert await pack.append(matrix, *metadata) is True
+
+        # The first new row fills the last chunk in SQL, without reading its blob
+        (fill,) = _statements(session, Update)
+        assert "||" in str(fill.compile(dialect=postgresql.dialect()))
+        assert matrix[:1].tobytes() in _params(fill).values()
+        # The second one starts a new chunk
+        assert len(_statements(session, Insert)) == 1
+        (chunk,) = session.execute.await_args_list[-1].args[1]
+        assert chunk["chunk_index"] == 1
+        assert chunk["row_count"] == 1
+        assert chunk["matrix"] == matrix[1:].tobytes()
+        assert chunk["account_ids"] == ["acc-3"]
+        session.commit.assert_not_awaited()
+
+    async def test_full_chunk_only_inserts(self):
+        result = MagicMock()
+        result.one_or_none.return_value = _last_chunk(row_count=3)
+        session = _session(result)
+        pack = EmbeddingPackRepository(session, uuid4(), "example", chunk_rows=3)
+
+        assert await pack.append(*_rows(1)) is True
+
+        assert _statements(session, Update) == []
+        assert len(_statements(session, Insert)) == 1
+
+    async def test_without_a_pack_writes_nothing(self):
+        result = MagicMock()
+        result.one_or_none.return_value = None
+        session = _session(result)
+        pack = EmbeddingPackRepository(session, uuid4(), "example")
+
+        assert await pack.append(*_rows(1)) is False
+
+        assert _statements(session, Insert) == []
+        assert _statements(session, Update) == []
+
+    async def test_outdated_pack_is_not_appended_to(self):
+        result = MagicMock()
+        result.one_or_none.return_value = _last_chunk(format_version=PACK_FORMAT_VERSION - 1)
+        session = _session(result)
+        pack = EmbeddingPackRepository(session, uuid4(), "example")
+
+        assert await pack.append(*_rows(1)) is False
+
+
+class TestReplace:
+    async def test_upserts_chunks_and_deletes_the_tail(self):
+        session = _session()
+        pack = EmbeddingPackRepository(session, uuid4(), "example", chunk_rows=2)
+
+        await pack.replace(*_rows(5))
+
+        (insert,) = _statements(session, Insert)
+        # Upserts, so concurrent first writes do not collide on the chunk key
+        assert "ON CONFLICT" in str(insert.compile(dialect=postgresql.dialect()))
+        chunks = session.execute.await_args_list[-2].args[1]
+        assert [c["chunk_index"] for c in chunks] == [0, 1, 2]
+        assert [c["row_count"] for c in chunks] == [2, 2, 1]
+        (delete,) = _statements(session, Delete)
+        assert 3 in _params(delete).values()
+
+    async def test_empty_replace_deletes_everything(self):
+        session = _session()
+        pack = EmbeddingPackRepository(session, uuid4(), "example")
+
+        await pack.replace(np.empty((0, 0), dtype=np.float32), [], [], [], [])
+
+        assert _statements(session, Insert) == []
+        (delete,) = _statements(session, Delete)
+        assert 0 in _params(delete).values()
+
+    async def test_stores_the_configured_dtype(self):
+        session = _session()
+        pack = EmbeddingPackRepository(session, uuid4(), "example", dtype="float16")
+        matrix, *metadata = _rows(2)
+
+        await pack.replace(matrix, *metadata)
+
+        (chunk,) = session.execute.await_args_list[-2].args[1]
+        assert chunk["dtype"] == "float16"
+        assert chunk["matrix"] == matrix.astype(np.float16).tobytes()
+
+
+def _chunk(index: int, rows: tuple, dtype: str = "float32") -> SimpleNamespace:
+    matrix, account_ids, account_numbers, labels, account_types = rows
+    return SimpleNamespace(
+        chunk_index=index,
+        format_version=PACK_FORMAT_VERSION,
+        dtype=dtype,
+        dimension=DIMENSION,
+        row_count=len(account_ids),
+        matrix=matrix.astype(dtype).tobytes(),
+        account_ids=account_ids,
+        account_numbers=account_numbers,
+        labels=labels,
+        account_types=account_types,
+    )
+
+
+class TestLoad:
+    async def test_concatenates_chunks_as_float32(self):
+        first, second = _rows(2), _rows(1, start=2)
+        result = MagicMock()
+        result.all.return_value = [_chunk(0, first, "float16"), _chunk(1, second, "float16")]
+        pack = EmbeddingPackRepository(_session(result), uuid4(), "example")
+
+        matrix, account_ids, *_ = await pack.load()
+
+        assert matrix.dtype == np.float32
+        np.testing.assert_array_equal(matrix, np.vstack([first[0], second[0]]))
+        assert account_ids == ["acc-0", "acc-1", "acc-2"]
+
+    async def test_outdated_pack_is_not_loaded(self):
+        chunk = _chunk(0, _rows(1))
+        chunk.format_version = PACK_FORMAT_VERSION - 1
+        result = MagicMock()
+        result.all.return_value = [chunk]
+        pack = EmbeddingPackRepository(_session(result), uuid4(), "example")
+
+        assert await pack.load() is None
+
+
+class TestExampleMatrixRead:
+    async def test_falls_back_to_rows_without_writing(self):
+        row = SimpleNamespace(
+            account_id="acc-0",
+            account_number="4000",
+            account_type="expense",
+            text="REWE",
+            embedding=np.ones(DIMENSION, dtype=np.float32).tobytes(),
+        )
+        result = MagicMock()
+        result.all.return_value = []
+        result.scalars.return_value.all.return_value = [row]
+        session = _session(result)
+
+        matrix, account_ids, *_ = await ExampleRepository(session, uuid4()).get_embeddings_matrix()
+
+        assert matrix.shape == (1, DIMENSION)
+        assert account_ids == ["acc-0"]
+        for kind in (Insert, Update, Delete):
+            assert _statements(session, kind) == []
+        session.commit.assert_not_awaited()
@@ -0,0 +1,122 @@
+"""Tests for cross-request encoder batching."""
+
+import asyncio
+import threading
+
+import numpy as np
+import pytest
+
+from swen_ml.inference._models import EncoderScheduler
+
+DIMENSION = 4
+
+
+class _FakeEncoder:
+    dimension = DIMENSION
+    model_name = "fake-model"
+    fingerprint = "fake:v1"
+
+    def __init__(self):
+        self.calls: list[list[str]] = []
+        self.threads: set[int] = set()
+        self.release = threading.Event()
+        self.release.set()
+        self.error: Exception | None = None
+
+    def encode(self, texts: list[str]) -> np.ndarray:
+        self.calls.append(list(texts))
+        self.threads.add(threading.get_ident())
+        self.release.wait(timeout=2)
+        if self.error is not None:
+            raise self.error
+        return np.array([[len(t)] * DIMENSION for t in texts], dtype=np.float32)
+
+
+@pytest.fixture
+async def schedulers():
+    """Create schedulers that are closed after the test."""
+    created: list[EncoderScheduler] = []
+
+    def make(encoder: _FakeEncoder, **kwargs) -> EncoderScheduler:
+        scheduler = EncoderScheduler(encoder, **kwargs)
+        created.append(scheduler)
+        return scheduler
+
+    yield make
+    for scheduler in created:
+        await scheduler.aclose()
+
+
+class TestEncoderScheduler:
+    async def test_concurrent_requests_share_one_batch(self, schedulers):
+        encoder = _FakeEncoder()
+        scheduler = schedulers(encoder, max_wait_ms=50)
+
+        first, second = await asyncio.gather(
+            scheduler.encode(["a", "bb"]),
+            scheduler.encode(["ccc"]),
+        )
+
+        assert encoder.calls == [["a", "bb", "ccc"]]
+        np.testing.assert_array_equal(first[:, 0], [1, 2])
+        np.testing.assert_array_equal(second[:, 0], [3])
+        assert (scheduler.stats.requests, scheduler.stats.batches) == (2, 1)
+
+    async def test_batches_stop_at_the_size_limit(self, schedulers):
+        encoder = _FakeEncoder()
+        scheduler = schedulers(encoder, max_batch_size=2, max_wait_ms=50)
+
+        await asyncio.gather(*(scheduler.encode([text]) for text in ["a", "b", "c"]))
+
+        assert encoder.calls == [["a", "b"], ["c"]]
+
+    async def test_encodes_off_the_event_loop_thread(self, schedulers):
+        encoder = _FakeEncoder()
+        scheduler = schedulers(encoder)
+
+        await scheduler.encode(["a"])
+
+        assert threading.get_ident() not in encoder.threads
+
+    async def test_failure_reaches_every_caller_of_the_batch(self, schedulers):
+        encoder = _FakeEncoder()
+        encoder.error = RuntimeError("model crashed")
+        scheduler = schedulers(encoder, max_wait_ms=50)
+
+        results = await asyncio.gather(
+            scheduler.encode(["a"]),
+            scheduler.encode(["b"]),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        # The collector keeps serving later requests
+        encoder.error = None
+        assert (await scheduler.encode(["c"])).shape == (1, DIMENSION)
+
+    async def test_empty_input_is_not_queued(self, schedulers):
+        encoder = _FakeEncoder()
+        scheduler = schedulers(encoder)
+
+        result = await scheduler.encode([])
+
+        assert result.shape == (0, DIMENSION)
+        assert scheduler.stats.requests == 0
+
+    async def test_close_fails_queued_requests(self, schedulers):
+        encoder = _FakeEncoder()
+        encoder.release.clear()
+        scheduler = schedulers(encoder, max_batch_size=1)
+        running = asyncio.create_task(scheduler.encode(["a"]))
+        while not encoder.calls:
+            await asyncio.sleep(0.01)
+        queued = asyncio.create_task(scheduler.encode(["b"]))
+        await asyncio.sleep(0)
+
+        await scheduler.aclose()
+        encoder.release.set()
+
+        with pytest.raises(asyncio.CancelledError):
+            await running
+        with pytest.raises(RuntimeError, match="closed"):
+            await queued
@@ -0,0 +1,192 @@
+"""Tests for the two-level (memory, then database) search enrichment cache."""
+
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from swen_ml.inference.classification.context import TransactionContext
+from swen_ml.inference.classification.enrichment import (
+    EnrichmentCache,
+    EnrichmentCacheStats,
+    EnrichmentService,
+    SearchResult,
+)
+from swen_ml.inference.classification.enrichment import cache as cache_module
+
+_DAY = 86400.0
+REWE_TEXT = "REWE Supermarktkette mit Lebensmitteln"
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Controllable monotonic clock for cache expiry."""
+    now = [1000.0]
+    monkeypatch.setattr(cache_module, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+class TestEnrichmentCache:
+    def test_queries_are_normalized(self):
+        cache = EnrichmentCache()
+
+        cache.put("  REWE ", "Supermarkt")
+
+        assert cache.get("rewe") == "Supermarkt"
+
+    def test_negative_entries_expire_on_the_shorter_ttl(self, clock):
+        cache = EnrichmentCache(ttl_days=7, negative_ttl_days=1)
+        cache.put("rewe", "Supermarkt")
+        cache.put("max mustermann", "")
+
+        clock[0] += 2 * _DAY
+
+        assert cache.get("max mustermann") is None
+        assert cache.get("rewe") == "Supermarkt"
+        clock[0] += 6 * _DAY
+        assert cache.get("rewe") is None
+
+    def test_evicts_least_recently_used(self):
+        cache = EnrichmentCache(max_entries=2)
+        cache.put("rewe", "a")
+        cache.put("aldi", "b")
+        cache.get("rewe")
+
+        cache.put("lidl", "c")
+
+        assert len(cache) == 2
+        assert cache.get("aldi") is None
+
+
+class TestEnrichmentCacheStats:
+    def test_hit_ratio_and_saved_search_time(self):
+        stats = EnrichmentCacheStats(
+            memory_hits=2, db_hits=1, misses=1, searches=2, search_seconds=1.0
+        )
+
+        assert stats.hit_ratio == 0.75
+        assert stats.avg_search_seconds == 0.5
+        assert stats.search_seconds_saved == 1.5
+
+    def test_empty_stats(self):
+        stats = EnrichmentCacheStats()
+
+        assert (stats.hit_ratio, stats.search_seconds_saved) == (0.0, 0.0)
+
+
+def _context(counterparty: str) -> TransactionContext:
+    ctx = TransactionContext(
+        transaction_id=uuid4(),
+        raw_counterparty=counterparty,
+        raw_purpose="",
+        amount=Decimal("-12.50"),
+        booking_date=date(2026, 1, 15),
+    )
+    ctx.cleaned_counterparty = counterparty
+    return ctx
+
+
+def _service(
+    cache: EnrichmentCache,
+    repository: MagicMock,
+    results: list[SearchResult],
+) -> tuple[EnrichmentService, MagicMock]:
+    adapter = MagicMock()
+    adapter.search = AsyncMock(return_value=results)
+    pipeline_ctx = SimpleNamespace(
+        searxng_adapter=adapter,
+        keyword_adapter=None,
+        enrichment_cache=cache,
+        enrichment_repository=repository,
+        enrichment_max_concurrency=4,
+        enrichment_deadline_seconds=None,
+    )
+    return EnrichmentService(pipeline_ctx), adapter
+
+
+def _repository(cached_text: str | None = None) -> MagicMock:
+    repository = MagicMock()
+    cached = None if cached_text is None else SimpleNamespace(enrichment_text=cached_text)
+    repository.get = AsyncMock(return_value=cached)
+    repository.set = AsyncMock()
+    repository.evict_if_needed = AsyncMock(return_value=0)
+    return repository
+
+
+_RESULTS = [
+    SearchResult(
+        title="REWE",
+        content="Supermarktkette mit Lebensmitteln. Mehr",
+        url="https://rewe.de",
+        score=1.0,
+    )
+]
+
+
+class TestEnrichmentServiceCaching:
+    async def test_memory_hit_skips_database_and_search(self):
+        cache = EnrichmentCache()
+        cache.put("rewe", REWE_TEXT)
+        repository = _repository()
+        service, adapter = _service(cache, repository, _RESULTS)
+        ctx = _context("rewe")
+
+        assert await service.enrich_batch([ctx]) == 1
+
+        assert ctx.search_enrichment == REWE_TEXT
+        repository.get.assert_not_awaited()
+        adapter.search.assert_not_awaited()
+        assert cache.stats.memory_hits == 1
+
+    async def test_database_hit_fills_the_memory_cache(self):
+        cache = EnrichmentCache()
+        repository = _repository(REWE_TEXT)
+        service, adapter = _service(cache, repository, _RESULTS)
+
+        await service.enrich_batch([_context("rewe")])
+        await service.enrich_batch([_context("rewe")])
+
+        repository.get.assert_awaited_once()
+        adapter.search.assert_not_awaited()
+        assert cache.get("rewe") == REWE_TEXT
+        assert (cache.stats.db_hits, cache.stats.memory_hits) == (1, 1)
+
+    async def test_miss_is_searched_and_stored_in_both_levels(self):
+        cache = EnrichmentCache(ttl_days=7, max_db_entries=500)
+        repository = _repository()
+        service, adapter = _service(cache, repository, _RESULTS)
+
+        await service.enrich_batch([_context("rewe"), _context("rewe")])
+
+        adapter.search.assert_awaited_once_with("rewe")
+        assert cache.get("rewe") == REWE_TEXT
+        repository.set.assert_awaited_once()
+        assert repository.set.await_args.kwargs["ttl_days"] == 7
+        repository.evict_if_needed.assert_awaited_once_with(500)
+        assert (cache.stats.misses, cache.stats.searches) == (1, 1)
+
+    async def test_empty_result_is_stored_as_negative_entry(self):
+        cache = EnrichmentCache(ttl_days=7, negative_ttl_days=1)
+        repository = _repository()
+        service, _ = _service(cache, repository, [])
+        ctx = _context("max mustermann")
+
+        assert await service.enrich_batch([ctx]) == 0
+
+        assert cache.get("max mustermann") == ""
+        args = repository.set.await_args
+        assert args.args[1] == ""
+        assert args.kwargs["ttl_days"] == 1
+
+    async def test_no_eviction_without_writes(self):
+        cache = EnrichmentCache()
+        cache.put("rewe", REWE_TEXT)
+        repository = _repository()
+        service, _ = _service(cache, repository, _RESULTS)
+
+        await service.enrich_batch([_context("rewe")])
+
+        repository.evict_if_needed.assert_not_awaited()
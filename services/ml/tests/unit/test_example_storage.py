@@ -0,0 +1,143 @@
+"""Tests for storing training examples in batches."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import numpy as np
+import pytest
+from sqlalchemy.sql.dml import Insert
+from swen_ml_contracts import MAX_EXAMPLES_PER_BATCH
+
+from swen_ml.api.routes import examples as examples_route
+from swen_ml.inference.classification.user_cache import UserDataCache
+from swen_ml.storage import ExampleRepository, ExampleTable, get_session
+
+DIMENSION = 4
+
+
+class _FakeEncoder:
+    fingerprint = "fake"
+    dimension = DIMENSION
+
+    def __init__(self):
+        self.calls: list[list[str]] = []
+
+    def encode(self, texts: list[str]) -> np.ndarray:
+        self.calls.append(list(texts))
+        return np.ones((len(texts), DIMENSION), dtype=np.float32)
+
+
+def _example_payload(purpose: str = "REWE SAGT DANKE") -> dict:
+    return {
+        "transaction_id": str(uuid4()),
+        "counterparty_name": "REWE",
+        "purpose": purpose,
+        "amount": "-12.50",
+        "account_id": str(uuid4()),
+        "account_number": "4000",
+        "account_type": "expense",
+    }
+
+
+@pytest.fixture
+def example_repo(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Route the endpoint to a fake example repository."""
+    repo = MagicMock()
+    repo.add_many = AsyncMock()
+    repo.count = AsyncMock(return_value=42)
+
+    def factory(session, user_id):
+        return SimpleNamespace(example=repo, user_id=user_id)
+
+    monkeypatch.setattr(examples_route, "RepositoryFactory", factory)
+    return repo
+
+
+@pytest.fixture
+def encoder(test_app) -> _FakeEncoder:
+    async def no_session():
+        return MagicMock()
+
+    encoder = _FakeEncoder()
+    test_app.state.encoder = encoder
+    test_app.state.infra = SimpleNamespace(user_cache=UserDataCache(), encoder_scheduler=None)
+    test_app.dependency_overrides[get_session] = no_session
+    return encoder
+
+
+class TestStoreExamplesBatchRoute:
+    def test_encodes_once_and_stores_all_examples(self, test_client, encoder, example_repo):
+        payloads = [_example_payload(f"Einkauf {i}") for i in range(3)]
+
+        response = test_client.post(
+            f"/users/{uuid4()}/examples:batch",
+            json={"examples": payloads},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["stored"] == 3
+        assert response.json()["total_examples"] == 42
+        assert encoder.calls == [[f"REWE Einkauf {i}" for i in range(3)]]
+        example_repo.add_many.assert_awaited_once()
+        kwargs = example_repo.add_many.await_args.kwargs
+        assert kwargs["embeddings"].shape == (3, DIMENSION)
+        assert kwargs["account_ids"] == [p["account_id"] for p in payloads]
+
+    def test_rejects_batches_over_the_limit(self, test_client, encoder, example_repo):
+        payloads = [_example_payload() for _ in range(MAX_EXAMPLES_PER_BATCH + 1)]
+
+        response = test_client.post(
+            f"/users/{uuid4()}/examples:batch",
+            json={"examples": payloads},
+        )
+
+        assert response.status_code == 422
+        example_repo.add_many.assert_not_awaited()
+
+
+def _session_without_pack() -> MagicMock:
+    result = MagicMock()
+    result.one_or_none.return_value = None
+    result.scalars.return_value.all.return_value = []
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=result)
+    session.commit = AsyncMock()
+    return session
+
+
+def _example_inserts(session: MagicMock) -> list[Insert]:
+    statements = [call.args[0] for call in session.execute.await_args_list]
+    return [
+        stmt
+        for stmt in statements
+        if isinstance(stmt, Insert) and stmt.table.name == ExampleTable.__tablename__
+    ]
+
+
+class TestExampleRepositoryAddMany:
+    async def test_inserts_in_chunks_with_one_commit(self):
+        session = _session_without_pack()
+        repo = ExampleRepository(session, uuid4())
+        count = 2500
+
+        await repo.add_many(
+            np.zeros((count, DIMENSION), dtype=np.float32),
+            [str(uuid4()) for _ in range(count)],
+            ["4000"] * count,
+            ["expense"] * count,
+            [f"text {i}" for i in range(count)],
+        )
+
+        # Below the PostgreSQL bind parameter limit: 1000 rows per statement
+        assert len(_example_inserts(session)) == 3
+        session.commit.assert_awaited_once()
+
+    async def test_empty_batch_writes_nothing(self):
+        session = _session_without_pack()
+        repo = ExampleRepository(session, uuid4())
+
+        await repo.add_many(np.zeros((0, DIMENSION), dtype=np.float32), [], [], [], [])
+
+        session.execute.assert_not_awaited()
+        session.commit.assert_not_awaited()
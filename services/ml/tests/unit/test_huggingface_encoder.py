@@ -0,0 +1,83 @@
+"""Tests for the HuggingFace encoder backend (with a stub model and tokenizer)."""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+pytest.importorskip("transformers")
+
+from swen_ml.inference._models.encoder.huggingface import HuggingFaceEncoder  # noqa: E402
+
+DIMENSION = 3
+
+
+class _StubTokenizer:
+    """One token per word; the token id is the word length."""
+
+    def __call__(self, texts, truncation, max_length, padding=False, return_tensors=None):
+        ids = [[len(word) for word in text.split()][:max_length] for text in texts]
+        if return_tensors is None:
+            return {"input_ids": ids}
+
+        width = max(len(row) for row in ids)
+        input_ids = torch.zeros((len(ids), width), dtype=torch.long)
+        attention_mask = torch.zeros((len(ids), width), dtype=torch.long)
+        for i, row in enumerate(ids):
+            input_ids[i, : len(row)] = torch.tensor(row)
+            attention_mask[i, : len(row)] = 1
+        return {"input_ids": input_ids, "attention_mask": attention_mask}
+
+
+class _StubModel:
+    """Returns each token id as its hidden state and records every forward pass."""
+
+    config = SimpleNamespace(hidden_size=DIMENSION)
+
+    def __init__(self):
+        self.batches: list[torch.Tensor] = []
+
+    def to(self, device):
+        return self
+
+    def eval(self):
+        return self
+
+    def __call__(self, input_ids, attention_mask):
+        self.batches.append(input_ids)
+        hidden = input_ids.float().unsqueeze(-1).repeat(1, 1, DIMENSION)
+        return SimpleNamespace(last_hidden_state=hidden)
+
+
+def _encoder(model: _StubModel, **kwargs) -> HuggingFaceEncoder:
+    options = {"model_name": "stub-model", "normalize": False, "pooling": "cls"} | kwargs
+    return HuggingFaceEncoder(model, _StubTokenizer(), **options)
+
+
+class TestEncode:
+    def test_outputs_are_returned_in_input_order(self):
+        encoder = _encoder(_StubModel(), batch_size=2)
+
+        result = encoder.encode(["ccc ccc ccc", "a", "bb bb", "dddd dddd dddd dddd", "e"])
+
+        np.testing.assert_array_equal(result[:, 0], [3, 1, 2, 4, 1])
+        assert result.dtype == np.float32
+
+    def test_no_forward_pass_exceeds_the_batch_size(self):
+        model = _StubModel()
+        encoder = _encoder(model, batch_size=2)
+
+        encoder.encode(["ccc ccc ccc", "a", "bb bb", "dddd dddd dddd dddd", "e"])
+
+        assert [batch.shape[0] for batch in model.batches] == [2, 2, 1]
+        # Sorted by token length, so each micro-batch pads to similar lengths
+        assert [batch.shape[1] for batch in model.batches] == [1, 3, 4]
+
+    def test_empty_input_skips_the_model(self):
+        model = _StubModel()
+
+        result = _encoder(model).encode([])
+
+        assert result.shape == (0, DIMENSION)
+        assert model.batches == []
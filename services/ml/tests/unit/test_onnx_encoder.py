@@ -0,0 +1,131 @@
+"""Tests for the ONNX Runtime encoder backend (with a fake session and tokenizer)."""
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+pytest.importorskip("onnxruntime")
+
+from swen_ml.inference._models.encoder.onnx_runtime import OnnxEncoder  # noqa: E402
+
+DIMENSION = 3
+_PADDING = 100.0
+
+
+class _FakeTokenizer:
+    """One token per word; the token id is the word length."""
+
+    def __call__(self, texts, truncation, max_length, padding=False, return_tensors=None):
+        ids = [[len(word) for word in text.split()][:max_length] for text in texts]
+        if return_tensors is None:
+            return {"input_ids": ids}
+
+        width = max(len(row) for row in ids)
+        input_ids = np.zeros((len(ids), width), dtype=np.int32)
+        attention_mask = np.zeros((len(ids), width), dtype=np.int32)
+        for i, row in enumerate(ids):
+            input_ids[i, : len(row)] = row
+            attention_mask[i, : len(row)] = 1
+        return {
+            "input_ids": input_ids,
+            "attention_mask": attention_mask,
+            "token_type_ids": np.zeros_like(input_ids),
+        }
+
+
+class _FakeSession:
+    """Returns each token id as its hidden state, and a marker for padding."""
+
+    def __init__(self):
+        self.batches: list[dict[str, np.ndarray]] = []
+
+    def get_inputs(self):
+        return [SimpleNamespace(name="input_ids"), SimpleNamespace(name="attention_mask")]
+
+    def run(self, output_names, inputs):
+        self.batches.append(inputs)
+        ids = inputs["input_ids"]
+        hidden = np.where(inputs["attention_mask"] > 0, ids, _PADDING).astype(np.float32)
+        return [np.repeat(hidden[..., None], DIMENSION, axis=2)]
+
+
+def _encoder(session: _FakeSession | None = None, **kwargs) -> OnnxEncoder:
+    options = {"model_name": "fake-model", "dimension": DIMENSION, "normalize": False} | kwargs
+    return OnnxEncoder(session or _FakeSession(), _FakeTokenizer(), **options)
+
+
+class TestEncode:
+    def test_runs_length_sorted_micro_batches_in_input_order(self):
+        session = _FakeSession()
+        encoder = _encoder(session, batch_size=2, pooling="cls")
+
+        result = encoder.encode(["ccc ccc ccc", "a", "bb bb"])
+
+        assert [batch["input_ids"].shape for batch in session.batches] == [(2, 2), (1, 3)]
+        np.testing.assert_array_equal(result[:, 0], [3, 1, 2])
+
+    def test_feeds_only_the_model_inputs_as_int64(self):
+        session = _FakeSession()
+
+        _encoder(session).encode(["a"])
+
+        (inputs,) = session.batches
+        assert set(inputs) == {"input_ids", "attention_mask"}
+        assert all(value.dtype == np.int64 for value in inputs.values())
+
+    @pytest.mark.parametrize(
+        ("pooling", "expected"),
+        [("mean", [3.0, 5.0]), ("cls", [2.0, 5.0]), ("max", [4.0, 5.0])],
+    )
+    def test_pooling_ignores_padding(self, pooling, expected):
+        encoder = _encoder(pooling=pooling)
+
+        result = encoder.encode(["aa bbbb", "ccccc"])
+
+        np.testing.assert_array_equal(result[:, 0], expected)
+
+    def test_normalizes_to_unit_length(self):
+        encoder = _encoder(normalize=True)
+
+        result = encoder.encode(["aa bbbb", "ccccc"])
+
+        np.testing.assert_allclose(np.linalg.norm(result, axis=1), [1.0, 1.0], rtol=1e-6)
+        assert result.dtype == np.float32
+
+    def test_empty_input_skips_the_session(self):
+        session = _FakeSession()
+
+        result = _encoder(session).encode([])
+
+        assert result.shape == (0, DIMENSION)
+        assert session.batches == []
+
+
+class TestFingerprint:
+    def test_differs_by_precision_and_settings(self):
+        base = _encoder()
+        variants = [
+            _encoder(quantize=False),
+            _encoder(pooling="cls"),
+            _encoder(normalize=True),
+            _encoder(max_length=128),
+        ]
+
+        assert base.fingerprint.startswith("onnx:fake-model:int8:")
+        assert len({base.fingerprint, *(v.fingerprint for v in variants)}) == 5
+
+    def test_ignores_the_batch_size(self):
+        assert _encoder(batch_size=8).fingerprint == _encoder(batch_size=64).fingerprint
+
+
+class TestArtifactDir:
+    def test_one_directory_per_model_and_precision(self):
+        cache = Path("/cache")
+
+        int8 = OnnxEncoder.artifact_dir(cache, "sentence-transformers/all-MiniLM-L6-v2", True)
+        fp32 = OnnxEncoder.artifact_dir(cache, "sentence-transformers/all-MiniLM-L6-v2", False)
+
+        assert int8 == cache / "sentence-transformers--all-MiniLM-L6-v2-int8"
+        assert fp32.name.endswith("-fp32")
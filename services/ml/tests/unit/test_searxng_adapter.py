@@ -0,0 +1,137 @@
+"""Tests for SearXNG retries and timeouts (with a mocked transport)."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from swen_ml.inference.classification.enrichment import SearchError, SearXNGAdapter
+from swen_ml.inference.classification.enrichment.search import searxng as searxng_module
+
+_RESULTS = {"results": [{"title": "REWE", "content": "Supermarkt", "url": "https://rewe.de"}]}
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Record retry delays instead of sleeping."""
+    delays: list[float] = []
+
+    async def sleep(seconds: float) -> None:
+        delays.append(seconds)
+
+    monkeypatch.setattr(searxng_module, "asyncio", SimpleNamespace(sleep=sleep))
+    return delays
+
+
+def _adapter(responses: list, **kwargs) -> tuple[SearXNGAdapter, list[httpx.Request]]:
+    """Adapter answering each request with the next response (or raising it)."""
+    requests: list[httpx.Request] = []
+    pending = list(responses)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        response = pending.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    adapter = SearXNGAdapter(base_url="http://searxng", **kwargs)
+    adapter._client = httpx.AsyncClient(
+        base_url=adapter.base_url, transport=httpx.MockTransport(handler)
+    )
+    return adapter, requests
+
+
+def _ok() -> httpx.Response:
+    return httpx.Response(200, json=_RESULTS)
+
+
+class TestRetries:
+    async def test_retries_rate_limited_and_server_errors(self, sleeps):
+        adapter, requests = _adapter([httpx.Response(429), httpx.Response(502), _ok()])
+
+        results = await adapter.search("REWE")
+
+        assert [r.title for r in results] == ["REWE"]
+        assert len(requests) == 3
+        # Exponential backoff without Retry-After
+        assert sleeps == [0.5, 1.0]
+
+    async def test_gives_up_after_max_retries(self, sleeps):
+        adapter, requests = _adapter([httpx.Response(503)] * 3, max_retries=2)
+
+        with pytest.raises(SearchError):
+            await adapter.search("REWE")
+
+        assert len(requests) == 3
+        assert len(sleeps) == 2
+
+    async def test_client_errors_are_not_retried(self, sleeps):
+        adapter, requests = _adapter([httpx.Response(404)])
+
+        with pytest.raises(SearchError):
+            await adapter.search("REWE")
+
+        assert len(requests) == 1
+        assert sleeps == []
+
+    async def test_transport_errors_are_retried(self, sleeps):
+        adapter, requests = _adapter([httpx.ConnectError("refused"), _ok()])
+
+        assert len(await adapter.search("REWE")) == 1
+        assert len(requests) == 2
+
+    async def test_every_attempt_takes_a_rate_limit_token(self, sleeps):
+        limiter = MagicMock()
+        limiter.acquire = AsyncMock()
+        adapter, _ = _adapter([httpx.Response(429), _ok()], rate_limiter=limiter)
+
+        await adapter.search("REWE")
+
+        assert limiter.acquire.await_count == 2
+
+
+class TestRetryAfter:
+    async def test_delay_follows_retry_after(self, sleeps):
+        adapter, _ = _adapter([httpx.Response(429, headers={"Retry-After": "3"}), _ok()])
+
+        await adapter.search("REWE")
+
+        assert sleeps == [3.0]
+
+    async def test_long_retry_after_is_capped(self, sleeps):
+        adapter, _ = _adapter([httpx.Response(503, headers={"Retry-After": "120"}), _ok()])
+
+        await adapter.search("REWE")
+
+        assert sleeps == [searxng_module._MAX_RETRY_AFTER_SECONDS]
+
+    async def test_unparseable_retry_after_falls_back_to_backoff(self, sleeps):
+        date = "Wed, 21 Oct 2026 07:28:00 GMT"
+        adapter, _ = _adapter([httpx.Response(429, headers={"Retry-After": date}), _ok()])
+
+        await adapter.search("REWE")
+
+        assert sleeps == [0.5]
+
+
+class TestTimeouts:
+    def test_connect_timeout_defaults_to_the_timeout(self):
+        timeout = SearXNGAdapter(timeout=4.0)._timeout()
+
+        assert (timeout.read, timeout.connect) == (4.0, 4.0)
+
+    def test_connect_timeout_can_be_shorter(self):
+        timeout = SearXNGAdapter(timeout=4.0, connect_timeout=1.0)._timeout()
+
+        assert (timeout.read, timeout.connect) == (4.0, 1.0)
+
+    async def test_aclose_releases_the_pooled_client(self):
+        adapter, _ = _adapter([])
+        client = adapter._client
+
+        await adapter.aclose()
+
+        assert client.is_closed
+        assert adapter._client is None
@@ -0,0 +1,47 @@
+"""Tests for the shared search rate limiter."""
+
+import asyncio
+import time
+
+from swen_ml.inference.classification.enrichment import TokenBucket
+
+INTERVAL = 0.05
+
+
+async def _elapsed(bucket: TokenBucket, calls: int) -> float:
+    start = time.monotonic()
+    for _ in range(calls):
+        await bucket.acquire()
+    return time.monotonic() - start
+
+
+class TestTokenBucket:
+    async def test_burst_is_served_at_once(self):
+        bucket = TokenBucket(INTERVAL, burst=3)
+
+        assert await _elapsed(bucket, 3) < INTERVAL
+
+    async def test_waits_for_a_refill_after_the_burst(self):
+        bucket = TokenBucket(INTERVAL, burst=2)
+        await _elapsed(bucket, 2)
+
+        assert await _elapsed(bucket, 2) >= 1.8 * INTERVAL
+
+    async def test_rate_holds_across_concurrent_callers(self):
+        bucket = TokenBucket(INTERVAL, burst=1)
+        start = time.monotonic()
+
+        await asyncio.gather(*(bucket.acquire() for _ in range(3)))
+
+        assert time.monotonic() - start >= 1.8 * INTERVAL
+
+    async def test_zero_interval_disables_the_limit(self):
+        bucket = TokenBucket(0, burst=1)
+
+        assert await _elapsed(bucket, 100) < INTERVAL
+
+    async def test_burst_below_one_is_clamped(self):
+        bucket = TokenBucket(INTERVAL, burst=0)
+
+        assert await _elapsed(bucket, 1) < INTERVAL
+        assert await _elapsed(bucket, 1) >= 0.9 * INTERVAL
@@ -0,0 +1,249 @@
+"""Tests for the per-user classification data cache."""
+
+from datetime import date
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import numpy as np
+import pytest
+from swen_ml_contracts import TransactionInput
+
+from swen_ml.inference.classification import orchestrator as orchestrator_module
+from swen_ml.inference.classification.context import EmbeddingStore
+from swen_ml.inference.classification.orchestrator import ClassificationOrchestrator
+from swen_ml.inference.classification.preprocessing import NoiseModel
+from swen_ml.inference.classification.user_cache import UserData, UserDataCache
+from swen_ml.training.example_embedding_service import ExampleEmbeddingService, ExampleInput
+
+DIMENSION = 4
+
+
+def _store(*account_ids: str) -> EmbeddingStore:
+    if not account_ids:
+        return EmbeddingStore.empty()
+    return EmbeddingStore(
+        embeddings=np.ones((len(account_ids), DIMENSION), dtype=np.float32),
+        account_ids=list(account_ids),
+        account_numbers=["4000"] * len(account_ids),
+        labels=[f"label {i}" for i in account_ids],
+        account_types=["expense"] * len(account_ids),
+    )
+
+
+def _user_data(examples: EmbeddingStore | None = None) -> UserData:
+    return UserData(
+        noise_model=MagicMock(),
+        example_store=examples if examples is not None else _store(),
+        anchor_store=_store("a", "b"),
+    )
+
+
+class TestLru:
+    def test_get_counts_hits_and_misses(self):
+        cache = UserDataCache()
+        user_id = uuid4()
+
+        assert cache.get(user_id) is None
+        cache.put(user_id, _user_data())
+        assert cache.get(user_id) is not None
+
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    def test_evicts_least_recently_used(self):
+        cache = UserDataCache(max_users=2)
+        first, second, third = uuid4(), uuid4(), uuid4()
+        cache.put(first, _user_data())
+        cache.put(second, _user_data())
+
+        cache.get(first)
+        cache.put(third, _user_data())
+
+        assert len(cache) == 2
+        assert cache.get(second) is None
+        assert cache.get(first) is not None
+        assert cache.stats.evictions == 1
+
+    def test_zero_size_disables_caching(self):
+        cache = UserDataCache(max_users=0)
+        user_id = uuid4()
+
+        cache.put(user_id, _user_data())
+
+        assert len(cache) == 0
+
+
+class TestIncrementalUpdates:
+    def test_add_examples_appends_without_touching_the_old_store(self):
+        cache = UserDataCache()
+        user_id = uuid4()
+        before = _store("a")
+        cache.put(user_id, _user_data(before))
+
+        cache.add_examples(user_id, _store("b"))
+
+        assert cache.get(user_id).example_store.account_ids == ["a", "b"]
+        # Readers holding the old store keep a consistent snapshot
+        assert before.account_ids == ["a"]
+
+    def test_anchor_updates(self):
+        cache = UserDataCache()
+        user_id = uuid4()
+        cache.put(user_id, _user_data())
+
+        cache.upsert_anchors(user_id, _store("b", "c"))
+        assert cache.get(user_id).anchor_store.account_ids == ["a", "b", "c"]
+
+        cache.remove_anchor(user_id, "a")
+        assert cache.get(user_id).anchor_store.account_ids == ["b", "c"]
+
+        cache.clear_anchors(user_id)
+        assert len(cache.get(user_id).anchor_store) == 0
+
+    def test_updates_for_uncached_users_are_ignored(self):
+        cache = UserDataCache()
+        user_id = uuid4()
+
+        cache.add_examples(user_id, _store("a"))
+
+        assert cache.get(user_id) is None
+
+
+class TestWriteGenerations:
+    def test_load_started_before_a_write_is_not_stored(self):
+        cache = UserDataCache()
+        user_id = uuid4()
+
+        generation = cache.generation(user_id)
+        with cache.writing(user_id):
+            pass
+        cache.put(user_id, _user_data(), generation)
+
+        assert cache.get(user_id) is None
+
+    def test_load_started_during_a_write_is_not_stored(self):
+        cache = UserDataCache()
+        user_id = uuid4()
+
+        with cache.writing(user_id):
+            generation = cache.generation(user_id)
+        cache.put(user_id, _user_data(), generation)
+
+        assert cache.get(user_id) is None
+
+    def test_load_after_the_write_is_stored(self):
+        cache = UserDataCache()
+        user_id = uuid4()
+        with cache.writing(user_id):
+            pass
+
+        cache.put(user_id, _user_data(), cache.generation(user_id))
+
+        assert cache.get(user_id) is not None
+
+    def test_failed_write_drops_the_entry(self):
+        cache = UserDataCache()
+        user_id = uuid4()
+        cache.put(user_id, _user_data())
+
+        with pytest.raises(RuntimeError), cache.writing(user_id):
+            raise RuntimeError
+
+        assert cache.get(user_id) is None
+
+
+def _service(cache: UserDataCache, user_id, repository: MagicMock) -> ExampleEmbeddingService:
+    encoder = MagicMock()
+    encoder.encode.side_effect = lambda texts: np.ones((len(texts), DIMENSION), dtype=np.float32)
+    return ExampleEmbeddingService(encoder, repository, user_id=user_id, user_cache=cache)
+
+
+def _example() -> ExampleInput:
+    return ExampleInput(
+        counterparty_name="REWE",
+        purpose="SAGT DANKE",
+        account_id=uuid4(),
+        account_number="4000",
+        account_type="expense",
+    )
+
+
+class TestExampleServiceCacheUpdates:
+    async def test_cache_is_updated_after_the_write(self):
+        cache = UserDataCache()
+        user_id = uuid4()
+        cache.put(user_id, _user_data())
+        repository = MagicMock()
+        repository.add_many = AsyncMock()
+        repository.count = AsyncMock(return_value=1)
+
+        await _service(cache, user_id, repository).store_examples([_example()])
+
+        assert cache.get(user_id).example_store.labels == ["REWE SAGT DANKE"]
+
+    async def test_failed_write_leaves_no_stale_entry(self):
+        cache = UserDataCache()
+        user_id = uuid4()
+        cache.put(user_id, _user_data())
+        repository = MagicMock()
+        repository.add_many = AsyncMock(side_effect=RuntimeError("commit failed"))
+
+        with pytest.raises(RuntimeError):
+            await _service(cache, user_id, repository).store_examples([_example()])
+
+        assert cache.get(user_id) is None
+
+
+def _orchestrator(
+    monkeypatch: pytest.MonkeyPatch, cache: UserDataCache, save: AsyncMock
+) -> ClassificationOrchestrator:
+    infra = MagicMock()
+    infra.user_cache = cache
+
+    def repositories(session, user_id):
+        repos = MagicMock()
+        repos.user_id = user_id
+        repos.noise.save = save
+        return repos
+
+    monkeypatch.setattr(orchestrator_module, "RepositoryFactory", repositories)
+    return ClassificationOrchestrator(infra)
+
+
+def _transaction() -> TransactionInput:
+    return TransactionInput(
+        transaction_id=uuid4(),
+        booking_date=date(2026, 1, 15),
+        purpose="VISA Kartenzahlung REWE",
+        amount=Decimal("-12.50"),
+    )
+
+
+class TestClassificationNoiseModelUpdates:
+    async def test_cached_noise_model_is_replaced_after_the_save(self, monkeypatch):
+        cache = UserDataCache()
+        user_id = uuid4()
+        noise_model = NoiseModel()
+        cache.put(user_id, UserData(noise_model, _store(), _store()))
+        orchestrator = _orchestrator(monkeypatch, cache, AsyncMock())
+
+        pipeline_ctx, _ = await orchestrator._prepare(MagicMock(), [_transaction()], user_id)
+
+        assert cache.get(user_id).noise_model is pipeline_ctx.noise_model
+        assert pipeline_ctx.noise_model.doc_count == 1
+        # The previously cached model is never changed in place
+        assert noise_model.doc_count == 0
+
+    async def test_failed_save_leaves_no_unsaved_noise_statistics(self, monkeypatch):
+        cache = UserDataCache()
+        user_id = uuid4()
+        noise_model = NoiseModel()
+        cache.put(user_id, UserData(noise_model, _store(), _store()))
+        save = AsyncMock(side_effect=RuntimeError("commit failed"))
+        orchestrator = _orchestrator(monkeypatch, cache, save)
+
+        with pytest.raises(RuntimeError):
+            await orchestrator._prepare(MagicMock(), [_transaction()], user_id)
+
+        assert cache.get(user_id) is None
+        assert noise_model.doc_count == 0